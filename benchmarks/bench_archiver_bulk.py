@@ -0,0 +1,163 @@
+"""
+Benchmark fault history retrieval against a local stand-in archiver.
+
+Serves getData.json (one PV per request) and getDataForPVs.json (many
+PVs per request) from a local HTTP server that adds a fixed latency per
+request and per PV, then fetches the status and severity PVs of every
+cavity two ways:
+
+- per cavity, as FaultDataFetcher does by default: 8 worker threads,
+  each sending one request per PV on a new connection (like lcls_tools'
+  get_values_over_time_range)
+- in bulk through BulkArchiveClient: chunk_size PVs per request over one
+  keep-alive session
+
+Usage:
+    python benchmarks/bench_archiver_bulk.py [--cavities N] [--latency-ms MS]
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+from urllib.parse import parse_qs, urlparse
+
+
+def _time(func, repeat: int) -> float:
+    """Median wall time of func() in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return statistics.median(samples)
+
+
+class StandInArchiver(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        pvs = parse_qs(url.query).get("pv", [])
+        with self.server.lock:
+            self.server.requests += 1
+        time.sleep(
+            (self.server.latency_ms + self.server.per_pv_ms * len(pvs)) / 1000
+        )
+        body = [{"meta": {"name": pv}, "data": self.server.data} for pv in pvs]
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cavities", type=int, default=296)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--per-pv-ms", type=float, default=1.0)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    import requests
+
+    from sc_linac_physics.displays.cavity_display.backend.archiver_client import (
+        BulkArchiveClient,
+    )
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInArchiver)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.latency_ms = args.latency_ms
+    server.per_pv_ms = args.per_pv_ms
+    server.data = [
+        {"secs": 1_700_000_000 + i, "nanos": 0, "val": 3, "severity": 0}
+        for i in range(args.samples)
+    ]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    base_url = f"http://{host}:{port}/retrieval/data"
+
+    cavity_pvs = [
+        [f"ACCL:L0B:{cav:04d}:CUDSTATUS", f"ACCL:L0B:{cav:04d}:CUDSEVR"]
+        for cav in range(args.cavities)
+    ]
+    end = datetime.now()
+    params = {
+        "from": (end - timedelta(days=1)).astimezone().isoformat(),
+        "to": end.astimezone().isoformat(),
+    }
+
+    def per_cavity():
+        def one_cavity(pvs):
+            # One connection per PV, no session
+            for pv in pvs:
+                response = requests.get(
+                    f"{base_url}/getData.json", params={"pv": pv, **params}
+                )
+                response.json()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(one_cavity, cavity_pvs))
+
+    client = BulkArchiveClient(base_url, chunk_size=args.chunk_size)
+    all_pvs = [pv for pvs in cavity_pvs for pv in pvs]
+
+    def bulk():
+        first = None
+        start = perf_counter()
+        for _ in client.iter_values_over_time_range(
+            all_pvs, end - timedelta(days=1), end
+        ):
+            if first is None:
+                first = perf_counter() - start
+        return first
+
+    results = {}
+    for name, func in (("per-cavity", per_cavity), ("bulk", bulk)):
+        server.requests = server.connections = 0
+        elapsed = _time(func, args.repeat)
+        # Keep-alive connections outlive a run, so count them over all runs
+        results[name] = (
+            elapsed,
+            server.requests // args.repeat,
+            server.connections,
+        )
+    first_result = bulk()
+    server.shutdown()
+    client.close()
+
+    print(
+        f"{args.cavities} cavities, {len(all_pvs)} PVs, "
+        f"{args.samples} samples/PV, {args.latency_ms:g} ms/request + "
+        f"{args.per_pv_ms:g} ms/PV server latency"
+    )
+    for name, (elapsed, request_count, connection_count) in results.items():
+        print(
+            f"  {name:11s} {elapsed * 1000:8.1f} ms  "
+            f"{request_count:4d} requests/run  "
+            f"{connection_count:4d} connections in {args.repeat} runs"
+        )
+    print(f"  bulk first result after {first_result * 1000:.1f} ms")
+    print(f"  speedup: {results['per-cavity'][0] / results['bulk'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark repainting cavity tiles through an alarm storm.
+
+Lays out a machine's worth of CavityWidgets in a grid, then replays a
+synthetic alarm storm: each frame a fraction of the tiles get a new
+severity (and so a new shape) and TLC, and the whole grid is repainted,
+as a zoom or an expose would. Compares painting every tile from scratch
+with the shared pixmap cache, where a repaint of a known state is a
+blit. Runs offscreen, so frame times exclude the compositor.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_cavity_render.py \\
+        [--cavities N] [--frames N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+from time import perf_counter
+
+TLCS = ["SSA", "QCH", "BCS", "PZT", "CPL", "STP", "FLL", "OFF", "RFS"]
+
+
+def _frame_times(container, widgets, storm, frames: int):
+    """Wall time of each storm frame (update + full repaint) in seconds."""
+    samples = []
+    for frame in range(frames):
+        start = perf_counter()
+        for index, severity, text in storm[frame]:
+            widgets[index].severity_channel_value_changed(severity)
+            widgets[index].cavity_text = text
+        container.repaint()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def _make_storm(cavities, frames, fraction, rng):
+    """Per frame, (tile index, severity, TLC) for the tiles that change."""
+    changed = max(1, int(cavities * fraction))
+    storm = []
+    for _ in range(frames):
+        frame = []
+        for index in rng.sample(range(cavities), changed):
+            severity = rng.choice([0, 0, 1, 2, 2, 3])
+            text = str(index % 8 + 1) if severity == 0 else rng.choice(TLCS)
+            frame.append((index, severity, text))
+        storm.append(frame)
+    return storm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cavities", type=int, default=296)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--changed-fraction", type=float, default=0.2)
+    parser.add_argument("--tile-size", type=int, default=50)
+    args = parser.parse_args()
+
+    from PyQt5.QtWidgets import QApplication, QGridLayout, QWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    from sc_linac_physics.displays.cavity_display.frontend.cavity_widget import (
+        CavityWidget,
+        RenderCache,
+    )
+
+    container = QWidget()
+    layout = QGridLayout(container)
+    layout.setSpacing(2)
+    widgets = []
+    for index in range(args.cavities):
+        widget = CavityWidget()
+        widget.setFixedSize(args.tile_size, args.tile_size)
+        widget.cavity_text = str(index % 8 + 1)
+        layout.addWidget(widget, index // 8, index % 8)
+        widgets.append(widget)
+    container.show()
+    app.processEvents()
+
+    storm = _make_storm(
+        args.cavities, args.frames, args.changed_fraction, random.Random(0)
+    )
+
+    CavityWidget.render_cache = None
+    direct = _frame_times(container, widgets, storm, args.frames)
+
+    cache = RenderCache()
+    CavityWidget.render_cache = cache
+    # The first frames fill the cache; report the steady state
+    _frame_times(container, widgets, storm, args.frames)
+    cache.hits = cache.misses = 0
+    cached = _frame_times(container, widgets, storm, args.frames)
+
+    before = statistics.median(direct)
+    after = statistics.median(cached)
+    print(
+        f"{args.cavities} tiles of {args.tile_size} px, {args.frames} frames, "
+        f"{args.changed_fraction:.0%} of tiles changing per frame"
+    )
+    print(
+        f"  direct paint:  {before * 1000:7.2f} ms/frame "
+        f"(p95 {statistics.quantiles(direct, n=20)[-1] * 1000:.2f} ms)"
+    )
+    print(
+        f"  pixmap cache:  {after * 1000:7.2f} ms/frame "
+        f"(p95 {statistics.quantiles(cached, n=20)[-1] * 1000:.2f} ms)"
+    )
+    print(
+        f"  cache: {len(cache)} pixmaps, "
+        f"{cache.hits / max(1, cache.hits + cache.misses):.1%} hits"
+    )
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
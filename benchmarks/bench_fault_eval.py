@@ -0,0 +1,106 @@
+"""
+Benchmark per-cycle fault evaluation for the whole machine.
+
+Compares the per-cavity, per-fault Python loop (BackendCavity._first_fault
+over FaultPVIndex.values_for) with the vectorized
+FaultPVIndex.first_faults on a lazy BackendMachine. Fault PV values are
+synthetic: mostly OK, with a few faulted and a few disconnected (None).
+No PVs are connected and no status PVs are written.
+
+Usage:
+    python benchmarks/bench_fault_eval.py [--repeat N] [--fault-rate F]
+"""
+
+import argparse
+import random
+import statistics
+from time import perf_counter
+
+
+def _time(func, repeat: int) -> float:
+    """Median wall time of func() in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _ok_value(faults):
+    """A value that trips none of the faults reading one PV."""
+    for fault in faults:
+        if fault.ok_value is not None:
+            return fault.ok_value
+    return min(fault.fault_value for fault in faults) - 1
+
+
+def _faulted_value(fault):
+    if fault.ok_value is not None:
+        return fault.ok_value + 1
+    return fault.fault_value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fault-rate", type=float, default=0.01)
+    parser.add_argument("--invalid-rate", type=float, default=0.005)
+    args = parser.parse_args()
+
+    from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
+        BackendMachine,
+    )
+    from sc_linac_physics.displays.cavity_display.backend.fault_pv_index import (
+        FaultPVIndex,
+    )
+
+    cavities = list(BackendMachine(lazy_fault_pvs=True).all_iterator)
+    index = FaultPVIndex(cavities)
+
+    # Several faults can read one PV (e.g. a .SEVR with warning and alarm
+    # fault values), so OK values must satisfy all of them
+    faults_for_pv = {}
+    for cavity in cavities:
+        for fault in cavity.faults.values():
+            faults_for_pv.setdefault(fault.pv, []).append(fault)
+
+    rng = random.Random(0)
+    values = []
+    for pv_name in index.pv_names:
+        roll = rng.random()
+        faults = faults_for_pv[pv_name]
+        if roll < args.invalid_rate:
+            values.append(None)
+        elif roll < args.invalid_rate + args.fault_rate:
+            values.append(_faulted_value(faults[0]))
+        else:
+            values.append(_ok_value(faults))
+    index.values = values
+
+    def per_cavity():
+        return [
+            cavity._first_fault(index.values_for(cavity)) for cavity in cavities
+        ]
+
+    def vectorized():
+        return index.first_faults()
+
+    expected = [(fault, invalid) for _, invalid, fault in per_cavity()]
+    assert vectorized() == expected, "vectorized result differs"
+
+    before = _time(per_cavity, args.repeat)
+    after = _time(vectorized, args.repeat)
+    faulted = sum(1 for fault, _ in expected if fault is not None)
+
+    print(
+        f"{len(cavities)} cavities, {index.reference_count} fault checks, "
+        f"{index.unique_count} unique PVs, {faulted} cavities faulted"
+    )
+    print(f"  per-cavity loop: {before * 1000:8.2f} ms/cycle")
+    print(f"  vectorized:      {after * 1000:8.2f} ms/cycle")
+    print(f"  speedup:         {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
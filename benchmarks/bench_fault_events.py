@@ -0,0 +1,187 @@
+"""
+Benchmark heatmap fault event storage for a 30-day full-machine fetch.
+
+Compares the list of FaultEvent objects the heatmap used to keep per
+cavity with the columnar FaultEventLog: memory held (tracemalloc) and
+the time to re-aggregate every cavity's counts for one slider window
+(bisect + Python loop vs searchsorted + prefix-sum index). Events are
+synthetic, spread uniformly over the range, with a mix of TLCs, OK
+transitions and severities.
+
+Usage:
+    python benchmarks/bench_fault_events.py [--events-per-cavity N]
+"""
+
+import argparse
+import bisect
+import random
+import statistics
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+from time import perf_counter
+
+TLCS = ["SSA", "QCH", "BCS", "PZT", "CPL", "STP", "FLL", "OFF", "RFS"]
+
+
+def _time(func, repeat: int) -> float:
+    """Median wall time of func() in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _list_windowed_counts(events, window_start, window_end):
+    """The previous list-of-FaultEvent implementation, for reference."""
+    from sc_linac_physics.displays.cavity_display.backend.fault import (
+        FaultCounter,
+        SeverityLevel,
+    )
+
+    lo = bisect.bisect_left(events, window_start, key=lambda e: e.timestamp)
+    hi = bisect.bisect_right(events, window_end, key=lambda e: e.timestamp)
+    counts = defaultdict(FaultCounter)
+    if lo > 0:
+        previous = events[lo - 1]
+        if previous.severity != SeverityLevel.NO_ALARM:
+            counts[previous.status].count_severity(previous.severity)
+    for event in events[lo:hi]:
+        if event.severity == SeverityLevel.NO_ALARM:
+            continue
+        counts[event.status].count_severity(event.severity)
+    return dict(counts)
+
+
+def _make_events(cav_num, count, start, days, rng):
+    from sc_linac_physics.displays.cavity_display.backend.fault import (
+        FaultEvent,
+        SeverityLevel,
+    )
+
+    span = days * 86400
+    offsets = sorted(rng.uniform(0, span) for _ in range(count))
+    events = []
+    for offset in offsets:
+        if rng.random() < 0.3:
+            status, severity = str(cav_num), SeverityLevel.NO_ALARM
+        else:
+            status = rng.choice(TLCS)
+            severity = rng.choice([1, 2, 2, 2, 3, None])
+        events.append(
+            FaultEvent(start + timedelta(seconds=offset), status, severity)
+        )
+    return events
+
+
+def _traced(build):
+    """(result, bytes allocated and still held) of build()."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def _check_same(event_lists, results, windows):
+    for ws, we in windows:
+        for events, result in zip(event_lists, results):
+            expected = _list_windowed_counts(events, ws, we)
+            actual = result.get_windowed_counts(ws, we)
+            assert set(actual) == set(expected), "windowed TLCs differ"
+            assert all(
+                vars(actual[tlc]) == vars(expected[tlc]) for tlc in expected
+            ), "windowed counts differ"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cavities", type=int, default=296)
+    parser.add_argument("--events-per-cavity", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--window-hours", type=float, default=24.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from sc_linac_physics.displays.cavity_display.backend.fault import (
+        FaultEventLog,
+    )
+    from sc_linac_physics.displays.cavity_display.frontend.heatmap.fault_data_fetcher import (
+        CavityFaultResult,
+    )
+
+    rng = random.Random(0)
+    start = datetime(2026, 1, 1)
+    per_cavity = [
+        _make_events(cav % 8 + 1, args.events_per_cavity, start, args.days, rng)
+        for cav in range(args.cavities)
+    ]
+
+    # Copy the events so the list's datetimes are counted as held by it
+    event_lists, list_bytes = _traced(
+        lambda: [
+            [type(e)(e.timestamp.replace(), e.status, e.severity) for e in evs]
+            for evs in per_cavity
+        ]
+    )
+
+    def build_results():
+        results = [
+            CavityFaultResult(
+                "01",
+                1,
+                fault_counts_by_tlc={},
+                fault_events=FaultEventLog.from_events(evs),
+            )
+            for evs in per_cavity
+        ]
+        # Include the tally keys built by the first window query
+        for result in results:
+            result.get_windowed_counts(start, start)
+        return results
+
+    results, log_bytes = _traced(build_results)
+
+    # Ten windows spread evenly over the range, like slider positions
+    window = timedelta(hours=args.window_hours)
+    step = (timedelta(days=args.days) - window) / 9
+    windows = [(start + i * step, start + i * step + window) for i in range(10)]
+    _check_same(event_lists, results, windows)
+
+    def list_query():
+        for ws, we in windows:
+            for events in event_lists:
+                _list_windowed_counts(events, ws, we)
+
+    def log_query():
+        for ws, we in windows:
+            for result in results:
+                result.get_windowed_counts(ws, we)
+
+    before = _time(list_query, args.repeat) / len(windows)
+    after = _time(log_query, args.repeat) / len(windows)
+    total_events = sum(len(evs) for evs in per_cavity)
+
+    print(
+        f"{args.cavities} cavities, {total_events} events over "
+        f"{args.days} days, {args.window_hours:g} h window"
+    )
+    print(
+        f"  memory  list of FaultEvent: {list_bytes / 2**20:8.1f} MiB "
+        f"({list_bytes / total_events:.0f} B/event)"
+    )
+    print(
+        f"          FaultEventLog:      {log_bytes / 2**20:8.1f} MiB "
+        f"({log_bytes / total_events:.0f} B/event)"
+    )
+    print(f"  window  list + bisect:      {before * 1000:8.2f} ms/window")
+    print(f"          FaultEventLog:      {after * 1000:8.2f} ms/window")
+    print(f"  memory reduction: {list_bytes / log_bytes:.1f}x")
+    print(f"  query speedup:    {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
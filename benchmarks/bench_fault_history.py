@@ -0,0 +1,177 @@
+"""
+Benchmark turning archived status/severity samples into fault counts.
+
+Compares the per-sample merge pass BackendCavity.process_fault_history
+used to run (datetime rounding, a Python loop and a FaultCounter update
+per sample) with the NumPy version (integer microseconds, searchsorted
+and a bincount per cavity). Samples are synthetic: a status and a
+severity sample per transition, spread uniformly over the range, with a
+mix of TLCs, OK transitions and severities. Both versions must give
+identical counts and events.
+
+Usage:
+    python benchmarks/bench_fault_history.py [--samples-per-cavity N]
+"""
+
+import argparse
+import random
+import statistics
+from collections import defaultdict
+from datetime import datetime, timedelta
+from time import perf_counter
+
+TLCS = ["SSA", "QCH", "BCS", "PZT", "CPL", "STP", "FLL", "OFF", "RFS"]
+
+
+def _time(func, repeat: int) -> float:
+    """Median wall time of func() in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return statistics.median(samples)
+
+
+class Samples:
+    """The values/timestamps pair of an ArchiveDataHandler."""
+
+    def __init__(self, pairs):
+        self.values = [value for value, _ in pairs]
+        self.timestamps = [ts for _, ts in pairs]
+
+
+def _merge_pass(cavity, statuses, severities):
+    """The previous per-sample implementation, for reference."""
+    from sc_linac_physics.displays.cavity_display.backend.fault import (
+        FaultCounter,
+        FaultEventLog,
+        SeverityLevel,
+    )
+
+    result = defaultdict(FaultCounter)
+    event_timestamps, event_statuses, event_severities = [], [], []
+    severity_values = severities.values
+    severity_timestamps = [
+        cavity._round_to_10ms(ts) for ts in severities.timestamps
+    ]
+    severity_idx = 0
+    current_severity = None
+
+    for status, status_ts in zip(statuses.values, statuses.timestamps):
+        if status == str(cavity.number):
+            event_timestamps.append(status_ts)
+            event_statuses.append(status)
+            event_severities.append(SeverityLevel.NO_ALARM)
+            continue
+
+        ts = cavity._round_to_10ms(status_ts)
+        while (
+            severity_idx < len(severity_timestamps)
+            and (ts - severity_timestamps[severity_idx]).total_seconds() >= 0
+        ):
+            current_severity = severity_values[severity_idx]
+            severity_idx += 1
+
+        result[status].count_severity(current_severity)
+        event_timestamps.append(status_ts)
+        event_statuses.append(status)
+        event_severities.append(current_severity)
+
+    return result, FaultEventLog.from_columns(
+        event_timestamps, event_statuses, event_severities
+    )
+
+
+def _make_samples(cav_num, count, start, days, rng):
+    span = days * 86400
+    offsets = sorted(rng.uniform(0, span) for _ in range(count))
+    statuses, severities = [], []
+    for offset in offsets:
+        ts = start + timedelta(seconds=offset)
+        if rng.random() < 0.3:
+            statuses.append((str(cav_num), ts))
+            severities.append((0, ts))
+        else:
+            statuses.append((rng.choice(TLCS), ts))
+            severities.append((rng.choice([1, 2, 2, 2, 3]), ts))
+    return Samples(statuses), Samples(severities)
+
+
+def _check_same(before, after):
+    (expected_counts, expected_events), (counts, events) = before, after
+    assert set(counts) == set(expected_counts), "faulted TLCs differ"
+    assert all(
+        vars(counts[tlc]) == vars(expected_counts[tlc])
+        for tlc in expected_counts
+    ), "fault counts differ"
+    assert events == expected_events, "events differ"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cavities", type=int, default=296)
+    parser.add_argument("--samples-per-cavity", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
+        BackendCavity,
+    )
+
+    rng = random.Random(0)
+    start = datetime(2026, 1, 1)
+    cavities = []
+    for cav in range(args.cavities):
+        # process_fault_history only needs the cavity number
+        cavity = BackendCavity.__new__(BackendCavity)
+        cavity.number = cav % 8 + 1
+        cavities.append(
+            (
+                cavity,
+                *_make_samples(
+                    cavity.number,
+                    args.samples_per_cavity,
+                    start,
+                    args.days,
+                    rng,
+                ),
+            )
+        )
+
+    for cavity, statuses, severities in cavities:
+        _check_same(
+            _merge_pass(cavity, statuses, severities),
+            cavity.process_fault_history(statuses, severities),
+        )
+
+    def merge_pass():
+        for cavity, statuses, severities in cavities:
+            _merge_pass(cavity, statuses, severities)
+
+    def vectorized():
+        for cavity, statuses, severities in cavities:
+            cavity.process_fault_history(statuses, severities)
+
+    before = _time(merge_pass, args.repeat)
+    after = _time(vectorized, args.repeat)
+    total = args.cavities * args.samples_per_cavity
+
+    print(
+        f"{args.cavities} cavities, {total} status samples over "
+        f"{args.days} days"
+    )
+    print(
+        f"  merge pass: {before * 1000:8.1f} ms "
+        f"({before / total * 1e9:.0f} ns/sample)"
+    )
+    print(
+        f"  NumPy:      {after * 1000:8.1f} ms "
+        f"({after / total * 1e9:.0f} ns/sample)"
+    )
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark fault table parsing and BackendMachine build time.
+
+Compares re-parsing faults.csv for every cavity (the old behaviour of
+BackendCavity.create_faults) with the shared, parse-once fault table, and
+times a full lazy BackendMachine build. No PVs are connected.
+
+Usage:
+    python benchmarks/bench_fault_spec.py [--repeat N]
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+
+from sc_linac_physics.displays.cavity_display.utils import utils
+
+CAVITY_COUNT = 296
+
+
+def _time(func, repeat: int) -> float:
+    """Median wall time of func() in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return statistics.median(samples)
+
+
+def parse_per_cavity():
+    for _ in range(CAVITY_COUNT):
+        utils.parse_csv()
+
+
+def parse_once():
+    utils.fault_specs.cache_clear()
+    for _ in range(CAVITY_COUNT):
+        utils.fault_specs()
+
+
+def build_machine():
+    from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
+        BackendMachine,
+    )
+
+    BackendMachine(lazy_fault_pvs=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    before = _time(parse_per_cavity, args.repeat)
+    after = _time(parse_once, args.repeat)
+    print(f"faults.csv parsing for {CAVITY_COUNT} cavities")
+    print(f"  parse per cavity: {before * 1000:8.1f} ms")
+    print(f"  shared table:     {after * 1000:8.1f} ms")
+    print(f"  speedup:          {before / after:8.1f}x")
+
+    machine = _time(build_machine, args.repeat)
+    print(f"BackendMachine(lazy_fault_pvs=True): {machine * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark PV.get_many and PV.put_many against the simulation service.
+
+Reads and writes N cavity PVs (ACON, PDES, GDES and SEL_ASET across the
+machine) two ways:
+
+- sequentially, one blocking pv.get()/pv.put(wait=True) at a time, as
+  get_many/put_many used to
+- through the pipelined PV.get_many/PV.put_many
+
+PVs are created unmonitored so that every read goes to the IOC. Start
+the simulation service first, e.g. `sc-sim` in another shell.
+
+Usage:
+    python benchmarks/bench_pv_many.py [--pvs N] [--repeat N]
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+
+SUFFIXES = ["ACON", "PDES", "GDES", "SEL_ASET"]
+
+
+def _time(func, repeat: int) -> float:
+    """Median wall time of func() in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _pv_names(count: int):
+    from sc_linac_physics.utils.sc_linac.linac_utils import (
+        L1BHL,
+        LINAC_TUPLES,
+        build_cavity_pv,
+    )
+
+    names = []
+    for suffix in SUFFIXES:
+        for linac_name, cryomodules in LINAC_TUPLES:
+            if linac_name == "L1B":
+                cryomodules = cryomodules + L1BHL
+            for cm_name in cryomodules:
+                for cavity_num in range(1, 9):
+                    names.append(
+                        build_cavity_pv(linac_name, cm_name, cavity_num, suffix)
+                    )
+                    if len(names) == count:
+                        return names
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pvs", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    args = parser.parse_args()
+
+    from sc_linac_physics.utils.epics import PV
+
+    names = _pv_names(args.pvs)
+    pvs = PV.batch_create(
+        names,
+        connection_timeout=args.timeout,
+        auto_monitor=False,
+        require_connection=True,
+    )
+    values = PV.get_many(pvs, timeout=args.timeout)
+
+    def sequential_get():
+        return [pv.get(timeout=args.timeout) for pv in pvs]
+
+    def pipelined_get():
+        return PV.get_many(pvs, timeout=args.timeout)
+
+    def sequential_put():
+        for pv, value in zip(pvs, values):
+            pv.put(value, wait=True, timeout=args.timeout)
+
+    def pipelined_put():
+        return PV.put_many(pvs, values, timeout=args.timeout)
+
+    assert pipelined_get() == sequential_get(), "pipelined get differs"
+
+    rows = [
+        (
+            "get",
+            _time(sequential_get, args.repeat),
+            _time(pipelined_get, args.repeat),
+        ),
+        (
+            "put",
+            _time(sequential_put, args.repeat),
+            _time(pipelined_put, args.repeat),
+        ),
+    ]
+
+    print(f"{len(pvs)} PVs, median of {args.repeat} runs")
+    for operation, before, after in rows:
+        print(f"  {operation} sequential: {before * 1000:8.1f} ms")
+        print(f"  {operation} pipelined:  {after * 1000:8.1f} ms")
+        print(f"  {operation} speedup:    {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import os
 from datetime import datetime
 from os.path import isfile
-from time import sleep
+from time import monotonic, sleep
 from typing import Dict, Optional
 
 import numpy as np
@@ -13,6 +13,7 @@ from sc_linac_physics.applications.q0.calibration import Calibration
 from sc_linac_physics.applications.q0.q0_utils import round_for_printing
 from sc_linac_physics.applications.q0.rf_measurement import Q0Measurement
 from sc_linac_physics.applications.q0.rf_run import RFRun
+from sc_linac_physics.utils.epics import wait_until
 from sc_linac_physics.utils.sc_linac.cryomodule import Cryomodule
 
 
@@ -297,13 +298,34 @@ class Q0Cryomodule(Cryomodule):
 
     def wait_for_ll_drop(self, target_ll_diff):
         starting_level = self.averaged_liquid_level
-        avg_level = starting_level
-        while (starting_level - avg_level) < target_ll_diff:
+        print(
+            f"Waiting for level to drop {target_ll_diff} from"
+            f" {round_for_printing(starting_level)}"
+        )
+        last_print = monotonic()
+
+        def dropped(_):
+            return (
+                starting_level - self.averaged_liquid_level
+            ) >= target_ll_diff
+
+        # Runs on every level update, so only report progress every 10s
+        def check_abort():
+            nonlocal last_print
             self.check_abort()
-            avg_level_rounded = round_for_printing(self.averaged_liquid_level)
-            print(f"Averaged level is {avg_level_rounded}; waiting 10s")
-            avg_level = self.averaged_liquid_level
-            sleep(10)
+            if monotonic() - last_print >= 10:
+                last_print = monotonic()
+                avg_level_rounded = round_for_printing(
+                    self.averaged_liquid_level
+                )
+                print(f"Averaged level is {avg_level_rounded}; waiting")
+
+        wait_until(
+            self.ds_level_pv_obj,
+            dropped,
+            abort_check=check_abort,
+            poll_interval=10,
+        )
 
     def fill_pressure_buffer(self, value, **kwargs):
         if self.q0_measurement:
@@ -14,7 +14,13 @@ from sc_linac_physics.applications.quench_processing.quench_utils import (
     RADIATION_LIMIT,
     QUENCH_LOG_DIR,
 )
-from sc_linac_physics.utils.epics import PV, EPICS_INVALID_VAL
+from sc_linac_physics.utils.epics import (
+    PV,
+    EPICS_INVALID_VAL,
+    PVInvalidError,
+    PVWaitTimeoutError,
+    wait_until,
+)
 from sc_linac_physics.utils.logger import custom_logger
 from sc_linac_physics.utils.sc_linac.cavity import Cavity
 from sc_linac_physics.utils.sc_linac.decarad import Decarad
@@ -140,6 +146,16 @@ class QuenchCavity(Cavity):
                 return
         time.sleep(seconds - int(seconds))
 
+    def _latch_quenched(self, latch) -> bool:
+        """Whether a quench latch value just read means a quench.
+
+        The severity comes with the same read, so an invalid latch raises
+        without going back to the network.
+        """
+        if self.quench_latch_invalid:
+            raise PVInvalidError(f"{self} quench latch PV invalid")
+        return latch == 1
+
     def wait_for_quench(
         self, time_to_wait=MAX_WAIT_TIME_FOR_QUENCH
     ) -> Optional[float]:
@@ -159,18 +175,21 @@ class QuenchCavity(Cavity):
 
         self.logger.debug(f"Waiting up to {time_to_wait}s for quench")
 
-        while (
-            not self.is_quenched
-            and (datetime.datetime.now() - time_start).total_seconds()
-            < time_to_wait
-        ):
-            self.check_abort()
-            time.sleep(1)
+        try:
+            wait_until(
+                self.quench_latch_pv_obj,
+                self._latch_quenched,
+                timeout=time_to_wait,
+                abort_check=self.check_abort,
+            )
+            quenched = True
+        except PVWaitTimeoutError:
+            quenched = False
 
         time_done = datetime.datetime.now()
         elapsed = (time_done - time_start).total_seconds()
 
-        if self.is_quenched:
+        if quenched:
             self.logger.info(f"Quenched after {elapsed:.1f}s")
         else:
             self.logger.debug(f"No quench after {elapsed:.1f}s")
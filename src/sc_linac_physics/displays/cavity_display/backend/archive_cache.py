@@ -0,0 +1,492 @@
+"""
+Persistent on-disk cache for archiver history.
+
+Archived samples of each PV are stored per fixed-width time chunk (one day
+by default) in a small columnar .npz file: epoch-ns timestamps, values,
+and the EPICS severity/status of each sample. A query reads the chunks it
+covers from disk, fetches only the missing ones from the archiver (one
+request per contiguous run of missing chunks), and always fetches the live
+tail: chunks that ended less than SETTLE_SEC ago are never cached because
+the archiver may still be ingesting them.
+
+Each chunk also keeps the last sample before it starts, so a query returns
+the same leading "last known value" sample a direct archiver request does.
+
+Files are evicted least recently used first once the cache grows past its
+size limit.
+"""
+
+import dataclasses
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from time import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+import numpy as np
+from lcls_tools.common.data.archiver import (
+    ArchiveDataHandler,
+    ArchiverValue,
+    get_values_over_time_range,
+)
+
+from sc_linac_physics.displays.cavity_display.utils.utils import (
+    cavity_fault_logger,
+)
+from sc_linac_physics.utils.platform_paths import get_cache_dir
+
+CHUNK_SEC = 24 * 60 * 60
+# Chunks ending more recently than this are fetched live, never cached
+SETTLE_SEC = 60 * 60
+ARCHIVE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Set to a directory to move the cache, or to an empty string to disable it
+ARCHIVE_CACHE_ENV = "SC_LINAC_ARCHIVE_CACHE_DIR"
+
+NS_PER_SEC = 1_000_000_000
+# Stands in for a None severity/status in the int16 columns
+_MISSING = -1
+
+Fetch = Callable[..., Dict[str, ArchiveDataHandler]]
+
+
+@dataclasses.dataclass
+class _Samples:
+    """Archived samples of one PV, in time order."""
+
+    ts_ns: np.ndarray
+    values: List[Any]
+    severities: List[Optional[int]]
+    statuses: List[Optional[int]]
+
+    @classmethod
+    def empty(cls) -> "_Samples":
+        return cls(np.empty(0, dtype=np.int64), [], [], [])
+
+    @classmethod
+    def from_handler(cls, handler: ArchiveDataHandler) -> "_Samples":
+        value_list = handler.value_list
+        return cls(
+            ts_ns=np.array(
+                [v.secs * NS_PER_SEC + (v.nanos or 0) for v in value_list],
+                dtype=np.int64,
+            ),
+            values=[v.val for v in value_list],
+            severities=[v.severity for v in value_list],
+            statuses=[v.status for v in value_list],
+        )
+
+    def slice(self, lo: int, hi: int) -> "_Samples":
+        return _Samples(
+            self.ts_ns[lo:hi],
+            self.values[lo:hi],
+            self.severities[lo:hi],
+            self.statuses[lo:hi],
+        )
+
+    def chunk(self, start_ns: int, end_ns: int) -> "_Samples":
+        """Samples in [start_ns, end_ns) plus the last one before it."""
+        lo, hi = np.searchsorted(self.ts_ns, [start_ns, end_ns], side="left")
+        return self.slice(max(int(lo) - 1, 0), int(hi))
+
+    @staticmethod
+    def concat(parts: Sequence["_Samples"]) -> "_Samples":
+        if not parts:
+            return _Samples.empty()
+        return _Samples(
+            np.concatenate([part.ts_ns for part in parts]),
+            [value for part in parts for value in part.values],
+            [severity for part in parts for severity in part.severities],
+            [status for part in parts for status in part.statuses],
+        )
+
+    def to_handler(self) -> ArchiveDataHandler:
+        secs, nanos = np.divmod(self.ts_ns, NS_PER_SEC)
+        return ArchiveDataHandler(
+            [
+                ArchiverValue(
+                    secs=sec,
+                    nanos=nano,
+                    val=value,
+                    severity=severity,
+                    status=status,
+                )
+                for sec, nano, value, severity, status in zip(
+                    secs.tolist(),
+                    nanos.tolist(),
+                    self.values,
+                    self.severities,
+                    self.statuses,
+                )
+            ]
+        )
+
+
+def _encode_values(values: List[Any]) -> Optional[np.ndarray]:
+    """Values as a flat array, or None if they don't fit one dtype."""
+    kinds = set(map(type, values))
+    if kinds <= {str}:
+        return np.array(values, dtype=str)
+    if kinds <= {int}:
+        return np.array(values, dtype=np.int64)
+    if kinds <= {int, float}:
+        return np.array(values, dtype=np.float64)
+    return None
+
+
+def _encode_codes(codes: List[Optional[int]]) -> Optional[np.ndarray]:
+    if not all(code is None or type(code) is int for code in codes):
+        return None
+    return np.array(
+        [_MISSING if code is None else code for code in codes], dtype=np.int16
+    )
+
+
+def _decode_codes(codes: np.ndarray) -> List[Optional[int]]:
+    return [None if code == _MISSING else code for code in codes.tolist()]
+
+
+class ArchiveCache:
+    """Time-chunked, size-limited on-disk cache of archiver samples.
+
+    Attributes:
+        cache_dir: Where chunk files are kept (one directory per PV)
+        max_bytes: Total chunk file size above which files are evicted
+        chunk_sec: Width of a cached chunk
+        settle_sec: Age a chunk's end must reach before it is cached
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = ARCHIVE_CACHE_MAX_BYTES,
+        chunk_sec: int = CHUNK_SEC,
+        settle_sec: float = SETTLE_SEC,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.chunk_sec = chunk_sec
+        self.settle_sec = settle_sec
+
+        self._lock = threading.Lock()
+        # Chunk file -> size, least recently used first (built lazily)
+        self._usage: Optional[OrderedDict[Path, int]] = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_values_over_time_range(
+        self,
+        pv_list: List[str],
+        start_time: datetime,
+        end_time: datetime,
+        fetch: Fetch = get_values_over_time_range,
+    ) -> Dict[str, ArchiveDataHandler]:
+        """Drop-in for archiver.get_values_over_time_range, from the cache.
+
+        Args:
+            pv_list: PVs to return samples for
+            start_time: Range start (naive local time, as for the archiver)
+            end_time: Range end
+            fetch: Archiver query used for whatever is not cached
+
+        Returns:
+            ArchiveDataHandler per PV: the samples in range, preceded by
+            the last sample before start_time if there is one
+        """
+        start_ns = int(start_time.timestamp() * NS_PER_SEC)
+        end_ns = int(end_time.timestamp() * NS_PER_SEC)
+        chunk = self.chunk_sec
+        first_chunk = int(start_time.timestamp()) // chunk
+        last_chunk = int(end_time.timestamp()) // chunk
+        settled_chunk = int(time() - self.settle_sec) // chunk
+        # Chunks from tail_chunk on are still being archived
+        tail_chunk = max(min(settled_chunk, last_chunk + 1), first_chunk)
+        cached_range = range(first_chunk, tail_chunk)
+
+        chunks: Dict[str, Dict[int, _Samples]] = {
+            pv: self._read_chunks(pv, cached_range) for pv in pv_list
+        }
+        self._fetch_missing(chunks, first_chunk, tail_chunk, fetch)
+
+        parts: Dict[str, List[Tuple[int, _Samples]]] = {
+            pv: [(i * chunk * NS_PER_SEC, chunks[pv][i]) for i in cached_range]
+            for pv in pv_list
+        }
+        if tail_chunk <= last_chunk:
+            tail_start = max(
+                start_time, datetime.fromtimestamp(tail_chunk * chunk)
+            )
+            tail_start_ns = int(tail_start.timestamp() * NS_PER_SEC)
+            fetched = fetch(
+                pv_list=pv_list, start_time=tail_start, end_time=end_time
+            )
+            for pv in pv_list:
+                samples = _Samples.from_handler(fetched[pv])
+                parts[pv].append((tail_start_ns, samples))
+
+        return {
+            pv: _assemble(parts[pv], start_ns, end_ns).to_handler()
+            for pv in pv_list
+        }
+
+    def _fetch_missing(
+        self,
+        chunks: Dict[str, Dict[int, _Samples]],
+        first_chunk: int,
+        tail_chunk: int,
+        fetch: Fetch,
+    ) -> None:
+        """Fetch missing chunk runs, one request per run for all PVs."""
+        groups: Dict[Tuple[Tuple[int, int], ...], List[str]] = {}
+        for pv, cached in chunks.items():
+            runs = _missing_runs(cached, first_chunk, tail_chunk)
+            if runs:
+                groups.setdefault(tuple(runs), []).append(pv)
+
+        for runs, pvs in groups.items():
+            for run_first, run_end in runs:
+                fetched = fetch(
+                    pv_list=pvs,
+                    start_time=datetime.fromtimestamp(
+                        run_first * self.chunk_sec
+                    ),
+                    end_time=datetime.fromtimestamp(run_end * self.chunk_sec),
+                )
+                for pv in pvs:
+                    samples = _Samples.from_handler(fetched[pv])
+                    for i in range(run_first, run_end):
+                        chunks[pv][i] = samples.chunk(
+                            i * self.chunk_sec * NS_PER_SEC,
+                            (i + 1) * self.chunk_sec * NS_PER_SEC,
+                        )
+                        self._write_chunk(pv, i, chunks[pv][i])
+
+    def _chunk_path(self, pv: str, index: int) -> Path:
+        start = index * self.chunk_sec
+        return (
+            self.cache_dir
+            / quote(pv, safe="")
+            / f"{start}+{self.chunk_sec}.npz"
+        )
+
+    def _read_chunks(self, pv: str, indices: range) -> Dict[int, _Samples]:
+        chunks = {}
+        for index in indices:
+            samples = self._read_chunk(self._chunk_path(pv, index))
+            if samples is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                chunks[index] = samples
+        return chunks
+
+    def _read_chunk(self, path: Path) -> Optional[_Samples]:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                samples = _Samples(
+                    ts_ns=data["ts_ns"],
+                    values=data["values"].tolist(),
+                    severities=_decode_codes(data["severities"]),
+                    statuses=_decode_codes(data["statuses"]),
+                )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            cavity_fault_logger.warning(
+                f"Discarding unreadable archive cache file {path}: {e}"
+            )
+            self._discard(path)
+            return None
+
+        self._touch(path)
+        return samples
+
+    def _write_chunk(self, pv: str, index: int, samples: _Samples) -> None:
+        """Store a settled chunk (skipped if its values aren't columnar)."""
+        values = _encode_values(samples.values)
+        severities = _encode_codes(samples.severities)
+        statuses = _encode_codes(samples.statuses)
+        if values is None or severities is None or statuses is None:
+            return
+
+        path = self._chunk_path(pv, index)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    ts_ns=samples.ts_ns,
+                    values=values,
+                    severities=severities,
+                    statuses=statuses,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            cavity_fault_logger.warning(
+                f"Could not write archive cache file {path}: {e}"
+            )
+            return
+
+        self._record(path, path.stat().st_size)
+
+    def _load_usage(self) -> OrderedDict:
+        """Scan the cache directory once, oldest files first."""
+        if self._usage is None:
+            files = []
+            if self.cache_dir.is_dir():
+                for path in self.cache_dir.glob("*/*.npz"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, path, stat.st_size))
+            files.sort()
+            self._usage = OrderedDict((path, size) for _, path, size in files)
+            self._total_bytes = sum(self._usage.values())
+        return self._usage
+
+    def _touch(self, path: Path) -> None:
+        """Mark a chunk file as just used (also on disk, for other runs)."""
+        with self._lock:
+            usage = self._load_usage()
+            if path in usage:
+                usage.move_to_end(path)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _record(self, path: Path, size: int) -> None:
+        with self._lock:
+            usage = self._load_usage()
+            self._total_bytes += size - usage.pop(path, 0)
+            usage[path] = size
+            while self._total_bytes > self.max_bytes and len(usage) > 1:
+                oldest, oldest_size = usage.popitem(last=False)
+                self._total_bytes -= oldest_size
+                try:
+                    oldest.unlink()
+                except OSError:
+                    pass
+
+    def _discard(self, path: Path) -> None:
+        with self._lock:
+            usage = self._load_usage()
+            self._total_bytes -= usage.pop(path, 0)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached chunk files."""
+        with self._lock:
+            self._load_usage()
+            return self._total_bytes
+
+    def clear(self) -> None:
+        """Delete every cached chunk."""
+        with self._lock:
+            usage = self._load_usage()
+            for path in usage:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            usage.clear()
+            self._total_bytes = 0
+
+
+def _assemble(
+    parts: List[Tuple[int, _Samples]], start_ns: int, end_ns: int
+) -> _Samples:
+    """Join consecutive parts and cut them to [start_ns, end_ns].
+
+    Each part is (part start, samples) and may open with the last sample
+    before its start; only the first part needs that sample, and the
+    result keeps the last sample before start_ns like the archiver does.
+    """
+    trimmed = []
+    for i, (part_start_ns, samples) in enumerate(parts):
+        if i:
+            lo = int(np.searchsorted(samples.ts_ns, part_start_ns, side="left"))
+            samples = samples.slice(lo, len(samples.values))
+        trimmed.append(samples)
+    samples = _Samples.concat(trimmed)
+
+    lo = int(np.searchsorted(samples.ts_ns, start_ns, side="left"))
+    hi = int(np.searchsorted(samples.ts_ns, end_ns, side="right"))
+    return samples.slice(max(lo - 1, 0), hi)
+
+
+def _missing_runs(
+    cached: Dict[int, _Samples], first: int, end: int
+) -> List[Tuple[int, int]]:
+    """[first, end) chunk index runs that are not in cached."""
+    runs = []
+    run_first = None
+    for index in range(first, end):
+        if index in cached:
+            if run_first is not None:
+                runs.append((run_first, index))
+                run_first = None
+        elif run_first is None:
+            run_first = index
+    if run_first is not None:
+        runs.append((run_first, end))
+    return runs
+
+
+_default_cache: Optional[ArchiveCache] = None
+_default_cache_lock = threading.Lock()
+_default_cache_set = False
+
+
+def default_archive_cache() -> Optional[ArchiveCache]:
+    """The process-wide archive cache (None if disabled).
+
+    Lives under the user cache directory unless ARCHIVE_CACHE_ENV names
+    another directory; an empty ARCHIVE_CACHE_ENV disables caching.
+    """
+    global _default_cache, _default_cache_set
+    with _default_cache_lock:
+        if not _default_cache_set:
+            location = os.environ.get(ARCHIVE_CACHE_ENV)
+            if location is None:
+                _default_cache = ArchiveCache(get_cache_dir() / "archiver")
+            elif location:
+                _default_cache = ArchiveCache(Path(location))
+            _default_cache_set = True
+        return _default_cache
+
+
+def set_default_archive_cache(cache: Optional[ArchiveCache]) -> None:
+    """Replace the process-wide archive cache (None disables caching)."""
+    global _default_cache, _default_cache_set
+    with _default_cache_lock:
+        _default_cache = cache
+        _default_cache_set = True
+
+
+def cached_values_over_time_range(
+    pv_list: List[str],
+    start_time: datetime,
+    end_time: datetime,
+    fetch: Fetch = get_values_over_time_range,
+) -> Dict[str, ArchiveDataHandler]:
+    """archiver.get_values_over_time_range through the default cache.
+
+    Goes straight to fetch when caching is disabled.
+    """
+    cache = default_archive_cache()
+    if cache is None:
+        return fetch(pv_list=pv_list, start_time=start_time, end_time=end_time)
+    return cache.get_values_over_time_range(
+        pv_list, start_time, end_time, fetch=fetch
+    )
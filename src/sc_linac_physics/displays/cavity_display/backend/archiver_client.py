@@ -0,0 +1,161 @@
+"""
+Bulk archiver retrieval over one shared HTTP session.
+
+lcls_tools' get_values_over_time_range sends one request per PV on a
+fresh connection, so fetching history for the whole machine costs
+hundreds of round trips. BulkArchiveClient asks the archiver appliance's
+getDataForPVs.json endpoint for up to chunk_size PVs per request, reuses
+keep-alive connections from a single requests.Session, and yields each
+chunk's PVs as soon as that request completes so callers can report
+progress while the rest is still in flight.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+from lcls_tools.common.data.archiver import (
+    ArchiveDataHandler,
+    ArchiverValue,
+)
+from requests.adapters import HTTPAdapter
+
+ARCHIVER_DATA_URL = "http://lcls-archapp.slac.stanford.edu/retrieval/data"
+BULK_ENDPOINT = "getDataForPVs.json"
+# PVs per request; long lists make long URLs and slow single responses
+PV_CHUNK_SIZE = 50
+BULK_TIMEOUT_SEC = 30.0
+# Requests in flight at once; keep low to avoid overloading the archiver
+BULK_MAX_WORKERS = 4
+
+
+class BulkArchiveClient:
+    """Multi-PV archiver client with connection reuse.
+
+    get_values_over_time_range has the signature of the lcls_tools
+    function, so it can be passed as the fetch of ArchiveCache.
+
+    Attributes:
+        base_url: Archiver appliance retrieval URL (.../retrieval/data)
+        chunk_size: Maximum PVs per request
+        max_workers: Maximum requests in flight (and pooled connections)
+        timeout: Per-request timeout (seconds)
+        request_count: HTTP requests sent so far
+    """
+
+    def __init__(
+        self,
+        base_url: str = ARCHIVER_DATA_URL,
+        chunk_size: int = PV_CHUNK_SIZE,
+        max_workers: int = BULK_MAX_WORKERS,
+        timeout: float = BULK_TIMEOUT_SEC,
+        session: Optional[requests.Session] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.base_url = base_url.rstrip("/")
+        self.chunk_size = chunk_size
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=self.max_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def chunks(self, pv_list: List[str]) -> List[List[str]]:
+        """Split pv_list (duplicates dropped) into request-sized chunks."""
+        pvs = list(dict.fromkeys(pv_list))
+        return [
+            pvs[i : i + self.chunk_size]
+            for i in range(0, len(pvs), self.chunk_size)
+        ]
+
+    def fetch_chunk(
+        self, pv_list: List[str], start_time: datetime, end_time: datetime
+    ) -> Dict[str, ArchiveDataHandler]:
+        """One request for all of pv_list.
+
+        PVs the archiver returns nothing for get an empty handler.
+
+        Raises:
+            requests.RequestException: On connection errors, timeouts and
+                non-2xx responses
+        """
+        params = [("pv", pv) for pv in pv_list] + [
+            ("from", start_time.astimezone().isoformat()),
+            ("to", end_time.astimezone().isoformat()),
+        ]
+        with self._count_lock:
+            self.request_count += 1
+        response = self.session.get(
+            f"{self.base_url}/{BULK_ENDPOINT}",
+            params=params,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+        result = {pv: ArchiveDataHandler([]) for pv in pv_list}
+        for entry in response.json():
+            pv = entry.get("meta", {}).get("name")
+            if pv not in result:
+                continue
+            result[pv] = ArchiveDataHandler(
+                [
+                    ArchiverValue(
+                        secs=sample["secs"],
+                        val=sample["val"],
+                        nanos=sample.get("nanos", 0),
+                        severity=sample.get("severity"),
+                        status=sample.get("status"),
+                    )
+                    for sample in entry.get("data", [])
+                ]
+            )
+        return result
+
+    def iter_values_over_time_range(
+        self, pv_list: List[str], start_time: datetime, end_time: datetime
+    ) -> Iterator[Tuple[str, ArchiveDataHandler]]:
+        """Yield (pv, data) pairs, chunk by chunk, as requests complete.
+
+        Chunks are requested concurrently; PVs of one chunk are yielded
+        together in pv_list order, chunks in completion order. A failed
+        request raises when its chunk is reached, after any chunks that
+        completed before it.
+        """
+        chunks = self.chunks(pv_list)
+        if len(chunks) == 1:
+            yield from self.fetch_chunk(chunks[0], start_time, end_time).items()
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.fetch_chunk, chunk, start_time, end_time)
+                for chunk in chunks
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield from future.result().items()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def get_values_over_time_range(
+        self, pv_list: List[str], start_time: datetime, end_time: datetime
+    ) -> Dict[str, ArchiveDataHandler]:
+        """Drop-in for archiver.get_values_over_time_range."""
+        return dict(
+            self.iter_values_over_time_range(pv_list, start_time, end_time)
+        )
+
+    def close(self) -> None:
+        self.session.close()
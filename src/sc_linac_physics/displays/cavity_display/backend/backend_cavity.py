@@ -1,5 +1,5 @@
 """
-Backend cavity fault monitoring and management with batch PV initialization.
+Backend cavity fault monitoring and management.
 """
 
 from collections import OrderedDict, defaultdict
@@ -7,25 +7,34 @@ from datetime import datetime, timedelta
 from time import time
 from typing import DefaultDict, Optional, Dict, List, Tuple
 
+import numpy as np
 from lcls_tools.common.data.archiver import (
     get_values_over_time_range,
     ArchiveDataHandler,
 )
 
+from sc_linac_physics.displays.cavity_display.backend.archive_cache import (
+    cached_values_over_time_range,
+)
 from sc_linac_physics.displays.cavity_display.backend.fault import (
     Fault,
     FaultCounter,
-    FaultEvent,
+    FaultEventLog,
     PVInvalidError,
     SeverityLevel,
+    count_by_status,
+    datetimes_to_ns,
+    encode_severity,
+    status_code,
 )
 from sc_linac_physics.displays.cavity_display.utils import utils
 from sc_linac_physics.displays.cavity_display.utils.utils import (
     STATUS_SUFFIX,
     DESCRIPTION_SUFFIX,
     SEVERITY_SUFFIX,
+    STATUS_REPUBLISH_INTERVAL_SEC,
+    FaultSpec,
     SpreadsheetError,
-    display_hash,
     cavity_fault_logger,
 )
 from sc_linac_physics.utils.epics import PV, PVBatch
@@ -57,8 +66,14 @@ class BackendCavity(Cavity):
         severity_pv: PV name for fault severity output
         description_pv: PV name for fault description output
         faults: Ordered dictionary of Fault objects keyed by unique hash
+        status_republish_interval: Seconds after which unchanged status is
+            put again anyway (None never forces, 0 puts every time)
+        status_put_count: Status PV puts issued so far
+        status_skip_count: Status PV puts skipped because nothing changed
     """
 
+    status_republish_interval: Optional[float] = STATUS_REPUBLISH_INTERVAL_SEC
+
     def __init__(self, cavity_num: int, rack_object):
         """Initialize backend cavity with fault monitoring.
 
@@ -78,106 +93,73 @@ class BackendCavity(Cavity):
         self.description_pv: str = self.pv_addr(DESCRIPTION_SUFFIX)
         self._description_pv_obj: Optional[PV] = None
 
+        # Last (severity, status, description) put, None if unknown
+        self._published_status: Optional[Tuple[int, str, str]] = None
+        self._last_full_publish = 0.0
+        self.status_put_count = 0
+        self.status_skip_count = 0
+        self.status_put_failure_count = 0
+        self.sequential_fallback_count = 0
+        # Set while bring-up status PVs are still connecting
+        self._awaiting_status_pvs = False
+
         # Fault storage
         self.faults: OrderedDict[int, Fault] = OrderedDict()
 
-        # Create fault objects (always lazy initially for speed)
+        # Fault objects never create PV objects up front; fault PVs are
+        # read in batches and status PVs are connected machine-wide by
+        # BackendMachine (see attach_status_pvs)
         fault_creation_start = time()
         self.create_faults()
         fault_creation_duration = time() - fault_creation_start
 
-        # Batch initialize PVs if not lazy mode
-        if not self.rack.cryomodule.linac.machine.lazy_fault_pvs:
-            self._batch_pv_init()
-
-        else:
-            total_duration = time() - init_start
-            cavity_fault_logger.debug(
-                "Cavity initialized (lazy mode)",
-                extra={
-                    "extra_data": {
-                        "cavity": self.pv_prefix,
-                        "num_faults": len(self.faults),
-                        "fault_creation_sec": round(fault_creation_duration, 3),
-                        "total_init_sec": round(total_duration, 3),
-                    }
-                },
-            )
-
-    def _batch_pv_init(self) -> int:
-        """Initialize only status PVs for this cavity using batch creation.
-
-        Fault PVs are read using caget_many() which doesn't require PV objects.
-
-        Returns:
-            Number of successfully connected PVs
-        """
-
-        # Only create PV objects for status PVs (needed for put operations)
-        pv_names = [
-            self.status_pv,
-            self.severity_pv,
-            self.description_pv,
-        ]
-
-        try:
-            all_pvs = PV.batch_create(
-                pv_names,
-                connection_timeout=0.5,
-                auto_monitor=False,
-                require_connection=False,
-            )
-        except Exception as e:
-            cavity_fault_logger.error(
-                f"Batch PV creation failed for {self.pv_prefix}: {e}"
-            )
-            return self._sequential_pv_init()
-
-        # Count successful connections
-        connected_count = sum(1 for pv in all_pvs if pv and pv.connected)
-
-        # Assign status PV objects
-        if all_pvs[0] and all_pvs[0].connected:
-            self._status_pv_obj = all_pvs[0]
-
-        if all_pvs[1] and all_pvs[1].connected:
-            self._severity_pv_obj = all_pvs[1]
+        cavity_fault_logger.debug(
+            "Cavity initialized",
+            extra={
+                "extra_data": {
+                    "cavity": self.pv_prefix,
+                    "num_faults": len(self.faults),
+                    "fault_creation_sec": round(fault_creation_duration, 3),
+                    "total_init_sec": round(time() - init_start, 3),
+                }
+            },
+        )
 
-        if all_pvs[2] and all_pvs[2].connected:
-            self._description_pv_obj = all_pvs[2]
+    @property
+    def status_pv_names(self) -> List[str]:
+        """Status output PV names: status, severity, description."""
+        return [self.status_pv, self.severity_pv, self.description_pv]
 
-        return connected_count
+    def attach_status_pvs(self, pvs: List[Optional[PV]]) -> int:
+        """Use status PV objects created by a machine-wide bring-up.
 
-    def _sequential_pv_init(self) -> int:
-        """Fallback: Initialize all PVs sequentially.
+        Connected PVs are attached right away. While any of them is still
+        connecting, status puts are skipped instead of blocking the cycle
+        on a dead IOC; call again once they connect.
 
-        Used if batch initialization fails.
+        Args:
+            pvs: PV objects in status_pv_names order (None if creation
+                failed, which leaves that PV to its lazy property)
 
         Returns:
-            Number of successfully connected PVs
+            Number of the given PVs that are connected
         """
-        success_count = 0
-
-        # Initialize cavity status PVs
-        try:
-            _ = self.status_pv_obj
-            success_count += 1
-        except Exception:
-            pass
-
-        try:
-            _ = self.severity_pv_obj
-            success_count += 1
-        except Exception:
-            pass
-
-        try:
-            _ = self.description_pv_obj
-            success_count += 1
-        except Exception:
-            pass
+        connected_count = 0
+        awaiting = False
+        for attr, pv in zip(
+            ("_status_pv_obj", "_severity_pv_obj", "_description_pv_obj"),
+            pvs,
+        ):
+            if pv is None:
+                continue
+            if pv.connected:
+                setattr(self, attr, pv)
+                connected_count += 1
+            else:
+                awaiting = True
 
-        return success_count
+        self._awaiting_status_pvs = awaiting
+        return connected_count
 
     @property
     def status_pv_obj(self) -> PV:
@@ -213,39 +195,38 @@ class BackendCavity(Cavity):
         return self._description_pv_obj
 
     def create_faults(self) -> None:
-        """Parse CSV fault configuration and create Fault objects.
+        """Create Fault objects from the shared fault table.
 
         All Fault objects are created with lazy_pv=True initially for speed,
         then PVs are initialized in batch if not in lazy mode.
         """
-        for csv_fault_dict in utils.parse_csv():
+        for spec in utils.fault_specs():
             try:
-                pv, macros = self._build_fault_pv(csv_fault_dict)
+                pv, macros = self._build_fault_pv(spec)
                 if pv is None:
                     continue
 
-                fault = self._create_fault_from_csv(csv_fault_dict, pv, macros)
-                key = self._generate_fault_key(csv_fault_dict)
-                self.faults[key] = fault
+                self.faults[spec.key] = self._create_fault_from_spec(
+                    spec, pv, macros
+                )
 
             except Exception as e:
                 cavity_fault_logger.error(
                     f"Error creating fault for {self.pv_prefix}: "
-                    f"{csv_fault_dict.get('Three Letter Code', 'UNKNOWN')} - {e}"
+                    f"{spec.tlc} - {e}"
                 )
 
-    def _build_fault_pv(self, csv_fault_dict: Dict[str, str]) -> tuple:
+    def _build_fault_pv(self, spec: FaultSpec) -> tuple:
         """Build the PV name and macros for a fault based on its level."""
-        level = csv_fault_dict["Level"]
-        suffix = csv_fault_dict["PV Suffix"]
-        rack = csv_fault_dict["Rack"]
-        button_command = csv_fault_dict["Button Path"]
+        level = spec.level
+        suffix = spec.pv_suffix
+        button_command = spec.button_path
         macros = self.edm_macro_string
 
         if level == FaultLevel.RACK:
-            if rack != self.rack.rack_name:
+            if spec.rack != self.rack.rack_name:
                 return None, ""
-            prefix = csv_fault_dict["PV Prefix"].format(
+            prefix = spec.pv_prefix.format(
                 LINAC=self.linac.name,
                 CRYOMODULE=self.cryomodule.name,
                 RACK=self.rack.rack_name,
@@ -254,7 +235,7 @@ class BackendCavity(Cavity):
             pv = prefix + suffix
 
         elif level == FaultLevel.CRYO:
-            prefix = csv_fault_dict["PV Prefix"].format(
+            prefix = spec.pv_prefix.format(
                 CRYOMODULE=self.cryomodule.name, CAVITY=self.number
             )
             pv = prefix + suffix
@@ -272,7 +253,7 @@ class BackendCavity(Cavity):
             pv = self.pv_addr(suffix)
 
         elif level == FaultLevel.CRYOMODULE:
-            cm_type = csv_fault_dict["CM Type"]
+            cm_type = spec.cm_type
 
             if (
                 cm_type == "1.3" and self.cryomodule.is_harmonic_linearizer
@@ -281,7 +262,7 @@ class BackendCavity(Cavity):
             ):
                 return None, ""
 
-            prefix = csv_fault_dict["PV Prefix"].format(
+            prefix = spec.pv_prefix.format(
                 LINAC=self.linac.name,
                 CRYOMODULE=self.cryomodule.name,
                 CAVITY=self.number,
@@ -289,8 +270,7 @@ class BackendCavity(Cavity):
             pv = prefix + suffix
 
         elif level == FaultLevel.ALL:
-            prefix = csv_fault_dict["PV Prefix"]
-            pv = prefix + suffix
+            pv = spec.pv_prefix + suffix
 
         else:
             raise SpreadsheetError(
@@ -299,67 +279,79 @@ class BackendCavity(Cavity):
 
         return pv, macros
 
-    def _create_fault_from_csv(
-        self, csv_fault_dict: Dict[str, str], pv: str, macros: str
+    def _create_fault_from_spec(
+        self, spec: FaultSpec, pv: str, macros: str
     ) -> Fault:
-        """Create a Fault object from CSV data."""
+        """Create a Fault object from a fault table entry."""
         return Fault(
-            tlc=csv_fault_dict["Three Letter Code"],
-            severity=csv_fault_dict["Severity"],
+            tlc=spec.tlc,
+            severity=spec.severity,
             pv=pv,
-            ok_value=csv_fault_dict["OK If Equal To"],
-            fault_value=csv_fault_dict["Faulted If Equal To"],
-            long_description=csv_fault_dict["Long Description"],
-            short_description=csv_fault_dict["Short Description"],
-            button_level=csv_fault_dict["Button Type"],
-            button_command=csv_fault_dict["Button Path"],
+            ok_value=spec.ok_value,
+            fault_value=spec.fault_value,
+            long_description=spec.long_description,
+            short_description=spec.short_description,
+            button_level=spec.button_type,
+            button_command=spec.button_path,
             macros=macros,
-            button_text=csv_fault_dict["Three Letter Code"],
-            button_macro=csv_fault_dict["Button Macros"],
-            action=csv_fault_dict["Recommended Corrective Actions"],
+            button_text=spec.tlc,
+            button_macro=spec.button_macros,
+            action=spec.action,
             lazy_pv=True,
             connection_timeout=0.1,  # Short timeout since we pre-connect
         )
 
-    def _generate_fault_key(self, csv_fault_dict: Dict[str, str]) -> int:
-        """Generate unique hash key for a fault."""
-        return display_hash(
-            rack=csv_fault_dict["Rack"],
-            fault_condition=csv_fault_dict["Faulted If Equal To"],
-            ok_condition=csv_fault_dict["OK If Equal To"],
-            tlc=csv_fault_dict["Three Letter Code"],
-            suffix=csv_fault_dict["PV Suffix"],
-            prefix=csv_fault_dict["PV Prefix"],
-        )
-
     def get_fault_counts(
-        self, start_time: datetime, end_time: datetime
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        raise_on_error: bool = False,
     ) -> DefaultDict[str, FaultCounter]:
         """Fault counts by TLC over a time range; see get_fault_history."""
-        counts, _ = self.get_fault_history(start_time, end_time)
+        counts, _ = self.get_fault_history(
+            start_time, end_time, raise_on_error=raise_on_error
+        )
         return counts
 
+    @property
+    def fault_history_pvs(self) -> List[str]:
+        """Archived (status, severity) PVs that get_fault_history reads."""
+        return [self.pv_addr("CUDSTATUS"), self.pv_addr("CUDSEVR")]
+
     def get_fault_history(
-        self, start_time: datetime, end_time: datetime
-    ) -> Tuple[DefaultDict[str, FaultCounter], List[FaultEvent]]:
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        raise_on_error: bool = False,
+    ) -> Tuple[DefaultDict[str, FaultCounter], FaultEventLog]:
         """Fetch this cavity's fault history from the archiver.
 
-        Returns (counts by TLC, chronological FaultEvents); both are
-        empty if the archiver query fails. Callers fetching many
+        Settled history comes from the on-disk archive cache (see
+        archive_cache) when it is enabled; only uncached chunks and the
+        live tail are requested from the archiver.
+
+        Returns (counts by TLC, chronological FaultEventLog); both are
+        empty if the archiver query fails, unless raise_on_error is set,
+        in which case the error propagates so callers can tell an outage
+        from a fault-free range. Callers fetching many
         cavities should batch the query themselves and use
         process_fault_history().
         """
+        pv_list = self.fault_history_pvs
         try:
-            data: Dict[str, ArchiveDataHandler] = get_values_over_time_range(
-                pv_list=[self.pv_addr("CUDSTATUS"), self.pv_addr("CUDSEVR")],
-                start_time=start_time,
-                end_time=end_time,
+            data: Dict[str, ArchiveDataHandler] = cached_values_over_time_range(
+                pv_list,
+                start_time,
+                end_time,
+                fetch=get_values_over_time_range,
             )
         except Exception as e:
             cavity_fault_logger.error(
                 f"Error retrieving archiver data for {self.pv_prefix}: {e}"
             )
-            return defaultdict(FaultCounter), []
+            if raise_on_error:
+                raise
+            return defaultdict(FaultCounter), FaultEventLog()
 
         return self.process_fault_history(
             statuses=data[self.pv_addr("CUDSTATUS")],
@@ -370,48 +362,69 @@ class BackendCavity(Cavity):
         self,
         statuses: ArchiveDataHandler,
         severities: ArchiveDataHandler,
-    ) -> Tuple[DefaultDict[str, FaultCounter], List[FaultEvent]]:
+    ) -> Tuple[DefaultDict[str, FaultCounter], FaultEventLog]:
         """Aggregate archived status/severity samples into counts and events.
 
+        Each status picks up the last severity at or before it, comparing
+        timestamps rounded to 10ms (see _round_to_10ms); a status before
+        any severity gets None. Both sample lists are chronological, so
+        this is one searchsorted over integer microseconds rather than a
+        per-sample merge loop.
+
         Note the archiver includes one sample from before the requested
         start (the last known value), so the first event can predate the
         range. That sample is the only trace of a fault that was already
         standing when the range began.
         """
-        result: DefaultDict[str, FaultCounter] = defaultdict(FaultCounter)
-        fault_events: List[FaultEvent] = []
-
-        # Both lists are chronological, so one merge pass finds the
-        # severity in effect at each status (rescanning gets slow fast)
-        severity_values = severities.values
-        severity_timestamps = [
-            self._round_to_10ms(ts) for ts in severities.timestamps
-        ]
-        severity_idx = 0
-        current_severity = None
-
-        for status, status_ts in zip(statuses.values, statuses.timestamps):
-            # The cavity number as status means OK; keep the event so
-            # it's clear when a fault ended
-            if status == str(self.number):
-                fault_events.append(
-                    FaultEvent(status_ts, status, SeverityLevel.NO_ALARM)
-                )
-                continue
+        status_timestamps = statuses.timestamps
+        count = min(len(statuses.values), len(status_timestamps))
+        status_us = datetimes_to_ns(status_timestamps[:count]) // 1000
+        codes = self._encode_each(
+            statuses.values[:count], status_code, np.int16
+        )
+        # The cavity number as status means OK; those events are kept
+        # so it's clear when a fault ended, but never counted
+        fault_idx = np.flatnonzero(codes != status_code(str(self.number)))
+
+        # Rounding can carry a sample past its successor; the running
+        # maximum keeps both sides in the order a merge pass would see
+        severity_us = np.maximum.accumulate(
+            self._round_to_10ms_us(
+                datetimes_to_ns(severities.timestamps) // 1000
+            )
+        )
+        in_effect = np.searchsorted(
+            severity_us,
+            np.maximum.accumulate(self._round_to_10ms_us(status_us[fault_idx])),
+            side="right",
+        )
+        # Slot 0 stands for "no severity yet"
+        severity_lookup = self._encode_each(
+            [None, *severities.values], encode_severity, np.int8
+        )
 
-            ts = self._round_to_10ms(status_ts)
-            while (
-                severity_idx < len(severity_timestamps)
-                and (ts - severity_timestamps[severity_idx]).total_seconds()
-                >= 0
-            ):
-                current_severity = severity_values[severity_idx]
-                severity_idx += 1
+        event_severities = np.full(count, SeverityLevel.NO_ALARM, np.int8)
+        event_severities[fault_idx] = severity_lookup[in_effect]
 
-            result[status].count_severity(current_severity)
-            fault_events.append(FaultEvent(status_ts, status, current_severity))
+        result: DefaultDict[str, FaultCounter] = defaultdict(
+            FaultCounter,
+            count_by_status(codes[fault_idx], event_severities[fault_idx]),
+        )
+        events = FaultEventLog(
+            status_us * 1000,
+            codes,
+            event_severities,
+            tz=status_timestamps[0].tzinfo if count else None,
+        )
+        return result, events
 
-        return result, fault_events
+    @staticmethod
+    def _encode_each(values: List, encode, dtype) -> np.ndarray:
+        """encode() every value, calling it once per distinct value."""
+        encoded = {value: encode(value) for value in set(values)}
+        return np.fromiter(
+            map(encoded.__getitem__, values), dtype=dtype, count=len(values)
+        )
 
     @staticmethod
     def _round_to_10ms(ts: datetime) -> datetime:
@@ -422,6 +435,25 @@ class BackendCavity(Cavity):
             # Rounding carried past the end of the second
             return ts + timedelta(seconds=1)
 
+    @staticmethod
+    def _round_to_10ms_us(us: np.ndarray) -> np.ndarray:
+        """_round_to_10ms on integer microseconds, exactly.
+
+        round() sends ties to even, and a carry past the end of the
+        second adds a whole second to the unrounded time, as there.
+        """
+        micros = us % 1_000_000
+        tens, rest = np.divmod(micros, 10_000)
+        tens = tens + ((rest > 5_000) | ((rest == 5_000) & (tens % 2 == 1)))
+        return np.where(
+            tens == 100, us + 1_000_000, us - micros + tens * 10_000
+        )
+
+    @property
+    def fault_pvs(self) -> List[str]:
+        """Fault input PV names, in fault priority order."""
+        return [fault.pv for fault in self.faults.values()]
+
     def run_through_faults(self) -> None:
         """Check all faults and update cavity status PVs (optimized batch version).
 
@@ -430,38 +462,15 @@ class BackendCavity(Cavity):
         Falls back to sequential checking if batch read fails.
         """
 
-        is_okay = True
-        invalid = False
-        faulted_fault: Optional[Fault] = None
-
-        # Get list of all faults
-        fault_list = list(self.faults.values())
-
         # Early exit if no faults configured
-        if not fault_list:
+        if not self.faults:
             self._update_status_pvs(is_okay=True, invalid=False, fault=None)
             return
 
-        # Collect PV names for batch read
-        pv_names = [fault.pv for fault in fault_list]
-
         try:
             # Batch read all fault PVs at once using our wrapper
-            values = PVBatch.get_values(pv_names, timeout=0.5)
-
-            # Check each fault with its pre-fetched value
-            for fault, value in zip(fault_list, values):
-                try:
-                    if fault.is_currently_faulted_with_value(value):
-                        is_okay = False
-                        faulted_fault = fault
-                        break  # Stop at first fault (maintains existing behavior)
-                except PVInvalidError:
-                    # PV is disconnected or returned None
-                    is_okay = False
-                    invalid = True
-                    faulted_fault = fault
-                    break
+            values = PVBatch.get_values(self.fault_pvs, timeout=0.5)
+            is_okay, invalid, faulted_fault = self._first_fault(values)
 
         except Exception as e:
             # If batch read fails entirely, fall back to sequential method
@@ -469,10 +478,57 @@ class BackendCavity(Cavity):
                 f"Batch fault check failed for {self.pv_prefix}, "
                 f"falling back to sequential: {e}"
             )
+            self.sequential_fallback_count += 1
             return self._run_through_faults_sequential()
 
         self._update_status_pvs(is_okay, invalid, faulted_fault)
 
+    def run_through_faults_with_values(self, values: List) -> None:
+        """Update cavity status PVs from already-known fault PV values.
+
+        Used by the monitor-driven Runner, which keeps the latest value of
+        every fault PV in memory instead of reading them each cycle.
+
+        Args:
+            values: One value per fault, in fault_pvs order (None for
+                disconnected PVs)
+        """
+        self._update_status_pvs(*self._first_fault(values))
+
+    def report_fault(
+        self, fault: Optional[Fault], invalid: bool = False
+    ) -> None:
+        """Update cavity status PVs from an already-evaluated fault state.
+
+        Used with FaultPVIndex.first_faults, which evaluates the whole
+        machine at once.
+
+        Args:
+            fault: The highest-priority active fault, or None if the
+                cavity is OK
+            invalid: True if that fault's PV was invalid/disconnected
+        """
+        self._update_status_pvs(fault is None, invalid, fault)
+
+    def _first_fault(self, values: List) -> Tuple[bool, bool, Optional[Fault]]:
+        """Find the first faulted fault given pre-fetched values.
+
+        Faults are checked in priority order and the first match wins;
+        a None value (disconnected PV) counts as an invalid fault.
+
+        Returns:
+            (is_okay, invalid, fault) as taken by _update_status_pvs
+        """
+        for fault, value in zip(self.faults.values(), values):
+            try:
+                if fault.is_currently_faulted_with_value(value):
+                    return False, False, fault
+            except PVInvalidError:
+                # PV is disconnected or returned None
+                return False, True, fault
+
+        return True, False, None
+
     def _run_through_faults_sequential(self) -> None:
         """Fallback sequential fault checking (original implementation).
 
@@ -502,28 +558,74 @@ class BackendCavity(Cavity):
     ) -> None:
         """Update cavity status PVs based on fault state.
 
+        Only values that differ from the last successful publish are put,
+        unless status_republish_interval has passed since everything was
+        last put.
+
         Args:
             is_okay: True if no faults detected
             invalid: True if a PV was invalid/disconnected
             fault: The Fault object that triggered (if any)
         """
-        try:
-            if is_okay:
-                self.severity_pv_obj.put(SeverityLevel.NO_ALARM)
-                self.status_pv_obj.put(str(self.number))
-                self.description_pv_obj.put(" ")
-            else:
-                if invalid:
-                    self.severity_pv_obj.put(SeverityLevel.INVALID)
-                else:
-                    self.severity_pv_obj.put(fault.severity)
+        if self._awaiting_status_pvs:
+            return
+
+        if is_okay:
+            status = (SeverityLevel.NO_ALARM, str(self.number), " ")
+        elif invalid:
+            status = (SeverityLevel.INVALID, fault.tlc, fault.short_description)
+        else:
+            status = (fault.severity, fault.tlc, fault.short_description)
 
-                self.status_pv_obj.put(fault.tlc)
-                self.description_pv_obj.put(fault.short_description)
+        now = time()
+        interval = self.status_republish_interval
+        force = self._published_status is None or (
+            interval is not None and now - self._last_full_publish >= interval
+        )
+        previous = (None, None, None) if force else self._published_status
+
+        try:
+            for attr, value, old_value in zip(
+                ("severity_pv_obj", "status_pv_obj", "description_pv_obj"),
+                status,
+                previous,
+            ):
+                if not force and value == old_value:
+                    self.status_skip_count += 1
+                    continue
+                getattr(self, attr).put(value)
+                self.status_put_count += 1
         except Exception as e:
+            # Some puts may not have landed; put everything next time
+            self._published_status = None
+            self.status_put_failure_count += 1
             cavity_fault_logger.error(
                 f"Error updating status PVs for {self.pv_prefix}: {e}"
             )
+            return
+
+        self._published_status = status
+        if force:
+            self._last_full_publish = now
+
+    def status_republish_due(self, now: float) -> bool:
+        """Whether status PVs should be put again though nothing changed.
+
+        The monitor-driven Runner only re-evaluates cavities whose inputs
+        changed, so it asks the quiet ones this to still heal a restarted
+        status IOC or a failed put.
+
+        Args:
+            now: Current time()
+        """
+        if self._awaiting_status_pvs:
+            return False
+        if self._published_status is None:
+            return True
+        interval = self.status_republish_interval
+        return (
+            interval is not None and now - self._last_full_publish >= interval
+        )
 
     def get_active_faults(self) -> List[Fault]:
         """Get list of all currently active faults.
@@ -1,10 +1,215 @@
+"""
+Backend machine with machine-wide Channel Access bring-up.
+
+When fault PVs are not lazy, every channel the fault runner needs (status
+outputs and fault inputs for all cavities) is created first and then
+waited on together against a single deadline, so a cold start costs
+roughly one connection round trip instead of one timeout per cavity.
+Status PVs that miss the deadline are attached in the background as
+they connect.
+"""
+
+import dataclasses
+import threading
+from time import time
+from typing import List, Optional, Tuple
+
 from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
     BackendCavity,
 )
+from sc_linac_physics.displays.cavity_display.utils.utils import (
+    cavity_fault_logger,
+)
+from sc_linac_physics.utils.epics import PV, PVBatch
 from sc_linac_physics.utils.sc_linac.linac import Machine
 
+CONNECTION_TIMEOUT_SEC = 5.0
+STRAGGLER_RETRY_INTERVAL_SEC = 10.0
+
+
+@dataclasses.dataclass
+class ConnectionReport:
+    """Outcome of the machine-wide connection bring-up.
+
+    Attributes:
+        status_connected: Status output PVs connected by the deadline
+        status_unconnected: Status output PVs still connecting
+        fault_connected: Distinct fault input PVs connected by the deadline
+        fault_unconnected: Distinct fault input PVs still connecting
+        duration_sec: Wall time of the bring-up
+    """
+
+    status_connected: int = 0
+    status_unconnected: int = 0
+    fault_connected: int = 0
+    fault_unconnected: int = 0
+    duration_sec: float = 0.0
+
+    @property
+    def connected_count(self) -> int:
+        return self.status_connected + self.fault_connected
+
+    @property
+    def unconnected_count(self) -> int:
+        return self.status_unconnected + self.fault_unconnected
+
 
 class BackendMachine(Machine):
-    def __init__(self, lazy_fault_pvs=True):
+    """Machine of BackendCavity objects.
+
+    Attributes:
+        lazy_fault_pvs: If False, connect every channel at construction
+        connection_report: Bring-up outcome (None when lazy)
+    """
+
+    def __init__(
+        self,
+        lazy_fault_pvs=True,
+        connection_timeout: float = CONNECTION_TIMEOUT_SEC,
+    ):
         self.lazy_fault_pvs = lazy_fault_pvs
+        self.connection_report: Optional[ConnectionReport] = None
+        self._stragglers: List[Tuple[BackendCavity, List[Optional[PV]]]] = []
+        self._retry_lock = threading.Lock()
+        self._retry_stop = threading.Event()
+        self._retry_thread: Optional[threading.Thread] = None
+
         super().__init__(cavity_class=BackendCavity)
+
+        if not lazy_fault_pvs:
+            self.connection_report = self.connect_all(connection_timeout)
+            if self._stragglers:
+                self.start_straggler_retry()
+
+    def connect_all(
+        self, timeout: float = CONNECTION_TIMEOUT_SEC
+    ) -> ConnectionReport:
+        """Create every channel, then wait for all of them at once.
+
+        Fault input channels are opened for the runner's batch reads and
+        status output PVs are attached to their cavities. Status PVs that
+        miss the deadline are kept for retry_stragglers.
+
+        Args:
+            timeout: Single deadline for the whole machine (seconds)
+
+        Returns:
+            Connected/unconnected counts for the bring-up
+        """
+        start = time()
+        cavities: List[BackendCavity] = list(self.all_iterator)
+
+        fault_pv_names = list(
+            dict.fromkeys(
+                fault.pv
+                for cavity in cavities
+                for fault in cavity.faults.values()
+            )
+        )
+        status_pv_names = [
+            pv_name for cavity in cavities for pv_name in cavity.status_pv_names
+        ]
+
+        # Start searches for fault inputs before waiting on anything
+        PVBatch.connect(fault_pv_names, timeout=0)
+        status_pvs = PV.batch_create(
+            status_pv_names,
+            connection_timeout=timeout,
+            auto_monitor=False,
+            require_connection=False,
+        )
+        fault_connected = PVBatch.connect(
+            fault_pv_names, timeout=max(0.0, start + timeout - time())
+        )
+
+        report = ConnectionReport(
+            fault_connected=sum(fault_connected),
+            fault_unconnected=len(fault_connected) - sum(fault_connected),
+        )
+        self._stragglers = []
+        for i, cavity in enumerate(cavities):
+            pvs = status_pvs[i * 3 : i * 3 + 3]
+            report.status_connected += cavity.attach_status_pvs(pvs)
+            unconnected = sum(
+                1 for pv in pvs if pv is not None and not pv.connected
+            )
+            if unconnected:
+                report.status_unconnected += unconnected
+                self._stragglers.append((cavity, pvs))
+        report.duration_sec = round(time() - start, 3)
+
+        cavity_fault_logger.info(
+            "Machine-wide PV bring-up complete",
+            extra={
+                "extra_data": {
+                    **dataclasses.asdict(report),
+                    "connected_count": report.connected_count,
+                    "unconnected_count": report.unconnected_count,
+                    "timeout_sec": timeout,
+                }
+            },
+        )
+        return report
+
+    @property
+    def straggler_count(self) -> int:
+        """Cavities whose status PVs are still connecting."""
+        with self._retry_lock:
+            return len(self._stragglers)
+
+    def retry_stragglers(self) -> int:
+        """Attach status PVs that connected since the bring-up.
+
+        Returns:
+            Number of cavities whose status PVs are now all attached
+        """
+        attached = 0
+        with self._retry_lock:
+            remaining = []
+            for cavity, pvs in self._stragglers:
+                cavity.attach_status_pvs(pvs)
+                if all(pv is None or pv.connected for pv in pvs):
+                    attached += 1
+                else:
+                    remaining.append((cavity, pvs))
+            self._stragglers = remaining
+
+        if attached:
+            cavity_fault_logger.info(
+                "Late status PVs connected",
+                extra={
+                    "extra_data": {
+                        "cavities_attached": attached,
+                        "cavities_remaining": len(remaining),
+                    }
+                },
+            )
+        return attached
+
+    def start_straggler_retry(
+        self, interval: float = STRAGGLER_RETRY_INTERVAL_SEC
+    ) -> None:
+        """Retry stragglers on a daemon thread until all are attached."""
+        if self._retry_thread is not None:
+            return
+        self._retry_stop.clear()
+        self._retry_thread = threading.Thread(
+            target=self._retry_loop,
+            args=(interval,),
+            name="status-pv-retry",
+            daemon=True,
+        )
+        self._retry_thread.start()
+
+    def stop_straggler_retry(self) -> None:
+        """Stop the background retry (stragglers stay unattached)."""
+        self._retry_stop.set()
+        if self._retry_thread is not None:
+            self._retry_thread.join(timeout=1.0)
+            self._retry_thread = None
+
+    def _retry_loop(self, interval: float) -> None:
+        while not self._retry_stop.wait(interval):
+            self.retry_stragglers()
+            if not self.straggler_count:
+                break
@@ -0,0 +1,187 @@
+"""
+Monitor-driven fault input cache for the cavity fault runner.
+
+Instead of reading every fault PV on every cycle, the FaultMonitor
+subscribes once to each distinct fault PV in a FaultPVIndex, keeps the
+latest value in the index and tracks which cavities have had an input
+change since they were last evaluated. Channel Access callbacks only
+record updates; evaluation and status PV writes happen on the Runner's
+thread.
+"""
+
+import threading
+from time import sleep, time
+from typing import Any, List, Optional, Set
+
+from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
+    BackendCavity,
+)
+from sc_linac_physics.displays.cavity_display.backend.fault_pv_index import (
+    FaultPVIndex,
+)
+from sc_linac_physics.displays.cavity_display.utils.utils import (
+    cavity_fault_logger,
+)
+from sc_linac_physics.utils.epics import PVBatch
+
+
+class FaultMonitor:
+    """Keeps fault PV values current via CA monitors.
+
+    Attributes:
+        index: Deduplicated fault PVs; its values are kept current
+        update_count: Number of value updates received since start()
+    """
+
+    def __init__(self, index: FaultPVIndex):
+        self.index = index
+        self._severities: List[Optional[int]] = [None] * index.unique_count
+        self._received: List[bool] = [False] * index.unique_count
+        self._monitors: list = []
+
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        # Everything is published once, even if no monitor ever fires
+        self._dirty: Set[int] = set(range(len(index.cavities)))
+        self._changed.set()
+
+        self.update_count = 0
+
+    @property
+    def cavities(self) -> List[BackendCavity]:
+        """Monitored cavities, in machine order."""
+        return self.index.cavities
+
+    @property
+    def pv_count(self) -> int:
+        """Number of distinct fault PVs monitored."""
+        return self.index.unique_count
+
+    @property
+    def connected_count(self) -> int:
+        """Number of monitored fault PVs that currently have a value."""
+        return sum(1 for value in self.index.values if value is not None)
+
+    def start(self, connection_timeout: float = 5.0) -> int:
+        """Subscribe to every fault PV.
+
+        Waits up to connection_timeout for initial values so the first
+        evaluation isn't dominated by not-yet-connected PVs; PVs that
+        connect later are picked up by their first monitor update.
+
+        Returns:
+            Number of fault PVs that delivered a value before the deadline
+        """
+        start = time()
+        self._monitors = PVBatch.monitor(
+            self.index.pv_names,
+            callback=self._on_value,
+            connection_callback=self._on_connection,
+        )
+
+        deadline = start + connection_timeout
+        while time() < deadline and self.connected_count < self.pv_count:
+            sleep(0.05)
+
+        connected = self.connected_count
+        cavity_fault_logger.info(
+            "Fault PV monitors started",
+            extra={
+                "extra_data": {
+                    "pv_count": self.pv_count,
+                    "connected_count": connected,
+                    "unconnected_count": self.pv_count - connected,
+                    "duration_sec": round(time() - start, 3),
+                }
+            },
+        )
+        return connected
+
+    def stop(self) -> None:
+        """Drop all subscriptions."""
+        for monitor in self._monitors:
+            if monitor is None:
+                continue
+            try:
+                monitor.clear_callbacks()
+                monitor.disconnect()
+            except Exception as e:
+                cavity_fault_logger.debug(
+                    f"Error disconnecting {monitor.pvname}: {e}"
+                )
+        self._monitors = []
+
+    def _on_value(
+        self,
+        pvname: str = None,
+        value: Any = None,
+        severity: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """CA monitor callback: record the value, mark dependents dirty."""
+        self._record(pvname, value, severity)
+
+    def _on_connection(
+        self, pvname: str = None, conn: bool = True, **kwargs
+    ) -> None:
+        """CA connection callback: a lost channel reads as invalid."""
+        if not conn:
+            self._record(pvname, None, None)
+
+    def _record(self, pvname: str, value: Any, severity: Optional[int]) -> None:
+        try:
+            position = self.index.position(pvname)
+        except KeyError:
+            return
+
+        with self._lock:
+            self.update_count += 1
+            if (
+                self._received[position]
+                and _same_value(self.index.values[position], value)
+                and self._severities[position] == severity
+            ):
+                return
+            self._received[position] = True
+            self.index.values[position] = value
+            self._severities[position] = severity
+            self._dirty.update(self.index.dependents[position])
+        self._changed.set()
+
+    def values_for(self, cavity: BackendCavity) -> List[Any]:
+        """Latest known value of each of a cavity's fault PVs.
+
+        PVs that haven't delivered a value yet (or are disconnected)
+        read as None, which the cavity treats as invalid.
+        """
+        return self.index.values_for(cavity)
+
+    def severity_of(self, pv_name: str) -> Optional[int]:
+        """Latest alarm severity reported for a fault PV."""
+        return self._severities[self.index.position(pv_name)]
+
+    def wait_for_changes(
+        self, timeout: Optional[float] = None
+    ) -> List[BackendCavity]:
+        """Block until a fault input changes, then claim changed cavities.
+
+        Args:
+            timeout: Longest time to wait, in seconds (None waits forever)
+
+        Returns:
+            Cavities with changed inputs since the last call, in machine
+            order; empty if the timeout expired first
+        """
+        self._changed.wait(timeout=timeout)
+        with self._lock:
+            self._changed.clear()
+            dirty, self._dirty = self._dirty, set()
+        return [self.cavities[index] for index in sorted(dirty)]
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Compare monitor values without tripping over numpy arrays."""
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,197 @@
+"""
+Machine-wide index of unique fault PVs.
+
+Rack, cryomodule and linac level faults resolve to the same PV for many
+cavities. The FaultPVIndex holds each distinct fault PV once, reads it
+once per cycle, and fans the value out to every cavity that depends on it.
+
+The ok/fault conditions of every cavity's faults are also compiled into
+aligned NumPy arrays, so evaluating the whole machine is a handful of
+vector operations instead of a Python loop per fault.
+"""
+
+from numbers import Real
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
+    BackendCavity,
+)
+from sc_linac_physics.displays.cavity_display.backend.fault import Fault
+from sc_linac_physics.utils.epics import PVBatch
+
+
+class FaultPVIndex:
+    """Deduplicated fault PV table for a set of cavities.
+
+    Attributes:
+        cavities: Indexed cavities, in machine order
+        pv_names: Each distinct fault PV name once, in first-seen order
+        dependents: For each entry of pv_names, indices into cavities of
+            the cavities that read it
+        values: Latest value of each entry of pv_names (None if unknown
+            or disconnected)
+    """
+
+    def __init__(self, cavities: Sequence[BackendCavity]):
+        self.cavities: List[BackendCavity] = list(cavities)
+        self.pv_names: List[str] = []
+        self.dependents: List[List[int]] = []
+
+        self._positions: Dict[str, int] = {}
+        self._cavity_positions: Dict[BackendCavity, List[int]] = {}
+
+        # One entry per (cavity, fault), cavities back to back, each
+        # cavity's faults in priority order
+        self._faults: List[Fault] = []
+        fault_positions: List[int] = []
+        targets: List[float] = []
+        fault_if_equal: List[bool] = []
+        starts: List[int] = []
+
+        for cavity_index, cavity in enumerate(self.cavities):
+            starts.append(len(self._faults))
+            cavity_positions = []
+            for fault in cavity.faults.values():
+                position = self._add_pv(fault.pv, cavity_index)
+                cavity_positions.append(position)
+
+                self._faults.append(fault)
+                fault_positions.append(position)
+                if fault.ok_value is not None:
+                    targets.append(fault.ok_value)
+                    fault_if_equal.append(False)
+                else:
+                    targets.append(fault.fault_value)
+                    fault_if_equal.append(True)
+            self._cavity_positions[cavity] = cavity_positions
+
+        self._fault_positions = np.array(fault_positions, dtype=np.intp)
+        self._targets = np.array(targets, dtype=float)
+        self._fault_if_equal = np.array(fault_if_equal, dtype=bool)
+        self._starts = np.array(starts, dtype=np.intp)
+        self._ends = np.append(self._starts[1:], len(self._faults))
+
+        self.values: List[Any] = [None] * len(self.pv_names)
+
+    def _add_pv(self, pv_name: str, cavity_index: int) -> int:
+        """Position of pv_name, adding it (and the dependent) if new."""
+        position = self._positions.get(pv_name)
+        if position is None:
+            position = len(self.pv_names)
+            self._positions[pv_name] = position
+            self.pv_names.append(pv_name)
+            self.dependents.append([])
+
+        if self.dependents[position][-1:] != [cavity_index]:
+            self.dependents[position].append(cavity_index)
+        return position
+
+    @property
+    def unique_count(self) -> int:
+        """Number of distinct fault PVs."""
+        return len(self.pv_names)
+
+    @property
+    def reference_count(self) -> int:
+        """Number of fault PV reads one cycle costs without deduplication."""
+        return len(self._faults)
+
+    @property
+    def disconnected_count(self) -> int:
+        """Number of distinct fault PVs with no current value."""
+        return sum(1 for value in self.values if value is None)
+
+    def position(self, pv_name: str) -> int:
+        """Index of a fault PV in pv_names/values.
+
+        Raises:
+            KeyError: If no indexed cavity reads this PV
+        """
+        return self._positions[pv_name]
+
+    def read(self, timeout: float = 0.5) -> None:
+        """Read every distinct fault PV once (one caget_many)."""
+        self.values = list(PVBatch.get_values(self.pv_names, timeout=timeout))
+
+    def values_for(self, cavity: BackendCavity) -> List[Any]:
+        """Current values of a cavity's fault PVs, in its fault order."""
+        values = self.values
+        return [values[position] for position in self._cavity_positions[cavity]]
+
+    def first_faults(self) -> List[Tuple[Optional[Fault], bool]]:
+        """Evaluate every cavity's faults against the current values.
+
+        Same rules as BackendCavity.run_through_faults: faults are checked
+        in priority order, the first match wins, and a None value
+        (disconnected PV) counts as an invalid fault.
+
+        Returns:
+            (fault, invalid) per cavity, in cavity order; fault is None
+            for cavities with no active fault
+        """
+        numeric, invalid = _as_arrays(self.values)
+        values = numeric[self._fault_positions]
+        invalid = invalid[self._fault_positions]
+
+        # NaN (non-numeric value) never equals anything, matching how a
+        # string or array compares against a float threshold
+        faulted = np.where(
+            self._fault_if_equal,
+            values == self._targets,
+            values != self._targets,
+        )
+        faulted |= invalid
+
+        # First faulted entry at or after each cavity's start, if it
+        # still belongs to that cavity
+        hits = np.flatnonzero(faulted)
+        if hits.size == 0:
+            return [(None, False)] * len(self.cavities)
+        candidates = hits[
+            np.minimum(np.searchsorted(hits, self._starts), hits.size - 1)
+        ]
+        found = (candidates >= self._starts) & (candidates < self._ends)
+
+        return [
+            (
+                (self._faults[entry], bool(invalid[entry]))
+                if hit
+                else (None, False)
+            )
+            for entry, hit in zip(candidates.tolist(), found.tolist())
+        ]
+
+
+_PLAIN_NUMBER_TYPES = frozenset({int, float, bool})
+_PLAIN_TYPES = _PLAIN_NUMBER_TYPES | {type(None)}
+
+
+def _as_arrays(values: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split raw PV values into a float array and an invalid (None) mask.
+
+    Anything that isn't a real number becomes NaN rather than being
+    coerced, so e.g. the string "2" does not compare equal to 2.0.
+    """
+    kinds = set(map(type, values))
+
+    # Fast paths for what caget_many returns for scalar PVs
+    if kinds <= _PLAIN_NUMBER_TYPES:
+        return np.array(values, dtype=float), np.zeros(len(values), dtype=bool)
+    if kinds <= _PLAIN_TYPES:
+        invalid = np.array([value is None for value in values], dtype=bool)
+        numeric = np.array(
+            [np.nan if value is None else value for value in values],
+            dtype=float,
+        )
+        return numeric, invalid
+
+    numeric = np.full(len(values), np.nan)
+    invalid = np.zeros(len(values), dtype=bool)
+    for position, value in enumerate(values):
+        if value is None:
+            invalid[position] = True
+        elif isinstance(value, Real):
+            numeric[position] = value
+    return numeric, invalid
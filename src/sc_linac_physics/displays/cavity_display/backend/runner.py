@@ -5,21 +5,36 @@ Continuously monitors all SC linac cavities for fault conditions and updates
 a heartbeat PV to indicate service health.
 """
 
+import argparse
+import dataclasses
 import signal
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from time import sleep, time
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
     BackendCavity,
 )
 from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
+    CONNECTION_TIMEOUT_SEC,
     BackendMachine,
 )
+from sc_linac_physics.displays.cavity_display.backend.fault_monitor import (
+    FaultMonitor,
+)
+from sc_linac_physics.displays.cavity_display.backend.fault_pv_index import (
+    FaultPVIndex,
+)
+from sc_linac_physics.displays.cavity_display.backend.telemetry import (
+    RunnerTelemetry,
+)
 from sc_linac_physics.displays.cavity_display.utils.utils import (
     DEBUG,
     BACKEND_SLEEP_TIME,
+    STATUS_REPUBLISH_INTERVAL_SEC,
     cavity_fault_logger,
 )
 from sc_linac_physics.utils.epics import (
@@ -34,6 +49,29 @@ _initialization_in_progress = False
 _cavity_init_count = 0
 _last_progress_time = 0
 SLOW_CAVITY_THRESHOLD_SEC = 0.1
+# Monitor mode: longest wait for a fault change before beating the heartbeat
+MONITOR_HEARTBEAT_INTERVAL_SEC = 1.0
+MONITOR_CONNECTION_TIMEOUT_SEC = 5.0
+SHARD_BY_CHOICES = ("cryomodule", "linac")
+
+# ca_attach_context is not thread-safe, see utils/simulation/launcher_service
+_ca_attach_lock = threading.Lock()
+
+
+def _in_ca_context(fn, *args):
+    """Run fn in the initial CA context from a worker thread.
+
+    Without this each pool thread would create its own CA context (and
+    its own channels) on its first caget_many.
+    """
+    import epics.ca
+
+    with _ca_attach_lock:
+        epics.ca.use_initial_context()
+    try:
+        return fn(*args)
+    finally:
+        epics.ca.detach_context()
 
 
 def _signal_handler_during_init(signum, frame):
@@ -82,6 +120,52 @@ def track_cavity_init():
         _last_progress_time = current_time
 
 
+@dataclasses.dataclass
+class FaultShard:
+    """Cavities checked together by one worker thread.
+
+    Attributes:
+        name: Name of the cryomodule or linac the shard covers
+        cavities: Shard cavities, in machine order
+        fault_pv_index: Fault PVs of just these cavities
+    """
+
+    name: str
+    cavities: List[BackendCavity]
+    fault_pv_index: FaultPVIndex
+
+
+def partition_cavities(
+    cavities: List[BackendCavity], shard_by: str = "cryomodule"
+) -> List[FaultShard]:
+    """Group cavities into one shard per cryomodule or linac.
+
+    Args:
+        cavities: Cavities in machine order
+        shard_by: "cryomodule" or "linac"
+
+    Returns:
+        Shards in machine order
+
+    Raises:
+        ValueError: If shard_by is not one of SHARD_BY_CHOICES
+    """
+    if shard_by not in SHARD_BY_CHOICES:
+        raise ValueError(
+            f"shard_by must be one of {SHARD_BY_CHOICES}, got {shard_by!r}"
+        )
+
+    groups: Dict[str, List[BackendCavity]] = {}
+    for cavity in cavities:
+        owner = cavity.cryomodule if shard_by == "cryomodule" else cavity.linac
+        groups.setdefault(owner.name, []).append(cavity)
+
+    return [
+        FaultShard(name, members, FaultPVIndex(members))
+        for name, members in groups.items()
+    ]
+
+
 class Runner:
     """
     Monitors and checks faults for all backend cavities.
@@ -90,18 +174,54 @@ class Runner:
     to indicate the service is running. The heartbeat PV can be monitored by external
     systems to verify the fault checker is alive.
 
+    In monitor mode the fault PVs are subscribed to once instead of polled, and
+    only cavities whose fault inputs changed are re-evaluated.
+
+    With more than one worker, polling cycles are split into per-cryomodule
+    (or per-linac) shards checked in parallel, each with its own batched
+    fault PV read and status writes; the heartbeat still beats once per cycle.
+
+    Cycle and per-cavity latency histograms and error counters are kept in
+    a RunnerTelemetry and published periodically as soft PVs next to the
+    heartbeat (and as a Prometheus text file if one is configured).
+
     Attributes:
         watcher_pv_name: PV name for heartbeat monitoring
+        backend_machine: Machine the cavities belong to
         backend_cavities: List of all cavity objects to monitor
+        fault_pv_index: Each distinct fault PV once, shared by all cavities
+        fault_monitor: Fault PV subscriptions (None when polling)
+        shards: Cavity shards checked in parallel (empty when sequential)
+        telemetry: Performance histograms and counters
     """
 
-    def __init__(self, lazy_fault_pvs: bool = False):
+    def __init__(
+        self,
+        lazy_fault_pvs: bool = False,
+        monitor_faults: bool = False,
+        status_republish_interval: Optional[
+            float
+        ] = STATUS_REPUBLISH_INTERVAL_SEC,
+        workers: int = 1,
+        shard_by: str = "cryomodule",
+        metrics_file: Optional[str] = None,
+    ):
         """
         Initialize the Runner.
 
         Args:
             lazy_fault_pvs: If True, delays initialization of fault PVs until first access.
                           This can speed up startup but may cause delays on first fault check.
+            monitor_faults: If True, subscribe to fault PVs and re-evaluate cavities
+                          as their inputs change instead of polling every cycle.
+            status_republish_interval: Seconds after which unchanged cavity status
+                          PVs are put again anyway (None never, 0 every cycle).
+            workers: Worker threads for polling cycles; more than one checks
+                          shards of cavities in parallel.
+            shard_by: "cryomodule" or "linac", how cavities are sharded when
+                          workers > 1.
+            metrics_file: If set, telemetry is also written to this file in
+                          the Prometheus text format.
         """
         global _initialization_in_progress, _cavity_init_count, _last_progress_time
 
@@ -113,15 +233,29 @@ class Runner:
         self._heartbeat_failures = 0
         self._max_heartbeat_failures = 10
         self._first_check = True
+        self._last_heartbeat_time = 0.0
+        self.fault_monitor: Optional[FaultMonitor] = None
+        self._status_put_totals = (0, 0)
+        self.shards: List[FaultShard] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.telemetry = RunnerTelemetry(metrics_file=metrics_file)
+        self._shard_durations: List[Tuple[str, float]] = []
 
         cavity_fault_logger.info(
             "Initializing cavity fault runner",
             extra={
                 "extra_data": {
                     "lazy_fault_pvs": lazy_fault_pvs,
+                    "monitor_faults": monitor_faults,
+                    "status_republish_interval_sec": (
+                        status_republish_interval
+                    ),
+                    "workers": workers,
+                    "shard_by": shard_by,
                     "debug_mode": DEBUG,
                     "sleep_time_sec": BACKEND_SLEEP_TIME,
                     "heartbeat_pv": self.watcher_pv_name,
+                    "metrics_file": metrics_file,
                 }
             },
         )
@@ -130,8 +264,11 @@ class Runner:
         if not lazy_fault_pvs:
             print(f"\n{'='*70}")
             print("Initializing Cavity Fault Runner")
-            print("Connecting to ~17,000 EPICS PVs (sequential initialization)")
-            print("Expected duration: ~2-5 minutes")
+            print("Connecting to ~17,000 EPICS PVs (all channels at once)")
+            print(
+                f"Connection deadline: {CONNECTION_TIMEOUT_SEC:.0f}s, "
+                "stragglers keep retrying in the background"
+            )
             print("Press Ctrl+C to cancel initialization")
             print(f"{'='*70}\n")
 
@@ -153,33 +290,39 @@ class Runner:
         BackendCavity.__init__ = patched_init
 
         try:
-            backend_machine = BackendMachine(lazy_fault_pvs=lazy_fault_pvs)
+            self.backend_machine = BackendMachine(lazy_fault_pvs=lazy_fault_pvs)
             machine_creation_duration = time() - machine_start
 
             iterator_start = time()
             self.backend_cavities: List[BackendCavity] = list(
-                backend_machine.all_iterator
+                self.backend_machine.all_iterator
             )
             iterator_duration = time() - iterator_start
 
             total_machine_duration = time() - machine_start
 
-            # Count total PVs initialized
-            total_fault_pvs = sum(
-                len(cav.faults) for cav in self.backend_cavities
-            )
-            total_pvs = total_fault_pvs + (len(self.backend_cavities) * 3)
+            # Shared rack/CM/linac fault PVs are only read once per cycle
+            self.fault_pv_index = FaultPVIndex(self.backend_cavities)
+            total_fault_pvs = self.fault_pv_index.reference_count
+            unique_fault_pvs = self.fault_pv_index.unique_count
+            total_pvs = unique_fault_pvs + (len(self.backend_cavities) * 3)
 
             # Clear progress line and print completion
             if not lazy_fault_pvs:
                 print()  # New line after progress bar
 
+            connection_data = (
+                {} if lazy_fault_pvs else self._connection_log_data()
+            )
+
             cavity_fault_logger.info(
                 "Backend cavities initialized successfully",
                 extra={
                     "extra_data": {
+                        **connection_data,
                         "cavity_count": len(self.backend_cavities),
                         "fault_pv_count": total_fault_pvs,
+                        "unique_fault_pv_count": unique_fault_pvs,
                         "total_pv_count": total_pvs,
                         "lazy_mode": lazy_fault_pvs,
                         "machine_creation_sec": round(
@@ -196,7 +339,17 @@ class Runner:
                 print(f"\n{'='*70}")
                 print("✓ Initialization complete!")
                 print(f"  Cavities: {len(self.backend_cavities)}")
+                print(
+                    f"  Fault PVs: {total_fault_pvs:,} "
+                    f"({unique_fault_pvs:,} unique)"
+                )
                 print(f"  Total PVs: {total_pvs:,}")
+                if connection_data:
+                    print(
+                        f"  Connected: {connection_data['connected_count']:,} "
+                        f"({connection_data['unconnected_count']:,} still "
+                        "connecting)"
+                    )
                 print(
                     f"  Duration: {total_machine_duration / 60:.2f} minutes ({total_machine_duration:.1f} seconds)"
                 )
@@ -234,6 +387,10 @@ class Runner:
             # Restore original __init__
             BackendCavity.__init__ = original_init
 
+        self.set_status_republish_interval(status_republish_interval)
+
+        self._start_checking(monitor_faults, workers, shard_by)
+
         total_init_duration = time() - init_start
         cavity_fault_logger.info(
             "Runner initialization complete",
@@ -241,11 +398,74 @@ class Runner:
                 "extra_data": {
                     "total_duration_sec": round(total_init_duration, 3),
                     "lazy_mode": lazy_fault_pvs,
+                    "monitor_mode": monitor_faults,
                     "ready_to_run": True,
                 }
             },
         )
 
+    def _connection_log_data(self) -> dict:
+        """Connected/unconnected counts from the machine-wide bring-up."""
+        report = self.backend_machine.connection_report
+        if report is None:
+            return {}
+        return {
+            "connected_count": report.connected_count,
+            "unconnected_count": report.unconnected_count,
+            "connection_sec": report.duration_sec,
+        }
+
+    def set_status_republish_interval(self, interval: Optional[float]) -> None:
+        """Set how often every cavity re-puts unchanged status PVs."""
+        for cavity in self.backend_cavities:
+            cavity.status_republish_interval = interval
+
+    def _start_checking(
+        self, monitor_faults: bool, workers: int, shard_by: str
+    ) -> None:
+        """Set up monitor mode or the shard worker pool, if requested."""
+        if monitor_faults:
+            self._start_fault_monitor()
+        elif workers > 1:
+            self._start_shards(workers, shard_by)
+
+    def _start_shards(self, workers: int, shard_by: str) -> None:
+        """Partition cavities and start the worker pool for sharded cycles."""
+        self.shards = partition_cavities(self.backend_cavities, shard_by)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="fault-shard"
+        )
+        cavity_fault_logger.info(
+            "Sharded fault checking enabled",
+            extra={
+                "extra_data": {
+                    "workers": workers,
+                    "shard_by": shard_by,
+                    "shard_count": len(self.shards),
+                    "unique_fault_pv_count": sum(
+                        shard.fault_pv_index.unique_count
+                        for shard in self.shards
+                    ),
+                }
+            },
+        )
+        print(
+            f"Checking {len(self.shards)} {shard_by} shards "
+            f"on {workers} worker threads\n"
+        )
+
+    def _start_fault_monitor(self) -> None:
+        """Subscribe to every fault PV for monitor mode."""
+        self.fault_monitor = FaultMonitor(self.fault_pv_index)
+        print(f"Subscribing to {self.fault_monitor.pv_count:,} fault PVs...")
+        connected = self.fault_monitor.start(
+            connection_timeout=MONITOR_CONNECTION_TIMEOUT_SEC
+        )
+        print(
+            f"  Connected: {connected:,}/{self.fault_monitor.pv_count:,} "
+            f"(the rest are reported INVALID until they connect)\n"
+        )
+
     @property
     def watcher_pv_obj(self) -> PV:
         """
@@ -314,6 +534,81 @@ class Runner:
         )
         self._sleep_if_needed(start)
         self._update_heartbeat()
+        self._publish_telemetry()
+
+    def check_changed_faults(self) -> None:
+        """Re-evaluate cavities whose fault inputs changed (monitor mode).
+
+        Waits up to MONITOR_HEARTBEAT_INTERVAL_SEC for a monitor update, so
+        status PVs follow input changes almost immediately while the
+        heartbeat keeps beating on a quiet machine. On each heartbeat tick,
+        unchanged cavities whose status is due a forced re-put are
+        re-evaluated too.
+        """
+        changed = self.fault_monitor.wait_for_changes(
+            timeout=MONITOR_HEARTBEAT_INTERVAL_SEC
+        )
+        start = time()
+        republish = []
+        if start - self._last_heartbeat_time >= MONITOR_HEARTBEAT_INTERVAL_SEC:
+            republish = self._cavities_due_republish(changed, start)
+        failed_cavities = []
+        exception_summary = {}
+        slow_cavities = []
+
+        for i, cavity in enumerate(changed + republish):
+            cavity_start = time()
+            try:
+                cavity.run_through_faults_with_values(
+                    self.fault_monitor.values_for(cavity)
+                )
+                self._track_slow_cavity(cavity, cavity_start, slow_cavities)
+            except Exception as e:
+                self._handle_cavity_error(
+                    cavity, i, e, failed_cavities, exception_summary
+                )
+
+        if failed_cavities:
+            self._log_failures(failed_cavities, exception_summary)
+
+        if changed or republish:
+            self.telemetry.cycle_time.observe(time() - start)
+            log_data = {
+                "duration_sec": round(time() - start, 3),
+                "cavities_changed": len(changed),
+                "cavities_republished": len(republish),
+                "cavities_failed": len(failed_cavities),
+                "monitor_updates": self.fault_monitor.update_count,
+                "first_check": self._first_check,
+            }
+            self._add_status_put_data(log_data)
+            self._add_slow_cavity_data(log_data, slow_cavities)
+            if self._first_check:
+                cavity_fault_logger.info(
+                    "First fault evaluation completed",
+                    extra={"extra_data": log_data},
+                )
+                self._first_check = False
+            else:
+                cavity_fault_logger.debug(
+                    "Changed cavities re-evaluated",
+                    extra={"extra_data": log_data},
+                )
+
+        if time() - self._last_heartbeat_time >= MONITOR_HEARTBEAT_INTERVAL_SEC:
+            self._update_heartbeat()
+            self._last_heartbeat_time = time()
+        self._publish_telemetry()
+
+    def _cavities_due_republish(self, changed: list, now: float) -> list:
+        """Unchanged cavities whose status PVs are due a forced re-put."""
+        changed_ids = {id(cavity) for cavity in changed}
+        return [
+            cavity
+            for cavity in self.backend_cavities
+            if id(cavity) not in changed_ids
+            and cavity.status_republish_due(now)
+        ]
 
     def _check_all_cavities(
         self,
@@ -322,25 +617,163 @@ class Runner:
         slow_cavities: list,
         start_time: float,
     ) -> None:
-        """Check faults for all cavities and track failures/performance."""
-        for i, cavity in enumerate(self.backend_cavities):
+        """Check faults for all cavities and track failures/performance.
+
+        Every distinct fault PV is read once for the whole machine (or
+        once per shard) and all fault conditions are evaluated in one
+        vectorized pass. If that fails, each cavity falls back to reading
+        its own fault PVs.
+        """
+        if self._executor is not None:
+            self._check_shards(
+                failed_cavities, exception_summary, slow_cavities
+            )
+            return
+
+        self._check_cavities(
+            self.backend_cavities,
+            self.fault_pv_index,
+            failed_cavities,
+            exception_summary,
+            slow_cavities,
+            start_time,
+        )
+
+    def _check_cavities(
+        self,
+        cavities: List[BackendCavity],
+        index: FaultPVIndex,
+        failed_cavities: list,
+        exception_summary: dict,
+        slow_cavities: list,
+        start_time: Optional[float] = None,
+    ) -> None:
+        """Check faults for some cavities against their shared fault index.
+
+        Args:
+            start_time: Cycle start for the first-check progress bar (None
+                to skip it, e.g. from worker threads)
+        """
+        first_faults = self._evaluate_fault_pv_index(index)
+
+        for i, cavity in enumerate(cavities):
             cavity_start = time()
 
             try:
-                cavity.run_through_faults()
+                if first_faults is not None:
+                    cavity.report_fault(*first_faults[i])
+                else:
+                    cavity.run_through_faults()
                 self._track_slow_cavity(cavity, cavity_start, slow_cavities)
-                self._update_first_check_progress(i, start_time)
+                if start_time is not None:
+                    self._update_first_check_progress(i, start_time)
 
             except Exception as e:
                 self._handle_cavity_error(
                     cavity, i, e, failed_cavities, exception_summary
                 )
 
+    def _check_shards(
+        self,
+        failed_cavities: list,
+        exception_summary: dict,
+        slow_cavities: list,
+    ) -> None:
+        """Check every shard on the worker pool and merge their results."""
+        futures = [
+            self._executor.submit(_in_ca_context, self._check_shard, shard)
+            for shard in self.shards
+        ]
+
+        self._shard_durations = []
+        for shard, future in zip(self.shards, futures):
+            try:
+                shard_failed, shard_exceptions, shard_slow, duration = (
+                    future.result()
+                )
+            except Exception as e:
+                # Only reachable if the shard machinery itself broke
+                cavity_fault_logger.error(
+                    "Error checking fault shard",
+                    extra={
+                        "extra_data": {
+                            "shard": shard.name,
+                            "cavity_count": len(shard.cavities),
+                            "error": str(e),
+                            "error_type": type(e).__name__,
+                        }
+                    },
+                    exc_info=DEBUG,
+                )
+                shard_failed = shard.cavities
+                shard_exceptions = {type(e).__name__: len(shard.cavities)}
+                shard_slow = []
+                duration = None
+
+            failed_cavities.extend(shard_failed)
+            slow_cavities.extend(shard_slow)
+            for error_type, count in shard_exceptions.items():
+                exception_summary[error_type] = (
+                    exception_summary.get(error_type, 0) + count
+                )
+            if duration is not None:
+                self._shard_durations.append((shard.name, duration))
+
+    def _check_shard(self, shard: FaultShard) -> Tuple[list, dict, list, float]:
+        """Check one shard (runs on a worker thread).
+
+        Returns:
+            (failed_cavities, exception_summary, slow_cavities, duration_sec)
+        """
+        start = time()
+        failed_cavities = []
+        exception_summary = {}
+        slow_cavities = []
+        self._check_cavities(
+            shard.cavities,
+            shard.fault_pv_index,
+            failed_cavities,
+            exception_summary,
+            slow_cavities,
+        )
+        return (
+            failed_cavities,
+            exception_summary,
+            slow_cavities,
+            round(time() - start, 3),
+        )
+
+    def _evaluate_fault_pv_index(self, index: FaultPVIndex) -> Optional[list]:
+        """Read every distinct fault PV once and find each cavity's fault.
+
+        Returns:
+            (fault, invalid) per cavity as from FaultPVIndex.first_faults,
+            or None if the read or evaluation failed
+        """
+        try:
+            index.read()
+            return index.first_faults()
+        except Exception as e:
+            self.telemetry.increment("fault_index_fallbacks")
+            cavity_fault_logger.warning(
+                "Machine-wide fault PV read failed, "
+                "falling back to per-cavity reads",
+                extra={
+                    "extra_data": {
+                        "unique_fault_pv_count": index.unique_count,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    }
+                },
+            )
+            return None
+
     def _track_slow_cavity(
         self, cavity: BackendCavity, cavity_start: float, slow_cavities: list
     ) -> None:
         """Track cavities that take longer than threshold to check."""
         cavity_duration = time() - cavity_start
+        self.telemetry.cavity_latency.observe(cavity_duration)
         if cavity_duration > SLOW_CAVITY_THRESHOLD_SEC:
             slow_cavities.append((str(cavity), round(cavity_duration, 3)))
 
@@ -409,6 +842,7 @@ class Runner:
             self._log_failures(failed_cavities, exception_summary)
 
         delta = time() - start_time
+        self.telemetry.cycle_time.observe(delta)
         log_data = self._build_log_data(delta, failed_cavities, slow_cavities)
         self._log_cycle_completion(delta, log_data)
 
@@ -450,9 +884,71 @@ class Runner:
         if DEBUG:
             log_data["target_sec"] = BACKEND_SLEEP_TIME
 
+        log_data.update(self.cycle_time_percentiles())
+        if self._shard_durations:
+            log_data["slowest_shard"] = max(
+                self._shard_durations, key=lambda x: x[1]
+            )
+        self._add_status_put_data(log_data)
         self._add_slow_cavity_data(log_data, slow_cavities)
         return log_data
 
+    def cycle_time_percentiles(self) -> Dict[str, float]:
+        """p50/p90/p99 of the last CYCLE_TIME_WINDOW cycle durations.
+
+        Returns:
+            {"cycle_p50_sec": ..., ...}, empty before the first cycle
+        """
+        quantiles = self.telemetry.cycle_time.quantiles((50, 90, 99))
+        return {
+            f"cycle_p{percent}_sec": round(value, 3)
+            for percent, value in quantiles.items()
+        }
+
+    def _add_status_put_data(self, log_data: dict) -> None:
+        """Add status PV puts issued/skipped since the last call."""
+        puts = sum(cavity.status_put_count for cavity in self.backend_cavities)
+        skips = sum(
+            cavity.status_skip_count for cavity in self.backend_cavities
+        )
+        last_puts, last_skips = self._status_put_totals
+        self._status_put_totals = (puts, skips)
+
+        log_data["status_puts"] = puts - last_puts
+        log_data["status_puts_skipped"] = skips - last_skips
+
+    def _publish_telemetry(self) -> None:
+        """Refresh totals and gauges, then publish if it is time to."""
+        telemetry = self.telemetry
+        if not telemetry.publish_due():
+            return
+
+        telemetry.set(
+            "sequential_fallbacks",
+            sum(
+                cavity.sequential_fallback_count
+                for cavity in self.backend_cavities
+            ),
+        )
+        telemetry.set(
+            "status_put_failures",
+            sum(
+                cavity.status_put_failure_count
+                for cavity in self.backend_cavities
+            ),
+        )
+        indices = [shard.fault_pv_index for shard in self.shards] or [
+            self.fault_pv_index
+        ]
+        telemetry.set(
+            "disconnected_fault_pvs",
+            sum(index.disconnected_count for index in indices),
+        )
+        telemetry.set(
+            "status_pv_stragglers", self.backend_machine.straggler_count
+        )
+        telemetry.publish()
+
     def _add_slow_cavity_data(
         self, log_data: dict, slow_cavities: list
     ) -> None:
@@ -626,10 +1122,15 @@ class Runner:
         cycle_count = 0
         last_status_log = service_start_time
         status_log_interval = 300.0  # Log status every 5 minutes
+        check = (
+            self.check_changed_faults
+            if self.fault_monitor is not None
+            else self.check_faults
+        )
 
         try:
             while self._running:
-                self.check_faults()
+                check()
                 cycle_count += 1
 
                 # Periodic status log based on time
@@ -652,6 +1153,7 @@ class Runner:
                                 "interval_sec": round(
                                     (now - last_status_log).total_seconds(), 1
                                 ),
+                                **self.cycle_time_percentiles(),
                             }
                         },
                     )
@@ -681,6 +1183,11 @@ class Runner:
             raise
 
         finally:
+            if self.fault_monitor is not None:
+                self.fault_monitor.stop()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self.backend_machine.stop_straggler_retry()
             cavity_fault_logger.info(
                 "Fault checker stopped",
                 extra={"extra_data": {"total_cycles": cycle_count}},
@@ -735,14 +1242,76 @@ class Runner:
         return exc_type is KeyboardInterrupt
 
 
-def main():
-    """Entry point for the fault checker service."""
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options for the fault checker service."""
+    parser = argparse.ArgumentParser(
+        description="Monitor SC linac cavity faults and publish cavity status"
+    )
+    parser.add_argument(
+        "--monitor",
+        action="store_true",
+        help="Subscribe to fault PVs and re-evaluate cavities on change "
+        "instead of polling every fault PV each cycle",
+    )
+    parser.add_argument(
+        "--republish-interval",
+        type=float,
+        default=STATUS_REPUBLISH_INTERVAL_SEC,
+        metavar="SECONDS",
+        help="Put unchanged cavity status PVs again after this long, so a "
+        "restarted IOC is repopulated (0 puts every cycle; default: "
+        "%(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Check shards of cavities on N worker threads per polling cycle "
+        "(default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=SHARD_BY_CHOICES,
+        default="cryomodule",
+        help="How cavities are split between workers (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help="Also write runner telemetry to PATH in the Prometheus text "
+        "format (e.g. a node_exporter textfile collector directory)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(
+    monitor_faults: bool = False,
+    status_republish_interval: Optional[float] = STATUS_REPUBLISH_INTERVAL_SEC,
+    workers: int = 1,
+    shard_by: str = "cryomodule",
+    metrics_file: Optional[str] = None,
+):
+    """Entry point for the fault checker service.
+
+    Args:
+        monitor_faults: Run in monitor mode (see Runner)
+        status_republish_interval: See Runner
+        workers: Worker threads for sharded polling cycles (see Runner)
+        shard_by: "cryomodule" or "linac" (see Runner)
+        metrics_file: Prometheus text file for telemetry (see Runner)
+    """
     cavity_fault_logger.info(
         "Cavity fault checker starting up",
         extra={
             "extra_data": {
                 "debug_mode": DEBUG,
                 "cycle_time_sec": BACKEND_SLEEP_TIME,
+                "monitor_faults": monitor_faults,
+                "status_republish_interval_sec": status_republish_interval,
+                "workers": workers,
+                "shard_by": shard_by,
+                "metrics_file": metrics_file,
             }
         },
     )
@@ -756,7 +1325,14 @@ def main():
         # Use lazy_fault_pvs=False for better runtime performance
         # With parallel initialization, startup is much faster (~30-60 seconds vs 5 minutes)
         try:
-            runner = Runner(lazy_fault_pvs=False)
+            runner = Runner(
+                lazy_fault_pvs=False,
+                monitor_faults=monitor_faults,
+                status_republish_interval=status_republish_interval,
+                workers=workers,
+                shard_by=shard_by,
+                metrics_file=metrics_file,
+            )
         except KeyboardInterrupt:
             # Already handled by _signal_handler_during_init
             sys.exit(0)
@@ -798,8 +1374,15 @@ def main():
 
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        main()
+        main(
+            monitor_faults=args.monitor,
+            status_republish_interval=args.republish_interval,
+            workers=args.workers,
+            shard_by=args.shard_by,
+            metrics_file=args.metrics_file,
+        )
     except KeyboardInterrupt:
         # Final catch-all for any missed interrupts
         print("\n\nShutdown complete.\n")
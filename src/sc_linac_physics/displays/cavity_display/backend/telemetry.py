@@ -0,0 +1,343 @@
+"""
+Performance telemetry for the cavity fault runner.
+
+Keeps rolling histograms of cycle duration and per-cavity check latency
+plus error counters, and publishes them periodically:
+
+- as soft PVs next to PHYS:SYS0:1:SC_CAV_FAULT_HEARTBEAT, so they can be
+  archived and trended like any other PV
+- as a Prometheus text exposition file (e.g. for node_exporter's textfile
+  collector), when a metrics file is configured
+
+Publishing never raises: telemetry must not take the runner down.
+"""
+
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from collections import deque
+from time import time
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from sc_linac_physics.displays.cavity_display.utils.utils import (
+    cavity_fault_logger,
+)
+from sc_linac_physics.utils.epics import PV
+
+TELEMETRY_PV_PREFIX = "PHYS:SYS0:1:SC_CAV_FAULT_"
+TELEMETRY_PUBLISH_INTERVAL_SEC = 10.0
+METRIC_PREFIX = "sc_cav_fault_"
+
+# Samples the rolling quantiles are computed over
+CYCLE_TIME_WINDOW = 100
+CAVITY_LATENCY_WINDOW = 10_000
+
+CYCLE_BUCKETS_SEC = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+CAVITY_BUCKETS_SEC = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+# Counter/gauge name -> (PV suffix, Prometheus type, help text)
+COUNTERS = {
+    "fault_index_fallbacks": (
+        "INDEX_FALLBACKS",
+        "counter",
+        "Machine-wide fault PV reads that fell back to per-cavity reads",
+    ),
+    "sequential_fallbacks": (
+        "SEQ_FALLBACKS",
+        "counter",
+        "Per-cavity batch reads that fell back to sequential reads",
+    ),
+    "status_put_failures": (
+        "PUT_FAILURES",
+        "counter",
+        "Cavity status PV publishes that failed",
+    ),
+    "disconnected_fault_pvs": (
+        "DISCONN_PVS",
+        "gauge",
+        "Distinct fault PVs without a value in the last read",
+    ),
+    "status_pv_stragglers": (
+        "STRAGGLERS",
+        "gauge",
+        "Cavities whose status PVs are still connecting",
+    ),
+}
+
+# Histogram name -> (PV suffix, quantiles published as PVs)
+QUANTILE_PVS = {
+    "cycle": ("CYCLE", (50, 90, 99)),
+    "cavity_latency": ("CAV_LAT", (50, 99)),
+}
+
+
+class RollingHistogram:
+    """Latency histogram with rolling quantiles.
+
+    Quantiles are computed over the most recent `window` samples. Bucket
+    counts, sum and count are cumulative since start, as Prometheus
+    histograms expect.
+
+    Attributes:
+        buckets: Upper bucket bounds (seconds), ascending
+        count: Samples observed since start
+        total: Sum of all samples observed since start
+    """
+
+    def __init__(self, buckets: Sequence[float], window: int):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.count = 0
+        self.total = 0.0
+        self._samples: Deque[float] = deque(maxlen=window)
+        # One slot per bucket plus +Inf
+        self._bucket_counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one sample."""
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            self._samples.append(value)
+            self._bucket_counts[slot] += 1
+            self.count += 1
+            self.total += value
+
+    def observe_many(self, values: Sequence[float]) -> None:
+        """Record several samples at once."""
+        values = np.asarray(values, dtype=float)
+        if not values.size:
+            return
+        slots = np.bincount(
+            np.searchsorted(self.buckets, values, side="left"),
+            minlength=len(self._bucket_counts),
+        )
+        with self._lock:
+            self._samples.extend(values.tolist())
+            for slot, count in enumerate(slots.tolist()):
+                self._bucket_counts[slot] += count
+            self.count += int(values.size)
+            self.total += float(values.sum())
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        with self._lock:
+            self._samples.clear()
+            self._bucket_counts = [0] * len(self._bucket_counts)
+            self.count = 0
+            self.total = 0.0
+
+    def quantiles(self, percents: Sequence[float]) -> Dict[float, float]:
+        """Percentiles of the rolling window (empty before any sample)."""
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return {}
+        values = np.percentile(samples, percents)
+        return {
+            percent: float(value) for percent, value in zip(percents, values)
+        }
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """(upper bound, samples <= bound) per bucket, ending with +Inf."""
+        with self._lock:
+            counts = list(self._bucket_counts)
+        bounds = list(self.buckets) + [float("inf")]
+        return list(zip(bounds, np.cumsum(counts).tolist()))
+
+
+class RunnerTelemetry:
+    """Runner metrics and their publication.
+
+    Attributes:
+        cycle_time: Fault check cycle durations
+        cavity_latency: Per-cavity check durations
+        counters: Counter and gauge values by name (see COUNTERS)
+        metrics_file: Prometheus text file to write, or None
+        publish_pvs: If True, put metrics to the soft telemetry PVs
+    """
+
+    def __init__(
+        self,
+        metrics_file: Optional[str] = None,
+        publish_pvs: bool = True,
+        publish_interval: float = TELEMETRY_PUBLISH_INTERVAL_SEC,
+        pv_prefix: str = TELEMETRY_PV_PREFIX,
+    ):
+        self.cycle_time = RollingHistogram(CYCLE_BUCKETS_SEC, CYCLE_TIME_WINDOW)
+        self.cavity_latency = RollingHistogram(
+            CAVITY_BUCKETS_SEC, CAVITY_LATENCY_WINDOW
+        )
+        self.counters: Dict[str, int] = {name: 0 for name in COUNTERS}
+        self.metrics_file = metrics_file
+        self.publish_pvs = publish_pvs
+        self.publish_interval = publish_interval
+        self.pv_prefix = pv_prefix
+
+        self._counter_lock = threading.Lock()
+        self._last_publish = 0.0
+        self._pvs: Optional[List[PV]] = None
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add to a counter kept by the runner itself."""
+        with self._counter_lock:
+            self.counters[name] += amount
+
+    def set(self, name: str, value: int) -> None:
+        """Set a gauge, or a counter totalled elsewhere (e.g. per cavity)."""
+        with self._counter_lock:
+            self.counters[name] = value
+
+    def histograms(self) -> Dict[str, RollingHistogram]:
+        return {"cycle": self.cycle_time, "cavity_latency": self.cavity_latency}
+
+    def pv_values(self) -> Dict[str, float]:
+        """Current value of every telemetry PV, by full PV name."""
+        values = {}
+        for name, (suffix, percents) in QUANTILE_PVS.items():
+            quantiles = self.histograms()[name].quantiles(percents)
+            for percent in percents:
+                values[f"{self.pv_prefix}{suffix}_P{percent}"] = quantiles.get(
+                    percent, 0.0
+                )
+        with self._counter_lock:
+            for name, (suffix, _, _) in COUNTERS.items():
+                values[f"{self.pv_prefix}{suffix}"] = self.counters[name]
+        return values
+
+    def prometheus_text(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, histogram in self.histograms().items():
+            metric = f"{METRIC_PREFIX}{name}_seconds"
+            lines += [
+                f"# HELP {metric} Fault runner {name.replace('_', ' ')}",
+                f"# TYPE {metric} histogram",
+            ]
+            for bound, count in histogram.cumulative_buckets():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{metric}_bucket{{le="{le}"}} {count}')
+            lines += [
+                f"{metric}_sum {histogram.total!r}",
+                f"{metric}_count {histogram.count}",
+            ]
+
+            rolling = f"{metric}_rolling"
+            lines += [
+                f"# HELP {rolling} Quantiles over the most recent samples",
+                f"# TYPE {rolling} gauge",
+            ]
+            quantiles = histogram.quantiles((50, 90, 99))
+            for percent, value in quantiles.items():
+                lines.append(
+                    f'{rolling}{{quantile="{percent / 100}"}} {value!r}'
+                )
+
+        with self._counter_lock:
+            counters = dict(self.counters)
+        for name, (_, kind, help_text) in COUNTERS.items():
+            metric = f"{METRIC_PREFIX}{name}"
+            if kind == "counter":
+                metric += "_total"
+            lines += [
+                f"# HELP {metric} {help_text}",
+                f"# TYPE {metric} {kind}",
+                f"{metric} {counters[name]}",
+            ]
+
+        metric = f"{METRIC_PREFIX}last_publish_timestamp_seconds"
+        lines += [
+            f"# HELP {metric} When these metrics were written",
+            f"# TYPE {metric} gauge",
+            f"{metric} {time()!r}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_metrics_file(self) -> None:
+        """Atomically replace metrics_file with the current metrics."""
+        directory = os.path.dirname(os.path.abspath(self.metrics_file))
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=".sc_cav_fault_", suffix=".prom"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.prometheus_text())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.metrics_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def put_pvs(self) -> int:
+        """Put every connected telemetry PV (without waiting).
+
+        The PVs are created on first use; ones that are not connected
+        yet are skipped so a missing soft IOC never stalls the runner.
+
+        Returns:
+            Number of PVs put
+        """
+        values = self.pv_values()
+        if self._pvs is None:
+            self._pvs = PV.batch_create(
+                list(values),
+                connection_timeout=0,
+                auto_monitor=False,
+                require_connection=False,
+            )
+
+        connected = [pv for pv in self._pvs if pv is not None and pv.connected]
+        if connected:
+            PV.put_many(
+                connected,
+                [values[pv.pvname] for pv in connected],
+                timeout=1.0,
+                wait=False,
+                raise_on_error=False,
+            )
+        return len(connected)
+
+    def publish_due(self, now: Optional[float] = None) -> bool:
+        """Whether publish_interval has passed since the last publish.
+
+        Returns True at most once per interval (the interval restarts).
+        """
+        now = time() if now is None else now
+        if now - self._last_publish < self.publish_interval:
+            return False
+        self._last_publish = now
+        return True
+
+    def publish(self) -> None:
+        """Write the metrics file and put the telemetry PVs now."""
+        if self.metrics_file:
+            try:
+                self.write_metrics_file()
+            except Exception as e:
+                cavity_fault_logger.warning(
+                    "Failed to write metrics file",
+                    extra={
+                        "extra_data": {
+                            "path": self.metrics_file,
+                            "error": str(e),
+                            "error_type": type(e).__name__,
+                        }
+                    },
+                )
+
+        if self.publish_pvs:
+            try:
+                self.put_pvs()
+            except Exception as e:
+                cavity_fault_logger.warning(
+                    "Failed to publish telemetry PVs",
+                    extra={
+                        "extra_data": {
+                            "pv_prefix": self.pv_prefix,
+                            "error": str(e),
+                            "error_type": type(e).__name__,
+                        }
+                    },
+                )
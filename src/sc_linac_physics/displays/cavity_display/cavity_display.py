@@ -548,6 +548,11 @@ class CavityDisplayGUI(Display):
         if hasattr(self, "audio_manager"):
             self.audio_manager.stop_monitoring()
 
+        # The hub owns every tile's PV channel
+        hub = getattr(self.gui_machine, "subscription_hub", None)
+        if hub is not None:
+            hub.close()
+
         # Stop timers explicitly before close (good practice)
         if hasattr(self, "status_timer"):
             self.status_timer.stop()
@@ -1,6 +1,8 @@
-from typing import TYPE_CHECKING
+import bisect
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import (
     QWidget,
@@ -13,16 +15,33 @@ from PyQt5.QtWidgets import (
     QComboBox,
 )
 
+from sc_linac_physics.displays.cavity_display.frontend.subscription_hub import (
+    SubscriptionHub,
+)
+
 if TYPE_CHECKING:
     from sc_linac_physics.displays.cavity_display.frontend.gui_machine import (
         GUIMachine,
     )
 
+ALARM_SEVERITY = 2
+WARNING_SEVERITY = 1
+
+
+def _cavity_sort_key(cavity) -> Tuple[str, int]:
+    return cavity.cryomodule.name, cavity.number
+
 
 class AlarmSidebarWidget(QWidget):
     """
     Responsive sidebar widget that adapts to width.
     Shows full text when wide, compact symbols when narrow.
+
+    Follows severity and description changes (from the machine's
+    SubscriptionHub, or else each CavityWidget's last_severity_changed
+    and description_updated signals), keeping the alarm and warning
+    lists sorted and touching only the list items of cavities that
+    changed.
     """
 
     cavity_clicked = pyqtSignal(object)
@@ -34,12 +53,17 @@ class AlarmSidebarWidget(QWidget):
     def __init__(self, gui_machine: "GUIMachine", parent=None):
         super().__init__(parent)
         self.gui_machine = gui_machine
+        # Both sorted by (cryomodule, cavity number)
         self.alarm_cavities = []
         self.warning_cavities = []
+        # Severity each listed cavity is listed under
+        self._listed_severity: Dict[object, int] = {}
+        self._connections: List[Tuple[object, partial]] = []
+        self._hub_listeners: List[Tuple[Callable, Callable]] = []
         self.display_mode = "full"  # "compact" or "full"
 
         self._setup_ui()
-        self._start_refresh_timer()
+        self._connect_cavity_signals()
 
         # Initial update
         self.update_alarm_list()
@@ -105,7 +129,7 @@ class AlarmSidebarWidget(QWidget):
         filter_layout = QHBoxLayout()
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["All", "Alarms Only", "Warnings Only"])
-        self.filter_combo.currentTextChanged.connect(self.update_alarm_list)
+        self.filter_combo.currentTextChanged.connect(self._rebuild_alarm_list)
         self.filter_combo.setStyleSheet("""
             QComboBox {
                 background-color: rgb(60, 60, 60);
@@ -166,6 +190,14 @@ class AlarmSidebarWidget(QWidget):
 
     def _update_display_mode(self):
         """Update UI elements based on current display mode"""
+        self._update_count_labels()
+        self.refresh_button.setText(
+            "↻" if self.display_mode == "compact" else "↻ Refresh"
+        )
+        self._rebuild_alarm_list()
+
+    def _update_count_labels(self):
+        """Update the alarm/warning counts (and their colors)"""
         alarm_count = len(self.alarm_cavities)
         warning_count = len(self.warning_cavities)
 
@@ -173,45 +205,40 @@ class AlarmSidebarWidget(QWidget):
             # Compact mode: just emoji and number
             self.alarm_count_label.setText(f"🔴\n{alarm_count}")
             self.warning_count_label.setText(f"🟡\n{warning_count}")
-            self.refresh_button.setText("↻")
 
             # Smaller font for compact mode
-            self.alarm_count_label.setStyleSheet("""
+            alarm_style = """
                 font-size: 14pt;
                 font-weight: bold;
                 background-color: rgb(150, 0, 0);
                 color: white;
                 padding: 4px;
                 border-radius: 3px;
-            """)
-            self.warning_count_label.setStyleSheet("""
+            """
+            warning_style = """
                 font-size: 12pt;
                 font-weight: bold;
                 background-color: rgb(255, 165, 0);
                 color: black;
                 padding: 3px;
                 border-radius: 3px;
-            """)
-
-            # Update list items to compact format
-            self._rebuild_alarm_list_compact()
+            """
 
         else:
             # Full mode: text labels
             self.alarm_count_label.setText(f"ALARMS: {alarm_count}")
             self.warning_count_label.setText(f"WARNINGS: {warning_count}")
-            self.refresh_button.setText("↻ Refresh")
 
             # Normal font for full mode
             alarm_bg = "rgb(150, 0, 0)" if alarm_count > 0 else "rgb(0, 100, 0)"
-            self.alarm_count_label.setStyleSheet(f"""
+            alarm_style = f"""
                 font-size: 16pt;
                 font-weight: bold;
                 background-color: {alarm_bg};
                 color: white;
                 padding: 5px;
                 border-radius: 3px;
-            """)
+            """
 
             warning_bg = (
                 "rgb(255, 165, 0)" if warning_count > 0 else "rgb(60, 60, 60)"
@@ -219,59 +246,61 @@ class AlarmSidebarWidget(QWidget):
             warning_color = (
                 "black" if warning_count > 0 else "rgb(180, 180, 180)"
             )
-            self.warning_count_label.setStyleSheet(f"""
+            warning_style = f"""
                 font-size: 14pt;
                 font-weight: bold;
                 background-color: {warning_bg};
                 color: {warning_color};
                 padding: 4px;
                 border-radius: 3px;
-            """)
+            """
 
-            # Update list items to full format
-            self._rebuild_alarm_list_full()
+        # Restyling repolishes the label, so only do it on a change
+        if self.alarm_count_label.styleSheet() != alarm_style:
+            self.alarm_count_label.setStyleSheet(alarm_style)
+        if self.warning_count_label.styleSheet() != warning_style:
+            self.warning_count_label.setStyleSheet(warning_style)
 
-    def _rebuild_alarm_list_compact(self):
-        """Rebuild list in compact format"""
+    def _rebuild_alarm_list(self):
+        """Rebuild the whole list in the current format and filter"""
         self.alarm_list.clear()
 
-        filter_mode = self.filter_combo.currentText()
-
-        if filter_mode in ["All", "Alarms Only"]:
-            for cavity in sorted(
-                self.alarm_cavities, key=lambda c: (c.cryomodule.name, c.number)
-            ):
-                item = self._create_compact_alarm_item(cavity, is_alarm=True)
-                self.alarm_list.addItem(item)
-
-        if filter_mode in ["All", "Warnings Only"]:
-            for cavity in sorted(
-                self.warning_cavities,
-                key=lambda c: (c.cryomodule.name, c.number),
-            ):
-                item = self._create_compact_alarm_item(cavity, is_alarm=False)
-                self.alarm_list.addItem(item)
-
-    def _rebuild_alarm_list_full(self):
-        """Rebuild list in full format"""
-        self.alarm_list.clear()
+        for severity in (ALARM_SEVERITY, WARNING_SEVERITY):
+            if not self._is_shown(severity):
+                continue
+            for cavity in self._cavities_with(severity):
+                self.alarm_list.addItem(self._create_item(cavity, severity))
 
+    def _is_shown(self, severity: int) -> bool:
+        """Whether the filter lists cavities with this severity"""
         filter_mode = self.filter_combo.currentText()
-
-        if filter_mode in ["All", "Alarms Only"]:
-            for cavity in sorted(
-                self.alarm_cavities, key=lambda c: (c.cryomodule.name, c.number)
-            ):
-                item = self._create_full_alarm_item(cavity, is_alarm=True)
-                self.alarm_list.addItem(item)
-
-        if filter_mode in ["All", "Warnings Only"]:
-            for cavity in sorted(
-                self.warning_cavities,
-                key=lambda c: (c.cryomodule.name, c.number),
-            ):
-                item = self._create_full_alarm_item(cavity, is_alarm=False)
-                self.alarm_list.addItem(item)
+        if severity == ALARM_SEVERITY:
+            return filter_mode in ["All", "Alarms Only"]
+        return filter_mode in ["All", "Warnings Only"]
+
+    def _cavities_with(self, severity: int) -> List:
+        if severity == ALARM_SEVERITY:
+            return self.alarm_cavities
+        return self.warning_cavities
+
+    def _position(self, cavity, severity: int) -> Tuple[int, int]:
+        """(index in its sorted list, list widget row) for a cavity"""
+        index = bisect.bisect_left(
+            self._cavities_with(severity),
+            _cavity_sort_key(cavity),
+            key=_cavity_sort_key,
+        )
+        row = index
+        # Warnings are listed after any alarms
+        if severity == WARNING_SEVERITY and self._is_shown(ALARM_SEVERITY):
+            row += len(self.alarm_cavities)
+        return index, row
+
+    def _create_item(self, cavity, severity: int) -> QListWidgetItem:
+        is_alarm = severity == ALARM_SEVERITY
+        if self.display_mode == "compact":
+            return self._create_compact_alarm_item(cavity, is_alarm=is_alarm)
+        return self._create_full_alarm_item(cavity, is_alarm=is_alarm)
 
     def _create_compact_alarm_item(self, cavity, is_alarm=True):
         """Create a compact format list item for a cavity"""
@@ -323,11 +352,36 @@ class AlarmSidebarWidget(QWidget):
 
         return item
 
-    def _start_refresh_timer(self):
-        """Start timer to refresh alarm list periodically"""
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.update_alarm_list)
-        self.refresh_timer.start(2000)
+    def _connect_cavity_signals(self):
+        """Follow severity and description changes of every cavity"""
+        hub = getattr(self.gui_machine, "subscription_hub", None)
+        if isinstance(hub, SubscriptionHub):
+            # One listener each for the whole machine
+            for add, remove, slot in (
+                (
+                    hub.add_severity_listener,
+                    hub.remove_severity_listener,
+                    self.on_severity_changed,
+                ),
+                (
+                    hub.add_description_listener,
+                    hub.remove_description_listener,
+                    self._on_description_updated,
+                ),
+            ):
+                add(slot)
+                self._hub_listeners.append((remove, slot))
+            return
+
+        for cavity in self._get_all_cavities():
+            widget = cavity.cavity_widget
+            for signal, slot in (
+                (widget.last_severity_changed, self.on_severity_changed),
+                (widget.description_updated, self._on_description_updated),
+            ):
+                callback = partial(slot, cavity)
+                signal.connect(callback)
+                self._connections.append((signal, callback))
 
     def _get_all_cavities(self):
         """Generator to iterate over all cavities"""
@@ -349,22 +403,66 @@ class AlarmSidebarWidget(QWidget):
                     yield cavity
 
     def update_alarm_list(self):
-        """Scan all cavities and update the alarm/warning lists"""
-        self.alarm_cavities.clear()
-        self.warning_cavities.clear()
+        """Rescan all cavities and rebuild the alarm/warning lists
 
-        # Collect all cavities with issues
+        Signals keep the lists current; this is the manual resync.
+        """
+        self._listed_severity = {}
         for cavity in self._get_all_cavities():
             severity = getattr(cavity.cavity_widget, "_last_severity", None)
-
-            if severity == 2:  # Red alarm
-                self.alarm_cavities.append(cavity)
-            elif severity == 1:  # Yellow warning
-                self.warning_cavities.append(cavity)
+            if severity in (ALARM_SEVERITY, WARNING_SEVERITY):
+                self._listed_severity[cavity] = severity
+
+        for severity in (ALARM_SEVERITY, WARNING_SEVERITY):
+            self._cavities_with(severity)[:] = sorted(
+                (
+                    cavity
+                    for cavity, listed in self._listed_severity.items()
+                    if listed == severity
+                ),
+                key=_cavity_sort_key,
+            )
 
         # Update display based on current mode
         self._update_display_mode()
 
+    def on_severity_changed(self, cavity, severity):
+        """Move one cavity into, out of or between the lists"""
+        if severity not in (ALARM_SEVERITY, WARNING_SEVERITY):
+            severity = None
+        previous = self._listed_severity.get(cavity)
+        if severity == previous:
+            return
+
+        if previous is not None:
+            index, row = self._position(cavity, previous)
+            del self._cavities_with(previous)[index]
+            del self._listed_severity[cavity]
+            if self._is_shown(previous):
+                self.alarm_list.takeItem(row)
+
+        if severity is not None:
+            index, row = self._position(cavity, severity)
+            self._cavities_with(severity).insert(index, cavity)
+            self._listed_severity[cavity] = severity
+            if self._is_shown(severity):
+                self.alarm_list.insertItem(
+                    row, self._create_item(cavity, severity)
+                )
+
+        self._update_count_labels()
+
+    def _on_description_updated(self, cavity, description: str):
+        """Refresh the text of a listed cavity's item"""
+        severity = self._listed_severity.get(cavity)
+        if severity is None or not self._is_shown(severity):
+            return
+        _, row = self._position(cavity, severity)
+        item = self.alarm_list.item(row)
+        updated = self._create_item(cavity, severity)
+        item.setText(updated.text())
+        item.setToolTip(updated.toolTip())
+
     def _on_alarm_clicked(self, item: QListWidgetItem):
         """Handle single click - highlight cavity"""
         cavity = item.data(Qt.UserRole)
@@ -379,6 +477,14 @@ class AlarmSidebarWidget(QWidget):
             cavity.show_fault_display()
 
     def stop_refresh(self):
-        """Stop the refresh timer (call when closing)"""
-        if hasattr(self, "refresh_timer"):
-            self.refresh_timer.stop()
+        """Stop following cavity changes (call when closing)"""
+        for signal, callback in self._connections:
+            try:
+                signal.disconnect(callback)
+            except TypeError:
+                # Already disconnected
+                pass
+        self._connections.clear()
+        for remove, slot in self._hub_listeners:
+            remove(slot)
+        self._hub_listeners.clear()
@@ -4,6 +4,9 @@ import time
 from PyQt5.QtCore import QTimer, QObject, pyqtSignal
 from PyQt5.QtWidgets import QApplication
 
+from sc_linac_physics.displays.cavity_display.frontend.subscription_hub import (
+    SubscriptionHub,
+)
 from sc_linac_physics.displays.cavity_display.utils.utils import (
     CAV_LOG_DIR,
     DEBUG,
@@ -512,6 +515,21 @@ class AudioAlertManager(QObject):
 
     def _connect_to_cavities(self):
         """Connect to all cavity severity changes via signals"""
+        hub = getattr(self.gui_machine, "subscription_hub", None)
+        if isinstance(hub, SubscriptionHub):
+            # One listener for the whole machine instead of one per cavity
+            hub.add_severity_listener(self._on_severity_change)
+            audio_alert_logger.info(
+                "Audio manager connected to cavity signals",
+                extra={
+                    "extra_data": {
+                        "cavity_count": len(hub.cavities),
+                        "connection_method": "subscription_hub",
+                    }
+                },
+            )
+            return
+
         cavity_count = 0
 
         for linac in self.gui_machine.linacs:
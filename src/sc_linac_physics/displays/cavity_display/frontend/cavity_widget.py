@@ -1,19 +1,28 @@
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Hashable, Optional
 
 import numpy as np
 from PyQt5.QtCore import QTimer, pyqtSignal
-from PyQt5.QtWidgets import QApplication, QMenu, QMessageBox
+from PyQt5.QtWidgets import (
+    QApplication,
+    QMenu,
+    QMessageBox,
+    QStyle,
+    QStyleOption,
+)
 from pydm import Display, PyDMChannel
 from pydm.widgets.drawing import PyDMDrawingPolygon
 from qtpy.QtCore import QPoint, QRectF, Property as qtProperty, Qt, Slot
 from qtpy.QtGui import (
+    QBrush,
     QColor,
     QCursor,
     QFontMetrics,
     QMouseEvent,
     QPainter,
     QPen,
+    QPixmap,
     QTextOption,
 )
 
@@ -48,12 +57,58 @@ SHAPE_PARAMETER_DICT = {
 }
 
 
+class RenderCache:
+    """LRU of rendered cavity tiles, shared by every CavityWidget.
+
+    Tiles are keyed by everything draw_item depends on, so widgets in
+    the same state at the same size share one pixmap. A zoom change
+    only misses for the new size; pixmaps of other sizes stay valid
+    until evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._pixmaps: OrderedDict[Hashable, QPixmap] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    def get(self, key: Hashable) -> Optional[QPixmap]:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        self._pixmaps[key] = pixmap
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.max_entries:
+            self._pixmaps.popitem(last=False)
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self.hits = self.misses = 0
+
+
+RENDER_CACHE = RenderCache()
+
+
 class CavityWidget(PyDMDrawingPolygon):
     """Custom widget for displaying cavity status."""
 
     press_pos: Optional[QPoint] = None
+    # None paints every update from scratch
+    render_cache: Optional[RenderCache] = RENDER_CACHE
     clicked = pyqtSignal()
     severity_changed = pyqtSignal(int)
+    # _last_severity changed (None when invalid); emitted only on change
+    last_severity_changed = pyqtSignal(object)
+    description_updated = pyqtSignal(str)
 
     def __init__(self, parent=None, init_channel=None):
         super(CavityWidget, self).__init__(parent, init_channel)
@@ -154,7 +209,7 @@ class CavityWidget(PyDMDrawingPolygon):
     def _apply_severity_shape(self, value, shape_params):
         """Apply shape parameters for a valid severity value."""
         try:
-            self._last_severity = value
+            self._set_last_severity(value)
             self.severity_changed.emit(value)
             self.change_shape(shape_params)
         except Exception:
@@ -162,7 +217,7 @@ class CavityWidget(PyDMDrawingPolygon):
 
     def _apply_fallback_shape(self):
         """Apply fallback shape when severity is invalid or error occurs."""
-        self._last_severity = None
+        self._set_last_severity(None)
         fallback = SHAPE_PARAMETER_DICT.get(3)
         if fallback is not None:
             try:
@@ -170,6 +225,11 @@ class CavityWidget(PyDMDrawingPolygon):
             except Exception:
                 pass
 
+    def _set_last_severity(self, value) -> None:
+        if value != self._last_severity:
+            self._last_severity = value
+            self.last_severity_changed.emit(value)
+
     @Slot()
     @Slot(object)
     @Slot(str)
@@ -178,6 +238,7 @@ class CavityWidget(PyDMDrawingPolygon):
         if value is None:
             self._cavity_description = ""
             self.setToolTip("No description available")
+            self.description_updated.emit("")
             self.update()
             return
 
@@ -203,6 +264,7 @@ class CavityWidget(PyDMDrawingPolygon):
             self._cavity_description = ""
             self.setToolTip("Description processing error")
 
+        self.description_updated.emit(self._cavity_description)
         self.update()
 
     def value_changed(self, new_val):
@@ -344,6 +406,63 @@ class CavityWidget(PyDMDrawingPolygon):
         self._pen.setColor(original_color)
         self.update()
 
+    def _render_key(self) -> Hashable:
+        """Everything the rendered tile depends on."""
+        # change_shape stores a bare QColor as the brush
+        brush = QBrush(self._brush)
+        return (
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+            brush.color().rgba(),
+            brush.style(),
+            # The pen holds the highlight state
+            self._pen.color().rgba(),
+            self._pen.widthF(),
+            self._pen.style(),
+            self._pen_width,
+            self._num_points,
+            self._rotation,
+            str(self._cavity_text),
+            self._underline,
+            self.font().key(),
+        )
+
+    def _render(self) -> QPixmap:
+        """Draw the tile into a transparent pixmap, as paintEvent would."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(self._brush)
+        painter.setPen(self._pen)
+        self.draw_item(painter)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        cache = self.render_cache
+        if cache is None or self.width() <= 0 or self.height() <= 0:
+            super().paintEvent(event)
+            return
+
+        key = self._render_key()
+        pixmap = cache.get(key)
+        if pixmap is None:
+            pixmap = self._render()
+            cache.put(key, pixmap)
+
+        painter = QPainter(self)
+        # Stylesheet background stays live; only the tile is cached
+        opt = QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
+        painter.drawPixmap(0, 0, pixmap)
+
     def draw_item(self, painter: QPainter):
         super(CavityWidget, self).draw_item(painter)
         x, y, w, h = self.get_bounds(maxsize=True)
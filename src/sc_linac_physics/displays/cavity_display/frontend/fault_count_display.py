@@ -1,7 +1,11 @@
-from typing import Dict, Optional, List
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import partial
+from typing import Dict, Optional, List, Set, Tuple
 
 import pyqtgraph as pg
-from PyQt5.QtCore import QDateTime
+from PyQt5.QtCore import QDateTime, QThread, pyqtSignal
 from PyQt5.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
@@ -27,11 +31,75 @@ from sc_linac_physics.displays.cavity_display.frontend.cavity_widget import (
 from sc_linac_physics.displays.cavity_display.utils import utils
 from sc_linac_physics.utils.sc_linac.linac_utils import ALL_CRYOMODULES
 
+# Fault counts kept per (cavity, start, end); each is a small dict
+FAULT_COUNT_CACHE_SIZE = 32
+
+CountsKey = Tuple[BackendCavity, datetime, datetime]
+
+
+class FaultCountLoader(QThread):
+    """Fetches one cavity's fault counts off the GUI thread.
+
+    The archiver query itself can't be interrupted, so cancel() marks
+    the loader stale and its result is dropped instead of emitted.
+    """
+
+    loaded = pyqtSignal(object, object)  # (key, Dict[str, FaultCounter])
+    failed = pyqtSignal(object, str)  # (key, error message)
+
+    def __init__(self, cavity: BackendCavity, start: datetime, end: datetime):
+        super().__init__()
+        self.key: CountsKey = (cavity, start, end)
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self) -> None:
+        cavity, start, end = self.key
+        try:
+            # An archiver outage must not look like a fault-free range
+            counts = cavity.get_fault_counts(start, end, raise_on_error=True)
+        except Exception as e:
+            if not self.is_cancelled:
+                self.failed.emit(self.key, str(e))
+            return
+        if not self.is_cancelled:
+            self.loaded.emit(self.key, counts)
+
+
+# Loaders abandoned by closed displays, kept referenced until their
+# archiver query ends so the QThread isn't destroyed while running
+_detached_loaders: Set[FaultCountLoader] = set()
+
+
+def _detach_loader(loader: FaultCountLoader) -> None:
+    """Cancel loader and let it finish in the background, unattended."""
+    loader.cancel()
+    for signal in (loader.loaded, loader.failed, loader.finished):
+        try:
+            signal.disconnect()
+        except TypeError:
+            # Nothing connected
+            pass
+    _detached_loaders.add(loader)
+    loader.finished.connect(partial(_release_loader, loader))
+    if not loader.isRunning():
+        _release_loader(loader)
+
+
+def _release_loader(loader: FaultCountLoader) -> None:
+    if loader in _detached_loaders:
+        _detached_loaders.discard(loader)
+        loader.deleteLater()
+
 
 class FaultCountDisplay(Display):
-    fault_tlc_list: List[str] = sorted(
-        set(map(lambda d: d["Three Letter Code"], utils.parse_csv()))
-    )
+    fault_tlc_list: List[str] = utils.fault_tlcs()
 
     def __init__(self, lazy_fault_pvs=True):
         super().__init__()
@@ -67,15 +135,17 @@ class FaultCountDisplay(Display):
         self.start_selector.setMinimumDateTime(min_date_time)
         self.start_selector.setDateTime(intermediate_time)
         self.end_selector.setDateTime(end_date_time)
-        self.start_selector.editingFinished.connect(self.update_plot)
-        self.end_selector.editingFinished.connect(self.update_plot)
+        self.start_selector.editingFinished.connect(self.load_data)
+        self.end_selector.editingFinished.connect(self.load_data)
 
         self.omit_tlc_text = QLabel(text="Select a fault to omit:")
         self.hide_fault_combo_box = QComboBox()
         self.hide_fault_combo_box.addItems(
             ["No fault selected"] + self.fault_tlc_list
         )
-        self.hide_fault_combo_box.currentIndexChanged.connect(self.update_plot)
+        # Served from the count cache; only a new range refetches
+        self.hide_fault_combo_box.currentIndexChanged.connect(self.load_data)
+        self.status_label = QLabel()
 
         input_h_layout.addWidget(QLabel("Cryomodule:"))
         input_h_layout.addWidget(self.cm_combo_box)
@@ -90,6 +160,7 @@ class FaultCountDisplay(Display):
         omit_fault_h_layout.addWidget(self.omit_tlc_text)
         omit_fault_h_layout.addWidget(self.hide_fault_combo_box)
         omit_fault_h_layout.addStretch()
+        omit_fault_h_layout.addWidget(self.status_label)
 
         self.cm_combo_box.addItems([""] + ALL_CRYOMODULES)
         self.cav_combo_box.addItems([""] + [str(i) for i in range(1, 9)])
@@ -100,6 +171,14 @@ class FaultCountDisplay(Display):
         self.y_data = None
         self.data: Dict[str, FaultCounter] = None
 
+        # Least recently used first
+        self._counts_cache: OrderedDict[CountsKey, Dict[str, FaultCounter]] = (
+            OrderedDict()
+        )
+        self._loader: Optional[FaultCountLoader] = None
+        # Cancelled loaders still finishing their archiver query
+        self._loaders: Set[FaultCountLoader] = set()
+
         self.cavity: Optional[BackendCavity] = None
         self.cm_combo_box.currentIndexChanged.connect(self.update_cavity)
         self.cav_combo_box.currentIndexChanged.connect(self.update_cavity)
@@ -114,7 +193,91 @@ class FaultCountDisplay(Display):
         self.cavity: BackendCavity = self.machine.cryomodules[cm_name].cavities[
             int(cav_num)
         ]
-        self.update_plot()
+        self.load_data()
+
+    def _data_key(self) -> CountsKey:
+        return (
+            self.cavity,
+            self.start_selector.dateTime().toPyDateTime(),
+            self.end_selector.dateTime().toPyDateTime(),
+        )
+
+    def cached_counts(
+        self, key: CountsKey
+    ) -> Optional[Dict[str, FaultCounter]]:
+        """Counts for key if cached, marking them most recently used."""
+        counts = self._counts_cache.get(key)
+        if counts is not None:
+            self._counts_cache.move_to_end(key)
+        return counts
+
+    def _cache_counts(
+        self, key: CountsKey, counts: Dict[str, FaultCounter]
+    ) -> None:
+        self._counts_cache[key] = counts
+        self._counts_cache.move_to_end(key)
+        while len(self._counts_cache) > FAULT_COUNT_CACHE_SIZE:
+            self._counts_cache.popitem(last=False)
+
+    def load_data(self):
+        """Show counts for the current selection without blocking the GUI.
+
+        Cached counts are plotted straight away; otherwise a
+        FaultCountLoader fetches them and the plot updates when it
+        finishes. Starting a load cancels any load for an older
+        selection, so only the latest one is ever plotted.
+        """
+        if not self.cavity:
+            return
+
+        key = self._data_key()
+        if self.cached_counts(key) is not None:
+            self._cancel_load()
+            self.update_plot()
+            return
+        if self._loader is not None and self._loader.key == key:
+            return
+
+        self._cancel_load()
+        loader = FaultCountLoader(*key)
+        loader.loaded.connect(self._on_counts_loaded)
+        loader.failed.connect(self._on_load_failed)
+        loader.finished.connect(partial(self._on_loader_finished, loader))
+        self._loader = loader
+        self._loaders.add(loader)
+        self.status_label.setText(
+            f"Loading CM{self.cavity.cryomodule.name} "
+            f"cavity {self.cavity.number}..."
+        )
+        loader.start()
+
+    def _cancel_load(self) -> None:
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+        self.status_label.clear()
+
+    def _on_counts_loaded(
+        self, key: CountsKey, counts: Dict[str, FaultCounter]
+    ) -> None:
+        self._cache_counts(key, counts)
+        # A newer selection may have been made after the loader emitted
+        if self._loader is not None and self._loader.key == key:
+            self._loader = None
+            self.status_label.clear()
+            self.update_plot()
+
+    def _on_load_failed(self, key: CountsKey, error: str) -> None:
+        if self._loader is not None and self._loader.key == key:
+            self._loader = None
+            self.status_label.setText(f"Failed to load fault counts: {error}")
+
+    def _on_loader_finished(self, loader: FaultCountLoader) -> None:
+        # finished is emitted just before the thread exits
+        loader.wait()
+        self._loaders.discard(loader)
+        if self._loader is loader:
+            self._loader = None
 
     def get_data(self):
         self.num_faults = []
@@ -122,19 +285,24 @@ class FaultCountDisplay(Display):
         self.num_warnings = []
         self.y_data = []
 
-        start = self.start_selector.dateTime().toPyDateTime()
-        end = self.end_selector.dateTime().toPyDateTime()
-
         """
         result is a dictionary with:
             key = fault TLC string i.e. "BCS"
             value = FaultCounter(fault_count=0, ok_count=1, invalid_count=0) <-- Example
         """
-        data: Dict[str, FaultCounter] = self.cavity.get_fault_counts(start, end)
-
+        key = self._data_key()
+        data: Optional[Dict[str, FaultCounter]] = self.cached_counts(key)
+        if data is None:
+            # Blocking; the GUI goes through load_data instead. Errors
+            # propagate so an outage is never cached as "no faults"
+            data = self.cavity.get_fault_counts(*key[1:], raise_on_error=True)
+            self._cache_counts(key, data)
+
+        # Filter a view so the cached counts keep every TLC
         fault_tlc = self.hide_fault_combo_box.currentText()
-        if fault_tlc in data:
-            data.pop(fault_tlc)
+        data = {
+            tlc: counter for tlc, counter in data.items() if tlc != fault_tlc
+        }
 
         for tlc, counter_obj in data.items():
             self.y_data.append(tlc)
@@ -145,6 +313,9 @@ class FaultCountDisplay(Display):
     def update_plot(self):
         if not self.cavity:
             return
+        if self._loader is not None and self._loader.key == self._data_key():
+            # Plotted when the background load finishes
+            return
         self.plot_window.clear()
         self.get_data()
 
@@ -190,3 +361,13 @@ class FaultCountDisplay(Display):
         self.plot_window.addItem(warning_bars)
 
         print("Displaying plot for", self.cavity.cryomodule, self.cavity.number)
+
+    def closeEvent(self, event) -> None:
+        # Archiver queries can't be interrupted, and terminating a thread
+        # mid-request can leave locks held, so in-flight loaders are left
+        # to finish in the background without blocking the GUI
+        self._cancel_load()
+        for loader in self._loaders:
+            _detach_loader(loader)
+        self._loaders.clear()
+        super().closeEvent(event)
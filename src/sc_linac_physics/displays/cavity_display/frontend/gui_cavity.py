@@ -26,6 +26,9 @@ from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
 from sc_linac_physics.displays.cavity_display.frontend.cavity_widget import (
     CavityWidget,
 )
+from sc_linac_physics.displays.cavity_display.frontend.subscription_hub import (
+    SubscriptionHub,
+)
 from sc_linac_physics.displays.cavity_display.frontend.utils import (
     make_header,
     EnumLabel,
@@ -124,7 +127,16 @@ class GUICavity(BackendCavity):
         return hor_layout
 
     def _setup_pv_channels(self):
-        """Configure PV channels for the cavity widget."""
+        """Configure PV channels for the cavity widget.
+
+        Machines with a SubscriptionHub feed the widget from shared
+        channels instead of the widget opening its own.
+        """
+        hub = getattr(self.linac.machine, "subscription_hub", None)
+        if isinstance(hub, SubscriptionHub):
+            hub.subscribe_cavity(self)
+            return
+
         severity_pv = self.pv_addr("CUDSEVR")
         status_pv = self.pv_addr("CUDSTATUS")
         description_pv = self.pv_addr("CUDDESC")
@@ -15,6 +15,9 @@ from sc_linac_physics.displays.cavity_display.frontend.gui_cavity import (
 from sc_linac_physics.displays.cavity_display.frontend.gui_cryomodule import (
     GUICryomodule,
 )
+from sc_linac_physics.displays.cavity_display.frontend.subscription_hub import (
+    SubscriptionHub,
+)
 from sc_linac_physics.utils.sc_linac.linac import Machine
 
 
@@ -58,6 +61,8 @@ class GUIMachine(Machine):
 
     def __init__(self, lazy_fault_pvs=True):
         self.lazy_fault_pvs = lazy_fault_pvs
+        # Cavities subscribe to it as they're built
+        self.subscription_hub = SubscriptionHub()
         super().__init__(cavity_class=GUICavity, cryomodule_class=GUICryomodule)
 
         # Layout configuration
@@ -1,17 +1,17 @@
-import bisect
 import dataclasses
 import threading
-from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from sc_linac_physics.displays.cavity_display.backend.archive_cache import (
+    cached_values_over_time_range,
+)
 from sc_linac_physics.displays.cavity_display.backend.fault import (
     FaultCounter,
-    FaultEvent,
-    SeverityLevel,
+    FaultEventLog,
 )
 
 
@@ -22,16 +22,23 @@ class CavityFaultResult:
     fault_events stores the raw timestamped fault data from the archiver,
     enabling the time slider to filter by time window and re-aggregate
     counts without re-fetching. Events are stored in chronological order
-    (as returned by the archiver) so bisect can be used for O(log n)
-    window lookups.
+    (as returned by the archiver) so window lookups can binary search.
+    They are kept in a columnar FaultEventLog; a list of FaultEvents is
+    converted on construction.
     """
 
     cm_name: str
     cavity_num: int
     fault_counts_by_tlc: Optional[Dict[str, FaultCounter]] = None
-    fault_events: Optional[List[FaultEvent]] = None
+    fault_events: Optional[FaultEventLog] = None
     error: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if self.fault_events is not None and not isinstance(
+            self.fault_events, FaultEventLog
+        ):
+            self.fault_events = FaultEventLog.from_events(self.fault_events)
+
     def _sum_tlc_field(self, field: str) -> int:
         """Sum a single field (e.g. 'alarm_count') across all TLC fault types."""
         if not self.fault_counts_by_tlc:
@@ -77,32 +84,16 @@ class CavityFaultResult:
         was already standing when it opened, so the answer matches a
         direct archiver fetch of just that window. Returns None for
         results with no events (e.g. errors). Runs per cavity on every
-        slider tick, hence the bisect.
+        slider tick, hence the binary search over the timestamp column.
         """
         if self.fault_events is None:
             return None
 
         # events are in archiver (chronological) order
-        lo = bisect.bisect_left(
-            self.fault_events, window_start, key=lambda e: e.timestamp
-        )
-        hi = bisect.bisect_right(
-            self.fault_events, window_end, key=lambda e: e.timestamp
-        )
-
-        counts: Dict[str, FaultCounter] = defaultdict(FaultCounter)
-
-        # carry in a fault that was still standing when the window opened
-        if lo > 0:
-            previous = self.fault_events[lo - 1]
-            if previous.severity != SeverityLevel.NO_ALARM:
-                counts[previous.status].count_severity(previous.severity)
-
-        for event in self.fault_events[lo:hi]:
-            if event.severity == SeverityLevel.NO_ALARM:  # an OK, not a fault
-                continue
-            counts[event.status].count_severity(event.severity)
-        return dict(counts)
+        lo, hi = self.fault_events.index_range(window_start, window_end)
+        # Starting one event early carries in a fault that was still
+        # standing when the window opened (OK events are never counted)
+        return self.fault_events.fault_counts(max(lo - 1, 0), hi)
 
 
 class FaultDataFetcher(QThread):
@@ -111,6 +102,13 @@ class FaultDataFetcher(QThread):
     Uses a ThreadPoolExecutor internally so individual archiver queries
     run concurrently, but signals are emitted back on the Qt thread for
     safe UI updates.
+
+    By default each cavity sends its own archiver query. Given an
+    archive_client (a BulkArchiveClient), cavities are instead fetched in
+    groups that fill one multi-PV request each, over the client's shared
+    session; results are still emitted cavity by cavity as each group
+    completes. A group whose bulk request fails is retried one cavity
+    at a time.
     """
 
     progress = pyqtSignal(int, int)  # (completed, total)
@@ -126,8 +124,10 @@ class FaultDataFetcher(QThread):
         cavity_filter: Optional[Set[Tuple[str, int]]] = None,
         cm_whitelist: Optional[Set[str]] = None,
         parent=None,
+        archive_client=None,
     ) -> None:
         super().__init__(parent)
+        self._archive_client = archive_client
         self._machine = machine
         self._start_time = start_time
         self._end_time = end_time
@@ -177,6 +177,10 @@ class FaultDataFetcher(QThread):
             self.fetch_error.emit("No cavities found in machine")
             return
 
+        if self._archive_client is not None:
+            self.finished_all.emit(self._run_bulk(cavities))
+            return
+
         all_results: List[CavityFaultResult] = []
 
         with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
@@ -207,6 +211,86 @@ class FaultDataFetcher(QThread):
 
         self.finished_all.emit(all_results)
 
+    def _run_bulk(
+        self, cavities: List[Tuple[str, int, Any]]
+    ) -> List[CavityFaultResult]:
+        """Fetch cavities in groups of one bulk archiver request each."""
+        client = self._archive_client
+        # Each cavity needs a status and a severity PV
+        group_size = max(1, client.chunk_size // 2)
+        groups = [
+            cavities[i : i + group_size]
+            for i in range(0, len(cavities), group_size)
+        ]
+
+        all_results: List[CavityFaultResult] = []
+        with ThreadPoolExecutor(max_workers=client.max_workers) as executor:
+            futures = [
+                executor.submit(self._fetch_cavity_group, group)
+                for group in groups
+            ]
+            for future in as_completed(futures):
+                for result in future.result():
+                    all_results.append(result)
+                    self.cavity_result.emit(result)
+                    self.progress.emit(len(all_results), len(cavities))
+
+                if self._abort_event.is_set():
+                    for f in futures:
+                        f.cancel()
+                    break
+        return all_results
+
+    def _fetch_cavity_group(
+        self, group: List[Tuple[str, int, Any]]
+    ) -> List[CavityFaultResult]:
+        """One bulk archiver query for a group of cavities."""
+        if self._abort_event.is_set():
+            return [
+                CavityFaultResult(cm_name, cav_num, error="Aborted")
+                for cm_name, cav_num, _ in group
+            ]
+
+        pv_list = [
+            pv for _, _, cavity in group for pv in cavity.fault_history_pvs
+        ]
+        try:
+            data = cached_values_over_time_range(
+                pv_list,
+                self._start_time,
+                self._end_time,
+                fetch=self._archive_client.get_values_over_time_range,
+            )
+        except Exception:
+            # Fall back to one query per cavity so a bad PV or an
+            # unsupported bulk endpoint only costs speed, not the group
+            return [
+                self._fetch_single_cavity(cm_name, cav_num, cavity)
+                for cm_name, cav_num, cavity in group
+            ]
+
+        results = []
+        for cm_name, cav_num, cavity in group:
+            status_pv, severity_pv = cavity.fault_history_pvs
+            try:
+                fault_counts, fault_events = cavity.process_fault_history(
+                    statuses=data[status_pv], severities=data[severity_pv]
+                )
+            except Exception as e:
+                results.append(
+                    CavityFaultResult(cm_name, cav_num, error=str(e))
+                )
+                continue
+            results.append(
+                CavityFaultResult(
+                    cm_name=cm_name,
+                    cavity_num=cav_num,
+                    fault_counts_by_tlc=dict(fault_counts),
+                    fault_events=fault_events,
+                )
+            )
+        return results
+
     def _fetch_single_cavity(
         self, cm_name: str, cavity_num: int, cavity
     ) -> CavityFaultResult:
@@ -1,8 +1,9 @@
 import math
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QKeySequence
 from PyQt5.QtGui import QColor, QPainter
@@ -25,8 +26,11 @@ from PyQt5.QtWidgets import (
 )
 from pydm import Display
 
+from sc_linac_physics.displays.cavity_display.backend.archiver_client import (
+    BulkArchiveClient,
+)
 from sc_linac_physics.displays.cavity_display.backend.fault import (
-    SeverityLevel,
+    datetime_to_ns,
 )
 from sc_linac_physics.displays.cavity_display.frontend.heatmap.color_bar_widget import (
     ColorBarWidget,
@@ -109,10 +113,16 @@ class FaultHeatmapDisplay(Display):
         parent=None,
         args=None,
         macros=None,
+        archive_client=None,
     ) -> None:
         super().__init__(parent=parent, args=args, macros=macros)
 
         self._machine = machine
+        # BulkArchiveClient shared by every fetch; closed on exit if ours
+        self._owns_archive_client = archive_client is None
+        if archive_client is None:
+            archive_client = BulkArchiveClient()
+        self._archive_client = archive_client
         self._fetcher: Optional[FaultDataFetcher] = None
         self._results: List[CavityFaultResult] = []
         self._cavity_filter_active = False
@@ -791,31 +801,24 @@ class FaultHeatmapDisplay(Display):
             self._density_bar.set_data([], self._fetch_start, self._fetch_end)
             return
 
-        include_by_severity = {
-            SeverityLevel.WARNING: self._severity_filter.include_warnings,
-            SeverityLevel.ALARM: self._severity_filter.include_alarms,
-        }
         tlc = self._get_selected_tlc()
+        fault_timestamps = [
+            result.fault_events.timestamps_ns[
+                result.fault_events.fault_mask(
+                    status=tlc,
+                    include_warnings=self._severity_filter.include_warnings,
+                    include_alarms=self._severity_filter.include_alarms,
+                    include_invalid=self._severity_filter.include_invalid,
+                )
+            ]
+            for result in self._results
+            if result.fault_events
+        ]
 
-        all_timestamps: List[datetime] = []
-        for result in self._results:
-            if not result.fault_events:
-                continue
-            for event in result.fault_events:
-                # OK transitions are state markers
-                if event.severity == SeverityLevel.NO_ALARM:
-                    continue
-                if tlc is not None and event.status != tlc:
-                    continue
-                # Anything that isn't warning/alarm counts as invalid
-                if not include_by_severity.get(
-                    event.severity, self._severity_filter.include_invalid
-                ):
-                    continue
-                all_timestamps.append(event.timestamp)
-
-        self._density_bar.set_data(
-            all_timestamps, self._fetch_start, self._fetch_end
+        self._density_bar.set_data_ns(
+            np.concatenate(fault_timestamps) if fault_timestamps else [],
+            self._fetch_start,
+            self._fetch_end,
         )
 
     def _build_heatmap_row(self, sections: list) -> QHBoxLayout:
@@ -1127,6 +1130,7 @@ class FaultHeatmapDisplay(Display):
             end,
             cavity_filter=cavity_filter,
             cm_whitelist=set(self._cm_widgets.keys()),
+            archive_client=self._archive_client,
         )
         self._fetcher.progress.connect(self._on_fetch_progress)
         self._fetcher.cavity_result.connect(self._on_cavity_result)
@@ -1453,6 +1457,8 @@ class FaultHeatmapDisplay(Display):
             if not self._fetcher.wait(5000):
                 self._fetcher.terminate()
                 self._fetcher.wait(2000)
+        if self._owns_archive_client:
+            self._archive_client.close()
         super().closeEvent(event)
 
 
@@ -1500,28 +1506,35 @@ class FaultDensityBar(QWidget):
         end: Optional[datetime],
     ) -> None:
         """Bucket the timestamps and trigger a repaint."""
-        if not timestamps or not start or not end:
+        self.set_data_ns([datetime_to_ns(ts) for ts in timestamps], start, end)
+
+    def set_data_ns(
+        self,
+        timestamps_ns: Sequence[int],
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> None:
+        """set_data for epoch-ns timestamps (e.g. FaultEventLog columns)."""
+        if not len(timestamps_ns) or not start or not end:
             self._buckets = []
             self._max_count = 0
             self.update()
             return
 
-        total_secs = (end - start).total_seconds()
-        if total_secs <= 0:
+        start_ns, end_ns = datetime_to_ns(start), datetime_to_ns(end)
+        if end_ns <= start_ns:
             self._buckets = []
             self._max_count = 0
             self.update()
             return
 
-        buckets = [0] * self.NUM_BUCKETS
-        for ts in timestamps:
-            # the archiver's pre-range sample would land in a bad bucket
-            if ts < start or ts > end:
-                continue
-            offset = (ts - start).total_seconds()
-            idx = int((offset / total_secs) * self.NUM_BUCKETS)
-            idx = max(0, min(idx, self.NUM_BUCKETS - 1))
-            buckets[idx] += 1
+        offsets = np.asarray(timestamps_ns, dtype=np.int64) - start_ns
+        # the archiver's pre-range sample would land in a bad bucket
+        offsets = offsets[(offsets >= 0) & (offsets <= end_ns - start_ns)]
+        idx = (offsets / (end_ns - start_ns) * self.NUM_BUCKETS).astype(int)
+        buckets = np.bincount(
+            np.minimum(idx, self.NUM_BUCKETS - 1), minlength=self.NUM_BUCKETS
+        ).tolist()
 
         self._buckets = buckets
         self._max_count = max(buckets) if buckets else 0
@@ -1624,7 +1637,9 @@ if __name__ == "__main__":
 
     app = _QApp(sys.argv)
     machine = BackendMachine(lazy_fault_pvs=True)
-    window = FaultHeatmapDisplay(machine=machine)
+    window = FaultHeatmapDisplay(
+        machine=machine, archive_client=BulkArchiveClient(timeout=30)
+    )
     window.resize(1400, 700)
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,171 @@
+"""
+Shared PV subscriptions for the cavity display, delivered in frames.
+
+Every cavity tile used to open its own PyDMChannel for CUDSTATUS,
+CUDSEVR and CUDDESC, and the alarm sidebar and audio manager then
+connected to each tile's signals again. SubscriptionHub owns one
+channel per PV instead. Updates are only recorded as they arrive; a
+frame tick then delivers the latest value of each changed PV once, to
+the tile first and then to machine-wide listeners. A PV that updates
+several times within a frame is delivered once, so the work per frame
+is bounded by the number of PVs however fast they change.
+"""
+
+import logging
+from collections import defaultdict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+from PyQt5.QtCore import QObject, QTimer
+from pydm.widgets.channel import PyDMChannel
+
+if TYPE_CHECKING:
+    from sc_linac_physics.displays.cavity_display.frontend.gui_cavity import (
+        GUICavity,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Delivery tick; 10 frames/s keeps alarms prompt without repainting on
+# every monitor update
+FRAME_INTERVAL_MS = 100
+
+CavityListener = Callable[["GUICavity", Any], None]
+
+
+class SubscriptionHub(QObject):
+    """One PyDM connection per PV, dispatched on a frame tick.
+
+    Attributes:
+        frame_interval_ms: Time between deliveries (milliseconds)
+        updates_received: Value updates received from all channels
+        updates_delivered: Updates passed on to subscribers; the
+            difference from updates_received was coalesced away
+        cavities: Cavities subscribed through subscribe_cavity
+    """
+
+    def __init__(self, frame_interval_ms: int = FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.frame_interval_ms = frame_interval_ms
+        self.updates_received = 0
+        self.updates_delivered = 0
+        self.cavities: List["GUICavity"] = []
+
+        self._channels: Dict[str, PyDMChannel] = {}
+        self._value_callbacks: Dict[str, List[Callable]] = defaultdict(list)
+        self._connection_callbacks: Dict[str, List[Callable]] = defaultdict(
+            list
+        )
+        # Latest undelivered value per address, in arrival order
+        self._pending: Dict[str, Any] = {}
+        self._severity_listeners: List[CavityListener] = []
+        self._description_listeners: List[CavityListener] = []
+
+        # Single shot, started by the first update of a frame, so an
+        # idle machine costs no ticks
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self.flush)
+
+    @property
+    def channel_count(self) -> int:
+        return len(self._channels)
+
+    def subscribe(
+        self,
+        address: str,
+        value_callback: Callable[[Any], None],
+        connection_callback: Callable[[bool], None] = None,
+    ) -> None:
+        """Deliver address's values (once per frame) to value_callback.
+
+        Connection changes are passed straight to connection_callback;
+        they are rare and widgets act on them immediately.
+        """
+        self._value_callbacks[address].append(value_callback)
+        if connection_callback is not None:
+            self._connection_callbacks[address].append(connection_callback)
+
+        if address not in self._channels:
+            channel = PyDMChannel(
+                address=address,
+                value_slot=partial(self._on_value, address),
+                connection_slot=partial(self._on_connection, address),
+            )
+            self._channels[address] = channel
+            channel.connect()
+
+    def subscribe_cavity(self, cavity: "GUICavity") -> None:
+        """Feed a cavity's tile from its status, severity and description."""
+        self.cavities.append(cavity)
+        widget = cavity.cavity_widget
+        self.subscribe(
+            cavity.pv_addr("CUDSTATUS"),
+            widget.value_changed,
+            widget.connection_changed,
+        )
+        self.subscribe(
+            cavity.pv_addr("CUDSEVR"), partial(self._deliver_severity, cavity)
+        )
+        self.subscribe(
+            cavity.pv_addr("CUDDESC"),
+            partial(self._deliver_description, cavity),
+        )
+
+    def add_severity_listener(self, listener: CavityListener) -> None:
+        """Call listener(cavity, severity) after each tile severity update."""
+        self._severity_listeners.append(listener)
+
+    def remove_severity_listener(self, listener: CavityListener) -> None:
+        if listener in self._severity_listeners:
+            self._severity_listeners.remove(listener)
+
+    def add_description_listener(self, listener: CavityListener) -> None:
+        """Call listener(cavity, description) after each tile update."""
+        self._description_listeners.append(listener)
+
+    def remove_description_listener(self, listener: CavityListener) -> None:
+        if listener in self._description_listeners:
+            self._description_listeners.remove(listener)
+
+    def _on_value(self, address: str, value: Any) -> None:
+        self.updates_received += 1
+        self._pending[address] = value
+        if not self._frame_timer.isActive():
+            self._frame_timer.start(self.frame_interval_ms)
+
+    def _on_connection(self, address: str, connected: bool) -> None:
+        for callback in self._connection_callbacks.get(address, ()):
+            callback(connected)
+
+    def flush(self) -> None:
+        """Deliver every pending update now."""
+        pending, self._pending = self._pending, {}
+        self._frame_timer.stop()
+        for address, value in pending.items():
+            self.updates_delivered += 1
+            for callback in self._value_callbacks.get(address, ()):
+                try:
+                    callback(value)
+                except Exception:
+                    # One broken subscriber must not starve the rest
+                    logger.exception("Subscriber for %s failed", address)
+
+    def _deliver_severity(self, cavity: "GUICavity", value: Any) -> None:
+        cavity.cavity_widget.severity_channel_value_changed(value)
+        for listener in self._severity_listeners:
+            listener(cavity, value)
+
+    def _deliver_description(self, cavity: "GUICavity", value: Any) -> None:
+        cavity.cavity_widget.description_changed(value)
+        description = cavity.cavity_widget._cavity_description
+        for listener in self._description_listeners:
+            listener(cavity, description)
+
+    def close(self) -> None:
+        """Disconnect every channel and drop undelivered updates."""
+        self._frame_timer.stop()
+        self._pending.clear()
+        for channel in self._channels.values():
+            channel.disconnect()
+        self._channels.clear()
@@ -1,11 +1,14 @@
 import logging
 import os
 from csv import DictReader
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List
+from functools import cache
+from typing import Dict, List, Optional, Tuple
 
 from lcls_tools.common.data.archiver import ArchiveDataHandler
 
+from sc_linac_physics.displays.cavity_display.backend.fault import Fault
 from sc_linac_physics.utils.logger import BASE_LOG_DIR, custom_logger
 from sc_linac_physics.utils.platform_paths import is_macos
 
@@ -14,6 +17,8 @@ CAV_LOG_DIR = str(BASE_LOG_DIR / "cavity_display")
 # Basic OS detection
 DEBUG = is_macos()
 BACKEND_SLEEP_TIME = 10 if DEBUG else 0
+# Unchanged cavity status is re-put this often so a restarted IOC recovers
+STATUS_REPUBLISH_INTERVAL_SEC = 60.0
 
 STATUS_SUFFIX = "CUDSTATUS"
 SEVERITY_SUFFIX = "CUDSEVR"
@@ -25,9 +30,10 @@ def parse_csv() -> List[Dict]:
     this_dir = os.path.dirname(__file__)
     path = os.path.join(this_dir, "faults.csv")
     faults: List[Dict] = []
-    for row in DictReader(open(path, encoding="utf-8-sig")):
-        if row["PV Suffix"]:
-            faults.append(row)
+    with open(path, encoding="utf-8-sig") as csv_file:
+        for row in DictReader(csv_file):
+            if row["PV Suffix"]:
+                faults.append(row)
     return faults
 
 
@@ -55,6 +61,89 @@ class SpreadsheetError(Exception):
         super().__init__(self.message)
 
 
+@dataclass(frozen=True, slots=True)
+class FaultSpec:
+    """One faults.csv row, with its values already parsed.
+
+    PV prefixes and button paths still hold their {LINAC}/{CRYOMODULE}/...
+    placeholders; they are filled in per cavity.
+    """
+
+    tlc: str
+    short_description: str
+    long_description: str
+    action: str
+    level: str
+    cm_type: str
+    button_type: str
+    button_path: str
+    button_macros: str
+    rack: str
+    pv_prefix: str
+    pv_suffix: str
+    ok_value: Optional[float]
+    fault_value: Optional[float]
+    severity: int
+    generic_short_description: str
+    key: int
+
+    @classmethod
+    def from_csv_row(cls, row: Dict[str, str]) -> "FaultSpec":
+        return cls(
+            tlc=row["Three Letter Code"],
+            short_description=row["Short Description"],
+            long_description=row["Long Description"],
+            action=row["Recommended Corrective Actions"],
+            level=row["Level"],
+            cm_type=row["CM Type"],
+            button_type=row["Button Type"],
+            button_path=row["Button Path"],
+            button_macros=row["Button Macros"],
+            rack=row["Rack"],
+            pv_prefix=row["PV Prefix"],
+            pv_suffix=row["PV Suffix"],
+            ok_value=Fault._parse_numeric_value(row["OK If Equal To"]),
+            fault_value=Fault._parse_numeric_value(row["Faulted If Equal To"]),
+            severity=int(row["Severity"]),
+            generic_short_description=row.get(
+                "Generic Short Description for Decoder", ""
+            ),
+            key=display_hash(
+                rack=row["Rack"],
+                fault_condition=row["Faulted If Equal To"],
+                ok_condition=row["OK If Equal To"],
+                tlc=row["Three Letter Code"],
+                suffix=row["PV Suffix"],
+                prefix=row["PV Prefix"],
+            ),
+        )
+
+
+@cache
+def fault_specs() -> Tuple[FaultSpec, ...]:
+    """The fault table from faults.csv, parsed once per process.
+
+    Every cavity (and every display) shares this table instead of
+    re-reading the spreadsheet. Rows that can't be parsed are logged
+    and left out.
+    """
+    specs = []
+    for row in parse_csv():
+        try:
+            specs.append(FaultSpec.from_csv_row(row))
+        except (KeyError, TypeError, ValueError) as e:
+            cavity_fault_logger.error(
+                f"Skipping faults.csv row "
+                f"{row.get('Three Letter Code', 'UNKNOWN')}: {e}"
+            )
+    return tuple(specs)
+
+
+def fault_tlcs() -> List[str]:
+    """Sorted distinct three-letter codes in the fault table."""
+    return sorted({spec.tlc for spec in fault_specs()})
+
+
 def severity_of_fault(timestamp: datetime, severities: ArchiveDataHandler):
     sevr = None
     for severity_timestamp, severity in zip(
@@ -23,6 +23,59 @@ Batch Operations:
     >>> # Low-level batch read (fastest for one-time operations)
     >>> values = PVBatch.get_values(["PV:1", "PV:2", "PV:3"])
 
+Shared PVs:
+    >>> from sc_linac_physics.utils.epics import PV_REGISTRY, shared_pv
+    >>>
+    >>> # One PV per name (and form/count/auto_monitor) in the process
+    >>> pv = shared_pv("SOME:PV:NAME", owner=self)
+    >>> PV_REGISTRY.stats().channels
+
+Waiting on PVs:
+    >>> from sc_linac_physics.utils.epics import wait_until
+    >>>
+    >>> # Wakes on monitor updates instead of sleeping between polls
+    >>> wait_until(pv, lambda value: value == 1, timeout=10.0)
+
+Unreachable IOCs:
+    >>> from sc_linac_physics.utils.epics import CIRCUIT_BREAKERS
+    >>>
+    >>> # After repeated failures, PVs on an IOC fail fast with
+    >>> # PVCircuitOpenError until a probe gets through again
+    >>> if not CIRCUIT_BREAKERS.is_reachable("ACCL:L0B:0110:ACON"):
+    ...     print("IOC unreachable")
+    >>> CIRCUIT_BREAKERS.status()
+
+Metrics:
+    >>> from sc_linac_physics.utils.epics import PV_METRICS
+    >>>
+    >>> # Per-PV latency, failures, timeouts, retries and reconnects;
+    >>> # or set SC_LINAC_PV_METRICS=/path/metrics.json
+    >>> PV_METRICS.enable("pv_metrics.json")  # dumped at exit
+    >>> PV_METRICS.top(10, by="total_s")
+    >>> PV_METRICS.dump("pv_metrics.csv")
+
+Record and replay:
+    >>> from sc_linac_physics.utils.epics import PV_RECORDER, ReplaySession
+    >>>
+    >>> # Capture every get, put and monitor update (or set
+    >>> # SC_LINAC_PV_RECORD=/path/session.jsonl.gz)
+    >>> with PV_RECORDER.recording("session.jsonl.gz"):
+    ...     cavity.validate_quench()
+    >>>
+    >>> # Later, with no network: PVs created in the block replay it
+    >>> with ReplaySession("session.jsonl.gz", speed=None) as session:
+    ...     cavity = QuenchCavity(...)
+    ...     cavity.validate_quench()
+    >>> session.divergences
+
+asyncio:
+    >>> from sc_linac_physics.utils.epics import AsyncPV
+    >>>
+    >>> async def turn_on(pvname):
+    ...     pv = AsyncPV(pvname)
+    ...     await pv.put(1)
+    ...     await pv.wait_for(lambda value: value == 1, timeout=10.0)
+
 Custom Configuration:
     >>> from sc_linac_physics.utils.epics import PV, PVConfig
     >>>
@@ -34,6 +87,10 @@ Custom Configuration:
     ...     retry_delay=1.0
     ... )
     >>> pv = PV("SLOW:PV", config=slow_config)
+    >>>
+    >>> # Serve monitored values up to 0.5 s old without a network get
+    >>> value = pv.get(max_age=0.5)
+    >>> PV.default_config = PVConfig(max_age=0.5)
 
 Testing:
     >>> from sc_linac_physics.utils.epics.testing import make_mock_pv
@@ -42,8 +99,20 @@ Testing:
     >>> assert mock.get() == 42.0
 """
 
+# asyncio front end
+from .async_pv import AsyncPV
+
 # Batch operations
 from .batch import PVBatch
+
+# Per-IOC circuit breakers
+from .breaker import (
+    CIRCUIT_BREAKERS,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    CircuitStatus,
+)
 from .config import (
     PVConfig,
     EPICS_NO_ALARM_VAL,
@@ -55,22 +124,41 @@ from .config import (
 # Core functionality
 from .core import PV
 from .exceptions import (
+    PVCircuitOpenError,
     PVConnectionError,
     PVGetError,
     PVPutError,
     PVInvalidError,
+    PVWaitTimeoutError,
+    PVWaitAbortedError,
 )
 
+# Latency and error metrics
+from .metrics import PVMetrics, PV_METRICS
+
+# Recording and replay of PV traffic
+from .recording import PVRecorder, PV_RECORDER, Recording, read_recording
+
+# Shared PV registry
+from .registry import PVRegistry, PVRegistryStats, PV_REGISTRY, shared_pv
+
 # Testing utilities
 from .testing import make_mock_pv
 
+# Replay backend
+from .replay import ReplayPV, ReplaySession
+
 # Utilities
 from .utils import create_pv_safe, diagnose_pv_connection
 
+# Waiting on PV values
+from .wait import wait_until
+
 __all__ = [
     # Core
     "PV",
     "PVConfig",
+    "AsyncPV",
     # Constants
     "EPICS_NO_ALARM_VAL",
     "EPICS_MINOR_VAL",
@@ -81,8 +169,34 @@ __all__ = [
     "PVGetError",
     "PVPutError",
     "PVInvalidError",
+    "PVWaitTimeoutError",
+    "PVWaitAbortedError",
+    "PVCircuitOpenError",
     # Batch operations
     "PVBatch",
+    # Shared PV registry
+    "PVRegistry",
+    "PVRegistryStats",
+    "PV_REGISTRY",
+    "shared_pv",
+    # Per-IOC circuit breakers
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    "CircuitStatus",
+    "CIRCUIT_BREAKERS",
+    # Latency and error metrics
+    "PVMetrics",
+    "PV_METRICS",
+    # Recording and replay of PV traffic
+    "PVRecorder",
+    "PV_RECORDER",
+    "Recording",
+    "read_recording",
+    "ReplayPV",
+    "ReplaySession",
+    # Waiting on PV values
+    "wait_until",
     # Utilities
     "create_pv_safe",
     "diagnose_pv_connection",
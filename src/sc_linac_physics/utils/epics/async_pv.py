@@ -0,0 +1,356 @@
+"""
+asyncio front end for PV.
+
+AsyncPV lets many sequences share one event loop instead of a thread
+each. It wraps a PV and turns Channel Access callbacks, which arrive on
+pyepics' own thread, into asyncio wake-ups:
+
+- put(wait=True) completes on the put-completion callback
+- wait_for() and monitor() wake on monitor updates
+- get() serves the monitored value when there is one
+
+Reads that need the network (unmonitored PVs, or before the first monitor
+update) run the blocking PV.get in the loop's default executor.
+Timeouts and retries follow the PV's PVConfig, with retry delays awaited
+rather than slept.
+"""
+
+import asyncio
+from functools import partial
+from time import monotonic
+from typing import Any, AsyncIterator, Callable, Optional
+
+from epics import PV as EPICS_PV
+
+from sc_linac_physics.utils.epics.breaker import backoff_delay
+from sc_linac_physics.utils.epics.config import PVConfig
+from sc_linac_physics.utils.epics.core import PV
+from sc_linac_physics.utils.epics.exceptions import (
+    PVConnectionError,
+    PVPutError,
+    PVWaitTimeoutError,
+)
+from sc_linac_physics.utils.epics.logger import get_logger
+from sc_linac_physics.utils.epics.wait import DEFAULT_POLL_INTERVAL
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, func: Callable, *args):
+    """Schedule func on loop from a Channel Access thread"""
+    try:
+        loop.call_soon_threadsafe(func, *args)
+    except RuntimeError:
+        # The loop closed while a callback was still registered
+        pass
+
+
+def _set_result(future: asyncio.Future, result: Any = None):
+    if not future.done():
+        future.set_result(result)
+
+
+def _put_done(loop: asyncio.AbstractEventLoop, done: asyncio.Future, **kwargs):
+    """Put-completion callback; pyepics passes pvname and data"""
+    _call_soon(loop, _set_result, done)
+
+
+class AsyncPV:
+    """
+    Awaitable wrapper around PV.
+
+    Examples:
+        >>> pv = AsyncPV("ACCL:L0B:0110:ACON")
+        >>> value = await pv.get()
+        >>> await pv.put(16.6)
+        >>> await pv.wait_for(lambda value: value > 16, timeout=10)
+        >>> async for value in pv.monitor():
+        ...     print(value)
+    """
+
+    def __init__(
+        self,
+        pvname: str,
+        auto_monitor: bool = True,
+        form: str = "time",
+        count: Optional[int] = None,
+        config: Optional[PVConfig] = None,
+    ):
+        """
+        Create the underlying PV without waiting for it to connect; await
+        connect() (or any other method) to do that.
+
+        Args:
+            pvname: Process variable name
+            auto_monitor: Monitor the PV, so get() and wait_for() can use
+                monitor updates instead of network reads
+            form: Data form ('time', 'ctrl', or 'native')
+            count: Number of array elements to fetch
+            config: Custom PVConfig (uses PV.default_config if None)
+        """
+        self.pv = PV(
+            pvname,
+            form=form,
+            auto_monitor=auto_monitor,
+            count=count,
+            require_connection=False,
+            config=config,
+            _skip_connection_wait=True,
+        )
+
+    @property
+    def pvname(self) -> str:
+        return self.pv.pvname
+
+    @property
+    def config(self) -> PVConfig:
+        return self.pv.config
+
+    @property
+    def connected(self) -> bool:
+        return self.pv.connected
+
+    def __str__(self) -> str:
+        return f"AsyncPV({self.pvname})"
+
+    def __repr__(self) -> str:
+        return f"AsyncPV({self.pvname!r}, connected={self.connected})"
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
+        return False
+
+    def disconnect(self):
+        self.pv.disconnect()
+
+    async def connect(self, timeout: Optional[float] = None):
+        """
+        Wait for the PV to connect.
+
+        Raises:
+            PVConnectionError: If it does not connect within timeout
+        """
+        if self.pv.connected:
+            return
+
+        timeout = timeout or self.config.connection_timeout
+        loop = asyncio.get_running_loop()
+        connected = loop.create_future()
+
+        def on_connection(conn: bool = False, **kwargs):
+            if conn:
+                _call_soon(loop, _set_result, connected)
+
+        self.pv.connection_callbacks.append(on_connection)
+        try:
+            # It may have connected before the callback was added
+            if not self.pv.connected:
+                await asyncio.wait_for(connected, timeout)
+        except asyncio.TimeoutError:
+            error_msg = f"PV {self.pvname} failed to connect within {timeout}s"
+            get_logger().error(error_msg)
+            raise PVConnectionError(error_msg) from None
+        finally:
+            self.pv.connection_callbacks.remove(on_connection)
+
+    async def get(
+        self,
+        timeout: Optional[float] = None,
+        use_monitor: Optional[bool] = None,
+        as_string: bool = False,
+    ) -> Any:
+        """
+        Get the PV value.
+
+        A monitored PV that has had a monitor update is read from the
+        monitor without blocking. Anything else is read from the IOC by
+        PV.get (with its retries) in the default executor.
+
+        Raises:
+            PVConnectionError: If the PV does not connect
+            PVGetError: If the read fails after retries
+        """
+        timeout = timeout or self.config.get_timeout
+        await self.connect()
+
+        if use_monitor is None:
+            use_monitor = self.pv.auto_monitor
+
+        # _last_update is set once the first monitor update has arrived
+        if use_monitor and self.pv._last_update is not None:
+            return self.pv.get(as_string=as_string, use_monitor=True)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                self.pv.get,
+                timeout=timeout,
+                as_string=as_string,
+                use_monitor=use_monitor,
+            ),
+        )
+
+    async def put(
+        self, value: Any, wait: bool = True, timeout: Optional[float] = None
+    ):
+        """
+        Put value to the PV, retrying per the PV's config.
+
+        Args:
+            value: Value to write
+            wait: Wait for the put to complete on the IOC
+            timeout: Seconds to wait for completion, per attempt
+
+        Raises:
+            PVConnectionError: If the PV does not connect, or its IOC is
+                considered unreachable (PVCircuitOpenError)
+            PVPutError: If the put fails after retries
+        """
+        timeout = timeout or self.config.put_timeout
+
+        # Shares the PV's IOC circuit breaker with blocking gets and puts
+        with self.pv._circuit_guard():
+            await self.connect()
+            await self._put_with_retry(value, wait, timeout)
+
+    async def _put_with_retry(self, value: Any, wait: bool, timeout: float):
+        """Put attempts until one succeeds; raises PVPutError if none do"""
+        max_retries = self.config.max_retries
+        last_exception = None
+        attempt = 0
+
+        for attempt in range(1, max_retries + 1):
+            last_exception = await self._put_once(value, wait, timeout)
+            if last_exception is None:
+                if attempt > 1:
+                    get_logger().info(
+                        f"PV {self.pvname} put succeeded on attempt {attempt}"
+                    )
+                return
+
+            if attempt < max_retries:
+                if not self.pv._circuit_closed():
+                    break
+                get_logger().warning(
+                    f"PV {self.pvname} put failed: {last_exception} "
+                    f"(attempt {attempt}/{max_retries})"
+                )
+                await self._retry_backoff(attempt)
+
+        error_msg = (
+            f"PV {self.pvname} put with {{'value': {value!r}}} failed after "
+            f"{attempt} attempts. Last exception: {last_exception}"
+        )
+        get_logger().error(error_msg)
+        error = PVPutError(error_msg)
+        error.timed_out = isinstance(last_exception, TimeoutError)
+        raise error from last_exception
+
+    async def _put_once(
+        self, value: Any, wait: bool, timeout: float
+    ) -> Optional[Exception]:
+        """One put attempt; returns the failure, or None on success"""
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        callback = partial(_put_done, loop, done) if wait else None
+        try:
+            # The base put with wait=False returns straight away
+            status = EPICS_PV.put(self.pv, value, wait=False, callback=callback)
+            if status != 1:
+                return PVPutError(f"put returned status {status}")
+            if wait:
+                await asyncio.wait_for(done, timeout)
+            # The monitor update for this put may not have arrived yet, so
+            # read from the IOC until it does
+            self.pv._last_update = None
+        except asyncio.TimeoutError:
+            return TimeoutError(f"put not completed within {timeout}s")
+        except Exception as e:
+            return e
+        return None
+
+    async def _retry_backoff(self, attempt: int):
+        """Await the retry delay, then try to reconnect if disconnected"""
+        await asyncio.sleep(backoff_delay(self.config.retry_delay, attempt))
+        if not self.pv.connected:
+            try:
+                await self.connect()
+            except PVConnectionError as e:
+                get_logger().debug(f"Reconnection attempt failed: {e}")
+
+    async def wait_for(
+        self,
+        predicate: Callable[[Any], bool],
+        timeout: Optional[float] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> Any:
+        """
+        Wait until predicate(value) is true and return that value.
+
+        The asyncio counterpart of wait_until: wakes on monitor updates
+        and re-reads at least every poll_interval seconds. Cancel the
+        awaiting task to abort.
+
+        Raises:
+            PVWaitTimeoutError: If timeout passes first
+        """
+        await self.connect()
+
+        loop = asyncio.get_running_loop()
+        updated = asyncio.Event()
+
+        def on_update(**kwargs):
+            _call_soon(loop, updated.set)
+
+        index = self.pv.add_callback(on_update)
+        deadline = None if timeout is None else monotonic() + timeout
+
+        try:
+            while True:
+                updated.clear()
+
+                value = await self.get()
+                if predicate(value):
+                    return value
+
+                wait = poll_interval
+                if deadline is not None:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        raise PVWaitTimeoutError(
+                            f"{self.pvname} did not reach the awaited state "
+                            f"within {timeout}s (last value {value!r})"
+                        )
+                    wait = min(wait, remaining)
+
+                try:
+                    await asyncio.wait_for(updated.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.pv.remove_callback(index)
+
+    async def monitor(self) -> AsyncIterator[Any]:
+        """
+        Yield the current value, then the value of every monitor update.
+
+        Updates are queued, so a slow consumer sees every one of them.
+        Stop iterating (or close the iterator) to unsubscribe.
+        """
+        await self.connect()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def on_update(value: Any = None, **kwargs):
+            _call_soon(loop, queue.put_nowait, value)
+
+        index = self.pv.add_callback(on_update)
+        try:
+            yield await self.get()
+            while True:
+                yield await queue.get()
+        finally:
+            self.pv.remove_callback(index)
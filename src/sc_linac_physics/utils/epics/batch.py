@@ -1,8 +1,38 @@
-from typing import List, Any
+from time import perf_counter, sleep, time
+from typing import List, Any, Callable, Optional
 
 import epics
 
+from sc_linac_physics.utils.epics.core import PV
 from sc_linac_physics.utils.epics.logger import get_logger
+from sc_linac_physics.utils.epics.metrics import PV_METRICS
+from sc_linac_physics.utils.epics.recording import (
+    GET,
+    MONITOR,
+    PUT,
+    PV_RECORDER,
+)
+
+
+def _record(pv_name: str, operation: str, start: float, ok: bool):
+    """Record a batch call in PV_METRICS; a failure counts as a timeout"""
+    PV_METRICS.record(
+        pv_name,
+        operation,
+        perf_counter() - start,
+        ok=ok,
+        timeouts=int(not ok),
+    )
+
+
+def _recording_callback(callback: Callable) -> Callable:
+    """Wrap a monitor callback to record each update in PV_RECORDER"""
+
+    def record_then_call(pvname=None, value=None, severity=None, **kwargs):
+        PV_RECORDER.record(MONITOR, pvname, value, severity)
+        return callback(pvname=pvname, value=value, severity=severity, **kwargs)
+
+    return record_then_call
 
 
 class PVBatch:
@@ -34,8 +64,27 @@ class PVBatch:
         if not pv_names:
             return []
 
+        if PV.backend is not None:
+            return [
+                PV.backend.read(pv_name) if PV.backend.has_pv(pv_name) else None
+                for pv_name in pv_names
+            ]
+
+        values = PVBatch._caget_many(pv_names, timeout)
+        if PV_RECORDER.enabled:
+            for pv_name, value in zip(pv_names, values):
+                PV_RECORDER.record(GET, pv_name, value)
+        return values
+
+    @staticmethod
+    def _caget_many(pv_names: List[str], timeout: float) -> List[Any]:
+        start = perf_counter()
         try:
             values = epics.caget_many(pv_names, timeout=timeout)
+            if PV_METRICS.enabled:
+                # One shared latency: the whole batch read
+                for pv_name, value in zip(pv_names, values):
+                    _record(pv_name, "batch_get", start, value is not None)
             return values
         except Exception as e:
             get_logger().warning(
@@ -45,10 +94,13 @@ class PVBatch:
             # Fallback to individual caget calls
             values = []
             for pv_name in pv_names:
+                start = perf_counter()
                 try:
                     values.append(epics.caget(pv_name, timeout=timeout))
                 except Exception:
                     values.append(None)
+                if PV_METRICS.enabled:
+                    _record(pv_name, "batch_get", start, values[-1] is not None)
             return values
 
     @staticmethod
@@ -78,13 +130,135 @@ class PVBatch:
                 f"Length mismatch: {len(pv_names)} PVs but {len(values)} values"
             )
 
+        if PV.backend is not None:
+            results = []
+            for pv_name, value in zip(pv_names, values):
+                known = PV.backend.has_pv(pv_name)
+                if known:
+                    PV.backend.write(pv_name, value)
+                results.append(known)
+            return results
+
         results = []
         for pv_name, value in zip(pv_names, values):
+            start = perf_counter()
             try:
                 status = epics.caput(pv_name, value, wait=wait, timeout=timeout)
                 results.append(status == 1)
             except Exception as e:
                 get_logger().warning(f"Failed to put {pv_name}={value}: {e}")
                 results.append(False)
+            if PV_METRICS.enabled:
+                _record(pv_name, "batch_put", start, results[-1])
+            if results[-1] and PV_RECORDER.enabled:
+                PV_RECORDER.record(PUT, pv_name, value)
 
         return results
+
+    @staticmethod
+    def monitor(
+        pv_names: List[str],
+        callback: Callable,
+        connection_callback: Optional[Callable] = None,
+    ) -> List[Optional[epics.PV]]:
+        """
+        Subscribe to value updates for multiple PVs without blocking.
+
+        Channels are created with auto_monitor enabled and connect in the
+        background, so the first callback for each PV carries its current
+        value. Callbacks run on the Channel Access thread and should only
+        record the update; do any blocking work (puts, gets) elsewhere.
+
+        Args:
+            pv_names: List of PV names to subscribe to
+            callback: Called as callback(pvname=..., value=..., severity=...,
+                **kw) on every monitor update
+            connection_callback: Called as connection_callback(pvname=...,
+                conn=..., **kw) whenever a channel connects or disconnects
+
+        Returns:
+            List of raw EPICS PV objects in same order as pv_names (None for
+            channels that could not be created). Keep these alive for as long
+            as updates are wanted and disconnect() them when done.
+        """
+        if PV.backend is not None:
+            return [
+                PV(
+                    pv_name,
+                    callback=callback,
+                    connection_callback=connection_callback,
+                )
+                for pv_name in pv_names
+            ]
+
+        if PV_RECORDER.enabled:
+            callback = _recording_callback(callback)
+
+        monitors = []
+        for pv_name in pv_names:
+            try:
+                monitors.append(
+                    epics.PV(
+                        pv_name,
+                        callback=callback,
+                        connection_callback=connection_callback,
+                        auto_monitor=True,
+                    )
+                )
+            except Exception as e:
+                get_logger().warning(f"Failed to monitor {pv_name}: {e}")
+                monitors.append(None)
+        return monitors
+
+    @staticmethod
+    def connect(pv_names: List[str], timeout: float = 5.0) -> List[bool]:
+        """
+        Open Channel Access channels for many PVs and wait for them together.
+
+        Every channel is created (and its search sent) before waiting on
+        any of them, and the wait is bounded by one overall deadline rather
+        than a timeout per PV. Channels are the ones caget_many() and
+        caput() use, so later batch reads of these PVs find them already
+        connected. Unconnected channels keep searching in the background.
+
+        Args:
+            pv_names: List of PV names to connect
+            timeout: Overall deadline for all connections (seconds); 0 only
+                creates the channels
+
+        Returns:
+            List of connection status (True/False) for each PV
+        """
+        if not pv_names:
+            return []
+
+        if PV.backend is not None:
+            return [PV.backend.has_pv(pv_name) for pv_name in pv_names]
+
+        chids = []
+        for pv_name in pv_names:
+            try:
+                chids.append(
+                    epics.ca.create_channel(
+                        pv_name, connect=False, auto_cb=False
+                    )
+                )
+            except Exception as e:
+                get_logger().warning(f"Failed to create channel {pv_name}: {e}")
+                chids.append(None)
+
+        deadline = time() + timeout
+        pending = [chid for chid in chids if chid is not None]
+        while True:
+            epics.ca.poll()
+            pending = [
+                chid for chid in pending if not epics.ca.isConnected(chid)
+            ]
+            if not pending or time() >= deadline:
+                break
+            sleep(0.01)
+
+        return [
+            chid is not None and bool(epics.ca.isConnected(chid))
+            for chid in chids
+        ]
@@ -0,0 +1,333 @@
+"""
+Process-wide circuit breakers for PV operations, one per IOC.
+
+When an IOC goes down, every PV it serves fails only after its
+connection timeout and all of its retries, and each caller pays that
+cost again. A breaker counts consecutive timeouts and disconnects
+across the PVs of one IOC. Once failure_threshold is reached it opens,
+and further operations fail at once with PVCircuitOpenError. After a
+cooldown it goes half-open and lets one operation through as a probe.
+A successful probe closes it. A failed probe opens it again, and the
+cooldown doubles each time up to max_cooldown, with jitter so that
+clients do not all probe together.
+
+An IOC is identified by the host:port of the Channel Access server a
+channel connected to. PV names do not identify one: a cavity's PVs come
+from the LLRF, SSA, stepper and soft IOCs alike. Until a channel has
+connected its IOC is unknown, and the PV has a breaker of its own.
+"""
+
+import random
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+
+from sc_linac_physics.utils.epics.logger import get_logger
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 5.0
+DEFAULT_MAX_COOLDOWN = 60.0
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitStatus:
+    """Snapshot of a CircuitBreaker"""
+
+    key: str
+    state: CircuitState
+    failures: int
+    retry_in: float
+
+
+def ioc_key(pvname: str, host: Optional[str] = None) -> str:
+    """
+    The key of the breaker covering a PV: the host:port of the server
+    (IOC) that serves it, or the PV name while that is unknown.
+
+    Examples:
+        >>> ioc_key("ACCL:L0B:0110:ACON", "ioc-l0b-llrf1:5064")
+        'ioc-l0b-llrf1:5064'
+        >>> ioc_key("ACCL:L0B:0110:ACON")
+        'ACCL:L0B:0110:ACON'
+    """
+    return host or pvname
+
+
+def backoff_delay(
+    base: float,
+    attempt: int,
+    cap: Optional[float] = None,
+    uniform: Callable[[float, float], float] = random.uniform,
+) -> float:
+    """
+    Exponential backoff with jitter.
+
+    The delay for attempt n (from 1) is drawn from [d/2, d], where
+    d = base * 2 ** (n - 1), capped at cap.
+    """
+    delay = base * 2 ** (attempt - 1)
+    if cap is not None:
+        delay = min(delay, cap)
+    return uniform(delay / 2, delay)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one IOC.
+
+    Call allow() before an operation and record_success() or
+    record_failure() after it. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_cooldown: float = DEFAULT_MAX_COOLDOWN,
+        clock: Callable[[], float] = monotonic,
+        uniform: Callable[[float, float], float] = random.uniform,
+    ):
+        """
+        Args:
+            key: IOC (host:port) or PV name this breaker covers
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown: Seconds before the first half-open probe
+            max_cooldown: Upper bound on the doubled cooldown
+            clock: Monotonic time source (seconds)
+            uniform: Jitter source, called as uniform(low, high)
+        """
+        if failure_threshold < 1:
+            raise ValueError(
+                f"failure_threshold must be >= 1, got {failure_threshold}"
+            )
+
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._clock = clock
+        self._uniform = uniform
+        self._lock = threading.Lock()
+        self._failures = 0
+        # Times opened without a success in between; sets the cooldown
+        self._trips = 0
+        # When the next probe may go through; None while closed
+        self._retry_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state_locked(self._clock())
+
+    def _state_locked(self, now: float) -> CircuitState:
+        if self._retry_at is None:
+            return CircuitState.CLOSED
+        if self._probing or now < self._retry_at:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def retry_in(self) -> float:
+        """Seconds until a probe may go through, 0 if it may now."""
+        with self._lock:
+            if self._retry_at is None:
+                return 0.0
+            return max(0.0, self._retry_at - self._clock())
+
+    def allow(self) -> bool:
+        """
+        Whether an operation may go ahead.
+
+        In the half-open state this lets one probe through. If the probe
+        never reports back, another is allowed after the next cooldown.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._retry_at is None:
+                return True
+            if now < self._retry_at:
+                return False
+            self._probing = True
+            self._retry_at = now + self._next_cooldown()
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._retry_at is not None:
+                get_logger().info(f"IOC {self.key} reachable again")
+            self._failures = 0
+            self._trips = 0
+            self._retry_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing:
+                self._trip_locked()
+            elif (
+                self._retry_at is None
+                and self._failures >= self.failure_threshold
+            ):
+                self._trip_locked()
+            # Otherwise it is already open and this call started before
+            # it opened; the cooldown is left alone
+
+    def _trip_locked(self) -> None:
+        self._trips += 1
+        self._probing = False
+        cooldown = self._next_cooldown()
+        self._retry_at = self._clock() + cooldown
+        get_logger().warning(
+            f"IOC {self.key} unreachable after {self._failures} consecutive "
+            f"failures, failing fast for {cooldown:.1f}s"
+        )
+
+    def _next_cooldown(self) -> float:
+        return backoff_delay(
+            self.cooldown,
+            max(self._trips, 1),
+            cap=self.max_cooldown,
+            uniform=self._uniform,
+        )
+
+    def reset(self) -> None:
+        """Close the breaker and forget its failures."""
+        with self._lock:
+            self._failures = 0
+            self._trips = 0
+            self._retry_at = None
+            self._probing = False
+
+    def status(self) -> CircuitStatus:
+        with self._lock:
+            now = self._clock()
+            retry_in = 0.0
+            if self._retry_at is not None:
+                retry_in = max(0.0, self._retry_at - now)
+            return CircuitStatus(
+                key=self.key,
+                state=self._state_locked(now),
+                failures=self._failures,
+                retry_in=retry_in,
+            )
+
+
+class CircuitBreakerRegistry:
+    """
+    The circuit breakers of a process, created on first use per IOC.
+
+    PVs are looked up by name. The registry remembers which IOC served a
+    PV the last time it was given one, so a PV's breaker can be found by
+    name alone once it has connected.
+
+    Breaker settings apply to breakers created after they are changed.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_cooldown: float = DEFAULT_MAX_COOLDOWN,
+        key_func: Callable[[str, Optional[str]], str] = ioc_key,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a breaker
+            cooldown: Seconds before a breaker's first half-open probe
+            max_cooldown: Upper bound on a breaker's doubled cooldown
+            key_func: Maps a PV name and its IOC host (None if unknown)
+                to the key of its breaker
+            clock: Monotonic time source (seconds)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.key_func = key_func
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # PV name -> host:port of the IOC that last served it
+        self._hosts: Dict[str, str] = {}
+
+    def _key_locked(self, pvname: str, host: Optional[str]) -> str:
+        if host:
+            self._hosts[pvname] = host
+        else:
+            host = self._hosts.get(pvname)
+        return self.key_func(pvname, host)
+
+    def breaker(
+        self, pvname: str, host: Optional[str] = None
+    ) -> CircuitBreaker:
+        """
+        The breaker covering pvname, creating it if needed.
+
+        Args:
+            pvname: PV name
+            host: host:port of the IOC serving it, if it has connected
+        """
+        with self._lock:
+            key = self._key_locked(pvname, host)
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    key,
+                    failure_threshold=self.failure_threshold,
+                    cooldown=self.cooldown,
+                    max_cooldown=self.max_cooldown,
+                    clock=self._clock,
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def state(self, pvname: str) -> CircuitState:
+        """State of the breaker covering pvname (CLOSED if it has none)."""
+        with self._lock:
+            breaker = self._breakers.get(self._key_locked(pvname, None))
+        if breaker is None:
+            return CircuitState.CLOSED
+        return breaker.state
+
+    def is_reachable(self, pvname: str) -> bool:
+        """False while pvname's IOC is considered unreachable."""
+        return self.state(pvname) is CircuitState.CLOSED
+
+    def status(self) -> List[CircuitStatus]:
+        """Snapshot of every breaker that is not closed."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        statuses = [breaker.status() for breaker in breakers]
+        return [s for s in statuses if s.state is not CircuitState.CLOSED]
+
+    def reset(self, pvname: Optional[str] = None) -> None:
+        """Close the breaker covering pvname, or every breaker."""
+        with self._lock:
+            if pvname is None:
+                breakers = list(self._breakers.values())
+            else:
+                breaker = self._breakers.get(self._key_locked(pvname, None))
+                breakers = [breaker] if breaker is not None else []
+        for breaker in breakers:
+            breaker.reset()
+
+    def clear(self) -> None:
+        """Forget every breaker, and which IOC serves each PV."""
+        with self._lock:
+            self._breakers.clear()
+            self._hosts.clear()
+
+
+CIRCUIT_BREAKERS = CircuitBreakerRegistry()
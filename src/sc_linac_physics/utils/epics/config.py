@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 EPICS_NO_ALARM_VAL = 0
 EPICS_MINOR_VAL = 1
@@ -15,3 +16,7 @@ class PVConfig:
     put_timeout: float = 30.0
     max_retries: int = 3
     retry_delay: float = 0.5
+    # Default max_age for PV.get(); None always reads as before
+    max_age: Optional[float] = None
+    # Fail fast while the PV's IOC circuit breaker is open
+    circuit_breaker: bool = True
@@ -1,11 +1,19 @@
 import threading
-from time import sleep
-from typing import List, Any, Optional, Callable, Union
+from contextlib import contextmanager
+from functools import partial
+from time import monotonic, perf_counter, sleep, time
+from typing import List, Any, Optional, Callable, Tuple, Union
 
 import epics
 import numpy as np
 from epics import PV as EPICS_PV
 
+from sc_linac_physics.utils.epics.breaker import (
+    CIRCUIT_BREAKERS,
+    CircuitBreaker,
+    CircuitState,
+    backoff_delay,
+)
 from sc_linac_physics.utils.epics.config import (
     PVConfig,
     EPICS_INVALID_VAL,
@@ -13,12 +21,20 @@ from sc_linac_physics.utils.epics.config import (
     EPICS_MAJOR_VAL,
 )
 from sc_linac_physics.utils.epics.exceptions import (
+    PVCircuitOpenError,
     PVConnectionError,
     PVGetError,
     PVPutError,
     PVInvalidError,
 )
 from sc_linac_physics.utils.epics.logger import get_logger
+from sc_linac_physics.utils.epics.metrics import PV_METRICS
+from sc_linac_physics.utils.epics.recording import (
+    GET,
+    MONITOR,
+    PUT,
+    PV_RECORDER,
+)
 
 
 class PV(EPICS_PV):
@@ -30,6 +46,15 @@ class PV(EPICS_PV):
     # Default configuration (can be overridden per instance)
     default_config = PVConfig()
 
+    # Serves PVs in place of Channel Access while set (a ReplaySession)
+    backend = None
+
+    def __new__(cls, *args, **kwargs):
+        if PV.backend is not None:
+            # Not a PV, so __init__ is skipped
+            return PV.backend.create_pv(*args, **kwargs)
+        return super().__new__(cls)
+
     def __init__(
         self,
         pvname: str,
@@ -67,6 +92,8 @@ class PV(EPICS_PV):
         self._connection_lock = threading.RLock()
         self._user_callback = callback
         self._require_connection = require_connection
+        # monotonic() time of the last monitor update, for get(max_age=...)
+        self._last_update: Optional[float] = None
 
         if connection_timeout is None:
             connection_timeout = self.config.connection_timeout
@@ -98,6 +125,18 @@ class PV(EPICS_PV):
         if self._user_callback is not None and self.connected:
             self.add_callback(self._user_callback)
 
+    def run_callbacks(self):
+        """Note when the monitored value last changed, then run callbacks"""
+        self._last_update = monotonic()
+        if PV_RECORDER.enabled:
+            PV_RECORDER.record(
+                MONITOR,
+                self.pvname,
+                self._args.get("value"),
+                self._args.get("severity"),
+            )
+        super().run_callbacks()
+
     def _wait_for_connection_with_retry(self, timeout: float):
         """Wait for initial connection with retry logic"""
         # Quick initial check
@@ -184,7 +223,19 @@ class PV(EPICS_PV):
                 f"PV {self.pvname} disconnected, attempting to reconnect"
             )
 
-            if not self.wait_for_connection(timeout=timeout):
+            start = perf_counter()
+            reconnected = self.wait_for_connection(timeout=timeout)
+            if PV_METRICS.enabled:
+                PV_METRICS.record(
+                    self.pvname,
+                    "connect",
+                    perf_counter() - start,
+                    ok=reconnected,
+                    timeouts=int(not reconnected),
+                    disconnects=1,
+                )
+
+            if not reconnected:
                 error_msg = (
                     f"PV {self.pvname} failed to reconnect within {timeout}s"
                 )
@@ -221,10 +272,15 @@ class PV(EPICS_PV):
         timeout: Optional[float] = None,
         with_ctrlvars: bool = False,
         use_monitor: Optional[bool] = None,
+        max_age: Optional[float] = None,
     ) -> Union[int, float, str, np.ndarray, List]:
         """
         Get PV value with automatic retry logic.
 
+        With max_age, a monitored PV whose last monitor update is at most
+        max_age seconds old is read from the monitor without touching the
+        network; otherwise the value is read from the IOC.
+
         Args:
             count: Number of elements to fetch
             as_string: Return value as string
@@ -232,32 +288,71 @@ class PV(EPICS_PV):
             timeout: Timeout for get operation
             with_ctrlvars: Include control variables
             use_monitor: Use cached monitored value
+            max_age: Staleness bound for the monitored value (seconds);
+                defaults to config.max_age. Ignored if use_monitor=False.
 
         Returns:
             PV value (never None)
 
         Raises:
-            PVConnectionError: If PV is not connected
+            PVConnectionError: If PV is not connected, or its IOC is
+                considered unreachable (PVCircuitOpenError)
             PVGetError: If get operation fails after retries
         """
         timeout = timeout or self.config.get_timeout
+        if max_age is None:
+            max_age = self.config.max_age
+
+        if max_age is not None and use_monitor is not False:
+            if not with_ctrlvars and self._is_fresh(max_age):
+                value = super().get(
+                    count=count,
+                    as_string=as_string,
+                    as_numpy=as_numpy,
+                    timeout=timeout,
+                    use_monitor=True,
+                )
+                if value is not None:
+                    if PV_RECORDER.enabled:
+                        PV_RECORDER.record(
+                            GET, self.pvname, value, self.severity
+                        )
+                    return value
+            use_monitor = False
+
         use_monitor = (
             use_monitor if use_monitor is not None else self.auto_monitor
         )
 
-        self._ensure_connected(timeout=timeout)
-
-        return self._execute_with_retry(
-            operation="get",
-            operation_func=lambda: super(PV, self).get(
-                count=count,
-                as_string=as_string,
-                as_numpy=as_numpy,
+        with self._circuit_guard():
+            self._ensure_connected(timeout=timeout)
+
+            value = self._execute_with_retry(
+                operation="get",
+                operation_func=lambda: super(PV, self).get(
+                    count=count,
+                    as_string=as_string,
+                    as_numpy=as_numpy,
+                    timeout=timeout,
+                    with_ctrlvars=with_ctrlvars,
+                    use_monitor=use_monitor,
+                ),
                 timeout=timeout,
-                with_ctrlvars=with_ctrlvars,
-                use_monitor=use_monitor,
-            ),
-            timeout=timeout,
+            )
+        if max_age is not None:
+            # A network read also refreshes the value the monitor serves
+            self._last_update = monotonic()
+        if PV_RECORDER.enabled:
+            PV_RECORDER.record(GET, self.pvname, value, self.severity)
+        return value
+
+    def _is_fresh(self, max_age: float) -> bool:
+        """Whether the monitored value was updated within max_age seconds"""
+        return (
+            self.auto_monitor
+            and self.connected
+            and self._last_update is not None
+            and monotonic() - self._last_update <= max_age
         )
 
     def put(
@@ -281,26 +376,123 @@ class PV(EPICS_PV):
             callback_data: Data to pass to callback
 
         Raises:
-            PVConnectionError: If PV is not connected
+            PVConnectionError: If PV is not connected, or its IOC is
+                considered unreachable (PVCircuitOpenError)
             PVPutError: If put operation fails after retries
         """
         timeout = timeout or self.config.put_timeout
+        # A put with a completion callback is recorded once it completes,
+        # so that a recording holds no puts that never took effect
+        record_on_completion = (
+            PV_RECORDER.enabled and not wait and callback is not None
+        )
+        if record_on_completion:
+            callback = self._recorded_on_completion(value, callback)
+
+        with self._circuit_guard():
+            self._ensure_connected(timeout=timeout)
+
+            self._execute_with_retry(
+                operation="put",
+                operation_func=lambda: super(PV, self).put(
+                    value,
+                    wait=wait,
+                    timeout=timeout,
+                    use_complete=use_complete,
+                    callback=callback,
+                    callback_data=callback_data,
+                ),
+                timeout=timeout,
+                context={"value": value},
+            )
+        if PV_RECORDER.enabled and not record_on_completion:
+            PV_RECORDER.record(PUT, self.pvname, value)
 
-        self._ensure_connected(timeout=timeout)
+    def _recorded_on_completion(self, value: Any, callback: Callable):
+        """Wrap a put completion callback to record the put first"""
 
-        self._execute_with_retry(
-            operation="put",
-            operation_func=lambda: super(PV, self).put(
-                value,
-                wait=wait,
-                timeout=timeout,
-                use_complete=use_complete,
-                callback=callback,
-                callback_data=callback_data,
-            ),
-            timeout=timeout,
-            context={"value": value},
-        )
+        def record_then_call(**kwargs):
+            PV_RECORDER.record(PUT, self.pvname, value)
+            return callback(**kwargs)
+
+        return record_then_call
+
+    def _ioc_host(self) -> Optional[str]:
+        """host:port of the IOC this channel last connected to, None if
+        it never has"""
+        return getattr(self, "_args", {}).get("host")
+
+    def _circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The breaker shared with the other PVs on this PV's IOC"""
+        if not self.config.circuit_breaker:
+            return None
+        return CIRCUIT_BREAKERS.breaker(self.pvname, host=self._ioc_host())
+
+    def _ioc_failed(self, error: Exception) -> bool:
+        """
+        Whether a failed operation counts against this PV's IOC: a timeout
+        or a disconnect of a channel that has connected before. A PV that
+        never connected (e.g. a misspelled name) or an operation the IOC
+        refused says nothing about the IOC.
+        """
+        if self._ioc_host() is None:
+            return False
+        if isinstance(error, PVConnectionError):
+            return True
+        return error.timed_out or not self.connected
+
+    @contextmanager
+    def _circuit_guard(self):
+        """
+        Fail fast while this PV's IOC is considered unreachable, and report
+        the outcome of the guarded operation to its circuit breaker. Only
+        timeouts and disconnects count as failures (see _ioc_failed).
+
+        Raises:
+            PVCircuitOpenError: If the circuit breaker is open
+        """
+        breaker = self._circuit_breaker()
+        if breaker is None:
+            yield
+            return
+
+        if not breaker.allow():
+            error_msg = (
+                f"PV {self.pvname} not tried: IOC {breaker.key} unreachable, "
+                f"next attempt in {breaker.retry_in():.1f}s"
+            )
+            get_logger().debug(error_msg)
+            raise PVCircuitOpenError(error_msg)
+
+        try:
+            yield
+        except (PVConnectionError, PVGetError, PVPutError) as e:
+            if self._ioc_failed(e):
+                breaker.record_failure()
+            elif self.connected:
+                # The IOC answered; the failure is this PV's own
+                breaker.record_success()
+            raise
+        breaker.record_success()
+
+    def _report_outcome(self, ok: bool):
+        """
+        Report to the circuit breaker an operation _circuit_guard did not
+        wrap: a pipelined read, or a pipelined put's completion. A missing
+        reply counts only for a channel that has connected before.
+        """
+        breaker = self._circuit_breaker()
+        if breaker is None:
+            return
+        if ok:
+            breaker.record_success()
+        elif self._ioc_host() is not None:
+            breaker.record_failure()
+
+    def _circuit_closed(self) -> bool:
+        """Whether retries may go on; False once the IOC is unreachable"""
+        breaker = self._circuit_breaker()
+        return breaker is None or breaker.state is CircuitState.CLOSED
 
     def _execute_with_retry(
         self,
@@ -326,50 +518,100 @@ class PV(EPICS_PV):
         """
         context = context or {}
         last_exception = None
+        attempt = 0
+        timeouts = 0
+        timed_out = False
+        start = perf_counter() if PV_METRICS.enabled else None
 
         for attempt in range(1, self.config.max_retries + 1):
-            try:
-                result = operation_func()
-
-                # Check success based on operation type
-                if operation == "get":
-                    success = result is not None
-                else:  # put
-                    success = result == 1
-
-                if success:
-                    if attempt > 1:
-                        get_logger().info(
-                            f"PV {self.pvname} {operation} succeeded on attempt {attempt}"
-                        )
-                    return result if operation == "get" else None
+            success, result, exception = self._attempt(
+                operation, operation_func, attempt
+            )
 
-                # Operation returned failure status
-                if attempt < self.config.max_retries:
-                    get_logger().warning(
-                        f"PV {self.pvname} {operation} failed "
-                        f"(attempt {attempt}/{self.config.max_retries})"
+            if success:
+                if attempt > 1:
+                    get_logger().info(
+                        f"PV {self.pvname} {operation} succeeded on attempt {attempt}"
                     )
+                if start is not None:
+                    self._record_metrics(operation, start, attempt, timeouts)
+                return result if operation == "get" else None
 
-            except Exception as e:
-                last_exception = e
-                if attempt < self.config.max_retries:
-                    get_logger().warning(
-                        f"PV {self.pvname} {operation} raised exception: {e} "
-                        f"(attempt {attempt}/{self.config.max_retries})"
-                    )
+            last_exception = exception or last_exception
+            timed_out = self._timed_out(operation, result, exception)
+            timeouts += timed_out
 
-            # Retry with backoff
+            # Retry with backoff, unless the IOC has meanwhile been found
+            # unreachable (or this is a half-open probe)
             if attempt < self.config.max_retries:
+                if not self._circuit_closed():
+                    break
                 self._retry_backoff(attempt, timeout)
 
         # All retries exhausted - raise appropriate error
-        self._raise_operation_error(operation, last_exception, context)
+        if start is not None:
+            self._record_metrics(operation, start, attempt, timeouts, ok=False)
+        self._raise_operation_error(
+            operation, last_exception, context, attempt, timed_out
+        )
+
+    def _attempt(
+        self, operation: str, operation_func: Callable, attempt: int
+    ) -> Tuple[bool, Any, Optional[Exception]]:
+        """One try of an operation: (success, result, exception raised)"""
+        try:
+            result = operation_func()
+        except Exception as e:
+            if attempt < self.config.max_retries:
+                get_logger().warning(
+                    f"PV {self.pvname} {operation} raised exception: {e} "
+                    f"(attempt {attempt}/{self.config.max_retries})"
+                )
+            return False, None, e
+
+        # Check success based on operation type: a get returns the value,
+        # a put returns 1
+        success = result is not None if operation == "get" else result == 1
+
+        if not success and attempt < self.config.max_retries:
+            get_logger().warning(
+                f"PV {self.pvname} {operation} failed "
+                f"(attempt {attempt}/{self.config.max_retries})"
+            )
+        return success, result, None
+
+    @staticmethod
+    def _timed_out(
+        operation: str, result: Any, exception: Optional[Exception]
+    ) -> bool:
+        """Whether a failed attempt timed out; pyepics returns None from a
+        get and -1 from a put with wait when it does"""
+        if exception is not None:
+            return isinstance(exception, TimeoutError)
+        return result is None if operation == "get" else result == -1
+
+    def _record_metrics(
+        self,
+        operation: str,
+        start: float,
+        attempts: int,
+        timeouts: int,
+        ok: bool = True,
+    ):
+        PV_METRICS.record(
+            self.pvname,
+            operation,
+            perf_counter() - start,
+            ok=ok,
+            timeouts=timeouts,
+            retries=attempts - 1,
+        )
 
     def _retry_backoff(self, attempt: int, timeout: float):
         """Handle retry delay and reconnection attempt"""
-        # Exponential backoff
-        sleep(self.config.retry_delay * attempt)
+        # Exponential backoff with jitter, so that PVs failing together
+        # do not retry in lockstep
+        sleep(backoff_delay(self.config.retry_delay, attempt))
 
         # Try to reconnect if disconnected
         if not self.connected:
@@ -379,7 +621,12 @@ class PV(EPICS_PV):
                 get_logger().debug(f"Reconnection attempt failed: {e}")
 
     def _raise_operation_error(
-        self, operation: str, last_exception: Optional[Exception], context: dict
+        self,
+        operation: str,
+        last_exception: Optional[Exception],
+        context: dict,
+        attempts: Optional[int] = None,
+        timed_out: bool = False,
     ):
         """Raise appropriate error after retries exhausted"""
         error_class = PVGetError if operation == "get" else PVPutError
@@ -390,16 +637,15 @@ class PV(EPICS_PV):
 
         error_msg = (
             f"PV {self.pvname} {operation}{context_str} failed after "
-            f"{self.config.max_retries} attempts"
+            f"{attempts or self.config.max_retries} attempts"
         )
 
         if last_exception:
             error_msg += f". Last exception: {last_exception}"
-            get_logger().error(error_msg)
-            raise error_class(error_msg) from last_exception
-        else:
-            get_logger().error(error_msg)
-            raise error_class(error_msg)
+        get_logger().error(error_msg)
+        error = error_class(error_msg)
+        error.timed_out = timed_out
+        raise error from last_exception
 
     def validate_value(
         self,
@@ -501,7 +747,8 @@ class PV(EPICS_PV):
 
         Args:
             pv_names: List of PV names to create
-            connection_timeout: Timeout for each PV connection (seconds)
+            connection_timeout: Overall deadline for the whole batch to
+                connect (seconds), not a timeout per PV
             auto_monitor: Whether to enable automatic monitoring
             require_connection: If True, raise error if any PV fails to connect
             config: Custom PVConfig to use for all PVs
@@ -521,6 +768,17 @@ class PV(EPICS_PV):
         if not pv_names:
             return []
 
+        if PV.backend is not None:
+            return [
+                cls(
+                    pv_name,
+                    auto_monitor=auto_monitor,
+                    require_connection=require_connection,
+                    config=config,
+                )
+                for pv_name in pv_names
+            ]
+
         # Phase 1: Create raw EPICS PVs (non-blocking, fast)
         raw_pvs = cls._create_raw_pvs(
             pv_names, auto_monitor, connection_timeout
@@ -567,15 +825,23 @@ class PV(EPICS_PV):
         raw_pvs: List[Optional[epics.PV]],
         connection_timeout: float,
     ) -> List[str]:
-        """Wait for raw PVs to connect and return list of failed PV names."""
+        """Wait for raw PVs to connect and return list of failed PV names.
+
+        All searches are already in flight, so the PVs share one deadline:
+        once it has passed, the remaining PVs are only checked, not waited
+        on, and a batch with many dead PVs no longer costs a full timeout
+        per dead PV.
+        """
         failed_pvs = []
+        deadline = time() + connection_timeout
 
         for pv_name, raw_pv in zip(pv_names, raw_pvs):
             if raw_pv is None:
                 failed_pvs.append(pv_name)
                 continue
 
-            if not raw_pv.wait_for_connection(timeout=connection_timeout):
+            remaining = max(0.0, deadline - time())
+            if not raw_pv.wait_for_connection(timeout=remaining):
                 failed_pvs.append(pv_name)
 
         if failed_pvs:
@@ -624,6 +890,38 @@ class PV(EPICS_PV):
 
         return wrapped_pvs
 
+    def _issue_get(self) -> bool:
+        """
+        Send a network read without waiting for the reply.
+
+        Returns:
+            True if a read was sent, False if the PV is disconnected, is
+            monitored (get() would answer from the monitor) or its IOC is
+            considered unreachable
+        """
+        if self.auto_monitor or not self.connected:
+            return False
+        breaker = self._circuit_breaker()
+        if breaker is not None and not breaker.allow():
+            return False
+
+        try:
+            epics.ca.get(self.chid, ftype=self.ftype, wait=False)
+            return True
+        except Exception as e:
+            get_logger().debug(f"PV {self.pvname} pipelined get failed: {e}")
+            return False
+
+    def _complete_get(self, timeout: float) -> Optional[Any]:
+        """Collect the reply to _issue_get(), None if there is none in time"""
+        try:
+            return epics.ca.get_complete(
+                self.chid, ftype=self.ftype, timeout=timeout
+            )
+        except Exception as e:
+            get_logger().debug(f"PV {self.pvname} pipelined get failed: {e}")
+            return None
+
     @staticmethod
     def get_many(
         pvs: List["PV"],
@@ -631,11 +929,20 @@ class PV(EPICS_PV):
         raise_on_error: bool = True,
     ) -> List[Any]:
         """
-        Get multiple PV values efficiently.
+        Get multiple PV values with pipelined reads.
+
+        A read is sent for every unmonitored PV before any reply is waited
+        on, and the replies share one deadline, so N PVs cost about one
+        round trip instead of N. Monitored PVs are read from their monitor.
+        Any PV without a value by then is read with get(), with its usual
+        retries and errors. Pipelined reads share the PVs' circuit
+        breakers with get(): none is sent while a PV's IOC is considered
+        unreachable, and each reply or missing reply is reported.
 
         Args:
             pvs: List of PV objects
-            timeout: Timeout for each get
+            timeout: Deadline for the pipelined reads, and timeout for
+                each get() fallback
             raise_on_error: If True, raise exception on any failure.
                            If False, failed PVs will have None in results.
 
@@ -645,12 +952,33 @@ class PV(EPICS_PV):
         Raises:
             PVGetError: If any PV fails to get and raise_on_error=True
         """
+        start = perf_counter() if PV_METRICS.enabled else None
+        issued = [pv._issue_get() for pv in pvs]
+        deadline = time() + (timeout or PV.default_config.get_timeout)
+
         results = []
         errors = []
 
-        for pv in pvs:
+        for pv, pending in zip(pvs, issued):
+            value = None
+            if pending:
+                value = pv._complete_get(max(0.0, deadline - time()))
+                pv._report_outcome(value is not None)
+                if start is not None:
+                    # Latency from sending the reads to this reply
+                    PV_METRICS.record(
+                        pv.pvname,
+                        "pipelined_get",
+                        perf_counter() - start,
+                        ok=value is not None,
+                        timeouts=int(value is None),
+                    )
+                if value is not None and PV_RECORDER.enabled:
+                    PV_RECORDER.record(GET, pv.pvname, value)
             try:
-                results.append(pv.get(timeout=timeout))
+                if value is None:
+                    value = pv.get(timeout=timeout)
+                results.append(value)
             except (PVConnectionError, PVGetError) as e:
                 errors.append((pv.pvname, str(e)))
                 results.append(None)
@@ -662,6 +990,101 @@ class PV(EPICS_PV):
 
         return results
 
+    @staticmethod
+    def _put_done(done: threading.Event, **kwargs):
+        """put_many completion callback, called from the CA thread"""
+        done.set()
+
+    @staticmethod
+    def _send_puts(
+        pvs: List["PV"],
+        values: List[Any],
+        indices: List[int],
+        completions: Optional[List[threading.Event]],
+        failures: dict,
+        timeout: Optional[float],
+    ):
+        """Send put_many's puts at indices without blocking, adding those
+        that could not be sent to failures"""
+        for i in indices:
+            callback = None
+            if completions is not None:
+                callback = partial(PV._put_done, completions[i])
+            try:
+                pvs[i].put(
+                    values[i], timeout=timeout, wait=False, callback=callback
+                )
+            except (PVConnectionError, PVPutError) as e:
+                failures[i] = str(e)
+
+    @staticmethod
+    def _wait_for_puts(
+        pvs: List["PV"],
+        indices: List[int],
+        completions: List[threading.Event],
+        put_timeout: float,
+        start: Optional[float],
+    ) -> List[int]:
+        """Wait for the completions of the puts at indices against one
+        deadline, returning the indices not confirmed in time"""
+        deadline = time() + put_timeout
+        unconfirmed = []
+        for i in indices:
+            pv = pvs[i]
+            done = completions[i].wait(max(0.0, deadline - time()))
+            pv._report_outcome(done)
+            if start is not None:
+                # Latency from sending the puts to this completion
+                PV_METRICS.record(
+                    pv.pvname,
+                    "pipelined_put",
+                    perf_counter() - start,
+                    ok=done,
+                    timeouts=int(not done),
+                )
+            if not done:
+                unconfirmed.append(i)
+        return unconfirmed
+
+    @staticmethod
+    def _confirm_puts(
+        pvs: List["PV"],
+        values: List[Any],
+        completions: List[threading.Event],
+        failures: dict,
+        timeout: Optional[float],
+        start: Optional[float],
+    ):
+        """
+        Wait for put_many's completions, re-sending the puts not confirmed
+        in time with backoff, up to config.max_retries attempts in all.
+        Puts still unconfirmed after that are added to failures.
+        """
+        config = PV.default_config
+        put_timeout = timeout or config.put_timeout
+        pending = [i for i in range(len(pvs)) if i not in failures]
+        attempt = 1
+        while True:
+            pending = PV._wait_for_puts(
+                pvs, pending, completions, put_timeout, start
+            )
+            if not pending or attempt >= config.max_retries:
+                break
+            get_logger().warning(
+                f"{len(pending)} puts not completed within {put_timeout}s, "
+                f"resending (attempt {attempt}/{config.max_retries})"
+            )
+            sleep(backoff_delay(config.retry_delay, attempt))
+            attempt += 1
+            PV._send_puts(pvs, values, pending, completions, failures, timeout)
+            pending = [i for i in pending if i not in failures]
+
+        for i in pending:
+            failures[i] = (
+                f"PV {pvs[i].pvname} put with {{'value': {values[i]}}} "
+                f"not completed within {put_timeout}s after {attempt} attempts"
+            )
+
     @staticmethod
     def put_many(
         pvs: List["PV"],
@@ -671,12 +1094,22 @@ class PV(EPICS_PV):
         raise_on_error: bool = True,
     ) -> List[bool]:
         """
-        Put values to multiple PVs.
+        Put values to multiple PVs with pipelined writes.
+
+        Every put is sent without blocking; with wait, completion callbacks
+        are then awaited together against one deadline rather than one
+        put at a time. The puts not confirmed by then are sent again with
+        backoff and awaited against a new deadline, up to
+        config.max_retries attempts, like put()'s retries. A put still
+        unconfirmed after that counts as failed. Each put is sent through
+        put(), and so shares its PV's circuit breaker; a missing
+        completion is reported to it as well.
 
         Args:
             pvs: List of PV objects
             values: List of values to write (must match length of pvs)
-            timeout: Timeout for each put
+            timeout: Timeout for sending each put, and deadline for each
+                attempt's completions
             wait: Wait for completion
             raise_on_error: If True, raise exception on any failure
 
@@ -692,16 +1125,20 @@ class PV(EPICS_PV):
                 f"Length mismatch: {len(pvs)} PVs but {len(values)} values"
             )
 
-        results = []
-        errors = []
+        completions = [threading.Event() for _ in pvs] if wait else None
+        failures = {}
+        start = perf_counter() if PV_METRICS.enabled else None
 
-        for pv, value in zip(pvs, values):
-            try:
-                pv.put(value, timeout=timeout, wait=wait)
-                results.append(True)
-            except (PVConnectionError, PVPutError) as e:
-                errors.append((pv.pvname, value, str(e)))
-                results.append(False)
+        PV._send_puts(
+            pvs, values, list(range(len(pvs))), completions, failures, timeout
+        )
+        if wait:
+            PV._confirm_puts(pvs, values, completions, failures, timeout, start)
+
+        results = [i not in failures for i in range(len(pvs))]
+        errors = [
+            (pvs[i].pvname, values[i], failures[i]) for i in sorted(failures)
+        ]
 
         if errors and raise_on_error:
             error_msg = f"Failed to put {len(errors)} PVs: {errors}"
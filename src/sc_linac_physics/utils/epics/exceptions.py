@@ -7,16 +7,36 @@ class PVConnectionError(Exception):
 class PVGetError(Exception):
     """Raised when PV get operation fails"""
 
-    pass
+    # Whether the last attempt timed out, rather than being refused
+    timed_out = False
 
 
 class PVPutError(Exception):
     """Raised when PV put operation fails"""
 
-    pass
+    # Whether the last attempt timed out, rather than being refused
+    timed_out = False
 
 
 class PVInvalidError(Exception):
     """Raised when PV value is invalid"""
 
     pass
+
+
+class PVWaitTimeoutError(Exception):
+    """Raised when a PV does not reach the awaited state in time"""
+
+    pass
+
+
+class PVWaitAbortedError(Exception):
+    """Raised when a wait on a PV is aborted by its abort check"""
+
+    pass
+
+
+class PVCircuitOpenError(PVConnectionError):
+    """Raised without trying when a PV's IOC is considered unreachable"""
+
+    pass
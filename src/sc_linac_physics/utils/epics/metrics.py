@@ -0,0 +1,261 @@
+"""
+Opt-in per-PV latency and error metrics.
+
+When enabled, PV.get/put, the pipelined PV.get_many and PVBatch record
+every call: its latency, whether it failed or timed out, and how many
+retries it took. Reconnects after a disconnect are recorded as "connect"
+calls. Metrics are kept per (PV, operation) and rolled up by IOC prefix
+when reported, so the few slow or flaky channels can be found among
+thousands:
+
+    >>> PV_METRICS.enable("pv_metrics.json")  # also dumped at exit
+    >>> ...
+    >>> for row in PV_METRICS.top(10):
+    ...     print(row["name"], row["operation"], row["total_s"])
+
+Setting SC_LINAC_PV_METRICS to a .json or .csv path enables collection
+from the start and dumps there at exit. When disabled, instrumented
+calls only check PV_METRICS.enabled.
+"""
+
+import atexit
+import csv
+import json
+import os
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sc_linac_physics.utils.epics.logger import get_logger
+
+METRICS_ENV = "SC_LINAC_PV_METRICS"
+
+# PV name fields metrics are rolled up by, e.g. ACCL:L0B:0110
+PREFIX_FIELDS = 3
+
+LATENCY_BUCKETS_SEC = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+COUNT_FIELDS = ("calls", "failures", "timeouts", "retries", "disconnects")
+ROW_FIELDS = (
+    ("scope", "name", "operation")
+    + COUNT_FIELDS
+    + ("total_s", "mean_s", "max_s")
+    + tuple(f"le_{bound}" for bound in LATENCY_BUCKETS_SEC)
+    + ("le_inf",)
+)
+
+
+def ioc_prefix(pvname: str) -> str:
+    """
+    The prefix a PV's metrics are rolled up by: the name without its
+    last field, and at most the first PREFIX_FIELDS fields.
+
+    Examples:
+        >>> ioc_prefix("ACCL:L0B:0110:SSA:StatusMsg")
+        'ACCL:L0B:0110'
+        >>> ioc_prefix("TEST:PV")
+        'TEST'
+    """
+    fields = pvname.split(":")
+    if len(fields) > 1:
+        fields = fields[:-1]
+    return ":".join(fields[:PREFIX_FIELDS])
+
+
+class OperationStats:
+    """Counts and latency histogram for one PV operation"""
+
+    __slots__ = COUNT_FIELDS + ("total", "max", "buckets")
+
+    def __init__(self):
+        for field in COUNT_FIELDS:
+            setattr(self, field, 0)
+        self.total = 0.0
+        self.max = 0.0
+        # One slot per bucket plus +Inf
+        self.buckets = [0] * (len(LATENCY_BUCKETS_SEC) + 1)
+
+    def add(self, other: "OperationStats") -> None:
+        for field in COUNT_FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def row(self, scope: str, name: str, operation: str) -> Dict[str, Any]:
+        """This operation's counts as one flat report row"""
+        row = {"scope": scope, "name": name, "operation": operation}
+        for field in COUNT_FIELDS:
+            row[field] = getattr(self, field)
+        row["total_s"] = self.total
+        row["mean_s"] = self.total / self.calls if self.calls else 0.0
+        row["max_s"] = self.max
+        for field, count in zip(ROW_FIELDS[-len(self.buckets) :], self.buckets):
+            row[field] = count
+        return row
+
+
+class PVMetrics:
+    """
+    Collects OperationStats per (PV name, operation).
+
+    Attributes:
+        enabled: Whether instrumented calls record anything
+        dump_path: File written at exit, if any
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.dump_path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], OperationStats] = {}
+        self._atexit_registered = False
+
+    def enable(self, dump_path: Optional[str] = None) -> None:
+        """
+        Start recording.
+
+        Args:
+            dump_path: If given, dump() to this .json or .csv file at exit
+        """
+        if dump_path is not None:
+            self.dump_path = dump_path
+            if not self._atexit_registered:
+                atexit.register(self._dump_at_exit)
+                self._atexit_registered = True
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; what was recorded is kept."""
+        self.enabled = False
+
+    def record(
+        self,
+        pvname: str,
+        operation: str,
+        latency: float,
+        ok: bool = True,
+        timeouts: int = 0,
+        retries: int = 0,
+        disconnects: int = 0,
+    ) -> None:
+        """
+        Record one call.
+
+        Args:
+            pvname: Process variable name
+            operation: Operation name, e.g. 'get', 'put' or 'connect'
+            latency: Duration of the call including retries (seconds)
+            ok: Whether the call succeeded
+            timeouts: Attempts within the call that timed out
+            retries: Attempts after the first
+            disconnects: Disconnects the call found
+        """
+        slot = bisect_left(LATENCY_BUCKETS_SEC, latency)
+        with self._lock:
+            stats = self._stats.get((pvname, operation))
+            if stats is None:
+                stats = self._stats[(pvname, operation)] = OperationStats()
+            stats.calls += 1
+            stats.failures += not ok
+            stats.timeouts += timeouts
+            stats.retries += retries
+            stats.disconnects += disconnects
+            stats.total += latency
+            stats.max = max(stats.max, latency)
+            stats.buckets[slot] += 1
+
+    def clear(self) -> None:
+        """Forget everything recorded."""
+        with self._lock:
+            self._stats.clear()
+
+    def rows(self, scope: str = "pv") -> List[Dict[str, Any]]:
+        """
+        Report rows, one per operation of each PV (scope 'pv') or of each
+        IOC prefix (scope 'prefix').
+        """
+        if scope not in ("pv", "prefix"):
+            raise ValueError(f"scope must be 'pv' or 'prefix', got {scope!r}")
+
+        with self._lock:
+            items = [
+                (key, self._copy(stats)) for key, stats in self._stats.items()
+            ]
+
+        if scope == "prefix":
+            merged: Dict[Tuple[str, str], OperationStats] = {}
+            for (pvname, operation), stats in items:
+                key = (ioc_prefix(pvname), operation)
+                merged.setdefault(key, OperationStats()).add(stats)
+            items = list(merged.items())
+
+        return [
+            stats.row(scope, name, operation)
+            for (name, operation), stats in sorted(items)
+        ]
+
+    @staticmethod
+    def _copy(stats: OperationStats) -> OperationStats:
+        copy = OperationStats()
+        copy.add(stats)
+        return copy
+
+    def top(
+        self, n: int = 10, by: str = "total_s", scope: str = "pv"
+    ) -> List[Dict[str, Any]]:
+        """The n rows with the largest value of the `by` column"""
+        return sorted(self.rows(scope), key=lambda row: -row[by])[:n]
+
+    def to_json(self, path: str) -> None:
+        """Write per-PV and per-prefix rows to a JSON file."""
+        report = {
+            "generated": datetime.now().isoformat(),
+            "latency_buckets_s": list(LATENCY_BUCKETS_SEC),
+            "pvs": self.rows("pv"),
+            "prefixes": self.rows("prefix"),
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    def to_csv(self, path: str) -> None:
+        """Write per-PV then per-prefix rows to a CSV file."""
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=ROW_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.rows("pv"))
+            writer.writerows(self.rows("prefix"))
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """
+        Write the metrics to path (default dump_path), as CSV if it ends
+        in .csv and as JSON otherwise.
+
+        Returns:
+            The path written
+        """
+        path = path or self.dump_path
+        if path is None:
+            raise ValueError("No path given and no dump_path set")
+        if path.lower().endswith(".csv"):
+            self.to_csv(path)
+        else:
+            self.to_json(path)
+        return path
+
+    def _dump_at_exit(self) -> None:
+        if self.dump_path is None:
+            return
+        try:
+            self.dump()
+        except Exception as e:
+            get_logger().warning(
+                f"Could not write PV metrics to {self.dump_path}: {e}"
+            )
+
+
+PV_METRICS = PVMetrics()
+
+if os.environ.get(METRICS_ENV):
+    PV_METRICS.enable(os.environ[METRICS_ENV])
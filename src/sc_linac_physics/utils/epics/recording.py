@@ -0,0 +1,202 @@
+"""
+Capture of PV traffic for offline replay.
+
+While PV_RECORDER is recording, every PV.get, PV.put and monitor update
+(and the pipelined and PVBatch reads, writes and monitors) is appended
+to a gzip-compressed JSON Lines file. The first line is a header; each
+following line is one event:
+
+    [seconds since start, kind, PV name, value, severity]
+
+with kind "g" (get), "p" (put) or "m" (monitor update). Arrays are
+stored as {"nd": [...], "dtype": "..."} and come back as numpy arrays.
+Severity is null where it is not known (puts, pipelined and batch gets).
+
+    >>> with PV_RECORDER.recording("incident.jsonl.gz"):
+    ...     cavity.validate_quench()
+
+Setting SC_LINAC_PV_RECORD to a path records the whole process. See
+replay.ReplaySession for playing a recording back.
+"""
+
+import atexit
+import gzip
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import Any, List, NamedTuple, Optional
+
+import numpy as np
+
+from sc_linac_physics.utils.epics.logger import get_logger
+
+RECORD_ENV = "SC_LINAC_PV_RECORD"
+
+FORMAT_NAME = "sc_linac_pv_recording"
+FORMAT_VERSION = 1
+
+GET = "g"
+PUT = "p"
+MONITOR = "m"
+
+
+class RecordedEvent(NamedTuple):
+    t: float
+    kind: str
+    pvname: str
+    value: Any
+    severity: Optional[int]
+
+
+@dataclass
+class Recording:
+    """A recording read back from file"""
+
+    # time() when recording started
+    start: float
+    # In recorded order, which is time order
+    events: List[RecordedEvent]
+
+    @property
+    def pvnames(self) -> List[str]:
+        return sorted({event.pvname for event in self.events})
+
+
+def _encode(value: Any) -> Any:
+    """JSON stand-in for values json cannot encode itself"""
+    if isinstance(value, np.ndarray):
+        return {"nd": value.tolist(), "dtype": str(value.dtype)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    return str(value)
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict) and "nd" in value:
+        return np.array(value["nd"], dtype=value.get("dtype"))
+    return value
+
+
+def read_recording(path: str) -> Recording:
+    """
+    Read a file written by PVRecorder.
+
+    Raises:
+        ValueError: If the file is not a PV recording
+    """
+    with gzip.open(path, "rt") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != FORMAT_NAME:
+            raise ValueError(f"{path} is not a PV recording")
+        events = [
+            RecordedEvent(t, kind, pvname, _decode(value), severity)
+            for t, kind, pvname, value, severity in map(json.loads, f)
+        ]
+    return Recording(start=header["start"], events=events)
+
+
+class PVRecorder:
+    """
+    Writes PV events to a recording file.
+
+    Attributes:
+        enabled: Whether instrumented calls record anything
+        path: File being recorded to, if any
+        events: Events written since start()
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.events = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._t0 = 0.0
+        self._atexit_registered = False
+
+    def start(self, path: str) -> None:
+        """
+        Start recording to path, replacing any file there.
+
+        Raises:
+            RuntimeError: If already recording
+        """
+        with self._lock:
+            if self._file is not None:
+                raise RuntimeError(f"Already recording to {self.path}")
+            self._file = gzip.open(path, "wt")
+            header = {
+                "format": FORMAT_NAME,
+                "version": FORMAT_VERSION,
+                "start": time(),
+            }
+            self._file.write(json.dumps(header) + "\n")
+            self._t0 = monotonic()
+            self.path = path
+            self.events = 0
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+            self.enabled = True
+        get_logger().info(f"Recording PV traffic to {path}")
+
+    def stop(self) -> None:
+        """Stop recording and close the file."""
+        with self._lock:
+            self.enabled = False
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        get_logger().info(f"Recorded {self.events} PV events to {self.path}")
+
+    @contextmanager
+    def recording(self, path: str):
+        """Record to path for the duration of a with block"""
+        self.start(path)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def record(
+        self,
+        kind: str,
+        pvname: str,
+        value: Any,
+        severity: Optional[int] = None,
+    ) -> None:
+        """
+        Append one event.
+
+        Args:
+            kind: GET, PUT or MONITOR
+            pvname: Process variable name
+            value: Value read, written or received
+            severity: Alarm severity, if known
+        """
+        t = round(monotonic() - self._t0, 6)
+        try:
+            line = json.dumps(
+                [t, kind, pvname, value, severity],
+                separators=(",", ":"),
+                default=_encode,
+            )
+        except ValueError as e:
+            get_logger().debug(f"Not recording {pvname} event: {e}")
+            return
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+                self.events += 1
+
+
+PV_RECORDER = PVRecorder()
+
+if os.environ.get(RECORD_ENV):
+    PV_RECORDER.start(os.environ[RECORD_ENV])
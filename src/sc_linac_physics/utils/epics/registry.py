@@ -0,0 +1,288 @@
+"""
+Process-wide, reference-counted registry of shared PV objects.
+
+Every Machine subclass builds its own linac objects, and each of those
+creates its PVs lazily. Without sharing, a process holding two machines
+has two PV objects (and two monitors) for every PV both of them touch.
+The registry hands out one PV per (PV class, name, form, count,
+auto_monitor) and counts its users. A PV nobody holds stays connected
+for idle_ttl seconds, so a user that comes back soon finds it still
+connected, and is then disconnected.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Type
+
+from sc_linac_physics.utils.epics.core import PV
+from sc_linac_physics.utils.epics.logger import get_logger
+
+DEFAULT_IDLE_TTL = 60.0
+
+RegistryKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class PVRegistryStats:
+    """Snapshot of a PVRegistry's channels"""
+
+    channels: int
+    connected: int
+    in_use: int
+    idle: int
+    references: int
+    created: int
+    reused: int
+    expired: int
+
+
+class _Entry:
+    __slots__ = ("pv", "refs")
+
+    def __init__(self, pv: PV):
+        self.pv = pv
+        self.refs = 0
+
+
+class PVRegistry:
+    """
+    Shares PV objects between all users in a process.
+
+    acquire() returns the registered PV for a key, creating it on first
+    use, and release() gives it back. Released PVs are disconnected once
+    they have been idle for idle_ttl seconds; sweeps happen on
+    acquire/release and on a background timer while anything is idle.
+
+    Callbacks added to a shared PV are seen by every user, and a PV must
+    not be used after it has been released.
+    """
+
+    def __init__(
+        self,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """
+        Args:
+            idle_ttl: Seconds an unreferenced PV stays connected
+            clock: Monotonic time source (seconds)
+        """
+        if idle_ttl < 0:
+            raise ValueError(f"idle_ttl must be >= 0, got {idle_ttl}")
+
+        self.idle_ttl = idle_ttl
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: Dict[RegistryKey, _Entry] = {}
+        self._keys_by_pv: Dict[int, RegistryKey] = {}
+        # Idle keys in the order they went idle, with that time
+        self._idle: OrderedDict[RegistryKey, float] = OrderedDict()
+        self._creating: Dict[RegistryKey, threading.Lock] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._created = 0
+        self._reused = 0
+        self._expired = 0
+
+    @staticmethod
+    def make_key(
+        pvname: str,
+        form: str = "time",
+        count: Optional[int] = None,
+        auto_monitor: bool = True,
+        pv_class: Type[PV] = PV,
+    ) -> RegistryKey:
+        # PVs served by a replay backend are not shared with live ones
+        return pv_class, PV.backend, pvname, form, count, auto_monitor
+
+    def acquire(
+        self,
+        pvname: str,
+        form: str = "time",
+        count: Optional[int] = None,
+        auto_monitor: bool = True,
+        pv_class: Type[PV] = PV,
+        owner: Any = None,
+        **kwargs,
+    ) -> PV:
+        """
+        Get the shared PV for pvname, creating it if needed.
+
+        Args:
+            pvname: Process variable name
+            form: Data form ('time', 'ctrl', or 'native')
+            count: Number of array elements to fetch
+            auto_monitor: Automatically monitor for changes
+            pv_class: PV class to create; part of the key
+            owner: If given, the reference is released when owner is
+                garbage collected instead of by calling release()
+            **kwargs: Passed to pv_class when the PV is created; ignored
+                for a PV that already exists
+
+        Returns:
+            The registered PV
+
+        Raises:
+            PVConnectionError: If the PV is created and fails to connect
+        """
+        key = self.make_key(pvname, form, count, auto_monitor, pv_class)
+        entry = self._take(key)
+        if entry is None:
+            # Connecting can block for the connection timeout, so only
+            # other users of the same key wait for it
+            with self._creation_lock(key):
+                entry = self._take(key)
+                if entry is None:
+                    try:
+                        pv = pv_class(
+                            pvname,
+                            form=form,
+                            count=count,
+                            auto_monitor=auto_monitor,
+                            **kwargs,
+                        )
+                    finally:
+                        with self._lock:
+                            self._creating.pop(key, None)
+                    entry = self._register(key, pv)
+
+        if owner is not None:
+            # Nothing to release at interpreter exit
+            finalizer = weakref.finalize(owner, self._release, key, entry)
+            finalizer.atexit = False
+        return entry.pv
+
+    def _take(self, key: RegistryKey) -> Optional[_Entry]:
+        """Add a reference to key's entry, if there is one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refs += 1
+                self._reused += 1
+                self._idle.pop(key, None)
+                self._sweep_locked()
+            return entry
+
+    def _creation_lock(self, key: RegistryKey) -> threading.Lock:
+        with self._lock:
+            return self._creating.setdefault(key, threading.Lock())
+
+    def _register(self, key: RegistryKey, pv: PV) -> _Entry:
+        with self._lock:
+            entry = _Entry(pv)
+            entry.refs = 1
+            self._entries[key] = entry
+            self._keys_by_pv[id(pv)] = key
+            self._created += 1
+            self._sweep_locked()
+            return entry
+
+    def release(self, pv: PV) -> None:
+        """Give back one reference to a PV returned by acquire()."""
+        with self._lock:
+            key = self._keys_by_pv.get(id(pv))
+            if key is None:
+                raise KeyError(f"{pv} was not acquired from this registry")
+            self._release(key, self._entries[key])
+
+    def _release(self, key: RegistryKey, entry: _Entry) -> None:
+        with self._lock:
+            # A cleared registry may since have a new entry for key
+            if self._entries.get(key) is not entry or entry.refs == 0:
+                return
+            entry.refs -= 1
+            if entry.refs == 0:
+                self._idle[key] = self._clock()
+            self._sweep_locked()
+
+    def sweep(self) -> int:
+        """Disconnect PVs idle for longer than idle_ttl.
+
+        Returns:
+            Number of PVs disconnected
+        """
+        with self._lock:
+            return self._sweep_locked()
+
+    def _sweep_locked(self) -> int:
+        now = self._clock()
+        expired = 0
+        while self._idle:
+            key, idle_since = next(iter(self._idle.items()))
+            if now - idle_since < self.idle_ttl:
+                break
+            del self._idle[key]
+            self._disconnect(self._entries.pop(key).pv)
+            expired += 1
+
+        self._expired += expired
+        self._schedule_sweep_locked(now)
+        return expired
+
+    def _schedule_sweep_locked(self, now: float) -> None:
+        if self._timer is not None or not self._idle:
+            return
+        oldest = next(iter(self._idle.values()))
+        delay = max(0.0, oldest + self.idle_ttl - now)
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._sweep_locked()
+
+    def _disconnect(self, pv: PV) -> None:
+        self._keys_by_pv.pop(id(pv), None)
+        try:
+            pv.disconnect()
+        except Exception as e:
+            get_logger().warning(f"Error disconnecting idle PV {pv}: {e}")
+
+    def stats(self) -> PVRegistryStats:
+        """Counts of the registry's channels and of its activity so far."""
+        with self._lock:
+            entries = list(self._entries.values())
+            return PVRegistryStats(
+                channels=len(entries),
+                connected=sum(1 for entry in entries if entry.pv.connected),
+                in_use=sum(1 for entry in entries if entry.refs),
+                idle=len(self._idle),
+                references=sum(entry.refs for entry in entries),
+                created=self._created,
+                reused=self._reused,
+                expired=self._expired,
+            )
+
+    def clear(self) -> None:
+        """Disconnect every PV, in use or not, and forget them."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            for entry in self._entries.values():
+                self._disconnect(entry.pv)
+            self._entries.clear()
+            self._keys_by_pv.clear()
+            self._idle.clear()
+
+
+PV_REGISTRY = PVRegistry()
+
+
+def shared_pv(pvname: str, owner: Any = None, **kwargs) -> PV:
+    """
+    Get pvname's PV from the process-wide registry.
+
+    Args:
+        pvname: Process variable name
+        owner: Object whose lifetime holds the reference
+        **kwargs: See PVRegistry.acquire
+
+    Returns:
+        The shared PV
+    """
+    return PV_REGISTRY.acquire(pvname, owner=owner, **kwargs)
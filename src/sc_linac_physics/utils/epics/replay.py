@@ -0,0 +1,453 @@
+"""
+Replay of recorded PV traffic through the PV API, with no network.
+
+While a ReplaySession is active, PV(...) (and so shared_pv, batch_create
+and everything built on them) returns a ReplayPV that serves values from
+a recording made with PV_RECORDER, and PVBatch reads from it too:
+
+    >>> with ReplaySession("incident.jsonl.gz", speed=10):
+    ...     cavity = QuenchCavity(...)
+    ...     cavity.validate_quench()
+
+A PV's value at replay time t is the last one recorded for it (by a get
+or a monitor update) at or before t, and monitor updates are delivered to
+callbacks at their recorded times. With speed, replay time runs at that
+multiple of wall time from the start of the session. With speed=None it
+advances in steps instead: each get returns the PV's next recorded get
+and moves replay time to it, and a PV with no recorded gets left moves
+it to its next monitor update. Stepping reproduces a recorded sequence
+of reads exactly, however long the code under test takes.
+
+Puts change nothing. They are checked against the PV's next recorded
+put, and any mismatch is logged and listed in divergences. PVs that are
+not in the recording never connect. Create the objects under test inside
+the session: PVs created before it still use the network.
+"""
+
+import inspect
+import threading
+from bisect import bisect_right
+from collections import defaultdict, deque
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from sc_linac_physics.utils.epics.config import PVConfig
+from sc_linac_physics.utils.epics.core import PV
+from sc_linac_physics.utils.epics.exceptions import (
+    PVConnectionError,
+    PVGetError,
+)
+from sc_linac_physics.utils.epics.logger import get_logger
+from sc_linac_physics.utils.epics.recording import (
+    GET,
+    MONITOR,
+    PUT,
+    RecordedEvent,
+    Recording,
+    read_recording,
+)
+
+_PV_SIGNATURE = inspect.signature(PV.__init__)
+
+
+def _same(a: Any, b: Any) -> bool:
+    try:
+        return bool(np.array_equal(a, b))
+    except Exception:
+        return a == b
+
+
+class ReplayPV:
+    """
+    Stands in for a PV during replay.
+
+    Supports the PV methods the rest of the package uses: get, put, the
+    callback methods, check_alarm and validate_value, and the pvname,
+    connected, value, severity and timestamp attributes.
+    """
+
+    # Shared with PV; they only need the attributes above
+    validate_value = PV.validate_value
+    check_alarm = PV.check_alarm
+
+    def __init__(
+        self,
+        session: "ReplaySession",
+        pvname: str,
+        callback: Optional[Callable] = None,
+        form: str = "time",
+        auto_monitor: bool = True,
+        count: Optional[int] = None,
+        connection_callback: Optional[Callable] = None,
+        config: Optional[PVConfig] = None,
+    ):
+        self.pvname = pvname
+        self.form = form
+        self.auto_monitor = auto_monitor
+        self.count = count
+        self.config = config or PV.default_config
+        self.callbacks: Dict[int, Tuple[Callable, dict]] = {}
+        self.connection_callbacks: List[Callable] = []
+        self._session = session
+        self._next_index = 0
+        self._connected = session.has_pv(pvname)
+
+        session.subscribe(self)
+        if connection_callback is not None:
+            self.connection_callbacks.append(connection_callback)
+            connection_callback(pvname=pvname, conn=self._connected, pv=self)
+        if callback is not None:
+            self.add_callback(callback)
+
+    def __str__(self) -> str:
+        return self.pvname
+
+    def __repr__(self) -> str:
+        status = "connected" if self.connected else "disconnected"
+        return f"ReplayPV('{self.pvname}', {status})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
+        return False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def wait_for_connection(self, timeout: Optional[float] = None) -> bool:
+        return self._connected
+
+    def _ensure_connected(self, timeout: Optional[float] = None):
+        if not self._connected:
+            raise PVConnectionError(f"PV {self.pvname} is not in the recording")
+
+    def disconnect(self, deepclean: bool = True):
+        self._connected = False
+        self._session.unsubscribe(self)
+        self.callbacks.clear()
+
+    def get(
+        self,
+        count: Optional[int] = None,
+        as_string: bool = False,
+        as_numpy: bool = True,
+        timeout: Optional[float] = None,
+        with_ctrlvars: bool = False,
+        use_monitor: Optional[bool] = None,
+        max_age: Optional[float] = None,
+    ) -> Any:
+        """
+        The PV's recorded value at the current replay time.
+
+        Raises:
+            PVConnectionError: If the PV is not in the recording
+            PVGetError: If nothing was ever read from the PV
+        """
+        self._ensure_connected()
+        value = self._session.read(self.pvname)
+        if value is None:
+            raise PVGetError(f"PV {self.pvname} has no recorded value")
+        return str(value) if as_string else value
+
+    def put(
+        self,
+        value: Any,
+        wait: bool = True,
+        timeout: Optional[float] = None,
+        use_complete: bool = False,
+        callback: Optional[Callable] = None,
+        callback_data: Optional[Any] = None,
+    ):
+        """Check value against the recording; completes at once."""
+        self._ensure_connected()
+        self._session.write(self.pvname, value)
+        if callback is not None:
+            callback(pvname=self.pvname, data=callback_data)
+
+    @property
+    def value(self) -> Any:
+        return self._session.state(self.pvname)[0]
+
+    @property
+    def val(self) -> Any:
+        return self.get()
+
+    @property
+    def value_or_none(self) -> Any:
+        try:
+            return self.get()
+        except (PVConnectionError, PVGetError):
+            return None
+
+    @property
+    def char_value(self) -> str:
+        return str(self.value)
+
+    @property
+    def severity(self) -> Optional[int]:
+        return self._session.state(self.pvname)[1]
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        return self._session.state(self.pvname)[2]
+
+    def _issue_get(self) -> bool:
+        """No pipelined reads; PV.get_many falls back to get()"""
+        return False
+
+    def _report_outcome(self, ok: bool):
+        """No circuit breakers in a replay"""
+
+    def add_callback(
+        self, callback: Callable, index: Optional[int] = None, **kwargs
+    ) -> int:
+        if index is None:
+            index = self._next_index
+            self._next_index += 1
+        self.callbacks[index] = (callback, kwargs)
+        return index
+
+    def remove_callback(self, index: int):
+        self.callbacks.pop(index, None)
+
+    def clear_callbacks(self):
+        self.callbacks.clear()
+
+    def run_callbacks(self):
+        self._notify(*self._session.state(self.pvname))
+
+    def _notify(
+        self, value: Any, severity: Optional[int], timestamp: Optional[float]
+    ):
+        for callback, kwargs in list(self.callbacks.values()):
+            try:
+                callback(
+                    pvname=self.pvname,
+                    value=value,
+                    severity=severity,
+                    timestamp=timestamp,
+                    **kwargs,
+                )
+            except Exception as e:
+                get_logger().warning(
+                    f"Replay callback for {self.pvname} failed: {e}"
+                )
+
+
+class ReplaySession:
+    """
+    Serves a recording to the PV API.
+
+    Attributes:
+        recording: The recording being replayed
+        speed: Replay time per wall time, or None to step (see module doc)
+        divergences: Descriptions of puts that differ from the recording
+    """
+
+    def __init__(
+        self,
+        recording: Union[str, Recording],
+        speed: Optional[float] = 1.0,
+    ):
+        """
+        Args:
+            recording: Recording, or path of a recording file
+            speed: Replay time per wall time (1.0 for real time), or None
+                to step through recorded gets
+        """
+        if isinstance(recording, str):
+            recording = read_recording(recording)
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be > 0 or None, got {speed}")
+
+        self.recording = recording
+        self.speed = speed
+        self.divergences: List[str] = []
+
+        self._lock = threading.RLock()
+        self._names = set(recording.pvnames)
+        # Per PV: times and (value, severity) of every get and monitor
+        self._history_t: Dict[str, List[float]] = defaultdict(list)
+        self._history: Dict[str, List[Tuple[Any, Optional[int]]]] = defaultdict(
+            list
+        )
+        self._gets: Dict[str, Deque[RecordedEvent]] = defaultdict(deque)
+        self._puts: Dict[str, Deque[RecordedEvent]] = defaultdict(deque)
+        self._monitor_t: Dict[str, Deque[float]] = defaultdict(deque)
+        self._monitors: List[RecordedEvent] = []
+        self._next_monitor = 0
+        self._subscribers: Dict[str, List[ReplayPV]] = defaultdict(list)
+        self._step_t = 0.0
+        self._t0 = 0.0
+        self._stop = threading.Event()
+        self._feeder: Optional[threading.Thread] = None
+
+        for event in recording.events:
+            self._index(event)
+
+    def _index(self, event: RecordedEvent):
+        if event.kind == PUT:
+            self._puts[event.pvname].append(event)
+            return
+        self._history_t[event.pvname].append(event.t)
+        self._history[event.pvname].append((event.value, event.severity))
+        if event.kind == GET:
+            self._gets[event.pvname].append(event)
+        elif event.kind == MONITOR:
+            self._monitors.append(event)
+            self._monitor_t[event.pvname].append(event.t)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def start(self):
+        """
+        Route new PVs to this session.
+
+        Raises:
+            RuntimeError: If another PV backend is already active
+        """
+        if PV.backend is not None:
+            raise RuntimeError(f"PV backend already active: {PV.backend}")
+        PV.backend = self
+        self._t0 = monotonic()
+        self._stop.clear()
+        if self.speed is not None:
+            self._feeder = threading.Thread(
+                target=self._feed_monitors, daemon=True
+            )
+            self._feeder.start()
+        get_logger().info(
+            f"Replaying {len(self.recording.events)} PV events "
+            f"({'stepped' if self.speed is None else f'{self.speed}x'})"
+        )
+
+    def stop(self):
+        """Stop routing new PVs here and stop delivering monitor updates."""
+        self._stop.set()
+        if self._feeder is not None:
+            self._feeder.join()
+            self._feeder = None
+        if PV.backend is self:
+            PV.backend = None
+
+    def create_pv(self, pvname: str, *args, **kwargs) -> ReplayPV:
+        """Make the ReplayPV for a PV(...) call's arguments"""
+        options = _PV_SIGNATURE.bind(None, pvname, *args, **kwargs).arguments
+        return ReplayPV(
+            self,
+            pvname,
+            callback=options.get("callback"),
+            form=options.get("form", "time"),
+            auto_monitor=options.get("auto_monitor", True),
+            count=options.get("count"),
+            connection_callback=options.get("connection_callback"),
+            config=options.get("config"),
+        )
+
+    def has_pv(self, pvname: str) -> bool:
+        return pvname in self._names
+
+    def now(self) -> float:
+        """Current replay time, in recorded seconds"""
+        if self.speed is None:
+            return self._step_t
+        return (monotonic() - self._t0) * self.speed
+
+    def state(self, pvname: str) -> Tuple[Any, Optional[int], Optional[float]]:
+        """(value, severity, timestamp) of pvname at the current replay time"""
+        with self._lock:
+            times = self._history_t.get(pvname)
+            if not times:
+                return None, None, None
+            # Before its first recorded value, a PV has that value
+            i = max(bisect_right(times, self.now()) - 1, 0)
+            value, severity = self._history[pvname][i]
+            return value, severity, self.recording.start + times[i]
+
+    def read(self, pvname: str) -> Any:
+        """A get of pvname: its value now, after stepping if stepped"""
+        if self.speed is None:
+            self._step_for_read(pvname)
+        return self.state(pvname)[0]
+
+    def _step_for_read(self, pvname: str):
+        with self._lock:
+            if self._gets[pvname]:
+                t = self._gets[pvname].popleft().t
+            elif self._monitor_t[pvname]:
+                t = self._monitor_t[pvname][0]
+            else:
+                return
+        self._advance(t)
+
+    def write(self, pvname: str, value: Any):
+        """A put to pvname, checked against its next recorded put"""
+        with self._lock:
+            puts = self._puts[pvname]
+            expected = puts.popleft() if puts else None
+        if expected is not None and self.speed is None:
+            self._advance(expected.t)
+
+        if expected is None:
+            divergence = f"{pvname}: unexpected put of {value!r}"
+        elif not _same(value, expected.value):
+            divergence = (
+                f"{pvname}: put {value!r}, recorded {expected.value!r} "
+                f"at {expected.t:.3f}s"
+            )
+        else:
+            return
+        get_logger().warning(f"Replay diverged: {divergence}")
+        self.divergences.append(divergence)
+
+    def _advance(self, t: float):
+        """Move stepped replay time to t, delivering monitors up to it"""
+        with self._lock:
+            self._step_t = max(self._step_t, t)
+            until = self._step_t
+        self._deliver_monitors(until)
+
+    def _deliver_monitors(self, until: float):
+        while True:
+            with self._lock:
+                if self._next_monitor >= len(self._monitors):
+                    return
+                event = self._monitors[self._next_monitor]
+                if event.t > until:
+                    return
+                self._next_monitor += 1
+                self._monitor_t[event.pvname].popleft()
+                subscribers = list(self._subscribers.get(event.pvname, ()))
+            timestamp = self.recording.start + event.t
+            for pv in subscribers:
+                pv._notify(event.value, event.severity, timestamp)
+
+    def _feed_monitors(self):
+        """Deliver monitor updates at their scaled recorded times"""
+        while self._next_monitor < len(self._monitors):
+            event = self._monitors[self._next_monitor]
+            delay = event.t / self.speed - (monotonic() - self._t0)
+            if delay > 0 and self._stop.wait(delay):
+                return
+            self._deliver_monitors(event.t)
+
+    def subscribe(self, pv: ReplayPV):
+        with self._lock:
+            self._subscribers[pv.pvname].append(pv)
+
+    def unsubscribe(self, pv: ReplayPV):
+        with self._lock:
+            subscribers = self._subscribers.get(pv.pvname, [])
+            if pv in subscribers:
+                subscribers.remove(pv)
@@ -0,0 +1,77 @@
+"""
+Event-driven waiting on PV values.
+
+Sequences used to poll a PV with time.sleep(), so they reacted up to a
+whole poll period late and read the PV on every pass. wait_until()
+subscribes to the PV's monitor instead and re-checks the predicate as
+soon as an update arrives. It still wakes every poll_interval seconds to
+run the abort check, and re-reads the PV then in case an update was
+missed.
+"""
+
+import threading
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from sc_linac_physics.utils.epics.exceptions import (
+    PVWaitAbortedError,
+    PVWaitTimeoutError,
+)
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def wait_until(
+    pv,
+    predicate: Callable[[Any], bool],
+    timeout: Optional[float] = None,
+    abort_check: Optional[Callable[[], Any]] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> Any:
+    """
+    Block until predicate(pv.get()) is true and return that value.
+
+    Args:
+        pv: PV to watch; anything with get/add_callback/remove_callback
+        predicate: Called with each value read; True ends the wait
+        timeout: Seconds to wait, or None to wait indefinitely
+        abort_check: Called after every unsatisfied check. It may raise
+            (e.g. a cavity's check_abort) or return a truthy value to abort
+        poll_interval: Longest time between checks without an update
+
+    Raises:
+        PVWaitTimeoutError: If timeout passes first
+        PVWaitAbortedError: If abort_check returns a truthy value
+    """
+    updated = threading.Event()
+
+    def on_update(**kwargs):
+        updated.set()
+
+    index = pv.add_callback(on_update)
+    deadline = None if timeout is None else monotonic() + timeout
+
+    try:
+        while True:
+            updated.clear()
+
+            value = pv.get()
+            if predicate(value):
+                return value
+
+            if abort_check is not None and abort_check():
+                raise PVWaitAbortedError(f"Wait on {pv.pvname} aborted")
+
+            wait = poll_interval
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise PVWaitTimeoutError(
+                        f"{pv.pvname} did not reach the awaited state "
+                        f"within {timeout}s (last value {value!r})"
+                    )
+                wait = min(wait, remaining)
+
+            updated.wait(wait)
+    finally:
+        pv.remove_callback(index)
@@ -77,3 +77,16 @@ def get_ssa_cal_base_dir(
     return (
         get_srf_base_dir(system_name=system_name, home_dir=home_dir) / "ssa_cal"
     )
+
+
+def get_cache_dir(
+    *,
+    system_name: str | None = None,
+    home_dir: Path | None = None,
+) -> Path:
+    """Return the per-user cache directory for the current platform."""
+    if is_linux(system_name=system_name):
+        return _current_home(home_dir) / ".cache" / "sc_linac_physics"
+    return (
+        get_srf_base_dir(system_name=system_name, home_dir=home_dir) / "cache"
+    )
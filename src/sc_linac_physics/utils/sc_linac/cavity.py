@@ -3,7 +3,12 @@ import time
 from datetime import datetime
 from typing import Optional, Callable, TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV, EPICS_INVALID_VAL, PVInvalidError
+from sc_linac_physics.utils.epics import (
+    PV,
+    EPICS_INVALID_VAL,
+    PVInvalidError,
+    shared_pv,
+)
 from sc_linac_physics.utils.logger import BASE_LOG_DIR, custom_logger
 from sc_linac_physics.utils.sc_linac import linac_utils
 from sc_linac_physics.utils.sc_linac.linac_utils import (
@@ -259,13 +264,13 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def note_pv_obj(self) -> PV:
         if not self._note_pv_obj:
-            self._note_pv_obj = PV(self.note_pv)
+            self._note_pv_obj = shared_pv(self.note_pv, owner=self)
         return self._note_pv_obj
 
     @property
     def status_pv_obj(self):
         if not self._status_pv_obj:
-            self._status_pv_obj = PV(self.status_pv)
+            self._status_pv_obj = shared_pv(self.status_pv, owner=self)
         return self._status_pv_obj
 
     @property
@@ -283,7 +288,7 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def progress_pv_obj(self):
         if not self._progress_pv_obj:
-            self._progress_pv_obj = PV(self.progress_pv)
+            self._progress_pv_obj = shared_pv(self.progress_pv, owner=self)
         return self._progress_pv_obj
 
     @property
@@ -297,7 +302,7 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def status_msg_pv_obj(self) -> PV:
         if not self._status_msg_pv_obj:
-            self._status_msg_pv_obj = PV(self.status_msg_pv)
+            self._status_msg_pv_obj = shared_pv(self.status_msg_pv, owner=self)
         return self._status_msg_pv_obj
 
     @property
@@ -341,15 +346,17 @@ class Cavity(linac_utils.SCLinacObject):
 
     def start_characterization(self):
         if not self._characterization_start_pv_obj:
-            self._characterization_start_pv_obj = PV(
-                self.characterization_start_pv
+            self._characterization_start_pv_obj = shared_pv(
+                self.characterization_start_pv, owner=self
             )
         self._characterization_start_pv_obj.put(1, wait=False)
 
     @property
     def cw_data_decimation_pv_obj(self) -> PV:
         if not self._cw_data_decim_pv_obj:
-            self._cw_data_decim_pv_obj = PV(self.cw_data_decimation_pv)
+            self._cw_data_decim_pv_obj = shared_pv(
+                self.cw_data_decimation_pv, owner=self
+            )
         return self._cw_data_decim_pv_obj
 
     @property
@@ -363,7 +370,9 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def pulsed_data_decimation_pv_obj(self) -> PV:
         if not self._pulsed_data_decim_pv_obj:
-            self._pulsed_data_decim_pv_obj = PV(self.pulsed_data_decimation_pv)
+            self._pulsed_data_decim_pv_obj = shared_pv(
+                self.pulsed_data_decimation_pv, owner=self
+            )
         return self._pulsed_data_decim_pv_obj
 
     @property
@@ -377,7 +386,7 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def rf_control_pv_obj(self) -> PV:
         if not self._rf_control_pv_obj:
-            self._rf_control_pv_obj = PV(self.rf_control_pv)
+            self._rf_control_pv_obj = shared_pv(self.rf_control_pv, owner=self)
         return self._rf_control_pv_obj
 
     @property
@@ -391,13 +400,15 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def rf_mode(self):
         if not self._rf_mode_pv_obj:
-            self._rf_mode_pv_obj = PV(self.rf_mode_pv)
+            self._rf_mode_pv_obj = shared_pv(self.rf_mode_pv, owner=self)
         return self._rf_mode_pv_obj.get()
 
     @property
     def rf_mode_ctrl_pv_obj(self) -> PV:
         if not self._rf_mode_ctrl_pv_obj:
-            self._rf_mode_ctrl_pv_obj = PV(self.rf_mode_ctrl_pv)
+            self._rf_mode_ctrl_pv_obj = shared_pv(
+                self.rf_mode_ctrl_pv, owner=self
+            )
         return self._rf_mode_ctrl_pv_obj
 
     def set_chirp_mode(self):
@@ -415,7 +426,9 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def drive_level_pv_obj(self):
         if not self._drive_level_pv_obj:
-            self._drive_level_pv_obj = PV(self.drive_level_pv)
+            self._drive_level_pv_obj = shared_pv(
+                self.drive_level_pv, owner=self
+            )
         return self._drive_level_pv_obj
 
     @property
@@ -428,20 +441,24 @@ class Cavity(linac_utils.SCLinacObject):
 
     def push_ssa_slope(self):
         if not self._push_ssa_slope_pv_obj:
-            self._push_ssa_slope_pv_obj = PV(
-                self._pv_prefix + "PUSH_SSA_SLOPE.PROC"
+            self._push_ssa_slope_pv_obj = shared_pv(
+                self._pv_prefix + "PUSH_SSA_SLOPE.PROC", owner=self
             )
         self._push_ssa_slope_pv_obj.put(1, wait=False)
 
     def save_ssa_slope(self):
         if not self._save_ssa_slope_pv_obj:
-            self._save_ssa_slope_pv_obj = PV(self.save_ssa_slope_pv)
+            self._save_ssa_slope_pv_obj = shared_pv(
+                self.save_ssa_slope_pv, owner=self
+            )
         self._save_ssa_slope_pv_obj.put(1, wait=False)
 
     @property
     def measured_loaded_q(self) -> float:
         if not self._measured_loaded_q_pv_obj:
-            self._measured_loaded_q_pv_obj = PV(self.measured_loaded_q_pv)
+            self._measured_loaded_q_pv_obj = shared_pv(
+                self.measured_loaded_q_pv, owner=self
+            )
         return self._measured_loaded_q_pv_obj.get()
 
     @property
@@ -454,14 +471,16 @@ class Cavity(linac_utils.SCLinacObject):
 
     def push_loaded_q(self):
         if not self._push_loaded_q_pv_obj:
-            self._push_loaded_q_pv_obj = PV(self.push_loaded_q_pv)
+            self._push_loaded_q_pv_obj = shared_pv(
+                self.push_loaded_q_pv, owner=self
+            )
         self._push_loaded_q_pv_obj.put(1, wait=False)
 
     @property
     def measured_scale_factor(self) -> float:
         if not self._measured_scale_factor_pv_obj:
-            self._measured_scale_factor_pv_obj = PV(
-                self.measured_scale_factor_pv
+            self._measured_scale_factor_pv_obj = shared_pv(
+                self.measured_scale_factor_pv, owner=self
             )
         return self._measured_scale_factor_pv_obj.get()
 
@@ -475,14 +494,16 @@ class Cavity(linac_utils.SCLinacObject):
 
     def push_scale_factor(self):
         if not self._push_scale_factor_pv_obj:
-            self._push_scale_factor_pv_obj = PV(self.push_scale_factor_pv)
+            self._push_scale_factor_pv_obj = shared_pv(
+                self.push_scale_factor_pv, owner=self
+            )
         self._push_scale_factor_pv_obj.put(1, wait=False)
 
     @property
     def characterization_status(self):
         if not self._characterization_status_pv_obj:
-            self._characterization_status_pv_obj = PV(
-                self.characterization_status_pv
+            self._characterization_status_pv_obj = shared_pv(
+                self.characterization_status_pv, owner=self
             )
         return self._characterization_status_pv_obj.get()
 
@@ -503,25 +524,31 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def pulse_on_time(self):
         if not self._pulse_on_time_pv_obj:
-            self._pulse_on_time_pv_obj = PV(self.pulse_on_time_pv)
+            self._pulse_on_time_pv_obj = shared_pv(
+                self.pulse_on_time_pv, owner=self
+            )
         return self._pulse_on_time_pv_obj.get()
 
     @pulse_on_time.setter
     def pulse_on_time(self, value: int):
         if not self._pulse_on_time_pv_obj:
-            self._pulse_on_time_pv_obj = PV(self.pulse_on_time_pv)
+            self._pulse_on_time_pv_obj = shared_pv(
+                self.pulse_on_time_pv, owner=self
+            )
         self._pulse_on_time_pv_obj.put(value)
 
     @property
     def pulse_status(self):
         if not self._pulse_status_pv_obj:
-            self._pulse_status_pv_obj = PV(self.pulse_status_pv)
+            self._pulse_status_pv_obj = shared_pv(
+                self.pulse_status_pv, owner=self
+            )
         return self._pulse_status_pv_obj.get()
 
     @property
     def rf_permit(self):
         if not self._rf_permit_pv_obj:
-            self._rf_permit_pv_obj = PV(self.rf_permit_pv)
+            self._rf_permit_pv_obj = shared_pv(self.rf_permit_pv, owner=self)
         return self._rf_permit_pv_obj.get()
 
     @property
@@ -531,37 +558,37 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def ades(self):
         if not self._ades_pv_obj:
-            self._ades_pv_obj = PV(self.ades_pv)
+            self._ades_pv_obj = shared_pv(self.ades_pv, owner=self)
         return self._ades_pv_obj.get()
 
     @ades.setter
     def ades(self, value: float):
         if not self._ades_pv_obj:
-            self._ades_pv_obj = PV(self._pv_prefix + "ADES")
+            self._ades_pv_obj = shared_pv(self._pv_prefix + "ADES", owner=self)
         self._ades_pv_obj.put(value)
 
     @property
     def acon(self):
         if not self._acon_pv_obj:
-            self._acon_pv_obj = PV(self.acon_pv)
+            self._acon_pv_obj = shared_pv(self.acon_pv, owner=self)
         return self._acon_pv_obj.get()
 
     @acon.setter
     def acon(self, value: float):
         if not self._acon_pv_obj:
-            self._acon_pv_obj = PV(self.acon_pv)
+            self._acon_pv_obj = shared_pv(self.acon_pv, owner=self)
         self._acon_pv_obj.put(value)
 
     @property
     def aact(self):
         if not self._aact_pv_obj:
-            self._aact_pv_obj = PV(self.aact_pv)
+            self._aact_pv_obj = shared_pv(self.aact_pv, owner=self)
         return self._aact_pv_obj.get()
 
     @property
     def ades_max(self):
         if not self._ades_max_pv_obj:
-            self._ades_max_pv_obj = PV(self.ades_max_pv)
+            self._ades_max_pv_obj = shared_pv(self.ades_max_pv, owner=self)
         return self._ades_max_pv_obj.get()
 
     @property
@@ -600,7 +627,7 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def hw_mode_pv_obj(self) -> PV:
         if not self._hw_mode_pv_obj:
-            self._hw_mode_pv_obj = PV(self.hw_mode_pv)
+            self._hw_mode_pv_obj = shared_pv(self.hw_mode_pv, owner=self)
         return self._hw_mode_pv_obj
 
     @property
@@ -618,7 +645,9 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def is_quenched(self) -> bool:
         if not self._quench_latch_pv_obj:
-            self._quench_latch_pv_obj = PV(self.quench_latch_pv)
+            self._quench_latch_pv_obj = shared_pv(
+                self.quench_latch_pv, owner=self
+            )
         if self._quench_latch_pv_obj.severity == EPICS_INVALID_VAL:
             raise PVInvalidError(f"{self} quench latch PV invalid")
         return self._quench_latch_pv_obj.get() == 1
@@ -626,13 +655,17 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def tune_config_pv_obj(self) -> PV:
         if not self._tune_config_pv_obj:
-            self._tune_config_pv_obj = PV(self.tune_config_pv)
+            self._tune_config_pv_obj = shared_pv(
+                self.tune_config_pv, owner=self
+            )
         return self._tune_config_pv_obj
 
     @property
     def chirp_freq_start_pv_obj(self) -> PV:
         if not self._chirp_freq_start_pv_obj:
-            self._chirp_freq_start_pv_obj = PV(self.chirp_freq_start_pv)
+            self._chirp_freq_start_pv_obj = shared_pv(
+                self.chirp_freq_start_pv, owner=self
+            )
         return self._chirp_freq_start_pv_obj
 
     @property
@@ -646,7 +679,9 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def freq_stop_pv_obj(self) -> PV:
         if not self._chirp_freq_stop_pv_obj:
-            self._chirp_freq_stop_pv_obj = PV(self.chirp_freq_stop_pv)
+            self._chirp_freq_stop_pv_obj = shared_pv(
+                self.chirp_freq_stop_pv, owner=self
+            )
         return self._chirp_freq_stop_pv_obj
 
     @property
@@ -660,7 +695,9 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def calc_probe_q_pv_obj(self) -> PV:
         if not self._calc_probe_q_pv_obj:
-            self._calc_probe_q_pv_obj = PV(self.calc_probe_q_pv)
+            self._calc_probe_q_pv_obj = shared_pv(
+                self.calc_probe_q_pv, owner=self
+            )
         return self._calc_probe_q_pv_obj
 
     def calculate_probe_q(self):
@@ -680,7 +717,7 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def rf_state_pv_obj(self) -> PV:
         if not self._rf_state_pv_obj:
-            self._rf_state_pv_obj = PV(self.rf_state_pv)
+            self._rf_state_pv_obj = shared_pv(self.rf_state_pv, owner=self)
         return self._rf_state_pv_obj
 
     @property
@@ -749,55 +786,69 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def detune_best_pv_obj(self) -> PV:
         if not self._detune_best_pv_obj:
-            self._detune_best_pv_obj = PV(self.detune_best_pv)
+            self._detune_best_pv_obj = shared_pv(
+                self.detune_best_pv, owner=self
+            )
         return self._detune_best_pv_obj
 
     @property
     def detune_chirp_pv_obj(self) -> PV:
         if not self._detune_chirp_pv_obj:
-            self._detune_chirp_pv_obj = PV(self.detune_chirp_pv)
+            self._detune_chirp_pv_obj = shared_pv(
+                self.detune_chirp_pv, owner=self
+            )
         return self._detune_chirp_pv_obj
 
     @property
     def stepper_temp_pv_obj(self) -> PV:
         if not self._stepper_temp_pv_obj:
-            self._stepper_temp_pv_obj = PV(self.stepper_temp_pv)
+            self._stepper_temp_pv_obj = shared_pv(
+                self.stepper_temp_pv, owner=self
+            )
         return self._stepper_temp_pv_obj
 
     @property
     def df_cold_pv_obj(self) -> PV:
         if not self._df_cold_pv_obj:
-            self._df_cold_pv_obj = PV(self.df_cold_pv)
+            self._df_cold_pv_obj = shared_pv(self.df_cold_pv, owner=self)
         return self._df_cold_pv_obj
 
     @property
     def fscan_sel_pv_obj(self) -> PV:
         if not self._fscan_sel_pv_obj:
-            self._fscan_sel_pv_obj = PV(self.fscan_sel_pv)
+            self._fscan_sel_pv_obj = shared_pv(self.fscan_sel_pv, owner=self)
         return self._fscan_sel_pv_obj
 
     @property
     def fscan_8pi9_mode_pv_obj(self) -> PV:
         if not self._fscan_8pi9_mode_pv_obj:
-            self._fscan_8pi9_mode_pv_obj = PV(self.fscan_8pi9_mode_pv)
+            self._fscan_8pi9_mode_pv_obj = shared_pv(
+                self.fscan_8pi9_mode_pv, owner=self
+            )
         return self._fscan_8pi9_mode_pv_obj
 
     @property
     def fscan_7pi9_mode_pv_obj(self) -> PV:
         if not self._fscan_7pi9_mode_pv_obj:
-            self._fscan_7pi9_mode_pv_obj = PV(self.fscan_7pi9_mode_pv)
+            self._fscan_7pi9_mode_pv_obj = shared_pv(
+                self.fscan_7pi9_mode_pv, owner=self
+            )
         return self._fscan_7pi9_mode_pv_obj
 
     @property
     def fscan_push_8pi9_pv_obj(self) -> PV:
         if not self._fscan_push_8pi9_pv_obj:
-            self._fscan_push_8pi9_pv_obj = PV(self.fscan_push_8pi9_pv)
+            self._fscan_push_8pi9_pv_obj = shared_pv(
+                self.fscan_push_8pi9_pv, owner=self
+            )
         return self._fscan_push_8pi9_pv_obj
 
     @property
     def fscan_push_7pi9_pv_obj(self) -> PV:
         if not self._fscan_push_7pi9_pv_obj:
-            self._fscan_push_7pi9_pv_obj = PV(self.fscan_push_7pi9_pv)
+            self._fscan_push_7pi9_pv_obj = shared_pv(
+                self.fscan_push_7pi9_pv, owner=self
+            )
         return self._fscan_push_7pi9_pv_obj
 
     @property
@@ -992,7 +1043,9 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def pulse_go_pv_obj(self) -> PV:
         if not self._pulse_go_pv_obj:
-            self._pulse_go_pv_obj = PV(self._pv_prefix + "PULSE_DIFF_SUM")
+            self._pulse_go_pv_obj = shared_pv(
+                self._pv_prefix + "PULSE_DIFF_SUM", owner=self
+            )
         return self._pulse_go_pv_obj
 
     def push_go_button(self):
@@ -1236,7 +1289,9 @@ class Cavity(linac_utils.SCLinacObject):
         )
 
         if not self._interlock_reset_pv_obj:
-            self._interlock_reset_pv_obj = PV(self.interlock_reset_pv)
+            self._interlock_reset_pv_obj = shared_pv(
+                self.interlock_reset_pv, owner=self
+            )
 
         self._interlock_reset_pv_obj.put(1, wait=False)
         time.sleep(wait)
@@ -1271,7 +1326,9 @@ class Cavity(linac_utils.SCLinacObject):
     @property
     def characterization_timestamp(self) -> datetime:
         if not self._char_timestamp_pv_obj:
-            self._char_timestamp_pv_obj = PV(self.char_timestamp_pv)
+            self._char_timestamp_pv_obj = shared_pv(
+                self.char_timestamp_pv, owner=self
+            )
         date_string = self._char_timestamp_pv_obj.get()
         time_readback = datetime.strptime(date_string, "%Y-%m-%d-%H:%M:%S")
         return time_readback
@@ -1,6 +1,6 @@
 from typing import Type, Dict, List, TYPE_CHECKING, Optional
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import PV, shared_pv
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     SCLinacObject,
     L1BHL,
@@ -122,7 +122,7 @@ class Cryomodule(SCLinacObject):
     @property
     def ds_level_pv_obj(self) -> PV:
         if not self._ds_level_pv_obj:
-            self._ds_level_pv_obj = PV(self.ds_level_pv)
+            self._ds_level_pv_obj = shared_pv(self.ds_level_pv, owner=self)
         return self._ds_level_pv_obj
 
     @property
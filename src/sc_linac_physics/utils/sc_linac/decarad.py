@@ -1,6 +1,6 @@
 from typing import Dict, Optional
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import PV, shared_pv
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     SCLinacObject,
     DECARAD_BACKGROUND_READING_AVG,
@@ -35,13 +35,17 @@ class DecaradHead(SCLinacObject):
     @property
     def avg_dose_rate_pv_obj(self) -> PV:
         if not self._avg_dose_rate_pv_obj:
-            self._avg_dose_rate_pv_obj = PV(self.avg_dose_rate_pv)
+            self._avg_dose_rate_pv_obj = shared_pv(
+                self.avg_dose_rate_pv, owner=self
+            )
         return self._avg_dose_rate_pv_obj
 
     @property
     def raw_dose_rate_pv_obj(self) -> PV:
         if not self._raw_dose_rate_pv_obj:
-            self._raw_dose_rate_pv_obj = PV(self.raw_dose_rate_pv)
+            self._raw_dose_rate_pv_obj = shared_pv(
+                self.raw_dose_rate_pv, owner=self
+            )
         return self._raw_dose_rate_pv_obj
 
     @property
@@ -80,7 +84,9 @@ class Decarad(SCLinacObject):
     @property
     def power_control_pv_obj(self) -> PV:
         if not self._power_control_pv_obj:
-            self._power_control_pv_obj = PV(self.power_control_pv)
+            self._power_control_pv_obj = shared_pv(
+                self.power_control_pv, owner=self
+            )
         return self._power_control_pv_obj
 
     def turn_on(self):
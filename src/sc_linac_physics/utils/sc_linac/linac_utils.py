@@ -3,7 +3,7 @@ from typing import Dict, Optional
 
 from numpy import polyfit
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import PV, shared_pv
 
 # Cryomodule definitions
 L0B = ["01"]
@@ -397,13 +397,13 @@ class LauncherLinacObject(SCLinacObject):
     @property
     def start_pv_obj(self) -> PV:
         if not self._start_pv_obj:
-            self._start_pv_obj = PV(self.start_pv)
+            self._start_pv_obj = shared_pv(self.start_pv, owner=self)
         return self._start_pv_obj
 
     @property
     def stop_pv_obj(self) -> PV:
         if not self._stop_pv_obj:
-            self._stop_pv_obj = PV(self.stop_pv)
+            self._stop_pv_obj = shared_pv(self.stop_pv, owner=self)
         return self._stop_pv_obj
 
     def trigger_abort(self):
@@ -415,7 +415,7 @@ class LauncherLinacObject(SCLinacObject):
     @property
     def abort_pv_obj(self):
         if not self._abort_pv_obj:
-            self._abort_pv_obj = PV(self.abort_pv)
+            self._abort_pv_obj = shared_pv(self.abort_pv, owner=self)
         return self._abort_pv_obj
 
     @property
@@ -1,6 +1,6 @@
 from typing import Optional, TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import PV, shared_pv
 from sc_linac_physics.utils.sc_linac import linac_utils
 
 if TYPE_CHECKING:
@@ -48,13 +48,13 @@ class Magnet(linac_utils.SCLinacObject):
     @property
     def control_pv_obj(self) -> PV:
         if not self._control_pv_obj:
-            self._control_pv_obj = PV(self.control_pv)
+            self._control_pv_obj = shared_pv(self.control_pv, owner=self)
         return self._control_pv_obj
 
     @property
     def bdes(self):
         if not self._bdes_pv_obj:
-            self._bdes_pv_obj = PV(self.bdes_pv)
+            self._bdes_pv_obj = shared_pv(self.bdes_pv, owner=self)
         return self._bdes_pv_obj.get()
 
     @bdes.setter
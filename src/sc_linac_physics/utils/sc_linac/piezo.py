@@ -1,7 +1,11 @@
-import time
 from typing import Optional, TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVWaitTimeoutError,
+    shared_pv,
+    wait_until,
+)
 from sc_linac_physics.utils.sc_linac import linac_utils
 
 if TYPE_CHECKING:
@@ -63,13 +67,13 @@ class Piezo(linac_utils.SCLinacObject):
     @property
     def hz_per_v(self):
         if not self._hz_per_v_pv_obj:
-            self._hz_per_v_pv_obj = PV(self.hz_per_v_pv)
+            self._hz_per_v_pv_obj = shared_pv(self.hz_per_v_pv, owner=self)
         return self._hz_per_v_pv_obj.get()
 
     @property
     def voltage_pv_obj(self):
         if not self._voltage_pv_obj:
-            self._voltage_pv_obj = PV(self.voltage_pv)
+            self._voltage_pv_obj = shared_pv(self.voltage_pv, owner=self)
         return self._voltage_pv_obj
 
     @property
@@ -79,7 +83,9 @@ class Piezo(linac_utils.SCLinacObject):
     @property
     def bias_voltage_pv_obj(self):
         if not self._bias_voltage_pv_obj:
-            self._bias_voltage_pv_obj = PV(self.bias_voltage_pv)
+            self._bias_voltage_pv_obj = shared_pv(
+                self.bias_voltage_pv, owner=self
+            )
         return self._bias_voltage_pv_obj
 
     @property
@@ -98,7 +104,9 @@ class Piezo(linac_utils.SCLinacObject):
     @property
     def dc_setpoint_pv_obj(self) -> PV:
         if not self._dc_setpoint_pv_obj:
-            self._dc_setpoint_pv_obj = PV(self.dc_setpoint_pv)
+            self._dc_setpoint_pv_obj = shared_pv(
+                self.dc_setpoint_pv, owner=self
+            )
         return self._dc_setpoint_pv_obj
 
     @property
@@ -117,7 +125,9 @@ class Piezo(linac_utils.SCLinacObject):
     @property
     def feedback_setpoint_pv_obj(self) -> PV:
         if not self._feedback_setpoint_pv_obj:
-            self._feedback_setpoint_pv_obj = PV(self.feedback_setpoint_pv)
+            self._feedback_setpoint_pv_obj = shared_pv(
+                self.feedback_setpoint_pv, owner=self
+            )
         return self._feedback_setpoint_pv_obj
 
     @property
@@ -138,29 +148,45 @@ class Piezo(linac_utils.SCLinacObject):
     @property
     def enable_pv_obj(self) -> PV:
         if not self._enable_pv_obj:
-            self._enable_pv_obj = PV(self._pv_prefix + "ENABLE")
+            self._enable_pv_obj = shared_pv(
+                self._pv_prefix + "ENABLE", owner=self
+            )
         return self._enable_pv_obj
 
     @property
-    def is_enabled(self) -> bool:
+    def enable_stat_pv_obj(self) -> PV:
         if not self._enable_stat_pv_obj:
-            self._enable_stat_pv_obj = PV(self.enable_stat_pv)
+            self._enable_stat_pv_obj = shared_pv(
+                self.enable_stat_pv, owner=self
+            )
+        return self._enable_stat_pv_obj
+
+    @property
+    def is_enabled(self) -> bool:
         return (
-            self._enable_stat_pv_obj.get(use_monitor=False)
+            self.enable_stat_pv_obj.get(use_monitor=False)
             == linac_utils.PIEZO_ENABLE_VALUE
         )
 
     @property
     def feedback_control_pv_obj(self) -> PV:
         if not self._feedback_control_pv_obj:
-            self._feedback_control_pv_obj = PV(self.feedback_control_pv)
+            self._feedback_control_pv_obj = shared_pv(
+                self.feedback_control_pv, owner=self
+            )
         return self._feedback_control_pv_obj
 
     @property
-    def feedback_stat(self):
+    def feedback_stat_pv_obj(self) -> PV:
         if not self._feedback_stat_pv_obj:
-            self._feedback_stat_pv_obj = PV(self.feedback_stat_pv)
-        return self._feedback_stat_pv_obj.get(use_monitor=False)
+            self._feedback_stat_pv_obj = shared_pv(
+                self.feedback_stat_pv, owner=self
+            )
+        return self._feedback_stat_pv_obj
+
+    @property
+    def feedback_stat(self):
+        return self.feedback_stat_pv_obj.get(use_monitor=False)
 
     @property
     def in_manual(self) -> bool:
@@ -174,6 +200,21 @@ class Piezo(linac_utils.SCLinacObject):
         self.cavity.logger.debug("Setting piezo to manual mode")
         self.feedback_control_pv_obj.put(linac_utils.PIEZO_MANUAL_VALUE)
 
+    def wait_for_status(self, status_pv_obj: PV, value, timeout: float):
+        """
+        Wait until a status PV reads value, giving up quietly after timeout
+        seconds since callers re-check the status and retry
+        """
+        try:
+            wait_until(
+                status_pv_obj,
+                lambda status: status == value,
+                timeout=timeout,
+                abort_check=self.cavity.check_abort,
+            )
+        except PVWaitTimeoutError:
+            pass
+
     def enable(self):
         self.cavity.logger.info(
             "Enabling piezo with bias voltage 25V",
@@ -221,9 +262,13 @@ class Piezo(linac_utils.SCLinacObject):
                 },
             )
             self.enable_pv_obj.put(linac_utils.PIEZO_DISABLE_VALUE)
-            time.sleep(2)
+            self.wait_for_status(
+                self.enable_stat_pv_obj, linac_utils.PIEZO_DISABLE_VALUE, 2
+            )
             self.enable_pv_obj.put(linac_utils.PIEZO_ENABLE_VALUE)
-            time.sleep(2)
+            self.wait_for_status(
+                self.enable_stat_pv_obj, linac_utils.PIEZO_ENABLE_VALUE, 2
+            )
 
         self.cavity.logger.info(
             "Piezo successfully enabled",
@@ -272,9 +317,13 @@ class Piezo(linac_utils.SCLinacObject):
                 },
             )
             self.set_to_manual()
-            time.sleep(5)
+            self.wait_for_status(
+                self.feedback_stat_pv_obj, linac_utils.PIEZO_MANUAL_VALUE, 5
+            )
             self.set_to_feedback()
-            time.sleep(5)
+            self.wait_for_status(
+                self.feedback_stat_pv_obj, linac_utils.PIEZO_FEEDBACK_VALUE, 5
+            )
 
         self.cavity.logger.info(
             "Piezo feedback successfully enabled",
@@ -327,9 +376,13 @@ class Piezo(linac_utils.SCLinacObject):
                 },
             )
             self.set_to_feedback()
-            time.sleep(2)
+            self.wait_for_status(
+                self.feedback_stat_pv_obj, linac_utils.PIEZO_FEEDBACK_VALUE, 2
+            )
             self.set_to_manual()
-            time.sleep(2)
+            self.wait_for_status(
+                self.feedback_stat_pv_obj, linac_utils.PIEZO_MANUAL_VALUE, 2
+            )
 
         self.cavity.logger.info(
             "Piezo feedback successfully disabled",
@@ -1,7 +1,7 @@
 import time
 from typing import Type, Dict, Iterable, Optional, TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import PV, shared_pv
 from sc_linac_physics.utils.sc_linac import linac_utils
 from sc_linac_physics.utils.sc_linac.linac_utils import SCLinacObject
 from sc_linac_physics.utils.sc_linac.rfstation import RFStation
@@ -97,37 +97,47 @@ class Rack(SCLinacObject):
     @property
     def fscan_freq_start_pv_obj(self) -> PV:
         if not self._fscan_freq_start_pv_obj:
-            self._fscan_freq_start_pv_obj = PV(self.fscan_freq_start_pv)
+            self._fscan_freq_start_pv_obj = shared_pv(
+                self.fscan_freq_start_pv, owner=self
+            )
         return self._fscan_freq_start_pv_obj
 
     @property
     def fscan_freq_stop_pv_obj(self) -> PV:
         if not self._fscan_freq_stop_pv_obj:
-            self._fscan_freq_stop_pv_obj = PV(self.fscan_freq_stop_pv)
+            self._fscan_freq_stop_pv_obj = shared_pv(
+                self.fscan_freq_stop_pv, owner=self
+            )
         return self._fscan_freq_stop_pv_obj
 
     @property
     def fscan_rms_thresh_pv_obj(self) -> PV:
         if not self._fscan_rms_thresh_pv_obj:
-            self._fscan_rms_thresh_pv_obj = PV(self.fscan_rms_thresh_pv)
+            self._fscan_rms_thresh_pv_obj = shared_pv(
+                self.fscan_rms_thresh_pv, owner=self
+            )
         return self._fscan_rms_thresh_pv_obj
 
     @property
     def fscan_mode_overlap_pv_obj(self) -> PV:
         if not self._fscan_mode_overlap_pv_obj:
-            self._fscan_mode_overlap_pv_obj = PV(self.fscan_mode_overlap_pv)
+            self._fscan_mode_overlap_pv_obj = shared_pv(
+                self.fscan_mode_overlap_pv, owner=self
+            )
         return self._fscan_mode_overlap_pv_obj
 
     @property
     def fscan_start_pv_obj(self) -> PV:
         if not self._fscan_start_pv_obj:
-            self._fscan_start_pv_obj = PV(self.fscan_start_pv)
+            self._fscan_start_pv_obj = shared_pv(
+                self.fscan_start_pv, owner=self
+            )
         return self._fscan_start_pv_obj
 
     @property
     def fscan_stat_pv_obj(self) -> PV:
         if not self._fscan_stat_pv_obj:
-            self._fscan_stat_pv_obj = PV(self.fscan_stat_pv)
+            self._fscan_stat_pv_obj = shared_pv(self.fscan_stat_pv, owner=self)
         return self._fscan_stat_pv_obj
 
     def run_fscan(
@@ -1,7 +1,7 @@
 import threading
 from typing import TYPE_CHECKING, Optional
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import PV, shared_pv
 from sc_linac_physics.utils.sc_linac.linac_utils import SCLinacObject
 
 if TYPE_CHECKING:
@@ -36,7 +36,9 @@ class RFStation(SCLinacObject):
         if not self._dac_amp_pv_obj:
             with self._dac_lock:
                 if not self._dac_amp_pv_obj:
-                    self._dac_amp_pv_obj = PV(self.dac_amp_pv)
+                    self._dac_amp_pv_obj = shared_pv(
+                        self.dac_amp_pv, owner=self
+                    )
         return self._dac_amp_pv_obj
 
     @property
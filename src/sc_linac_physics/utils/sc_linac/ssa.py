@@ -1,8 +1,12 @@
 import time
-from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVWaitTimeoutError,
+    shared_pv,
+    wait_until,
+)
 from sc_linac_physics.utils.sc_linac import linac_utils
 
 if TYPE_CHECKING:
@@ -111,10 +115,14 @@ class SSA(linac_utils.SCLinacObject):
             return self.pv_prefix + suffix
 
     @property
-    def status_message(self):
+    def status_pv_obj(self) -> PV:
         if not self._status_pv_obj:
-            self._status_pv_obj = PV(self.status_pv)
-        return self._status_pv_obj.get()
+            self._status_pv_obj = shared_pv(self.status_pv, owner=self)
+        return self._status_pv_obj
+
+    @property
+    def status_message(self):
+        return self.status_pv_obj.get()
 
     @property
     def is_on(self) -> bool:
@@ -136,13 +144,17 @@ class SSA(linac_utils.SCLinacObject):
     @property
     def max_fwd_pwr(self):
         if not self._max_fwd_pwr_pv_obj:
-            self._max_fwd_pwr_pv_obj = PV(self.max_fwd_pwr_pv)
+            self._max_fwd_pwr_pv_obj = shared_pv(
+                self.max_fwd_pwr_pv, owner=self
+            )
         return self._max_fwd_pwr_pv_obj.get()
 
     @property
     def drive_max(self):
         if not self._saved_drive_max_pv_obj:
-            self._saved_drive_max_pv_obj = PV(self.saved_drive_max_pv)
+            self._saved_drive_max_pv_obj = shared_pv(
+                self.saved_drive_max_pv, owner=self
+            )
         saved_val = self._saved_drive_max_pv_obj.get()
         return (
             saved_val
@@ -153,7 +165,9 @@ class SSA(linac_utils.SCLinacObject):
     @drive_max.setter
     def drive_max(self, value: float):
         if not self._drive_max_setpoint_pv_obj:
-            self._drive_max_setpoint_pv_obj = PV(self.drive_max_setpoint_pv)
+            self._drive_max_setpoint_pv_obj = shared_pv(
+                self.drive_max_setpoint_pv, owner=self
+            )
         self._drive_max_setpoint_pv_obj.put(value)
 
     def calibrate(self, drive_max, attempt=0):
@@ -233,19 +247,23 @@ class SSA(linac_utils.SCLinacObject):
     @property
     def ps_volt_setpoint2_pv_obj(self):
         if not self._ps_volt_setpoint2_pv_obj:
-            self._ps_volt_setpoint2_pv_obj = PV(self.ps_volt_setpoint2_pv)
+            self._ps_volt_setpoint2_pv_obj = shared_pv(
+                self.ps_volt_setpoint2_pv, owner=self
+            )
         return self._ps_volt_setpoint2_pv_obj
 
     @property
     def ps_volt_setpoint1_pv_obj(self):
         if not self._ps_volt_setpoint1_pv_obj:
-            self._ps_volt_setpoint1_pv_obj = PV(self.ps_volt_setpoint1_pv)
+            self._ps_volt_setpoint1_pv_obj = shared_pv(
+                self.ps_volt_setpoint1_pv, owner=self
+            )
         return self._ps_volt_setpoint1_pv_obj
 
     @property
     def turn_on_pv_obj(self) -> PV:
         if not self._turn_on_pv_obj:
-            self._turn_on_pv_obj = PV(self.turn_on_pv)
+            self._turn_on_pv_obj = shared_pv(self.turn_on_pv, owner=self)
         return self._turn_on_pv_obj
 
     def turn_on(self):
@@ -257,18 +275,20 @@ class SSA(linac_utils.SCLinacObject):
             self.cavity.logger.info("Turning SSA on")
             self.turn_on_pv_obj.put(1)
 
-            while not self.is_on:
-                self.cavity.check_abort()
-                self.cavity.logger.debug(
-                    "Waiting for SSA to turn on",
-                    extra={
-                        "extra_data": {
-                            "status_message": self.status_message,
-                            "ssa": str(self),
-                        }
-                    },
-                )
-                time.sleep(1)
+            self.cavity.logger.debug(
+                "Waiting for SSA to turn on",
+                extra={
+                    "extra_data": {
+                        "status_message": self.status_message,
+                        "ssa": str(self),
+                    }
+                },
+            )
+            wait_until(
+                self.status_pv_obj,
+                lambda status: status == linac_utils.SSA_STATUS_ON_VALUE,
+                abort_check=self.cavity.check_abort,
+            )
 
         if self.cavity.cryomodule.is_harmonic_linearizer:
             self.cavity.logger.debug(
@@ -283,7 +303,7 @@ class SSA(linac_utils.SCLinacObject):
     @property
     def turn_off_pv_obj(self) -> PV:
         if not self._turn_off_pv_obj:
-            self._turn_off_pv_obj = PV(self.turn_off_pv)
+            self._turn_off_pv_obj = shared_pv(self.turn_off_pv, owner=self)
         return self._turn_off_pv_obj
 
     def turn_off(self):
@@ -291,25 +311,27 @@ class SSA(linac_utils.SCLinacObject):
             self.cavity.logger.info("Turning SSA off")
             self.turn_off_pv_obj.put(1)
 
-            while self.is_on:
-                self.cavity.check_abort()
-                self.cavity.logger.debug(
-                    "Waiting for SSA to turn off",
-                    extra={
-                        "extra_data": {
-                            "status_message": self.status_message,
-                            "ssa": str(self),
-                        }
-                    },
-                )
-                time.sleep(1)
+            self.cavity.logger.debug(
+                "Waiting for SSA to turn off",
+                extra={
+                    "extra_data": {
+                        "status_message": self.status_message,
+                        "ssa": str(self),
+                    }
+                },
+            )
+            wait_until(
+                self.status_pv_obj,
+                lambda status: status != linac_utils.SSA_STATUS_ON_VALUE,
+                abort_check=self.cavity.check_abort,
+            )
 
         self.cavity.logger.info("SSA successfully turned off")
 
     @property
     def reset_pv_obj(self) -> PV:
         if not self._reset_pv_obj:
-            self._reset_pv_obj = PV(self.reset_pv)
+            self._reset_pv_obj = shared_pv(self.reset_pv, owner=self)
         return self._reset_pv_obj
 
     def reset(self):
@@ -355,50 +377,56 @@ class SSA(linac_utils.SCLinacObject):
         self.cavity.logger.info("SSA successfully reset")
 
     def wait_while_resetting(self):
-        start = datetime.now()
-        while self.is_resetting:
-            self.cavity.check_abort()
-            elapsed = (datetime.now() - start).total_seconds()
-            self.cavity.logger.debug(
-                "Waiting for SSA to finish resetting (%.0fs elapsed)",
-                elapsed,
+        self.cavity.logger.debug(
+            "Waiting for SSA to finish resetting",
+            extra={
+                "extra_data": {
+                    "status_message": self.status_message,
+                    "ssa": str(self),
+                }
+            },
+        )
+        try:
+            wait_until(
+                self.status_pv_obj,
+                lambda status: status
+                != linac_utils.SSA_STATUS_RESETTING_FAULTS_VALUE,
+                timeout=90,
+                abort_check=self.cavity.check_abort,
+            )
+        except PVWaitTimeoutError:
+            self.cavity.logger.error(
+                "SSA reset timeout",
                 extra={
                     "extra_data": {
-                        "elapsed_seconds": elapsed,
-                        "status_message": self.status_message,
+                        "timeout_seconds": 90,
+                        "final_status": self.status_message,
                         "ssa": str(self),
                     }
                 },
             )
-            time.sleep(5)
-            if elapsed >= 90:
-                self.cavity.logger.error(
-                    "SSA reset timeout",
-                    extra={
-                        "extra_data": {
-                            "elapsed_seconds": elapsed,
-                            "timeout_seconds": 90,
-                            "final_status": self.status_message,
-                            "ssa": str(self),
-                        }
-                    },
-                )
-                raise linac_utils.SSAFaultError(
-                    f"{self} took too long to reset, inspect and try again"
-                )
+            raise linac_utils.SSAFaultError(
+                f"{self} took too long to reset, inspect and try again"
+            )
 
     def start_calibration(self):
         if not self._calibration_start_pv_obj:
-            self._calibration_start_pv_obj = PV(self.calibration_start_pv)
+            self._calibration_start_pv_obj = shared_pv(
+                self.calibration_start_pv, owner=self
+            )
         self._calibration_start_pv_obj.put(1, wait=False)
 
     @property
-    def calibration_status(self):
+    def calibration_status_pv_obj(self) -> PV:
         if not self._calibration_status_pv_obj:
-            self._calibration_status_pv_obj = PV(
-                self.calibration_status_pv, connection_timeout=10
+            self._calibration_status_pv_obj = shared_pv(
+                self.calibration_status_pv, connection_timeout=10, owner=self
             )
-        return self._calibration_status_pv_obj.get(timeout=10)
+        return self._calibration_status_pv_obj
+
+    @property
+    def calibration_status(self):
+        return self.calibration_status_pv_obj.get(timeout=10)
 
     @property
     def calibration_running(self) -> bool:
@@ -415,7 +443,9 @@ class SSA(linac_utils.SCLinacObject):
     @property
     def cal_result_status_pv_obj(self) -> PV:
         if not self._cal_result_status_pv_obj:
-            self._cal_result_status_pv_obj = PV(self.cal_result_status_pv)
+            self._cal_result_status_pv_obj = shared_pv(
+                self.cal_result_status_pv, owner=self
+            )
         return self._cal_result_status_pv_obj
 
     @property
@@ -452,17 +482,19 @@ class SSA(linac_utils.SCLinacObject):
         self.start_calibration()
         time.sleep(2)
 
-        while self.calibration_running:
-            self.cavity.logger.debug(
-                "Waiting for SSA calibration to complete",
-                extra={
-                    "extra_data": {
-                        "calibration_status": self.calibration_status,
-                        "ssa": str(self),
-                    }
-                },
-            )
-            time.sleep(1)
+        self.cavity.logger.debug(
+            "Waiting for SSA calibration to complete",
+            extra={
+                "extra_data": {
+                    "calibration_status": self.calibration_status,
+                    "ssa": str(self),
+                }
+            },
+        )
+        wait_until(
+            self.calibration_status_pv_obj,
+            lambda status: status != linac_utils.SSA_CALIBRATION_RUNNING_VALUE,
+        )
         time.sleep(2)
 
         if self.calibration_crashed:
@@ -554,13 +586,17 @@ class SSA(linac_utils.SCLinacObject):
     def current_slope(self):
         """Currently active SSA slope (SLOPE PV), i.e. the value in use by the cavity."""
         if not self._current_slope_pv_obj:
-            self._current_slope_pv_obj = PV(self.current_slope_pv)
+            self._current_slope_pv_obj = shared_pv(
+                self.current_slope_pv, owner=self
+            )
         return self._current_slope_pv_obj.get()
 
     @property
     def measured_slope(self):
         if not self._measured_slope_pv_obj:
-            self._measured_slope_pv_obj = PV(self.measured_slope_pv)
+            self._measured_slope_pv_obj = shared_pv(
+                self.measured_slope_pv, owner=self
+            )
         return self._measured_slope_pv_obj.get()
 
     @property
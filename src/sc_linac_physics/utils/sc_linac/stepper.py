@@ -1,10 +1,14 @@
-import time
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
 from numpy import sign
 
-from sc_linac_physics.utils.epics import PV
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVWaitTimeoutError,
+    shared_pv,
+    wait_until,
+)
 from sc_linac_physics.utils.sc_linac import linac_utils
 
 if TYPE_CHECKING:
@@ -89,7 +93,9 @@ class StepperTuner(linac_utils.SCLinacObject):
     @property
     def hz_per_microstep_pv_obj(self) -> PV:
         if not self._hz_per_microstep_pv_obj:
-            self._hz_per_microstep_pv_obj = PV(self.hz_per_microstep_pv)
+            self._hz_per_microstep_pv_obj = shared_pv(
+                self.hz_per_microstep_pv, owner=self
+            )
         return self._hz_per_microstep_pv_obj
 
     @property
@@ -99,7 +105,9 @@ class StepperTuner(linac_utils.SCLinacObject):
     @property
     def hz_per_step_calc_pv_obj(self) -> PV:
         if not self._hz_per_step_calc_pv_obj:
-            self._hz_per_step_calc_pv_obj = PV(self.hz_per_step_calc_pv)
+            self._hz_per_step_calc_pv_obj = shared_pv(
+                self.hz_per_step_calc_pv, owner=self
+            )
         return self._hz_per_step_calc_pv_obj
 
     def set_hz_per_microstep(self, hz_per_microstep: float) -> None:
@@ -117,13 +125,17 @@ class StepperTuner(linac_utils.SCLinacObject):
     @property
     def step_signed_pv_obj(self) -> PV:
         if not self._step_signed_pv_obj:
-            self._step_signed_pv_obj = PV(self.step_signed_pv)
+            self._step_signed_pv_obj = shared_pv(
+                self.step_signed_pv, owner=self
+            )
         return self._step_signed_pv_obj
 
     @property
     def steps_cold_landing_pv_obj(self) -> PV:
         if not self._steps_cold_landing_pv_obj:
-            self._steps_cold_landing_pv_obj = PV(self.steps_cold_landing_pv)
+            self._steps_cold_landing_pv_obj = shared_pv(
+                self.steps_cold_landing_pv, owner=self
+            )
         return self._steps_cold_landing_pv_obj
 
     def check_abort(self):
@@ -142,23 +154,23 @@ class StepperTuner(linac_utils.SCLinacObject):
     def abort(self):
         self.cavity.logger.info("Aborting stepper movement")
         if not self._abort_pv_obj:
-            self._abort_pv_obj = PV(self.abort_pv)
+            self._abort_pv_obj = shared_pv(self.abort_pv, owner=self)
         self._abort_pv_obj.put(1)
 
     def move_positive(self):
         if not self._move_pos_pv_obj:
-            self._move_pos_pv_obj = PV(self.move_pos_pv)
+            self._move_pos_pv_obj = shared_pv(self.move_pos_pv, owner=self)
         self._move_pos_pv_obj.put(1, wait=False)
 
     def move_negative(self):
         if not self._move_neg_pv_obj:
-            self._move_neg_pv_obj = PV(self.move_neg_pv)
+            self._move_neg_pv_obj = shared_pv(self.move_neg_pv, owner=self)
         self._move_neg_pv_obj.put(1, wait=False)
 
     @property
     def step_des_pv_obj(self):
         if not self._step_des_pv_obj:
-            self._step_des_pv_obj = PV(self.step_des_pv)
+            self._step_des_pv_obj = shared_pv(self.step_des_pv, owner=self)
         return self._step_des_pv_obj
 
     @property
@@ -170,27 +182,39 @@ class StepperTuner(linac_utils.SCLinacObject):
         self.step_des_pv_obj.put(value)
 
     @property
-    def motor_moving(self) -> bool:
+    def motor_moving_pv_obj(self) -> PV:
         if not self._motor_moving_pv_obj:
-            self._motor_moving_pv_obj = PV(self.motor_moving_pv)
-        return self._motor_moving_pv_obj.get() == 1
+            self._motor_moving_pv_obj = shared_pv(
+                self.motor_moving_pv, owner=self
+            )
+        return self._motor_moving_pv_obj
+
+    @property
+    def motor_moving(self) -> bool:
+        return self.motor_moving_pv_obj.get() == 1
 
     def reset_signed_steps(self):
         self.cavity.logger.debug("Resetting stepper signed steps counter")
         if not self._reset_signed_pv_obj:
-            self._reset_signed_pv_obj = PV(self.reset_signed_pv)
+            self._reset_signed_pv_obj = shared_pv(
+                self.reset_signed_pv, owner=self
+            )
         self._reset_signed_pv_obj.put(0)
 
     @property
     def limit_switch_a_pv_obj(self):
         if not self._limit_switch_a_pv_obj:
-            self._limit_switch_a_pv_obj = PV(self.limit_switch_a_pv)
+            self._limit_switch_a_pv_obj = shared_pv(
+                self.limit_switch_a_pv, owner=self
+            )
         return self._limit_switch_a_pv_obj
 
     @property
     def limit_switch_b_pv_obj(self):
         if not self._limit_switch_b_pv_obj:
-            self._limit_switch_b_pv_obj = PV(self.limit_switch_b_pv)
+            self._limit_switch_b_pv_obj = shared_pv(
+                self.limit_switch_b_pv, owner=self
+            )
         return self._limit_switch_b_pv_obj
 
     @property
@@ -205,7 +229,7 @@ class StepperTuner(linac_utils.SCLinacObject):
     @property
     def max_steps_pv_obj(self) -> PV:
         if not self._max_steps_pv_obj:
-            self._max_steps_pv_obj = PV(self.max_steps_pv)
+            self._max_steps_pv_obj = shared_pv(self.max_steps_pv, owner=self)
         return self._max_steps_pv_obj
 
     @property
@@ -219,7 +243,7 @@ class StepperTuner(linac_utils.SCLinacObject):
     @property
     def speed_pv_obj(self):
         if not self._speed_pv_obj:
-            self._speed_pv_obj = PV(self.speed_pv)
+            self._speed_pv_obj = shared_pv(self.speed_pv, owner=self)
         return self._speed_pv_obj
 
     @property
@@ -381,11 +405,21 @@ class StepperTuner(linac_utils.SCLinacObject):
         else:
             self.move_negative()
 
-        self.cavity.logger.debug("Waiting 5s for motor to start moving")
-        time.sleep(5)
+        self.cavity.logger.debug("Waiting up to 5s for motor to start moving")
+        try:
+            wait_until(
+                self.motor_moving_pv_obj,
+                lambda moving: moving == 1,
+                timeout=5,
+                abort_check=self.check_abort,
+            )
+        except PVWaitTimeoutError:
+            # Short moves can finish before we see the motor moving
+            self.cavity.logger.debug("Motor not seen moving after 5s")
 
         move_start_time = datetime.now()
-        while self.motor_moving:
+
+        def check_move():
             self.check_abort()
             if check_detune:
                 self.cavity.check_detune()
@@ -401,7 +435,13 @@ class StepperTuner(linac_utils.SCLinacObject):
                     }
                 },
             )
-            time.sleep(5)
+
+        wait_until(
+            self.motor_moving_pv_obj,
+            lambda moving: moving != 1,
+            abort_check=check_move,
+            poll_interval=5,
+        )
 
         total_move_time = (datetime.now() - move_start_time).total_seconds()
         self.cavity.logger.info(
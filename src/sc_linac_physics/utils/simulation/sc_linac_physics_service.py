@@ -76,6 +76,22 @@ HEARTBEAT_CHANNELS = [
     "SC_CAV_FAULT_HEARTBEAT",
 ]
 
+# Cavity fault runner telemetry (see cavity_display/backend/telemetry.py)
+FAULT_TELEMETRY_FLOAT_CHANNELS = [
+    "SC_CAV_FAULT_CYCLE_P50",
+    "SC_CAV_FAULT_CYCLE_P90",
+    "SC_CAV_FAULT_CYCLE_P99",
+    "SC_CAV_FAULT_CAV_LAT_P50",
+    "SC_CAV_FAULT_CAV_LAT_P99",
+]
+FAULT_TELEMETRY_INTEGER_CHANNELS = [
+    "SC_CAV_FAULT_INDEX_FALLBACKS",
+    "SC_CAV_FAULT_SEQ_FALLBACKS",
+    "SC_CAV_FAULT_PUT_FAILURES",
+    "SC_CAV_FAULT_DISCONN_PVS",
+    "SC_CAV_FAULT_STRAGGLERS",
+]
+
 ALARM_CHANNELS = [
     "SC_CAV_FAULT",
     "SC_SEL_PHAS_OPT",
@@ -163,6 +179,12 @@ class SCLinacPhysicsService(Service):
         for channel in HEARTBEAT_CHANNELS:
             self[f"PHYS:SYS0:1:{channel}"] = ChannelInteger(value=0)
 
+        # Fault runner telemetry channels
+        for channel in FAULT_TELEMETRY_FLOAT_CHANNELS:
+            self[f"PHYS:SYS0:1:{channel}"] = ChannelFloat(value=0.0)
+        for channel in FAULT_TELEMETRY_INTEGER_CHANNELS:
+            self[f"PHYS:SYS0:1:{channel}"] = ChannelInteger(value=0)
+
         # Alarm channels
         for channel in ALARM_CHANNELS:
             self[f"ALRM:SYS0:{channel}:ALHBERR"] = ChannelEnum(
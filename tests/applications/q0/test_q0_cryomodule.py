@@ -1734,6 +1734,15 @@ class TestQ0CryomoduleFillMethods:
             pass  # The call happens but our mock doesn't track it
 
 
+def _immediate_wait_until(
+    pv, predicate, timeout=None, abort_check=None, poll_interval=None
+):
+    """Stand-in for wait_until that re-checks without waiting"""
+    while not predicate(pv.get()):
+        if abort_check is not None:
+            abort_check()
+
+
 class TestQ0CryomoduleWaitForLLDrop:
     """Tests for wait_for_ll_drop method - FIXED"""
 
@@ -1760,14 +1769,16 @@ class TestQ0CryomoduleWaitForLLDrop:
 
         with (
             patch(
-                "sc_linac_physics.applications.q0.q0_cryomodule.sleep"
-            ) as mock_sleep,
+                "sc_linac_physics.applications.q0.q0_cryomodule.wait_until",
+                side_effect=_immediate_wait_until,
+            ) as mock_wait,
             patch("builtins.print"),
         ):
             Q0Cryomodule.wait_for_ll_drop(fast_q0_cryo, target_ll_diff)
 
-            # Should have waited (slept) while level dropped
-            assert mock_sleep.call_count >= 1
+            # Should have waited on the level PV while level dropped
+            mock_wait.assert_called_once()
+            assert mock_wait.call_args.args[0] is fast_q0_cryo.ds_level_pv_obj
 
     def test_wait_for_ll_drop_immediate_success(self, fast_q0_cryo):
         """Test wait_for_ll_drop when level has already dropped enough"""
@@ -1791,14 +1802,15 @@ class TestQ0CryomoduleWaitForLLDrop:
 
         with (
             patch(
-                "sc_linac_physics.applications.q0.q0_cryomodule.sleep"
-            ) as mock_sleep,
+                "sc_linac_physics.applications.q0.q0_cryomodule.wait_until",
+                side_effect=_immediate_wait_until,
+            ) as mock_wait,
             patch("builtins.print"),
         ):
             Q0Cryomodule.wait_for_ll_drop(fast_q0_cryo, target_ll_diff)
 
-            # The method may still sleep once for checking, so allow 0 or 1
-            assert mock_sleep.call_count <= 1
+            # The first check already passes
+            mock_wait.assert_called_once()
 
     def test_wait_for_ll_drop_gradual_progression(self, fast_q0_cryo):
         """Test wait_for_ll_drop with gradual level decrease"""
@@ -1824,14 +1836,15 @@ class TestQ0CryomoduleWaitForLLDrop:
 
         with (
             patch(
-                "sc_linac_physics.applications.q0.q0_cryomodule.sleep"
-            ) as mock_sleep,
+                "sc_linac_physics.applications.q0.q0_cryomodule.wait_until",
+                side_effect=_immediate_wait_until,
+            ),
             patch("builtins.print"),
         ):
             Q0Cryomodule.wait_for_ll_drop(fast_q0_cryo, target_ll_diff)
 
-            # Should have slept at least once, but exact count depends on implementation
-            assert mock_sleep.call_count >= 1
+            # Every level was checked before the drop was reached
+            assert level_index == len(levels)
 
     def test_wait_for_ll_drop_with_abort_check(self, fast_q0_cryo):
         """Test that wait_for_ll_drop calls check_abort"""
@@ -1865,7 +1878,10 @@ class TestQ0CryomoduleWaitForLLDrop:
         )
 
         with (
-            patch("sc_linac_physics.applications.q0.q0_cryomodule.sleep"),
+            patch(
+                "sc_linac_physics.applications.q0.q0_cryomodule.wait_until",
+                side_effect=_immediate_wait_until,
+            ),
             patch("builtins.print"),
         ):
             Q0Cryomodule.wait_for_ll_drop(fast_q0_cryo, target_ll_diff)
@@ -1901,7 +1917,10 @@ class TestQ0CryomoduleWaitForLLDrop:
         )
 
         with (
-            patch("sc_linac_physics.applications.q0.q0_cryomodule.sleep"),
+            patch(
+                "sc_linac_physics.applications.q0.q0_cryomodule.wait_until",
+                side_effect=_immediate_wait_until,
+            ),
             patch("builtins.print"),
         ):
             # Should raise abort exception
@@ -1929,7 +1948,10 @@ class TestQ0CryomoduleWaitForLLDrop:
         )
 
         with (
-            patch("sc_linac_physics.applications.q0.q0_cryomodule.sleep"),
+            patch(
+                "sc_linac_physics.applications.q0.q0_cryomodule.wait_until",
+                side_effect=_immediate_wait_until,
+            ),
             patch("builtins.print") as mock_print,
         ):
             Q0Cryomodule.wait_for_ll_drop(fast_q0_cryo, target_ll_diff)
@@ -105,9 +105,9 @@ def qapp():
     app = QApplication.instance()
     if app is None:
         app = QApplication([])
+    # Shared by the whole session; quitting it stops later tests'
+    # queued signals from being delivered
     yield app
-    if app:
-        app.quit()
 
 
 # Create a fixture that handles all the mocking
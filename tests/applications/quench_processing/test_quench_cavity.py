@@ -17,6 +17,7 @@ from sc_linac_physics.applications.quench_processing.quench_utils import (
     DECARAD_SETTLE_TIME,
     RADIATION_LIMIT,
 )
+from sc_linac_physics.utils.epics import PVInvalidError, PVWaitTimeoutError
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     QuenchError,
     RF_MODE_SELA,
@@ -229,14 +230,31 @@ class TestWaitMethods:
             end_time,
         ]
         cavity.reset_interlocks = Mock()
+        latch_pv = Mock(severity=0)
+        latch_pv.get.return_value = 1
+        cavity._quench_latch_pv_obj = latch_pv
 
-        with patch.object(
-            type(cavity), "is_quenched", PropertyMock(return_value=True)
-        ):
-            elapsed = cavity.wait_for_quench(time_to_wait=60)
+        elapsed = cavity.wait_for_quench(time_to_wait=60)
 
         assert elapsed == 5.0
         cavity.reset_interlocks.assert_called_once()
+        # The value wait_until read decides; no second read
+        latch_pv.get.assert_called_once()
+
+    @patch(
+        "sc_linac_physics.applications.quench_processing.quench_cavity.time.sleep"
+    )
+    def test_wait_for_quench_invalid_latch(self, mock_sleep, cavity):
+        """Test wait_for_quench raises on an invalid latch read."""
+        cavity.reset_interlocks = Mock()
+        latch_pv = Mock(severity=EPICS_INVALID_VAL)
+        latch_pv.get.return_value = 0
+        cavity._quench_latch_pv_obj = latch_pv
+
+        with pytest.raises(PVInvalidError):
+            cavity.wait_for_quench(time_to_wait=60)
+
+        latch_pv.get.assert_called_once()
 
     @patch(
         "sc_linac_physics.applications.quench_processing.quench_cavity.time.sleep"
@@ -247,21 +265,25 @@ class TestWaitMethods:
     def test_wait_for_quench_timeout(self, mock_datetime, mock_sleep, cavity):
         """Test wait_for_quench when timeout occurs without quench."""
         start_time = datetime.datetime(2024, 1, 1, 12, 0, 0)
+        end_time = start_time + datetime.timedelta(seconds=60)
 
-        # Simulate time passing
-        times = [start_time]
-        for i in range(1, 62):
-            times.append(start_time + datetime.timedelta(seconds=i))
-
-        mock_datetime.datetime.now.side_effect = times
+        mock_datetime.datetime.now.side_effect = [start_time, end_time]
         cavity.reset_interlocks = Mock()
 
-        with patch.object(
-            type(cavity), "is_quenched", PropertyMock(return_value=False)
+        with (
+            patch.object(
+                type(cavity), "is_quenched", PropertyMock(return_value=False)
+            ),
+            patch(
+                "sc_linac_physics.applications.quench_processing.quench_cavity.wait_until",
+                side_effect=PVWaitTimeoutError("timeout"),
+            ) as mock_wait,
         ):
             elapsed = cavity.wait_for_quench(time_to_wait=60)
 
         assert elapsed >= 60
+        assert mock_wait.call_args.kwargs["timeout"] == 60
+        assert mock_wait.call_args.kwargs["abort_check"] == cavity.check_abort
 
     # Fix test_wait_for_decarads_when_quenched (around line 268):
     @patch(
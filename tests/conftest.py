@@ -179,6 +179,8 @@ def _setup_fake_epics():
     fake_epics_ca = MagicMock()
     fake_epics_ca.CASeverityException = FakeCASeverityException
     fake_epics_ca.withInitialContext = fake_with_initial_context
+    fake_epics_ca.get = fake_ca_get
+    fake_epics_ca.get_complete = fake_ca_get_complete
 
     fake_epics.ca = fake_epics_ca
 
@@ -228,6 +230,15 @@ class FakeEPICS_PV:
     def connected(self):
         return self._connected
 
+    @property
+    def chid(self):
+        # Stands in for the channel ID passed to epics.ca functions
+        return self
+
+    @property
+    def ftype(self):
+        return None
+
     def wait_for_connection(self, timeout=None):
         return self._connected
 
@@ -259,6 +270,9 @@ class FakeEPICS_PV:
             except Exception:
                 pass
 
+        if callback is not None:
+            callback(pvname=self.pvname, data=callback_data)
+
         return self._put_return
 
     def add_callback(self, callback, index=None, **kwargs):
@@ -296,6 +310,16 @@ class FakeCASeverityException(Exception):
     pass
 
 
+def fake_ca_get(chid, ftype=None, count=None, wait=True, **kwargs):
+    """Fake epics.ca.get; a non-waiting get returns nothing."""
+    return FakeEPICS_PV.get(chid) if wait else None
+
+
+def fake_ca_get_complete(chid, ftype=None, count=None, timeout=None, **kw):
+    """Fake epics.ca.get_complete, reading through FakeEPICS_PV.get."""
+    return FakeEPICS_PV.get(chid)
+
+
 def fake_with_initial_context(func):
     """Fake decorator for withInitialContext."""
     return func
@@ -314,6 +338,16 @@ def suppress_logging():
     logging.disable(logging.NOTSET)
 
 
+@pytest.fixture(autouse=True)
+def clear_pv_registry():
+    """Keep shared PVs and circuit breakers from leaking between tests."""
+    yield
+    from sc_linac_physics.utils.epics import CIRCUIT_BREAKERS, PV_REGISTRY
+
+    PV_REGISTRY.clear()
+    CIRCUIT_BREAKERS.clear()
+
+
 class MockHandler:
     """A mock handler that mimics logging.Handler without creating files."""
 
@@ -0,0 +1,268 @@
+import dataclasses
+import random
+from datetime import datetime
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from sc_linac_physics.displays.cavity_display.backend import archive_cache
+from sc_linac_physics.displays.cavity_display.backend.archive_cache import (
+    ArchiveCache,
+)
+
+BASE = 1_700_000_000  # multiple of CHUNK
+CHUNK = 100
+NOW = BASE + 1_000
+
+
+@dataclasses.dataclass
+class FakeArchiverValue:
+    secs: int = None
+    val: Any = None
+    nanos: int = None
+    severity: Optional[int] = None
+    status: Optional[int] = None
+
+
+class FakeArchiveDataHandler:
+    def __init__(self, value_list: List[FakeArchiverValue] = None):
+        self.value_list = value_list or []
+
+    @property
+    def values(self):
+        return [value.val for value in self.value_list]
+
+    @property
+    def timestamps(self):
+        return [value.secs + value.nanos / 1e9 for value in self.value_list]
+
+
+class FakeArchiver:
+    """Archiver returning samples in [start, end] plus the one before."""
+
+    def __init__(self, samples):
+        # pv -> [(secs, nanos, val, severity, status)], in time order
+        self.samples = samples
+        self.calls = []
+
+    def __call__(self, pv_list, start_time, end_time):
+        self.calls.append((tuple(pv_list), start_time, end_time))
+        start, end = start_time.timestamp(), end_time.timestamp()
+        result = {}
+        for pv in pv_list:
+            rows = self.samples.get(pv, [])
+            times = [secs + nanos / 1e9 for secs, nanos, *_ in rows]
+            lo = sum(1 for t in times if t < start)
+            hi = sum(1 for t in times if t <= end)
+            result[pv] = FakeArchiveDataHandler(
+                [
+                    FakeArchiverValue(secs, val, nanos, severity, status)
+                    for secs, nanos, val, severity, status in rows[
+                        max(lo - 1, 0) : hi
+                    ]
+                ]
+            )
+        return result
+
+
+def at(secs: float) -> datetime:
+    return datetime.fromtimestamp(BASE + secs)
+
+
+def make_samples(count=200, seed=0):
+    rng = random.Random(seed)
+    times = sorted(rng.uniform(-50, 1_000) for _ in range(count))
+    status = []
+    severity = []
+    for t in times:
+        secs = BASE + int(t)
+        nanos = int((t % 1) * 1e9)
+        status.append((secs, nanos, rng.choice(["SSA", "QCH", "3"]), 0, 0))
+        severity.append((secs, nanos, rng.choice([0, 1, 2, 3]), 0, None))
+    return {"CAV:CUDSTATUS": status, "CAV:CUDSEVR": severity}
+
+
+def rows(handler):
+    return [
+        (v.secs, v.nanos, v.val, v.severity, v.status)
+        for v in handler.value_list
+    ]
+
+
+@pytest.fixture(autouse=True)
+def fake_archiver_types():
+    with (
+        patch.object(archive_cache, "ArchiverValue", FakeArchiverValue),
+        patch.object(
+            archive_cache, "ArchiveDataHandler", FakeArchiveDataHandler
+        ),
+        patch.object(archive_cache, "time", return_value=NOW),
+    ):
+        yield
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArchiveCache(tmp_path, chunk_sec=CHUNK, settle_sec=50)
+
+
+@pytest.fixture
+def archiver():
+    return FakeArchiver(make_samples())
+
+
+PVS = ["CAV:CUDSTATUS", "CAV:CUDSEVR"]
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [(0, 900), (130.5, 420.25), (-30, 40), (250, 990), (900, 960), (5, 5)],
+)
+def test_matches_direct_archiver_query(cache, archiver, start, end):
+    expected = archiver(PVS, at(start), at(end))
+
+    cold = cache.get_values_over_time_range(
+        PVS, at(start), at(end), fetch=archiver
+    )
+    warm = cache.get_values_over_time_range(
+        PVS, at(start), at(end), fetch=archiver
+    )
+
+    for pv in PVS:
+        assert rows(cold[pv]) == rows(expected[pv])
+        assert rows(warm[pv]) == rows(expected[pv])
+
+
+def test_randomized_ranges_match_direct_query(cache, archiver):
+    rng = random.Random(1)
+    for _ in range(50):
+        start = rng.uniform(-20, 1_000)
+        end = start + rng.uniform(0, 400)
+        expected = archiver(PVS, at(start), at(end))
+        result = cache.get_values_over_time_range(
+            PVS, at(start), at(end), fetch=archiver
+        )
+        for pv in PVS:
+            assert rows(result[pv]) == rows(expected[pv])
+
+
+def test_settled_range_served_from_disk(cache, archiver):
+    cache.get_values_over_time_range(PVS, at(0), at(500), fetch=archiver)
+    archiver.calls.clear()
+
+    cache.get_values_over_time_range(PVS, at(120), at(480), fetch=archiver)
+
+    assert archiver.calls == []
+    assert cache.hits > 0
+
+
+def test_only_missing_chunks_fetched(cache, archiver):
+    cache.get_values_over_time_range(PVS, at(300), at(550), fetch=archiver)
+    archiver.calls.clear()
+
+    cache.get_values_over_time_range(PVS, at(100), at(750), fetch=archiver)
+
+    # Both PVs share one request per missing run
+    assert archiver.calls == [
+        (tuple(PVS), at(100), at(300)),
+        (tuple(PVS), at(600), at(800)),
+    ]
+
+
+def test_live_tail_always_fetched(cache, archiver):
+    # Chunks ending after NOW - settle (BASE + 950) are never cached
+    cache.get_values_over_time_range(PVS, at(800), at(990), fetch=archiver)
+    archiver.calls.clear()
+
+    cache.get_values_over_time_range(PVS, at(800), at(990), fetch=archiver)
+
+    assert archiver.calls == [(tuple(PVS), at(900), at(990))]
+
+
+def test_cache_persists_across_instances(tmp_path, archiver):
+    first = ArchiveCache(tmp_path, chunk_sec=CHUNK, settle_sec=50)
+    first.get_values_over_time_range(PVS, at(0), at(300), fetch=archiver)
+    archiver.calls.clear()
+
+    second = ArchiveCache(tmp_path, chunk_sec=CHUNK, settle_sec=50)
+    second.get_values_over_time_range(PVS, at(0), at(300), fetch=archiver)
+
+    assert archiver.calls == []
+    assert second.size_bytes == first.size_bytes > 0
+
+
+def test_lru_eviction_by_size(tmp_path, archiver):
+    probe = ArchiveCache(tmp_path / "probe", chunk_sec=CHUNK, settle_sec=50)
+    probe.get_values_over_time_range(PVS[:1], at(0), at(99), fetch=archiver)
+    chunk_bytes = probe.size_bytes
+
+    cache = ArchiveCache(
+        tmp_path / "lru",
+        max_bytes=int(chunk_bytes * 3.5),
+        chunk_sec=CHUNK,
+        settle_sec=50,
+    )
+    for day in range(4):
+        cache.get_values_over_time_range(
+            PVS[:1], at(day * CHUNK), at(day * CHUNK + 99), fetch=archiver
+        )
+    # Use chunk 0 again so chunk 1 is the least recently used
+    cache.get_values_over_time_range(PVS[:1], at(0), at(99), fetch=archiver)
+    cache.get_values_over_time_range(PVS[:1], at(400), at(499), fetch=archiver)
+
+    assert cache.size_bytes <= cache.max_bytes
+    archiver.calls.clear()
+    cache.get_values_over_time_range(PVS[:1], at(0), at(99), fetch=archiver)
+    assert archiver.calls == []
+    cache.get_values_over_time_range(PVS[:1], at(100), at(199), fetch=archiver)
+    assert archiver.calls == [((PVS[0],), at(100), at(200))]
+
+
+def test_unreadable_file_refetched(cache, archiver):
+    cache.get_values_over_time_range(PVS, at(0), at(99), fetch=archiver)
+    for path in cache.cache_dir.glob("*/*.npz"):
+        path.write_bytes(b"not an npz file")
+    archiver.calls.clear()
+
+    result = cache.get_values_over_time_range(
+        PVS, at(0), at(99), fetch=archiver
+    )
+
+    assert len(archiver.calls) == 1
+    expected = archiver(PVS, at(0), at(99))
+    assert rows(result[PVS[0]]) == rows(expected[PVS[0]])
+
+
+def test_non_columnar_values_not_written(cache):
+    archiver = FakeArchiver(
+        {"WF": [(BASE + 10, 0, [1.0, 2.0], 0, 0), (BASE + 20, 0, "x", 0, 0)]}
+    )
+
+    result = cache.get_values_over_time_range(
+        ["WF"], at(0), at(99), fetch=archiver
+    )
+
+    assert [v.val for v in result["WF"].value_list] == [[1.0, 2.0], "x"]
+    assert cache.size_bytes == 0
+
+
+def test_cached_values_disabled(monkeypatch, archiver):
+    monkeypatch.setattr(archive_cache, "_default_cache", None)
+    monkeypatch.setattr(archive_cache, "_default_cache_set", False)
+    monkeypatch.setenv(archive_cache.ARCHIVE_CACHE_ENV, "")
+
+    assert archive_cache.default_archive_cache() is None
+    result = archive_cache.cached_values_over_time_range(
+        PVS, at(0), at(99), fetch=archiver
+    )
+    assert len(archiver.calls) == 1
+    assert rows(result[PVS[0]]) == rows(archiver(PVS, at(0), at(99))[PVS[0]])
+
+
+def test_default_cache_location_from_env(monkeypatch, tmp_path):
+    monkeypatch.setattr(archive_cache, "_default_cache", None)
+    monkeypatch.setattr(archive_cache, "_default_cache_set", False)
+    monkeypatch.setenv(archive_cache.ARCHIVE_CACHE_ENV, str(tmp_path))
+
+    assert archive_cache.default_archive_cache().cache_dir == tmp_path
@@ -0,0 +1,165 @@
+import dataclasses
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from sc_linac_physics.displays.cavity_display.backend import archiver_client
+from sc_linac_physics.displays.cavity_display.backend.archiver_client import (
+    BulkArchiveClient,
+)
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+END = datetime(2026, 1, 2, 12, 0, 0)
+
+
+@dataclasses.dataclass
+class FakeArchiverValue:
+    secs: int = None
+    val: Any = None
+    nanos: int = None
+    severity: Optional[int] = None
+    status: Optional[int] = None
+
+
+class FakeArchiveDataHandler:
+    def __init__(self, value_list: List[FakeArchiverValue] = None):
+        self.value_list = value_list or []
+
+
+class FakeArchiverHandler(BaseHTTPRequestHandler):
+    """getDataForPVs.json returning two samples per known PV."""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        self.server.queries.append((url.path, query))
+        if url.path.endswith("/fail/getDataForPVs.json"):
+            self.send_error(500)
+            return
+
+        body = [
+            {
+                "meta": {"name": pv},
+                "data": [
+                    {"secs": 100, "nanos": 5, "val": pv, "severity": 0},
+                    {"secs": 200, "nanos": 0, "val": 3, "status": 1},
+                ],
+            }
+            for pv in query["pv"]
+            if not pv.startswith("UNKNOWN")
+        ]
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_archiver_types():
+    with (
+        patch.object(archiver_client, "ArchiverValue", FakeArchiverValue),
+        patch.object(
+            archiver_client, "ArchiveDataHandler", FakeArchiveDataHandler
+        ),
+    ):
+        yield
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeArchiverHandler)
+    httpd.queries = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    host, port = server.server_address
+    client = BulkArchiveClient(
+        f"http://{host}:{port}/retrieval/data/", chunk_size=3
+    )
+    yield client
+    client.close()
+
+
+def test_chunks_drop_duplicates():
+    client = BulkArchiveClient(chunk_size=2)
+
+    assert client.chunks(["A", "B", "A", "C"]) == [["A", "B"], ["C"]]
+    assert client.chunks([]) == []
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError):
+        BulkArchiveClient(chunk_size=0)
+
+
+def test_fetch_chunk_parses_samples(client, server):
+    result = client.fetch_chunk(["A", "B"], START, END)
+
+    path, query = server.queries[0]
+    assert path == "/retrieval/data/getDataForPVs.json"
+    assert query["pv"] == ["A", "B"]
+    assert datetime.fromisoformat(query["from"][0]) == START.astimezone()
+    assert datetime.fromisoformat(query["to"][0]) == END.astimezone()
+
+    first, second = result["A"].value_list
+    assert first == FakeArchiverValue(100, "A", 5, 0, None)
+    assert second == FakeArchiverValue(200, 3, 0, None, 1)
+
+
+def test_missing_pv_gets_empty_handler(client):
+    result = client.fetch_chunk(["A", "UNKNOWN:PV"], START, END)
+
+    assert result["UNKNOWN:PV"].value_list == []
+    assert len(result["A"].value_list) == 2
+
+
+def test_one_request_per_chunk(client, server):
+    pvs = [f"PV{i}" for i in range(7)]
+
+    result = client.get_values_over_time_range(pvs, START, END)
+
+    assert sorted(result) == sorted(pvs)
+    assert client.request_count == len(server.queries) == 3
+    assert sorted(len(query["pv"]) for _, query in server.queries) == [1, 3, 3]
+
+
+def test_iter_streams_whole_chunks(client):
+    pvs = [f"PV{i}" for i in range(7)]
+    streamed = [
+        pv for pv, _ in client.iter_values_over_time_range(pvs, START, END)
+    ]
+
+    assert sorted(streamed) == sorted(pvs)
+    chunks = client.chunks(pvs)
+    # Each chunk's PVs arrive together, in request order
+    position = 0
+    while position < len(streamed):
+        chunk = next(c for c in chunks if c[0] == streamed[position])
+        assert streamed[position : position + len(chunk)] == chunk
+        position += len(chunk)
+
+
+def test_http_error_raises(server):
+    host, port = server.server_address
+    client = BulkArchiveClient(f"http://{host}:{port}/fail")
+
+    with pytest.raises(requests.HTTPError):
+        client.get_values_over_time_range(["A"], START, END)
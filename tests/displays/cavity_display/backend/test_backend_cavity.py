@@ -1,6 +1,6 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from datetime import timedelta, datetime
-from random import randint, choice
+from random import Random, randint, choice
 from typing import DefaultDict
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -14,8 +14,9 @@ from sc_linac_physics.displays.cavity_display.backend.backend_cavity import (
 from sc_linac_physics.displays.cavity_display.backend.fault import (
     FaultCounter,
     Fault,
+    SeverityLevel,
 )
-from tests.displays.cavity_display.test_utils.utils import mock_parse
+from tests.displays.cavity_display.test_utils.utils import mock_fault_specs
 
 
 @pytest.fixture
@@ -26,8 +27,8 @@ def cavity():
 
     rack.cryomodule.linac.machine.lazy_fault_pvs = True
     with patch(
-        "sc_linac_physics.displays.cavity_display.utils.utils.parse_csv",
-        mock_parse,
+        "sc_linac_physics.displays.cavity_display.utils.utils.fault_specs",
+        mock_fault_specs,
     ):
         cavity = BackendCavity(cavity_num=cav_num, rack_object=rack)
         cavity._status_pv_obj = make_mock_pv()
@@ -155,6 +156,267 @@ def test_run_through_faults_faulted(cavity):
     )
 
 
+def test_run_through_faults_with_values_first_match_wins(cavity):
+    faults = list(cavity.faults.values())
+    values = [
+        fault.ok_value if fault.ok_value is not None else fault.fault_value + 1
+        for fault in faults
+    ]
+    # Fault the last two; the earlier one has priority
+    for index in (-2, -1):
+        fault = faults[index]
+        values[index] = (
+            fault.fault_value if fault.ok_value is None else fault.ok_value + 1
+        )
+
+    cavity.run_through_faults_with_values(values)
+
+    cavity._status_pv_obj.put.assert_called_with(faults[-2].tlc)
+    cavity._severity_pv_obj.put.assert_called_with(faults[-2].severity)
+
+
+def test_run_through_faults_with_values_none_is_invalid(cavity):
+    faults = list(cavity.faults.values())
+    values = [
+        fault.ok_value if fault.ok_value is not None else fault.fault_value + 1
+        for fault in faults
+    ]
+    values[0] = None
+
+    cavity.run_through_faults_with_values(values)
+
+    cavity._status_pv_obj.put.assert_called_with(faults[0].tlc)
+    cavity._severity_pv_obj.put.assert_called_with(3)
+
+
+def test_run_through_faults_with_values_ok(cavity):
+    values = [
+        fault.ok_value if fault.ok_value is not None else fault.fault_value + 1
+        for fault in cavity.faults.values()
+    ]
+
+    cavity.run_through_faults_with_values(values)
+
+    cavity._status_pv_obj.put.assert_called_with(str(cavity.number))
+    cavity._severity_pv_obj.put.assert_called_with(0)
+
+
+def test_report_fault(cavity):
+    fault = list(cavity.faults.values())[0]
+
+    cavity.report_fault(fault)
+
+    cavity._status_pv_obj.put.assert_called_with(fault.tlc)
+    cavity._severity_pv_obj.put.assert_called_with(fault.severity)
+
+
+def test_report_fault_invalid(cavity):
+    fault = list(cavity.faults.values())[0]
+
+    cavity.report_fault(fault, invalid=True)
+
+    cavity._status_pv_obj.put.assert_called_with(fault.tlc)
+    cavity._severity_pv_obj.put.assert_called_with(3)
+
+
+def test_report_fault_ok(cavity):
+    cavity.report_fault(None)
+
+    cavity._status_pv_obj.put.assert_called_with(str(cavity.number))
+    cavity._severity_pv_obj.put.assert_called_with(0)
+
+
+def test_unchanged_status_not_republished(cavity):
+    fault = list(cavity.faults.values())[0]
+
+    cavity.report_fault(fault)
+    cavity.report_fault(fault)
+
+    cavity._status_pv_obj.put.assert_called_once_with(fault.tlc)
+    cavity._severity_pv_obj.put.assert_called_once_with(fault.severity)
+    assert cavity.status_put_count == 3
+    assert cavity.status_skip_count == 3
+
+
+def test_only_changed_status_values_put(cavity):
+    fault = list(cavity.faults.values())[0]
+
+    cavity.report_fault(fault)
+    cavity.report_fault(fault, invalid=True)
+
+    assert cavity._severity_pv_obj.put.call_count == 2
+    cavity._severity_pv_obj.put.assert_called_with(3)
+    cavity._status_pv_obj.put.assert_called_once()
+    cavity._description_pv_obj.put.assert_called_once()
+
+
+def test_status_republished_after_interval(cavity):
+    cavity.status_republish_interval = 60.0
+
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.backend_cavity.time",
+        side_effect=[1000.0, 1030.0, 1061.0],
+    ):
+        for _ in range(3):
+            cavity.report_fault(None)
+
+    assert cavity._status_pv_obj.put.call_count == 2
+    assert cavity.status_put_count == 6
+
+
+def test_zero_republish_interval_always_puts(cavity):
+    cavity.status_republish_interval = 0
+
+    cavity.report_fault(None)
+    cavity.report_fault(None)
+
+    assert cavity._status_pv_obj.put.call_count == 2
+
+
+def test_status_republished_after_put_failure(cavity):
+    cavity._status_pv_obj.put.side_effect = [RuntimeError("put"), None]
+
+    cavity.report_fault(None)
+    cavity.report_fault(None)
+
+    assert cavity._severity_pv_obj.put.call_count == 2
+    assert cavity._status_pv_obj.put.call_count == 2
+
+
+def test_status_republish_due(cavity):
+    cavity.status_republish_interval = 60.0
+    assert cavity.status_republish_due(1000.0)
+
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.backend_cavity.time",
+        return_value=1000.0,
+    ):
+        cavity.report_fault(None)
+
+    assert not cavity.status_republish_due(1030.0)
+    assert cavity.status_republish_due(1060.0)
+
+
+def test_status_republish_never_due_without_interval(cavity):
+    cavity.status_republish_interval = None
+    cavity.report_fault(None)
+
+    assert not cavity.status_republish_due(1e12)
+
+
+def test_status_republish_due_after_put_failure(cavity):
+    cavity.status_republish_interval = None
+    cavity._status_pv_obj.put.side_effect = RuntimeError("put")
+
+    cavity.report_fault(None)
+
+    assert cavity.status_republish_due(0.0)
+
+
+def test_status_put_failures_counted(cavity):
+    cavity._status_pv_obj.put.side_effect = RuntimeError("put")
+
+    cavity.report_fault(None)
+    cavity.report_fault(None)
+
+    assert cavity.status_put_failure_count == 2
+
+
+def test_sequential_fallback_counted(cavity):
+    with (
+        patch(
+            "sc_linac_physics.displays.cavity_display.backend.backend_cavity"
+            ".PVBatch.get_values",
+            side_effect=RuntimeError("batch"),
+        ),
+        patch.object(cavity, "_run_through_faults_sequential") as sequential,
+    ):
+        cavity.run_through_faults()
+
+    sequential.assert_called_once()
+    assert cavity.sequential_fallback_count == 1
+
+
+def test_attach_status_pvs_connected(cavity):
+    pvs = [make_mock_pv(), make_mock_pv(), make_mock_pv()]
+    for pv in pvs:
+        pv.connected = True
+
+    assert cavity.attach_status_pvs(pvs) == 3
+    assert cavity._status_pv_obj is pvs[0]
+    assert cavity._severity_pv_obj is pvs[1]
+    assert cavity._description_pv_obj is pvs[2]
+
+    cavity.report_fault(None)
+    pvs[1].put.assert_called_once()
+
+
+def test_status_puts_wait_for_attached_pvs(cavity):
+    pvs = [make_mock_pv(), make_mock_pv(), make_mock_pv()]
+    pvs[0].connected = True
+    pvs[1].connected = False
+    pvs[2].connected = True
+
+    assert cavity.attach_status_pvs(pvs) == 2
+    cavity.report_fault(None)
+    pvs[0].put.assert_not_called()
+
+    pvs[1].connected = True
+    assert cavity.attach_status_pvs(pvs) == 3
+    cavity.report_fault(None)
+    pvs[1].put.assert_called_once()
+
+
+def test_get_fault_history_reads_through_archive_cache(cavity):
+    statuses = _make_handler([("SSA", datetime(2025, 6, 2, 12))])
+    severities = _make_handler([(2, datetime(2025, 6, 2, 12))])
+    start, end = datetime(2025, 6, 1), datetime(2025, 6, 3)
+
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.backend_cavity"
+        ".cached_values_over_time_range",
+        return_value={
+            cavity.pv_addr("CUDSTATUS"): statuses,
+            cavity.pv_addr("CUDSEVR"): severities,
+        },
+    ) as cached:
+        counts, events = cavity.get_fault_history(start, end)
+
+    assert cached.call_args.args == (
+        [cavity.pv_addr("CUDSTATUS"), cavity.pv_addr("CUDSEVR")],
+        start,
+        end,
+    )
+    assert counts["SSA"].alarm_count == 1
+    assert len(events) == 1
+
+
+def test_get_fault_history_archiver_error(cavity):
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.backend_cavity"
+        ".cached_values_over_time_range",
+        side_effect=ConnectionError("archiver down"),
+    ):
+        counts, events = cavity.get_fault_history(
+            datetime(2025, 6, 1), datetime(2025, 6, 3)
+        )
+
+    assert dict(counts) == {}
+    assert events == []
+
+
+def test_get_fault_counts_raise_on_error(cavity):
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.backend_cavity"
+        ".cached_values_over_time_range",
+        side_effect=ConnectionError("archiver down"),
+    ):
+        with pytest.raises(ConnectionError):
+            cavity.get_fault_counts(
+                datetime(2025, 6, 1), datetime(2025, 6, 3), raise_on_error=True
+            )
+
+
 def _make_handler(samples):
     """Build an ArchiveDataHandler-like mock from (value, timestamp) pairs."""
     handler = MagicMock()
@@ -224,3 +486,79 @@ class TestProcessFaultHistory:
 
         assert counts["SSA"].invalid_count == 1
         assert events[0].severity is None
+
+    def test_vectorized_matches_merge_pass(self, cavity):
+        """Identical counts and events to the per-sample merge pass."""
+        rng = Random(0)
+        base = datetime(2025, 6, 2, 12, 0, 0)
+        # Land on rounding ties (x.xx5) and near-carries (.995+) often
+        fractions = [5_000, 15_000, 995_000, 999_999, 4_999, 5_001]
+        for _ in range(20):
+            severities = _make_handler(
+                _random_samples(rng, base, fractions, [0, 1, 2, 3, None])
+            )
+            statuses = _make_handler(
+                _random_samples(
+                    rng, base, fractions, ["SSA", "QCH", str(cavity.number)]
+                )
+            )
+
+            counts, events = cavity.process_fault_history(statuses, severities)
+            expected_counts, expected_events = _merge_reference(
+                cavity, statuses, severities
+            )
+
+            assert set(counts) == set(expected_counts)
+            for status, counter in expected_counts.items():
+                assert vars(counts[status]) == vars(counter)
+            assert [
+                (event.timestamp, event.status, event.severity)
+                for event in events
+            ] == expected_events
+
+    def test_empty_history(self, cavity):
+        counts, events = cavity.process_fault_history(
+            _make_handler([]), _make_handler([])
+        )
+
+        assert dict(counts) == {}
+        assert len(events) == 0
+
+
+def _random_samples(rng, base, fractions, values):
+    """Chronological (value, timestamp) pairs with awkward microseconds."""
+    samples = []
+    seconds = 0
+    for _ in range(rng.randint(0, 60)):
+        seconds += rng.randint(0, 3)
+        micros = rng.choice(fractions + [rng.randrange(1_000_000)])
+        ts = base + timedelta(seconds=seconds, microseconds=micros)
+        if samples and ts < samples[-1][1]:
+            ts = samples[-1][1]
+        samples.append((rng.choice(values), ts))
+    return samples
+
+
+def _merge_reference(cavity, statuses, severities):
+    """The merge pass process_fault_history used before NumPy."""
+    counts = defaultdict(FaultCounter)
+    events = []
+    severity_timestamps = [
+        cavity._round_to_10ms(ts) for ts in severities.timestamps
+    ]
+    severity_idx = 0
+    current_severity = None
+    for status, status_ts in zip(statuses.values, statuses.timestamps):
+        if status == str(cavity.number):
+            events.append((status_ts, status, SeverityLevel.NO_ALARM))
+            continue
+        ts = cavity._round_to_10ms(status_ts)
+        while (
+            severity_idx < len(severity_timestamps)
+            and ts >= severity_timestamps[severity_idx]
+        ):
+            current_severity = severities.values[severity_idx]
+            severity_idx += 1
+        counts[status].count_severity(current_severity)
+        events.append((status_ts, status, current_severity))
+    return counts, events
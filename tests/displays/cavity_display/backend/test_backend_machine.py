@@ -0,0 +1,148 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sc_linac_physics.displays.cavity_display.backend import backend_machine
+from sc_linac_physics.displays.cavity_display.backend.backend_machine import (
+    BackendMachine,
+)
+
+
+def make_cavity(name, fault_pvs):
+    cavity = MagicMock()
+    cavity.faults = {
+        i: MagicMock(pv=pv_name) for i, pv_name in enumerate(fault_pvs)
+    }
+    cavity.status_pv_names = [f"{name}:STATUS", f"{name}:SEVR", f"{name}:DESC"]
+    cavity.attach_status_pvs.side_effect = lambda pvs: sum(
+        1 for pv in pvs if pv is not None and pv.connected
+    )
+    return cavity
+
+
+def make_pv(name, connected=True):
+    pv = MagicMock()
+    pv.pvname = name
+    pv.connected = connected
+    return pv
+
+
+@pytest.fixture
+def machine():
+    """A lazy machine whose cavities are replaced by mocks."""
+    with patch.object(backend_machine.Machine, "__init__", return_value=None):
+        machine = BackendMachine(lazy_fault_pvs=True)
+    cavities = [
+        make_cavity("CAV1", ["RACK:A", "CAV1:FLT"]),
+        make_cavity("CAV2", ["RACK:A", "CAV2:FLT"]),
+    ]
+    type(machine).all_iterator = property(lambda self: iter(cavities))
+    yield machine, cavities
+    del type(machine).all_iterator
+    machine.stop_straggler_retry()
+
+
+def batch_create(unconnected=()):
+    def create(pv_names, **kwargs):
+        return [make_pv(name, name not in unconnected) for name in pv_names]
+
+    return create
+
+
+def test_lazy_machine_skips_bring_up():
+    with (
+        patch.object(backend_machine.Machine, "__init__", return_value=None),
+        patch.object(BackendMachine, "connect_all") as connect_all,
+    ):
+        machine = BackendMachine(lazy_fault_pvs=True)
+
+    connect_all.assert_not_called()
+    assert machine.connection_report is None
+
+
+def test_connect_all_counts(machine):
+    machine, cavities = machine
+    with (
+        patch.object(
+            backend_machine.PV, "batch_create", side_effect=batch_create()
+        ) as create,
+        patch.object(
+            backend_machine.PVBatch,
+            "connect",
+            side_effect=lambda names, timeout: [True] * len(names),
+        ) as connect,
+    ):
+        report = machine.connect_all(timeout=2.0)
+
+    # Shared rack PV is only connected once
+    fault_names = connect.call_args_list[-1].args[0]
+    assert fault_names == ["RACK:A", "CAV1:FLT", "CAV2:FLT"]
+    assert connect.call_args_list[0].kwargs["timeout"] == 0
+    assert create.call_args.kwargs["connection_timeout"] == 2.0
+    assert create.call_args.kwargs["require_connection"] is False
+
+    assert report.status_connected == 6
+    assert report.fault_connected == 3
+    assert report.unconnected_count == 0
+    assert machine.straggler_count == 0
+    for cavity in cavities:
+        assert len(cavity.attach_status_pvs.call_args.args[0]) == 3
+
+
+def test_connect_all_records_stragglers(machine):
+    machine, cavities = machine
+    with (
+        patch.object(
+            backend_machine.PV,
+            "batch_create",
+            side_effect=batch_create(unconnected={"CAV2:SEVR"}),
+        ),
+        patch.object(
+            backend_machine.PVBatch,
+            "connect",
+            side_effect=lambda names, timeout: [True, False, True],
+        ),
+    ):
+        report = machine.connect_all()
+
+    assert report.status_connected == 5
+    assert report.status_unconnected == 1
+    assert report.fault_unconnected == 1
+    assert report.connected_count == 7
+    assert report.unconnected_count == 2
+    assert machine.straggler_count == 1
+
+
+def test_retry_stragglers_attaches_late_pvs(machine):
+    machine, cavities = machine
+    with (
+        patch.object(
+            backend_machine.PV,
+            "batch_create",
+            side_effect=batch_create(unconnected={"CAV2:SEVR"}),
+        ),
+        patch.object(
+            backend_machine.PVBatch,
+            "connect",
+            side_effect=lambda names, timeout: [True] * len(names),
+        ),
+    ):
+        machine.connect_all()
+
+    assert machine.retry_stragglers() == 0
+    assert machine.straggler_count == 1
+
+    late_pv = cavities[1].attach_status_pvs.call_args.args[0][1]
+    late_pv.connected = True
+
+    assert machine.retry_stragglers() == 1
+    assert machine.straggler_count == 0
+
+
+def test_straggler_retry_thread_stops(machine):
+    machine, _ = machine
+    machine.start_straggler_retry(interval=60)
+    assert machine._retry_thread.is_alive()
+
+    machine.stop_straggler_retry()
+    assert machine._retry_thread is None
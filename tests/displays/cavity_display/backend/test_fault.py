@@ -1,5 +1,6 @@
-from datetime import datetime
-from random import randint
+import bisect
+from datetime import datetime, timedelta, timezone
+from random import Random, randint
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +9,9 @@ from lcls_tools.common.data.archiver import ArchiverValue, ArchiveDataHandler
 from sc_linac_physics.displays.cavity_display.backend.fault import (
     Fault,
     FaultCounter,
+    FaultEvent,
+    FaultEventLog,
+    SeverityLevel,
 )
 from sc_linac_physics.utils.epics import (
     make_mock_pv,
@@ -161,3 +165,112 @@ class TestFaultCounter(TestCase):
             self.assertTrue(self.fault_counter == self.fault_counter2)
         else:
             self.assertFalse(self.fault_counter == self.fault_counter2)
+
+
+def _random_events(count=500, seed=0):
+    rng = Random(seed)
+    base = datetime(2025, 6, 1, 12, 0, 0, 123456)
+    offsets = sorted(rng.uniform(0, 86400) for _ in range(count))
+    return [
+        FaultEvent(
+            base + timedelta(seconds=offset),
+            rng.choice(["SSA", "QCH", "BCS", "1"]),
+            rng.choice([None, 0, 1, 2, 3]),
+        )
+        for offset in offsets
+    ]
+
+
+class TestFaultEventLog(TestCase):
+    def setUp(self):
+        self.events = _random_events()
+        self.log = FaultEventLog.from_events(self.events)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.log), len(self.events))
+        self.assertEqual(list(self.log), self.events)
+        self.assertEqual(self.log[7], self.events[7])
+        self.assertEqual(self.log[-1], self.events[-1])
+        self.assertEqual(self.log, self.events)
+
+    def test_slice_is_log(self):
+        part = self.log[10:20]
+
+        self.assertIsInstance(part, FaultEventLog)
+        self.assertEqual(list(part), self.events[10:20])
+
+    def test_empty(self):
+        log = FaultEventLog()
+
+        self.assertEqual(len(log), 0)
+        self.assertFalse(log)
+        self.assertEqual(log, [])
+        self.assertEqual(log.fault_counts(), {})
+
+    def test_timezone_aware_round_trip(self):
+        ts = datetime(2025, 6, 1, 12, 0, 0, 5, tzinfo=timezone.utc)
+        log = FaultEventLog.from_events([FaultEvent(ts, "SSA", 2)])
+
+        self.assertEqual(log[0].timestamp, ts)
+        self.assertEqual(log[0].timestamp.tzinfo, timezone.utc)
+
+    def test_compact(self):
+        # 8 (timestamp) + 2 (status code) + 1 (severity) bytes per event
+        self.assertEqual(self.log.nbytes, 11 * len(self.events))
+        # + the window index: a row per event (plus a leading zero row)
+        # of warning/alarm/invalid uint16 columns per faulted status
+        self.log.fault_counts()
+        faulted = {e.status for e in self.events if e.severity != 0}
+        index_bytes = (len(self.events) + 1) * 3 * len(faulted) * 2
+        self.assertEqual(self.log.nbytes, 11 * len(self.events) + index_bytes)
+
+    def test_unrecognized_severity_stored_as_invalid(self):
+        log = FaultEventLog.from_events(
+            [FaultEvent(datetime(2025, 6, 1), "SSA", 500)]
+        )
+
+        self.assertEqual(log[0].severity, SeverityLevel.INVALID)
+        self.assertEqual(log.fault_counts()["SSA"].invalid_count, 1)
+
+    def test_index_range_matches_bisect(self):
+        timestamps = [event.timestamp for event in self.events]
+        for i in range(0, len(self.events), 37):
+            start = timestamps[i]
+            end = start + timedelta(hours=3)
+            self.assertEqual(
+                self.log.index_range(start, end),
+                (
+                    bisect.bisect_left(timestamps, start),
+                    bisect.bisect_right(timestamps, end),
+                ),
+            )
+
+    def test_fault_counts_match_count_severity(self):
+        rng = Random(2)
+        ranges = [(0, None), (50, 400), (0, 0), (499, 500)] + [
+            tuple(sorted(rng.sample(range(len(self.events) + 1), 2)))
+            for _ in range(50)
+        ]
+        for lo, hi in ranges:
+            expected = {}
+            for event in self.events[lo:hi]:
+                if event.severity == SeverityLevel.NO_ALARM:
+                    continue
+                counter = expected.setdefault(event.status, FaultCounter())
+                counter.count_severity(event.severity)
+
+            counts = self.log.fault_counts(lo, hi)
+
+            self.assertEqual(set(counts), set(expected))
+            for status, counter in expected.items():
+                self.assertEqual(vars(counts[status]), vars(counter))
+
+    def test_fault_mask(self):
+        mask = self.log.fault_mask(status="SSA", include_warnings=False)
+
+        expected = [
+            event.status == "SSA"
+            and event.severity not in (SeverityLevel.NO_ALARM, 1)
+            for event in self.events
+        ]
+        self.assertEqual(mask.tolist(), expected)
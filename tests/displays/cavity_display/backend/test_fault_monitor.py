@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+import pytest
+
+from sc_linac_physics.displays.cavity_display.backend.fault_monitor import (
+    FaultMonitor,
+)
+from sc_linac_physics.displays.cavity_display.backend.fault_pv_index import (
+    FaultPVIndex,
+)
+
+from tests.displays.cavity_display.test_utils.utils import make_cavity
+
+
+@pytest.fixture
+def cavities():
+    # SHARED:PV feeds both cavities, like a rack or cryomodule level fault
+    return [
+        make_cavity(["CAV1:PV", "SHARED:PV"]),
+        make_cavity(["CAV2:PV", "SHARED:PV"]),
+    ]
+
+
+@pytest.fixture
+def monitor(cavities):
+    fault_monitor = FaultMonitor(FaultPVIndex(cavities))
+    # Claim the initial "publish everything" batch
+    fault_monitor.wait_for_changes(timeout=0)
+    return fault_monitor
+
+
+def test_initially_everything_is_dirty(cavities):
+    fault_monitor = FaultMonitor(FaultPVIndex(cavities))
+    assert fault_monitor.wait_for_changes(timeout=0) == cavities
+
+
+def test_pv_count_counts_shared_pvs_once(monitor):
+    assert monitor.pv_count == 3
+
+
+def test_start_subscribes_once_per_pv(monitor):
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.fault_monitor"
+        ".PVBatch.monitor",
+        return_value=[],
+    ) as mock_monitor:
+        monitor.start(connection_timeout=0)
+
+    assert mock_monitor.call_args.args[0] == ["CAV1:PV", "SHARED:PV", "CAV2:PV"]
+
+
+def test_update_marks_only_dependent_cavities(monitor, cavities):
+    monitor._on_value(pvname="CAV2:PV", value=1, severity=0)
+    assert monitor.wait_for_changes(timeout=0) == [cavities[1]]
+
+
+def test_shared_update_marks_all_dependents(monitor, cavities):
+    monitor._on_value(pvname="SHARED:PV", value=1, severity=0)
+    assert monitor.wait_for_changes(timeout=0) == cavities
+
+
+def test_unchanged_value_is_ignored(monitor):
+    monitor._on_value(pvname="CAV1:PV", value=1, severity=0)
+    monitor.wait_for_changes(timeout=0)
+
+    monitor._on_value(pvname="CAV1:PV", value=1, severity=0)
+    assert monitor.wait_for_changes(timeout=0) == []
+    assert monitor.update_count == 2
+
+
+def test_values_for_in_fault_order(monitor, cavities):
+    monitor._on_value(pvname="SHARED:PV", value=5, severity=0)
+    monitor._on_value(pvname="CAV1:PV", value=3, severity=0)
+
+    assert monitor.values_for(cavities[0]) == [3, 5]
+    # CAV2:PV hasn't reported yet, so it reads as invalid
+    assert monitor.values_for(cavities[1]) == [None, 5]
+
+
+def test_disconnect_reads_as_invalid(monitor, cavities):
+    monitor._on_value(pvname="CAV1:PV", value=3, severity=0)
+    monitor.wait_for_changes(timeout=0)
+
+    monitor._on_connection(pvname="CAV1:PV", conn=False)
+
+    assert monitor.wait_for_changes(timeout=0) == [cavities[0]]
+    assert monitor.values_for(cavities[0])[0] is None
+
+
+def test_unknown_pv_is_ignored(monitor):
+    monitor._on_value(pvname="OTHER:PV", value=1, severity=0)
+    assert monitor.wait_for_changes(timeout=0) == []
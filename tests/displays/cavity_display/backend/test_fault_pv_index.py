@@ -0,0 +1,175 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from sc_linac_physics.displays.cavity_display.backend.fault import Fault
+from sc_linac_physics.displays.cavity_display.backend.fault_pv_index import (
+    FaultPVIndex,
+)
+
+from tests.displays.cavity_display.test_utils.utils import make_cavity
+
+
+@pytest.fixture
+def cavities():
+    # RACK:PV and LINAC:PV are shared, like rack and linac level faults
+    return [
+        make_cavity(["CAV1:PV", "RACK:PV", "LINAC:PV"]),
+        make_cavity(["CAV2:PV", "RACK:PV", "LINAC:PV"]),
+        make_cavity(["CAV3:PV", "LINAC:PV"]),
+    ]
+
+
+@pytest.fixture
+def index(cavities):
+    return FaultPVIndex(cavities)
+
+
+def test_counts(index):
+    assert index.reference_count == 8
+    assert index.unique_count == 5
+
+
+def test_pv_names_unique_in_first_seen_order(index):
+    assert index.pv_names == [
+        "CAV1:PV",
+        "RACK:PV",
+        "LINAC:PV",
+        "CAV2:PV",
+        "CAV3:PV",
+    ]
+
+
+def test_dependents(index):
+    assert index.dependents[index.position("RACK:PV")] == [0, 1]
+    assert index.dependents[index.position("LINAC:PV")] == [0, 1, 2]
+    assert index.dependents[index.position("CAV3:PV")] == [2]
+
+
+def test_repeated_pv_within_cavity_lists_dependent_once():
+    cavity = make_cavity(["SAME:PV", "SAME:PV"])
+    index = FaultPVIndex([cavity])
+
+    assert index.dependents == [[0]]
+    assert index.values_for(cavity) == [None, None]
+
+
+def test_unknown_pv_position_raises(index):
+    with pytest.raises(KeyError):
+        index.position("OTHER:PV")
+
+
+def test_read_fans_out_values(index, cavities):
+    with patch(
+        "sc_linac_physics.displays.cavity_display.backend.fault_pv_index"
+        ".PVBatch.get_values",
+        return_value=[1, 2, 3, 4, 5],
+    ) as mock_get:
+        index.read(timeout=0.25)
+
+    mock_get.assert_called_once_with(index.pv_names, timeout=0.25)
+    assert index.values_for(cavities[0]) == [1, 2, 3]
+    assert index.values_for(cavities[1]) == [4, 2, 3]
+    assert index.values_for(cavities[2]) == [5, 3]
+
+
+def test_values_unknown_before_first_read(index, cavities):
+    assert index.values_for(cavities[2]) == [None, None]
+
+
+def reference_first_fault(cavity, values):
+    """Per-fault loop, as BackendCavity._first_fault does it."""
+    for fault, value in zip(cavity.faults.values(), values):
+        if value is None:
+            return fault, True
+        if fault.is_currently_faulted_with_value(value):
+            return fault, False
+    return None, False
+
+
+def test_first_faults_all_ok(index, cavities):
+    index.values = [0] * index.unique_count
+
+    assert index.first_faults() == [(None, False)] * len(cavities)
+
+
+def test_first_faults_first_match_wins(index, cavities):
+    index.values = [0, 1, 1, 0, 0]  # RACK:PV and LINAC:PV faulted
+
+    assert index.first_faults() == [
+        (cavities[0].faults["FAULT1"], False),
+        (cavities[1].faults["FAULT1"], False),
+        (cavities[2].faults["FAULT1"], False),
+    ]
+
+
+def test_first_faults_none_is_invalid(index, cavities):
+    index.values = [None, 0, 1, 0, 0]
+
+    first = index.first_faults()
+
+    assert first[0] == (cavities[0].faults["FAULT0"], True)
+    assert first[1] == (cavities[1].faults["FAULT2"], False)
+
+
+def test_first_faults_fault_value_mode():
+    cavity = MagicMock()
+    cavity.faults = {
+        "A": Fault(tlc="A", pv="A:PV", fault_value=3),
+        "B": Fault(tlc="B", pv="B:PV", fault_value=3),
+    }
+    index = FaultPVIndex([cavity])
+
+    index.values = [2, 3]
+    assert index.first_faults() == [(cavity.faults["B"], False)]
+
+
+def test_first_faults_non_numeric_values_not_coerced():
+    cavity = MagicMock()
+    cavity.faults = {
+        "FAULT": Fault(tlc="F", pv="F:PV", fault_value=2),
+        "OK": Fault(tlc="O", pv="O:PV", ok_value=2),
+    }
+    index = FaultPVIndex([cavity])
+
+    # "2" != 2.0 in Python, so only the ok_value fault trips
+    index.values = ["2", "2"]
+    assert index.first_faults() == [(cavity.faults["OK"], False)]
+
+
+def test_first_faults_cavity_without_faults():
+    empty = MagicMock()
+    empty.faults = {}
+    faulted = make_cavity(["X:PV"])
+    index = FaultPVIndex([empty, faulted])
+
+    index.values = [1]
+    assert index.first_faults() == [
+        (None, False),
+        (faulted.faults["FAULT0"], False),
+    ]
+
+
+def test_first_faults_matches_per_fault_loop():
+    rng = np.random.default_rng(0)
+    shared = [f"SHARED{i}:PV" for i in range(5)]
+    cavities = [
+        make_cavity(
+            [f"CAV{c}:PV{i}" for i in range(6)]
+            + list(rng.choice(shared, size=3, replace=False)),
+            ok_value=int(rng.integers(0, 2)),
+        )
+        for c in range(40)
+    ]
+    index = FaultPVIndex(cavities)
+
+    for _ in range(20):
+        index.values = [
+            None if rng.random() < 0.05 else int(rng.integers(0, 2))
+            for _ in range(index.unique_count)
+        ]
+        assert index.first_faults() == [
+            reference_first_fault(cavity, index.values_for(cavity))
+            for cavity in cavities
+        ]
@@ -20,8 +20,21 @@ def create_mock_cavities(count=5):
     for i in range(count):
         cavity = MagicMock()
         cavity.__str__ = Mock(return_value=f"TestCavity{i}")
-        cavity.faults = [MagicMock() for _ in range(2)]
+        cavity.faults = {
+            f"FAULT{j}": MagicMock(
+                pv=f"CAV{i}:FAULT{j}", ok_value=0.0, fault_value=None
+            )
+            for j in range(2)
+        }
         cavity.run_through_faults = MagicMock(return_value=None)
+        cavity.status_put_count = 0
+        cavity.status_skip_count = 0
+        cavity.status_put_failure_count = 0
+        cavity.sequential_fallback_count = 0
+        cavity.status_republish_due.return_value = False
+        # Two cavities per cryomodule, all in one linac
+        cavity.cryomodule.name = f"{i // 2 + 1:02d}"
+        cavity.linac.name = "L1B"
         mock_cavities.append(cavity)
     return mock_cavities
 
@@ -40,6 +53,7 @@ def runner():
         )
 
         runner = Runner(lazy_fault_pvs=True)
+        runner.telemetry.publish_pvs = False
 
         # Create a properly configured mock PV
         mock_pv = MagicMock()
@@ -47,6 +61,14 @@ def runner():
         mock_pv.put = MagicMock(return_value=None)
         runner._watcher_pv_obj = mock_pv
 
+        # Fault PVs read as 0 (OK) unless a test says otherwise
+        def read(timeout=0.5):
+            runner.fault_pv_index.values = [0] * len(
+                runner.fault_pv_index.pv_names
+            )
+
+        runner.fault_pv_index.read = MagicMock(side_effect=read)
+
         yield runner
 
 
@@ -62,7 +84,7 @@ class TestBasicFunctionality:
         runner.check_faults()
 
         for cavity in runner.backend_cavities:
-            cavity.run_through_faults.assert_called()
+            cavity.report_fault.assert_called()
         runner._watcher_pv_obj.put.assert_called()
 
     def test_watcher_pv_obj(self, runner):
@@ -112,17 +134,14 @@ class TestFaultChecking:
     @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
     def test_cavity_errors_dont_stop_checking(self, mock_sleep, runner):
         """Test that cavity errors don't stop the check cycle."""
-        runner.backend_cavities[0].run_through_faults.side_effect = (
-            RuntimeError("Error 1")
-        )
-        runner.backend_cavities[2].run_through_faults.side_effect = ValueError(
-            "Error 2"
-        )
+        cavities = runner.backend_cavities
+        cavities[0].report_fault.side_effect = RuntimeError("Error 1")
+        cavities[2].report_fault.side_effect = ValueError("Error 2")
 
         runner.check_faults()
 
         for cavity in runner.backend_cavities:
-            cavity.run_through_faults.assert_called_once()
+            cavity.report_fault.assert_called_once()
         runner._watcher_pv_obj.put.assert_called()
 
     @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
@@ -139,7 +158,7 @@ class TestFaultChecking:
         def slow_cavity(*args, **kwargs):
             time.sleep(0.15)
 
-        runner.backend_cavities[1].run_through_faults = slow_cavity
+        runner.backend_cavities[1].report_fault = slow_cavity
         runner.check_faults()
 
     @patch(
@@ -168,12 +187,60 @@ class TestFaultChecking:
             return _track
 
         for i, cavity in enumerate(runner.backend_cavities):
-            cavity.run_through_faults = track_call(i)
+            cavity.report_fault = track_call(i)
 
         runner.check_faults()
 
         assert call_order == list(range(len(runner.backend_cavities)))
 
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_shared_fault_pvs_read_once(self, mock_sleep, runner):
+        """Test that the cycle reads the deduplicated PV list once."""
+        runner.check_faults()
+
+        runner.fault_pv_index.read.assert_called_once()
+        for cavity in runner.backend_cavities:
+            cavity.report_fault.assert_called_once_with(None, False)
+            cavity.run_through_faults.assert_not_called()
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_vectorized_evaluation_reports_first_fault(
+        self, mock_sleep, runner
+    ):
+        """Test that each cavity gets its own first fault reported."""
+        index = runner.fault_pv_index
+
+        def read(timeout=0.5):
+            index.values = [0] * len(index.pv_names)
+            index.values[index.position("CAV1:FAULT1")] = 1
+            index.values[index.position("CAV3:FAULT0")] = None
+
+        index.read.side_effect = read
+
+        runner.check_faults()
+
+        cavities = runner.backend_cavities
+        cavities[0].report_fault.assert_called_once_with(None, False)
+        cavities[1].report_fault.assert_called_once_with(
+            cavities[1].faults["FAULT1"], False
+        )
+        cavities[3].report_fault.assert_called_once_with(
+            cavities[3].faults["FAULT0"], True
+        )
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_shared_read_failure_falls_back_per_cavity(
+        self, mock_sleep, runner
+    ):
+        """Test per-cavity reads when the machine-wide read fails."""
+        runner.fault_pv_index.read.side_effect = RuntimeError("caget_many")
+
+        runner.check_faults()
+
+        for cavity in runner.backend_cavities:
+            cavity.run_through_faults.assert_called_once()
+            cavity.report_fault.assert_not_called()
+
 
 class TestHeartbeat:
     """Test heartbeat functionality."""
@@ -415,6 +482,441 @@ class TestMainFunction:
             assert 1 in exit_calls
 
 
+class TestMonitorMode:
+    """Test monitor-driven fault evaluation."""
+
+    @pytest.fixture
+    def monitor_runner(self, runner):
+        runner.fault_monitor = MagicMock()
+        runner.fault_monitor.values_for.side_effect = lambda cav: [str(cav)]
+        runner.fault_monitor.update_count = 0
+        return runner
+
+    def test_only_changed_cavities_evaluated(self, monitor_runner):
+        """Test that unchanged cavities are not re-evaluated."""
+        changed = monitor_runner.backend_cavities[1:3]
+        monitor_runner.fault_monitor.wait_for_changes.return_value = changed
+
+        monitor_runner.check_changed_faults()
+
+        for cavity in monitor_runner.backend_cavities:
+            cavity.run_through_faults.assert_not_called()
+            if cavity in changed:
+                cavity.run_through_faults_with_values.assert_called_once_with(
+                    [str(cavity)]
+                )
+            else:
+                cavity.run_through_faults_with_values.assert_not_called()
+        assert monitor_runner._first_check is False
+
+    def test_heartbeat_on_quiet_machine(self, monitor_runner):
+        """Test that the heartbeat beats even when nothing changed."""
+        monitor_runner.fault_monitor.wait_for_changes.return_value = []
+
+        monitor_runner.check_changed_faults()
+
+        monitor_runner._watcher_pv_obj.put.assert_called_once_with(
+            101, timeout=2.0
+        )
+
+    def test_heartbeat_rate_limited(self, monitor_runner):
+        """Test that rapid changes don't hammer the heartbeat PV."""
+        monitor_runner.fault_monitor.wait_for_changes.return_value = []
+
+        monitor_runner.check_changed_faults()
+        monitor_runner.check_changed_faults()
+
+        assert monitor_runner._watcher_pv_obj.put.call_count == 1
+
+    def test_due_cavities_republished_on_heartbeat(self, monitor_runner):
+        """Test quiet cavities still get their forced status re-put."""
+        cavities = monitor_runner.backend_cavities
+        monitor_runner.fault_monitor.wait_for_changes.return_value = [
+            cavities[0]
+        ]
+        cavities[0].status_republish_due.return_value = True
+        cavities[2].status_republish_due.return_value = True
+
+        monitor_runner.check_changed_faults()
+
+        cavities[0].run_through_faults_with_values.assert_called_once()
+        cavities[2].run_through_faults_with_values.assert_called_once_with(
+            [str(cavities[2])]
+        )
+        cavities[1].run_through_faults_with_values.assert_not_called()
+
+    def test_republish_waits_for_heartbeat_tick(self, monitor_runner):
+        """Test due cavities are not scanned between heartbeat ticks."""
+        cavities = monitor_runner.backend_cavities
+        monitor_runner.fault_monitor.wait_for_changes.return_value = []
+        monitor_runner.check_changed_faults()
+        cavities[2].status_republish_due.return_value = True
+
+        monitor_runner.check_changed_faults()
+
+        cavities[2].run_through_faults_with_values.assert_not_called()
+
+    def test_cavity_errors_dont_stop_evaluation(self, monitor_runner):
+        """Test that one failing cavity doesn't block the others."""
+        cavities = monitor_runner.backend_cavities
+        monitor_runner.fault_monitor.wait_for_changes.return_value = cavities
+        cavities[0].run_through_faults_with_values.side_effect = RuntimeError()
+
+        monitor_runner.check_changed_faults()
+
+        cavities[-1].run_through_faults_with_values.assert_called_once()
+
+    def test_run_stops_monitor(self, monitor_runner):
+        """Test that subscriptions are dropped when the runner stops."""
+
+        def stop_after_one(*args, **kwargs):
+            monitor_runner.stop()
+            return []
+
+        monitor_runner.fault_monitor.wait_for_changes.side_effect = (
+            stop_after_one
+        )
+
+        with patch("builtins.print"):
+            monitor_runner.run()
+
+        monitor_runner.fault_monitor.stop.assert_called_once()
+
+    def test_parse_args_monitor_flag(self):
+        """Test the --monitor command line option."""
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            parse_args,
+        )
+
+        assert parse_args([]).monitor is False
+        assert parse_args(["--monitor"]).monitor is True
+
+
+class TestStatusPutCounts:
+    """Test change-only status write accounting."""
+
+    def test_republish_interval_applied_to_cavities(self):
+        with patch(
+            "sc_linac_physics.displays.cavity_display.backend.runner.BackendMachine"
+        ) as mock_machine:
+            from sc_linac_physics.displays.cavity_display.backend.runner import (
+                Runner,
+            )
+
+            mock_cavities = create_mock_cavities(3)
+            mock_machine.return_value.all_iterator = iter(mock_cavities)
+
+            runner = Runner(lazy_fault_pvs=True, status_republish_interval=5.0)
+
+        for cavity in runner.backend_cavities:
+            assert cavity.status_republish_interval == 5.0
+
+    def test_cycle_log_has_put_counts_since_last_cycle(self, runner):
+        for cavity in runner.backend_cavities:
+            cavity.status_put_count = 3
+            cavity.status_skip_count = 0
+        log_data = runner._build_log_data(1.0, [], [])
+        assert log_data["status_puts"] == 15
+        assert log_data["status_puts_skipped"] == 0
+
+        runner.backend_cavities[0].status_put_count += 1
+        for cavity in runner.backend_cavities:
+            cavity.status_skip_count += 3
+        log_data = runner._build_log_data(1.0, [], [])
+        assert log_data["status_puts"] == 1
+        assert log_data["status_puts_skipped"] == 15
+
+    def test_parse_args_republish_interval(self):
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            STATUS_REPUBLISH_INTERVAL_SEC,
+            parse_args,
+        )
+
+        assert parse_args([]).republish_interval == (
+            STATUS_REPUBLISH_INTERVAL_SEC
+        )
+        assert parse_args(["--republish-interval", "0"]).republish_interval == 0
+
+
+def ok_read(index):
+    """Make a fault PV index read all-OK values without touching CA."""
+
+    def read(timeout=0.5):
+        index.values = [0] * len(index.pv_names)
+
+    index.read = MagicMock(side_effect=read)
+
+
+@pytest.fixture
+def sharded_runner():
+    """Runner with 5 cavities in 3 cryomodule shards on 2 workers."""
+    with (
+        patch(
+            "sc_linac_physics.displays.cavity_display.backend.runner.BackendMachine"
+        ) as mock_machine,
+        patch(
+            "sc_linac_physics.displays.cavity_display.backend.runner"
+            "._in_ca_context",
+            side_effect=lambda fn, *args: fn(*args),
+        ),
+    ):
+        mock_machine.return_value.all_iterator = iter(create_mock_cavities(5))
+
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            Runner,
+        )
+
+        runner = Runner(lazy_fault_pvs=True, workers=2)
+        runner.telemetry.publish_pvs = False
+        runner._watcher_pv_obj = MagicMock()
+        runner._watcher_pv_obj.get.return_value = 100
+        for shard in runner.shards:
+            ok_read(shard.fault_pv_index)
+
+        yield runner
+        runner._executor.shutdown(wait=True)
+
+
+class TestShardedMode:
+    """Test parallel sharded fault checking."""
+
+    def test_partition_by_cryomodule(self):
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            partition_cavities,
+        )
+
+        cavities = create_mock_cavities(5)
+        shards = partition_cavities(cavities, "cryomodule")
+
+        assert [shard.name for shard in shards] == ["01", "02", "03"]
+        assert [shard.cavities for shard in shards] == [
+            cavities[0:2],
+            cavities[2:4],
+            cavities[4:5],
+        ]
+        assert shards[0].fault_pv_index.cavities == cavities[0:2]
+
+    def test_partition_by_linac(self):
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            partition_cavities,
+        )
+
+        cavities = create_mock_cavities(5)
+        shards = partition_cavities(cavities, "linac")
+
+        assert len(shards) == 1
+        assert shards[0].cavities == cavities
+
+    def test_partition_rejects_unknown_grouping(self):
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            partition_cavities,
+        )
+
+        with pytest.raises(ValueError):
+            partition_cavities(create_mock_cavities(2), "rack")
+
+    def test_sequential_by_default(self, runner):
+        assert runner.shards == []
+        assert runner._executor is None
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_every_shard_checked_once_per_cycle(
+        self, mock_sleep, sharded_runner
+    ):
+        sharded_runner.check_faults()
+
+        for shard in sharded_runner.shards:
+            shard.fault_pv_index.read.assert_called_once()
+        for cavity in sharded_runner.backend_cavities:
+            cavity.report_fault.assert_called_once_with(None, False)
+        sharded_runner._watcher_pv_obj.put.assert_called_once_with(
+            101, timeout=2.0
+        )
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_failures_aggregated_across_shards(
+        self, mock_sleep, sharded_runner
+    ):
+        cavities = sharded_runner.backend_cavities
+        cavities[0].report_fault.side_effect = RuntimeError("shard 1")
+        cavities[4].report_fault.side_effect = RuntimeError("shard 3")
+
+        with patch.object(sharded_runner, "_log_failures") as mock_log:
+            sharded_runner.check_faults()
+
+        failed, summary = mock_log.call_args.args
+        assert failed == [cavities[0], cavities[4]]
+        assert summary == {"RuntimeError": 2}
+        cavities[1].report_fault.assert_called_once()
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_broken_shard_counts_all_its_cavities_failed(
+        self, mock_sleep, sharded_runner
+    ):
+        def check_shard(shard):
+            if shard.name == "01":
+                raise RuntimeError("boom")
+            return [], {}, [], 0.01
+
+        with (
+            patch.object(
+                sharded_runner, "_check_shard", side_effect=check_shard
+            ),
+            patch.object(sharded_runner, "_log_failures") as mock_log,
+        ):
+            sharded_runner.check_faults()
+
+        failed, summary = mock_log.call_args.args
+        assert failed == sharded_runner.shards[0].cavities
+        assert summary == {"RuntimeError": 2}
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_slowest_shard_logged(self, mock_sleep, sharded_runner):
+        sharded_runner.check_faults()
+
+        log_data = sharded_runner._build_log_data(1.0, [], [])
+        assert log_data["slowest_shard"][0] in {
+            shard.name for shard in sharded_runner.shards
+        }
+
+    def test_run_shuts_down_pool(self, sharded_runner):
+        def stop_after_one():
+            sharded_runner.stop()
+
+        with (
+            patch.object(
+                sharded_runner, "check_faults", side_effect=stop_after_one
+            ),
+            patch("builtins.print"),
+        ):
+            sharded_runner._running = True
+            sharded_runner.run()
+
+        with pytest.raises(RuntimeError):
+            sharded_runner._executor.submit(print)
+
+    def test_parse_args_workers(self):
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            parse_args,
+        )
+
+        args = parse_args([])
+        assert args.workers == 1
+        assert args.shard_by == "cryomodule"
+
+        args = parse_args(["--workers", "4", "--shard-by", "linac"])
+        assert args.workers == 4
+        assert args.shard_by == "linac"
+
+
+class TestCycleTimePercentiles:
+    """Test cycle-time percentile reporting."""
+
+    def test_empty_before_first_cycle(self, runner):
+        assert runner.cycle_time_percentiles() == {}
+
+    def test_percentiles_over_recent_cycles(self, runner):
+        runner.telemetry.cycle_time.observe_many(
+            [i / 100 for i in range(1, 101)]
+        )
+
+        percentiles = runner.cycle_time_percentiles()
+
+        assert percentiles["cycle_p50_sec"] == pytest.approx(0.505, abs=1e-3)
+        assert percentiles["cycle_p90_sec"] == pytest.approx(0.901, abs=1e-3)
+        assert percentiles["cycle_p99_sec"] == pytest.approx(0.99, abs=1e-3)
+
+    def test_window_is_bounded(self, runner):
+        from sc_linac_physics.displays.cavity_display.backend.telemetry import (
+            CYCLE_TIME_WINDOW,
+        )
+
+        runner.telemetry.cycle_time.observe_many([10.0] * CYCLE_TIME_WINDOW)
+        runner.telemetry.cycle_time.observe_many([1.0] * CYCLE_TIME_WINDOW)
+
+        assert runner.cycle_time_percentiles()["cycle_p99_sec"] == 1.0
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_cycle_log_includes_percentiles(self, mock_sleep, runner):
+        with patch.object(runner, "_log_cycle_completion") as mock_log:
+            runner.check_faults()
+
+        log_data = mock_log.call_args.args[1]
+        assert "cycle_p50_sec" in log_data
+        assert "cycle_p99_sec" in log_data
+
+
+class TestTelemetry:
+    """Test runner telemetry collection."""
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_cycle_and_cavity_latency_observed(self, mock_sleep, runner):
+        runner.check_faults()
+
+        assert runner.telemetry.cycle_time.count == 1
+        assert runner.telemetry.cavity_latency.count == len(
+            runner.backend_cavities
+        )
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_index_fallback_counted(self, mock_sleep, runner):
+        runner.fault_pv_index.read.side_effect = RuntimeError("CA down")
+
+        runner.check_faults()
+        runner.check_faults()
+
+        assert runner.telemetry.counters["fault_index_fallbacks"] == 2
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_publish_refreshes_totals(self, mock_sleep, runner):
+        runner.backend_cavities[0].sequential_fallback_count = 2
+        runner.backend_cavities[1].status_put_failure_count = 3
+        runner.backend_machine.straggler_count = 4
+        runner.fault_pv_index.read.side_effect = lambda timeout=0.5: setattr(
+            runner.fault_pv_index,
+            "values",
+            [None] + [0] * (runner.fault_pv_index.unique_count - 1),
+        )
+
+        with patch.object(runner.telemetry, "publish") as publish:
+            runner.check_faults()
+
+        publish.assert_called_once()
+        assert runner.telemetry.counters == {
+            "fault_index_fallbacks": 0,
+            "sequential_fallbacks": 2,
+            "status_put_failures": 3,
+            "disconnected_fault_pvs": 1,
+            "status_pv_stragglers": 4,
+        }
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_publish_throttled(self, mock_sleep, runner):
+        with patch.object(runner.telemetry, "publish") as publish:
+            runner.check_faults()
+            runner.check_faults()
+
+        publish.assert_called_once()
+
+    @patch("sc_linac_physics.displays.cavity_display.backend.runner.sleep")
+    def test_metrics_file_written(self, mock_sleep, runner, tmp_path):
+        runner.telemetry.metrics_file = str(tmp_path / "runner.prom")
+
+        runner.check_faults()
+
+        text = (tmp_path / "runner.prom").read_text()
+        assert "sc_cav_fault_cycle_seconds_count 1" in text
+
+    def test_parse_args_metrics_file(self):
+        from sc_linac_physics.displays.cavity_display.backend.runner import (
+            parse_args,
+        )
+
+        assert parse_args([]).metrics_file is None
+        args = parse_args(["--metrics-file", "/tmp/runner.prom"])
+        assert args.metrics_file == "/tmp/runner.prom"
+
+
 class TestUtilities:
     """Test utility functions."""
 
@@ -0,0 +1,166 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sc_linac_physics.displays.cavity_display.backend import telemetry
+from sc_linac_physics.displays.cavity_display.backend.telemetry import (
+    RollingHistogram,
+    RunnerTelemetry,
+)
+
+
+class TestRollingHistogram:
+    def test_empty(self):
+        histogram = RollingHistogram((0.1, 1.0), window=10)
+
+        assert histogram.quantiles((50, 99)) == {}
+        assert histogram.cumulative_buckets() == [
+            (0.1, 0),
+            (1.0, 0),
+            (float("inf"), 0),
+        ]
+
+    def test_bucket_bounds_are_inclusive(self):
+        histogram = RollingHistogram((0.1, 1.0), window=10)
+        for value in (0.05, 0.1, 0.5, 1.0, 5.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative_buckets() == [
+            (0.1, 2),
+            (1.0, 4),
+            (float("inf"), 5),
+        ]
+        assert histogram.count == 5
+        assert histogram.total == pytest.approx(6.65)
+
+    def test_observe_many_matches_observe(self):
+        values = [0.001 * i for i in range(1, 200)]
+        one_by_one = RollingHistogram(telemetry.CAVITY_BUCKETS_SEC, 50)
+        batched = RollingHistogram(telemetry.CAVITY_BUCKETS_SEC, 50)
+
+        for value in values:
+            one_by_one.observe(value)
+        batched.observe_many(values)
+
+        assert batched.cumulative_buckets() == one_by_one.cumulative_buckets()
+        assert batched.quantiles((50, 99)) == one_by_one.quantiles((50, 99))
+        assert batched.total == pytest.approx(one_by_one.total)
+
+    def test_quantiles_only_cover_window(self):
+        histogram = RollingHistogram((1.0,), window=3)
+        histogram.observe_many([100.0, 100.0, 1.0, 2.0, 3.0])
+
+        assert histogram.quantiles((50,)) == {50: 2.0}
+        # Buckets stay cumulative since start
+        assert histogram.count == 5
+        assert histogram.cumulative_buckets()[-1] == (float("inf"), 5)
+
+
+@pytest.fixture
+def runner_telemetry():
+    metrics = RunnerTelemetry(publish_pvs=False)
+    metrics.cycle_time.observe_many([0.5, 1.0, 1.5])
+    metrics.cavity_latency.observe_many([0.001] * 10)
+    metrics.increment("fault_index_fallbacks")
+    metrics.set("status_put_failures", 7)
+    return metrics
+
+
+def test_pv_values(runner_telemetry):
+    values = runner_telemetry.pv_values()
+
+    assert values["PHYS:SYS0:1:SC_CAV_FAULT_CYCLE_P50"] == 1.0
+    assert values["PHYS:SYS0:1:SC_CAV_FAULT_CAV_LAT_P99"] == pytest.approx(
+        0.001
+    )
+    assert values["PHYS:SYS0:1:SC_CAV_FAULT_INDEX_FALLBACKS"] == 1
+    assert values["PHYS:SYS0:1:SC_CAV_FAULT_PUT_FAILURES"] == 7
+    assert values["PHYS:SYS0:1:SC_CAV_FAULT_SEQ_FALLBACKS"] == 0
+
+
+def test_pv_names_served_by_simulation():
+    from sc_linac_physics.utils.simulation.sc_linac_physics_service import (
+        FAULT_TELEMETRY_FLOAT_CHANNELS,
+        FAULT_TELEMETRY_INTEGER_CHANNELS,
+    )
+
+    simulated = {
+        f"PHYS:SYS0:1:{channel}"
+        for channel in FAULT_TELEMETRY_FLOAT_CHANNELS
+        + FAULT_TELEMETRY_INTEGER_CHANNELS
+    }
+    assert set(RunnerTelemetry().pv_values()) == simulated
+
+
+def test_prometheus_text(runner_telemetry):
+    text = runner_telemetry.prometheus_text()
+    lines = text.splitlines()
+
+    assert "# TYPE sc_cav_fault_cycle_seconds histogram" in lines
+    assert 'sc_cav_fault_cycle_seconds_bucket{le="1.0"} 2' in lines
+    assert 'sc_cav_fault_cycle_seconds_bucket{le="+Inf"} 3' in lines
+    assert "sc_cav_fault_cycle_seconds_count 3" in lines
+    assert 'sc_cav_fault_cycle_seconds_rolling{quantile="0.5"} 1.0' in lines
+    assert "# TYPE sc_cav_fault_fault_index_fallbacks_total counter" in lines
+    assert "sc_cav_fault_fault_index_fallbacks_total 1" in lines
+    assert "sc_cav_fault_status_put_failures_total 7" in lines
+    assert "# TYPE sc_cav_fault_disconnected_fault_pvs gauge" in lines
+    assert text.endswith("\n")
+
+
+def test_write_metrics_file(runner_telemetry, tmp_path):
+    path = tmp_path / "sc_cav_fault.prom"
+    runner_telemetry.metrics_file = str(path)
+
+    runner_telemetry.publish()
+
+    assert "sc_cav_fault_cycle_seconds_count 3" in path.read_text()
+    # No temporary files left behind
+    assert os.listdir(tmp_path) == ["sc_cav_fault.prom"]
+
+
+def test_metrics_file_failure_does_not_raise(runner_telemetry, tmp_path):
+    runner_telemetry.metrics_file = str(tmp_path / "missing" / "x.prom")
+
+    runner_telemetry.publish()
+
+
+def test_put_pvs_skips_unconnected(runner_telemetry):
+    values = runner_telemetry.pv_values()
+    pvs = []
+    for i, name in enumerate(values):
+        pv = MagicMock(pvname=name, connected=i % 2 == 0)
+        pvs.append(pv)
+
+    with (
+        patch.object(
+            telemetry.PV, "batch_create", return_value=pvs
+        ) as batch_create,
+        patch.object(telemetry.PV, "put_many") as put_many,
+    ):
+        assert runner_telemetry.put_pvs() == (len(pvs) + 1) // 2
+        runner_telemetry.put_pvs()
+
+    batch_create.assert_called_once()
+    assert batch_create.call_args.kwargs["require_connection"] is False
+    put_pvs, put_values = put_many.call_args.args
+    assert all(pv.connected for pv in put_pvs)
+    assert put_values == [values[pv.pvname] for pv in put_pvs]
+    assert put_many.call_args.kwargs["wait"] is False
+
+
+def test_pv_failure_does_not_raise(runner_telemetry):
+    runner_telemetry.publish_pvs = True
+    with patch.object(
+        telemetry.PV, "batch_create", side_effect=RuntimeError("no CA")
+    ):
+        runner_telemetry.publish()
+
+
+def test_publish_due_once_per_interval():
+    metrics = RunnerTelemetry(publish_interval=10.0)
+
+    assert metrics.publish_due(now=100.0)
+    assert not metrics.publish_due(now=105.0)
+    assert metrics.publish_due(now=110.0)
@@ -1,7 +1,12 @@
 from datetime import datetime
 from unittest.mock import Mock
 
+import pytest
+
 from sc_linac_physics.displays.cavity_display.backend.fault import FaultCounter
+from sc_linac_physics.displays.cavity_display.frontend.heatmap import (
+    fault_data_fetcher,
+)
 from sc_linac_physics.displays.cavity_display.frontend.heatmap.fault_data_fetcher import (
     CavityFaultResult,
     FaultDataFetcher,
@@ -305,3 +310,144 @@ class TestFaultDataFetcherParallel:
         ok_results = [r for r in results if not r.is_error]
         assert len(error_results) == 2
         assert len(ok_results) == 2
+
+
+def make_bulk_machine(num_cavities: int) -> Mock:
+    """make_machine whose cavities aggregate bulk-fetched archiver data."""
+    machine = make_machine(num_cavities=num_cavities)
+    for num, cav in machine.linacs[0].cryomodules["01"].cavities.items():
+        cav.fault_history_pvs = [f"CAV{num}:CUDSTATUS", f"CAV{num}:CUDSEVR"]
+        cav.process_fault_history = Mock(
+            side_effect=lambda statuses, severities: (
+                {statuses: FaultCounter(1, 0, 0, 0)},
+                [],
+            )
+        )
+    return machine
+
+
+def make_archive_client(chunk_size: int = 4, side_effect=None) -> Mock:
+    client = Mock(chunk_size=chunk_size, max_workers=2)
+    client.get_values_over_time_range = Mock(
+        side_effect=side_effect
+        or (lambda pv_list, start_time, end_time: {pv: pv for pv in pv_list})
+    )
+    return client
+
+
+@pytest.fixture(autouse=True)
+def uncached_archiver(monkeypatch):
+    monkeypatch.setattr(
+        fault_data_fetcher,
+        "cached_values_over_time_range",
+        lambda pv_list, start_time, end_time, fetch: fetch(
+            pv_list=pv_list, start_time=start_time, end_time=end_time
+        ),
+    )
+
+
+class TestFaultDataFetcherBulk:
+    def test_one_request_per_group_of_cavities(self):
+        machine = make_bulk_machine(num_cavities=5)
+        client = make_archive_client(chunk_size=4)
+        fetcher = FaultDataFetcher(
+            machine, datetime.now(), datetime.now(), archive_client=client
+        )
+        result_spy = Mock()
+        progress_spy = Mock()
+        finished_spy = Mock()
+        fetcher.cavity_result.connect(result_spy)
+        fetcher.progress.connect(progress_spy)
+        fetcher.finished_all.connect(finished_spy)
+
+        fetcher.run()
+
+        # Two cavities (four PVs) per request
+        assert client.get_values_over_time_range.call_count == 3
+        results = finished_spy.call_args[0][0]
+        assert sorted(r.cavity_num for r in results) == [1, 2, 3, 4, 5]
+        assert all(not r.is_error for r in results)
+        assert result_spy.call_count == 5
+        progress_spy.assert_called_with(5, 5)
+        for cav in machine.linacs[0].cryomodules["01"].cavities.values():
+            cav.get_fault_history.assert_not_called()
+
+    def test_results_use_own_cavity_pvs(self):
+        machine = make_bulk_machine(num_cavities=3)
+        fetcher = FaultDataFetcher(
+            machine,
+            datetime.now(),
+            datetime.now(),
+            archive_client=make_archive_client(),
+        )
+        finished_spy = Mock()
+        fetcher.finished_all.connect(finished_spy)
+
+        fetcher.run()
+
+        for result in finished_spy.call_args[0][0]:
+            assert list(result.fault_counts_by_tlc) == [
+                f"CAV{result.cavity_num}:CUDSTATUS"
+            ]
+
+    def test_failed_request_falls_back_per_cavity(self):
+        def fail_for_cavity_one(pv_list, start_time, end_time):
+            if "CAV1:CUDSTATUS" in pv_list:
+                raise ConnectionError("archiver down")
+            return {pv: pv for pv in pv_list}
+
+        machine = make_bulk_machine(num_cavities=4)
+        cavities = machine.linacs[0].cryomodules["01"].cavities
+        cavities[2].get_fault_history.side_effect = ConnectionError("timeout")
+        fetcher = FaultDataFetcher(
+            machine,
+            datetime.now(),
+            datetime.now(),
+            archive_client=make_archive_client(side_effect=fail_for_cavity_one),
+        )
+        finished_spy = Mock()
+        fetcher.finished_all.connect(finished_spy)
+
+        fetcher.run()
+
+        results = {r.cavity_num: r for r in finished_spy.call_args[0][0]}
+        cavities[1].get_fault_history.assert_called_once()
+        assert not results[1].is_error
+        assert results[2].error == "timeout"
+        cavities[3].get_fault_history.assert_not_called()
+        assert not results[3].is_error and not results[4].is_error
+
+    def test_processing_error_is_per_cavity(self):
+        machine = make_bulk_machine(num_cavities=2)
+        cavities = machine.linacs[0].cryomodules["01"].cavities
+        cavities[2].process_fault_history.side_effect = ValueError("bad data")
+        fetcher = FaultDataFetcher(
+            machine,
+            datetime.now(),
+            datetime.now(),
+            archive_client=make_archive_client(),
+        )
+        finished_spy = Mock()
+        fetcher.finished_all.connect(finished_spy)
+
+        fetcher.run()
+
+        results = {r.cavity_num: r for r in finished_spy.call_args[0][0]}
+        assert not results[1].is_error
+        assert results[2].error == "bad data"
+
+    def test_aborted_before_start(self):
+        machine = make_bulk_machine(num_cavities=4)
+        client = make_archive_client()
+        fetcher = FaultDataFetcher(
+            machine, datetime.now(), datetime.now(), archive_client=client
+        )
+        finished_spy = Mock()
+        fetcher.finished_all.connect(finished_spy)
+
+        fetcher.abort()
+        fetcher.run()
+
+        client.get_values_over_time_range.assert_not_called()
+        results = finished_spy.call_args[0][0]
+        assert results and all(r.error == "Aborted" for r in results)
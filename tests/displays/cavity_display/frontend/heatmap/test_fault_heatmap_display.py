@@ -3,6 +3,9 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from sc_linac_physics.displays.cavity_display.backend.archiver_client import (
+    BulkArchiveClient,
+)
 from sc_linac_physics.displays.cavity_display.backend.fault import FaultCounter
 from sc_linac_physics.displays.cavity_display.frontend.heatmap.fault_data_fetcher import (
     CavityFaultResult,
@@ -55,6 +58,21 @@ class TestFaultHeatmapDisplayInit:
     def test_window_title(self, display):
         assert display.windowTitle() == "LCLS-II Fault Heatmap"
 
+    def test_defaults_to_bulk_archive_client(self, display):
+        assert isinstance(display._archive_client, BulkArchiveClient)
+
+    def test_uses_given_archive_client(self):
+        client = Mock()
+        disp = FaultHeatmapDisplay(archive_client=client)
+        assert disp._archive_client is client
+        disp.close()
+        client.close.assert_not_called()
+
+    def test_closes_own_archive_client(self, display):
+        with patch.object(display._archive_client, "close") as close:
+            display.close()
+        close.assert_called_once()
+
     def test_progress_bar_initial_state(self, display):
         assert display._progress_bar.value() == 0
 
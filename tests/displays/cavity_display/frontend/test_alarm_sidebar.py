@@ -0,0 +1,159 @@
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from sc_linac_physics.displays.cavity_display.frontend.alarm_sidebar import (
+    AlarmSidebarWidget,
+)
+from sc_linac_physics.displays.cavity_display.frontend.cavity_widget import (
+    CavityWidget,
+)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+class FakeCavity:
+    """Just what the sidebar reads off a GUICavity."""
+
+    def __init__(self, cm_name, number):
+        self.number = number
+        self.cryomodule = SimpleNamespace(name=cm_name)
+        self.cavity_widget = CavityWidget()
+        self.cavity_widget._parent_cavity = self
+
+    def __repr__(self):
+        return f"CM{self.cryomodule.name} cavity {self.number}"
+
+
+@pytest.fixture
+def cavities(qapp):
+    cavities = [FakeCavity(cm, num) for cm in ("01", "02") for num in (1, 2)]
+    yield cavities
+    for cavity in cavities:
+        cavity.cavity_widget.deleteLater()
+
+
+@pytest.fixture
+def sidebar(cavities):
+    gui_machine = SimpleNamespace(
+        linacs=[
+            SimpleNamespace(
+                cryomodules=[
+                    SimpleNamespace(
+                        cavities={
+                            c.number: c
+                            for c in cavities
+                            if c.cryomodule.name == cm_name
+                        }
+                    )
+                    for cm_name in ("01", "02")
+                ]
+            )
+        ]
+    )
+    with patch.object(CavityWidget, "change_shape"):
+        widget = AlarmSidebarWidget(gui_machine)
+        yield widget
+    widget.stop_refresh()
+    widget.deleteLater()
+
+
+def set_severity(cavity, value):
+    cavity.cavity_widget.severity_channel_value_changed(value)
+
+
+def listed(sidebar):
+    return [
+        sidebar.alarm_list.item(row).data(Qt.UserRole)
+        for row in range(sidebar.alarm_list.count())
+    ]
+
+
+def test_severity_changes_update_lists_immediately(sidebar, cavities):
+    cm1_cav1, cm1_cav2, cm2_cav1, cm2_cav2 = cavities
+
+    set_severity(cm2_cav2, 2)
+    set_severity(cm1_cav2, 1)
+    set_severity(cm1_cav1, 2)
+
+    assert sidebar.alarm_cavities == [cm1_cav1, cm2_cav2]
+    assert sidebar.warning_cavities == [cm1_cav2]
+    assert listed(sidebar) == [cm1_cav1, cm2_cav2, cm1_cav2]
+    assert sidebar.alarm_count_label.text() == "ALARMS: 2"
+    assert sidebar.warning_count_label.text() == "WARNINGS: 1"
+
+
+def test_cavity_moves_between_lists(sidebar, cavities):
+    cm1_cav1, cm1_cav2, cm2_cav1, _ = cavities
+    for cavity in (cm1_cav1, cm1_cav2, cm2_cav1):
+        set_severity(cavity, 2)
+
+    set_severity(cm1_cav2, 1)
+    assert listed(sidebar) == [cm1_cav1, cm2_cav1, cm1_cav2]
+
+    set_severity(cm1_cav1, 0)
+    set_severity(cm2_cav1, 999)  # invalid drops off the list
+    assert listed(sidebar) == [cm1_cav2]
+    assert sidebar.alarm_count_label.text() == "ALARMS: 0"
+
+
+def test_unchanged_items_kept(sidebar, cavities):
+    """Only the changed cavity's item is inserted; others are untouched."""
+    cm1_cav1, _, cm2_cav1, _ = cavities
+    set_severity(cm2_cav1, 2)
+    item = sidebar.alarm_list.item(0)
+    sidebar.alarm_list.setCurrentItem(item)
+
+    set_severity(cm1_cav1, 2)
+
+    assert sidebar.alarm_list.item(1) is item
+    assert sidebar.alarm_list.currentItem() is item
+
+
+def test_filter_applies_to_incremental_updates(sidebar, cavities):
+    cm1_cav1, cm1_cav2, _, _ = cavities
+    sidebar.filter_combo.setCurrentText("Warnings Only")
+
+    set_severity(cm1_cav1, 2)
+    set_severity(cm1_cav2, 1)
+    assert listed(sidebar) == [cm1_cav2]
+
+    sidebar.filter_combo.setCurrentText("All")
+    assert listed(sidebar) == [cm1_cav1, cm1_cav2]
+
+
+def test_description_updates_listed_item(sidebar, cavities):
+    cavity = cavities[0]
+    set_severity(cavity, 2)
+
+    cavity.cavity_widget.description_changed("SSA Fault")
+
+    assert "SSA Fault" in sidebar.alarm_list.item(0).text()
+
+
+def test_resync_matches_incremental(sidebar, cavities):
+    for cavity, value in zip(cavities, (1, 2, 0, 2)):
+        set_severity(cavity, value)
+    incremental = listed(sidebar)
+
+    sidebar.update_alarm_list()
+
+    assert listed(sidebar) == incremental
+
+
+def test_stop_refresh_disconnects(sidebar, cavities):
+    sidebar.stop_refresh()
+
+    set_severity(cavities[0], 2)
+
+    assert sidebar.alarm_cavities == []
@@ -16,6 +16,7 @@ from sc_linac_physics.displays.cavity_display.frontend.cavity_widget import (
     GREEN_FILL_COLOR,
     BLACK_TEXT_COLOR,
     RED_FILL_COLOR,
+    RenderCache,
 )
 
 
@@ -561,6 +562,92 @@ class TestCavityWidgetDrawing:
                 mock_painter.drawText.assert_not_called()
 
 
+class TestCavityWidgetRenderCache:
+    """Test the shared pixmap cache behind paintEvent."""
+
+    @pytest.fixture
+    def render_cache(self):
+        cache = RenderCache(max_entries=8)
+        with patch.object(CavityWidget, "render_cache", cache):
+            yield cache
+
+    @staticmethod
+    def _tile(text="SSA", size=50):
+        widget = CavityWidget()
+        widget.resize(size, size)
+        widget.cavity_text = text
+        widget.change_shape(SHAPE_PARAMETER_DICT[2])
+        return widget
+
+    def test_same_state_shares_one_pixmap(self, qapp, render_cache):
+        widgets = [self._tile() for _ in range(3)]
+        for widget in widgets:
+            widget.grab()
+
+        assert len(render_cache) == 1
+        assert render_cache.misses == 1
+        assert render_cache.hits == 2
+
+    def test_state_changes_change_key(self, qapp, render_cache):
+        widget = self._tile()
+        keys = {widget._render_key()}
+
+        widget.change_shape(SHAPE_PARAMETER_DICT[1])
+        keys.add(widget._render_key())
+        widget.cavity_text = "QCH"
+        keys.add(widget._render_key())
+        widget.underline = True
+        keys.add(widget._render_key())
+        width, color = widget._pen.width(), widget._pen.color()
+        widget.highlight()
+        keys.add(widget._render_key())
+        widget._unhighlight(width, color)
+
+        assert len(keys) == 5
+        assert widget._render_key() in keys
+
+    def test_resize_keeps_other_scales(self, qapp, render_cache):
+        widget = self._tile()
+        widget.grab()
+        widget.resize(80, 80)
+        widget.grab()
+        widget.resize(50, 50)
+        widget.grab()
+
+        assert len(render_cache) == 2
+        assert render_cache.hits == 1
+
+    def test_lru_eviction(self, qapp):
+        cache = RenderCache(max_entries=2)
+        for key in "abc":
+            cache.put(key, Mock())
+        cache.get("b")
+        cache.put("d", Mock())
+
+        assert cache.get("c") is None
+        assert cache.get("b") is not None
+        assert len(cache) == 2
+
+    def test_cached_paint_matches_direct_paint(self, qapp, render_cache):
+        widget = self._tile(text="5")
+        cached = widget.grab().toImage()
+        with patch.object(CavityWidget, "render_cache", None):
+            direct = widget.grab().toImage()
+
+        assert render_cache.misses == 1
+        # Blitting a premultiplied pixmap rounds by at most one level
+        assert cached.size() == direct.size()
+        assert all(
+            abs(a - b) <= 1
+            for x in range(cached.width())
+            for y in range(cached.height())
+            for a, b in zip(
+                cached.pixelColor(x, y).getRgb(),
+                direct.pixelColor(x, y).getRgb(),
+            )
+        )
+
+
 class TestCavityWidgetShapeChanging:
     """Test shape changing functionality."""
 
@@ -878,6 +965,30 @@ class TestCavityWidgetSeveritySignals:
         # Signal should not be emitted for invalid value
         signal_spy.assert_not_called()
 
+    def test_last_severity_changed_only_on_change(self, cavity_widget):
+        signal_spy = Mock()
+        cavity_widget.last_severity_changed.connect(signal_spy)
+
+        with patch.object(cavity_widget, "change_shape"):
+            for value in (2, 2, 1, 999, 999, 0):
+                cavity_widget.severity_channel_value_changed(value)
+
+        assert [c.args[0] for c in signal_spy.call_args_list] == [
+            2,
+            1,
+            None,
+            0,
+        ]
+
+    def test_description_updated_signal(self, cavity_widget):
+        signal_spy = Mock()
+        cavity_widget.description_updated.connect(signal_spy)
+
+        cavity_widget.description_changed("  Quench  ")
+        cavity_widget.description_changed(None)
+
+        assert [c.args[0] for c in signal_spy.call_args_list] == ["Quench", ""]
+
 
 class TestCavityWidgetEdgeCases:
     """Test edge cases and error conditions."""
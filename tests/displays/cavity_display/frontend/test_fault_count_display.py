@@ -7,6 +7,9 @@ import pytest
 from PyQt5.QtWidgets import QApplication
 
 from sc_linac_physics.displays.cavity_display.backend.fault import FaultCounter
+from sc_linac_physics.displays.cavity_display.frontend import (
+    fault_count_display,
+)
 from sc_linac_physics.displays.cavity_display.frontend.fault_count_display import (
     FaultCountDisplay,
 )
@@ -30,7 +33,7 @@ def mock_machine():
     ) as mock:
         machine = Mock()
         cavity = Mock()
-        cavity.cryomodule = "01"
+        cavity.cryomodule.name = "01"
         cavity.number = 1
         cavity.get_fault_counts = Mock(return_value={})
 
@@ -96,7 +99,7 @@ class TestCavitySelection:
         with patch.object(display, "update_plot"):
             display.update_cavity()
             assert display.cavity is not None
-            assert display.cavity.cryomodule == "01"
+            assert display.cavity.cryomodule.name == "01"
             assert display.cavity.number == 1
 
 
@@ -106,7 +109,7 @@ class TestDataProcessing:
     def cavity_with_data(self):
         """Create mock cavity with sample fault data using real fault codes."""
         cavity = Mock()
-        cavity.cryomodule = "01"
+        cavity.cryomodule.name = "01"
         cavity.number = 1
         cavity.get_fault_counts = Mock(
             return_value={
@@ -139,6 +142,21 @@ class TestDataProcessing:
         assert len(args) == 2
         assert all(isinstance(arg, datetime) for arg in args)
 
+    def test_get_data_propagates_archiver_errors(self, display):
+        """Should not cache an archiver outage as an empty count."""
+        display.cavity = Mock()
+        display.cavity.get_fault_counts = Mock(
+            side_effect=ConnectionError("archiver down")
+        )
+
+        with pytest.raises(ConnectionError):
+            display.get_data()
+
+        assert display.cached_counts(display._data_key()) is None
+        display.cavity.get_fault_counts.assert_called_once_with(
+            *display._data_key()[1:], raise_on_error=True
+        )
+
     def test_fault_filtering(self, display, cavity_with_data):
         """Should filter out selected fault type."""
         display.cavity = cavity_with_data
@@ -183,7 +201,7 @@ class TestPlotUpdates:
     def test_update_plot_clears_and_gets_data(self, display):
         """Should clear plot and get fresh data."""
         display.cavity = Mock()
-        display.cavity.cryomodule = "01"
+        display.cavity.cryomodule.name = "01"
         display.cavity.number = 1
         display.cavity.get_fault_counts = Mock(
             return_value={
@@ -203,7 +221,7 @@ class TestPlotUpdates:
     def test_creates_three_bar_graphs(self, display):
         """Should create bars for faults, invalids, and warnings."""
         display.cavity = Mock()
-        display.cavity.cryomodule = "01"
+        display.cavity.cryomodule.name = "01"
         display.cavity.number = 1
         display.cavity.get_fault_counts = Mock(
             return_value={
@@ -226,7 +244,7 @@ class TestPlotUpdates:
         )
 
         display.cavity = Mock()
-        display.cavity.cryomodule = "01"
+        display.cavity.cryomodule.name = "01"
         display.cavity.number = 1
         display.cavity.get_fault_counts = Mock(
             return_value={
@@ -254,7 +272,7 @@ class TestPlotUpdates:
     def test_stacked_bar_positioning(self, display):
         """Should stack bars correctly."""
         display.cavity = Mock()
-        display.cavity.cryomodule = "01"
+        display.cavity.cryomodule.name = "01"
         display.cavity.number = 1
         display.cavity.get_fault_counts = Mock(
             return_value={
@@ -279,12 +297,188 @@ class TestPlotUpdates:
             assert calls[2][1]["x0"] == [8]
 
 
+# Background Loading Tests
+def _counts_cavity(get_fault_counts):
+    cavity = Mock()
+    cavity.cryomodule.name = "01"
+    cavity.number = 1
+    cavity.get_fault_counts = Mock(side_effect=get_fault_counts)
+    return cavity
+
+
+def _sample_counts(start, end, raise_on_error=False):
+    return dict(SAMPLE_COUNTS)
+
+
+SAMPLE_COUNTS = {
+    "BCS": FaultCounter(alarm_count=5, ok_count=10, invalid_count=2),
+    "SSA": FaultCounter(alarm_count=3, ok_count=15, invalid_count=1),
+}
+
+
+@pytest.fixture
+def deferred_loaders(monkeypatch):
+    """Loaders started by the display, run later by the test.
+
+    Loaders run on the calling thread, so results are delivered through
+    direct signal connections without needing a live event loop.
+    """
+    started = []
+    monkeypatch.setattr(
+        fault_count_display.FaultCountLoader,
+        "start",
+        lambda loader: started.append(loader),
+    )
+    return started
+
+
+@pytest.fixture
+def sync_loaders(monkeypatch):
+    """Run each loader to completion as soon as the display starts it."""
+    monkeypatch.setattr(
+        fault_count_display.FaultCountLoader,
+        "start",
+        fault_count_display.FaultCountLoader.run,
+    )
+
+
+class TestBackgroundLoading:
+    @pytest.fixture(autouse=True)
+    def no_bars(self, display):
+        with patch.object(display.plot_window, "addItem"):
+            yield
+
+    def test_fetch_not_on_gui_thread(self, display, deferred_loaders):
+        """Should hand the fetch to a loader instead of blocking."""
+        display.cavity = _counts_cavity(_sample_counts)
+
+        display.load_data()
+
+        display.cavity.get_fault_counts.assert_not_called()
+        [loader] = deferred_loaders
+        assert isinstance(loader, fault_count_display.FaultCountLoader)
+        assert display.status_label.text() == "Loading CM01 cavity 1..."
+        assert display.y_data is None
+
+        loader.run()
+
+        assert display.y_data == ["BCS", "SSA"]
+        assert display.status_label.text() == ""
+
+    def test_cached_counts_not_refetched(self, display, sync_loaders):
+        display.cavity = _counts_cavity(_sample_counts)
+        display.load_data()
+        assert display.y_data == ["BCS", "SSA"]
+
+        display.hide_fault_combo_box.setCurrentText("BCS")
+        assert display.y_data == ["SSA"]
+        display.hide_fault_combo_box.setCurrentIndex(0)
+        assert display.y_data == ["BCS", "SSA"]
+
+        display.load_data()
+        assert display.cavity.get_fault_counts.call_count == 1
+
+    def test_stale_load_dropped(self, display, deferred_loaders):
+        slow = _counts_cavity(
+            lambda start, end, raise_on_error=False: {
+                "BCS": FaultCounter(alarm_count=1)
+            }
+        )
+        display.cavity = slow
+        display.load_data()
+
+        display.cavity = _counts_cavity(_sample_counts)
+        display.load_data()
+        stale_loader, current_loader = deferred_loaders
+        assert stale_loader.is_cancelled
+
+        current_loader.run()
+        stale_loader.run()
+        display._on_loader_finished(stale_loader)
+
+        assert display.y_data == ["BCS", "SSA"]
+        assert display.cached_counts((slow, *display._data_key()[1:])) is None
+        assert stale_loader not in display._loaders
+
+    def test_lru_eviction(self, display, monkeypatch):
+        monkeypatch.setattr(fault_count_display, "FAULT_COUNT_CACHE_SIZE", 2)
+        display.cavity = _counts_cavity(
+            lambda start, end, raise_on_error=False: {}
+        )
+        start = display.start_selector.dateTime()
+
+        keys = []
+        for minutes in (1, 2, 1, 3):
+            display.start_selector.setDateTime(start.addSecs(minutes * 60))
+            display.get_data()
+            keys.append(display._data_key())
+
+        assert display.cavity.get_fault_counts.call_count == 3
+        # The 2-minute range was least recently used
+        assert display.cached_counts(keys[1]) is None
+        assert display.cached_counts(keys[0]) == {}
+        assert display.cached_counts(keys[3]) == {}
+
+    def test_hidden_fault_kept_in_cache(self, display):
+        display.cavity = _counts_cavity(_sample_counts)
+        display.hide_fault_combo_box.blockSignals(True)
+        display.hide_fault_combo_box.setCurrentText("BCS")
+
+        display.get_data()
+
+        assert display.y_data == ["SSA"]
+        assert "BCS" in display.cached_counts(display._data_key())
+
+    def test_load_failure_reported(self, display, sync_loaders):
+        def failing(start, end, raise_on_error=False):
+            raise ConnectionError("archiver down")
+
+        display.cavity = _counts_cavity(failing)
+        display.load_data()
+
+        assert "archiver down" in display.status_label.text()
+        assert display.y_data is None
+        assert display.cached_counts(display._data_key()) is None
+
+    def test_loader_asks_for_archiver_errors(self, display, deferred_loaders):
+        """Should not let the cavity swallow an archiver outage."""
+        display.cavity = _counts_cavity(_sample_counts)
+        display.load_data()
+
+        deferred_loaders[0].run()
+
+        display.cavity.get_fault_counts.assert_called_once_with(
+            *display._data_key()[1:], raise_on_error=True
+        )
+
+    def test_close_does_not_block_on_loaders(self, display, deferred_loaders):
+        """Should detach in-flight loaders instead of waiting on them."""
+        display.cavity = _counts_cavity(_sample_counts)
+        display.load_data()
+        [loader] = deferred_loaders
+
+        with (
+            patch.object(loader, "wait") as mock_wait,
+            patch.object(loader, "terminate") as mock_terminate,
+        ):
+            display.close()
+
+        mock_wait.assert_not_called()
+        mock_terminate.assert_not_called()
+        assert loader.is_cancelled
+        assert not display._loaders
+
+        # A late result reaches nothing
+        loader.run()
+        assert display.y_data is None
+
+
 # Integration Tests
 class TestIntegration:
-    def test_full_workflow(self, display):
+    def test_full_workflow(self, display, sync_loaders):
         """Test complete user workflow."""
         cavity = Mock()
-        cavity.cryomodule = "01"
+        cavity.cryomodule.name = "01"
         cavity.number = 1
         cavity.get_fault_counts = Mock(
             return_value={
@@ -298,20 +492,18 @@ class TestIntegration:
         )
         display.machine.cryomodules["01"].cavities[1] = cavity
 
-        display.cm_combo_box.setCurrentText("01")
-        display.cav_combo_box.setCurrentText("1")
-        display.update_cavity()
-
         with patch.object(display.plot_window, "addItem"):
-            display.update_plot()
+            display.cm_combo_box.setCurrentText("01")
+            display.cav_combo_box.setCurrentText("1")
+            display.update_cavity()
 
         assert len(display.y_data) == 2
         assert display.num_faults == [5, 3]
 
-    def test_workflow_with_filtering(self, display):
+    def test_workflow_with_filtering(self, display, sync_loaders):
         """Test workflow with fault filtering."""
         cavity = Mock()
-        cavity.cryomodule = "01"
+        cavity.cryomodule.name = "01"
         cavity.number = 1
         cavity.get_fault_counts = Mock(
             return_value={
@@ -325,11 +517,9 @@ class TestIntegration:
         )
         display.cavity = cavity
 
-        # Filter BCS
-        display.hide_fault_combo_box.setCurrentText("BCS")
-
         with patch.object(display.plot_window, "addItem"):
-            display.update_plot()
+            # Filter BCS
+            display.hide_fault_combo_box.setCurrentText("BCS")
 
         assert "BCS" not in display.y_data
         assert "SSA" in display.y_data
@@ -0,0 +1,202 @@
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from sc_linac_physics.displays.cavity_display.frontend import subscription_hub
+from sc_linac_physics.displays.cavity_display.frontend.alarm_sidebar import (
+    AlarmSidebarWidget,
+)
+from sc_linac_physics.displays.cavity_display.frontend.audio_manager import (
+    AudioAlertManager,
+)
+from sc_linac_physics.displays.cavity_display.frontend.cavity_widget import (
+    CavityWidget,
+)
+from sc_linac_physics.displays.cavity_display.frontend.subscription_hub import (
+    SubscriptionHub,
+)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+class FakeChannel:
+    """PyDMChannel stand-in; tests push values through its slots."""
+
+    def __init__(self, address, value_slot, connection_slot):
+        self.address = address
+        self.value_slot = value_slot
+        self.connection_slot = connection_slot
+        self.connected = False
+
+    def connect(self):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+
+class FakeCavity:
+    def __init__(self, cm_name="01", number=1):
+        self.number = number
+        self.cryomodule = SimpleNamespace(name=cm_name)
+        self.cavity_widget = CavityWidget()
+
+    def pv_addr(self, suffix):
+        return f"ACCL:L0B:{self.cryomodule.name}{self.number}0:{suffix}"
+
+
+@pytest.fixture
+def hub(qapp):
+    with patch.object(subscription_hub, "PyDMChannel", FakeChannel):
+        hub = SubscriptionHub(frame_interval_ms=10)
+        yield hub
+        hub.close()
+
+
+def push(hub, address, value):
+    hub._channels[address].value_slot(value)
+
+
+def test_one_channel_per_pv(hub):
+    first, second = Mock(), Mock()
+
+    hub.subscribe("PV:A", first)
+    hub.subscribe("PV:A", second)
+
+    assert hub.channel_count == 1
+    push(hub, "PV:A", 5)
+    hub.flush()
+    first.assert_called_once_with(5)
+    second.assert_called_once_with(5)
+
+
+def test_updates_coalesced_within_frame(hub):
+    callback = Mock()
+    hub.subscribe("PV:A", callback)
+
+    for value in (1, 2, 3):
+        push(hub, "PV:A", value)
+    callback.assert_not_called()
+    hub.flush()
+
+    callback.assert_called_once_with(3)
+    assert hub.updates_received == 3
+    assert hub.updates_delivered == 1
+
+
+def test_frame_tick_delivers(hub):
+    callback = Mock()
+    hub.subscribe("PV:A", callback)
+
+    push(hub, "PV:A", 7)
+
+    # The first update of a frame arms the tick, which flushes
+    assert hub._frame_timer.isActive()
+    assert hub._frame_timer.interval() == hub.frame_interval_ms
+    callback.assert_not_called()
+    hub.flush()
+    callback.assert_called_once_with(7)
+    assert not hub._frame_timer.isActive()
+
+
+def test_connection_changes_immediate(hub):
+    on_connection = Mock()
+    hub.subscribe("PV:A", Mock(), on_connection)
+
+    hub._channels["PV:A"].connection_slot(True)
+
+    on_connection.assert_called_once_with(True)
+
+
+def test_failing_subscriber_does_not_block_others(hub):
+    working = Mock()
+    hub.subscribe("PV:A", Mock(side_effect=RuntimeError("boom")))
+    hub.subscribe("PV:B", working)
+
+    push(hub, "PV:A", 1)
+    push(hub, "PV:B", 2)
+    hub.flush()
+
+    working.assert_called_once_with(2)
+
+
+def test_cavity_tile_updated_before_listeners(hub):
+    cavity = FakeCavity()
+    seen = []
+    hub.add_severity_listener(
+        lambda cav, value: seen.append(
+            (value, cav.cavity_widget._last_severity)
+        )
+    )
+    hub.add_description_listener(lambda cav, text: seen.append(text))
+
+    with patch.object(CavityWidget, "change_shape"):
+        hub.subscribe_cavity(cavity)
+        assert hub.channel_count == 3
+        push(hub, cavity.pv_addr("CUDSEVR"), 2)
+        push(hub, cavity.pv_addr("CUDDESC"), " Quench ")
+        push(hub, cavity.pv_addr("CUDSTATUS"), "QCH")
+        hub.flush()
+
+    assert seen == [(2, 2), "Quench"]
+    assert cavity.cavity_widget.cavity_text == "QCH"
+
+
+def test_close_disconnects(hub):
+    hub.subscribe("PV:A", Mock())
+    channel = hub._channels["PV:A"]
+
+    hub.close()
+
+    assert not channel.connected
+    assert hub.channel_count == 0
+
+
+def test_sidebar_and_audio_listen_through_hub(hub):
+    cavities = [FakeCavity("01", 1), FakeCavity("01", 2)]
+    for cavity in cavities:
+        hub.subscribe_cavity(cavity)
+    gui_machine = SimpleNamespace(
+        subscription_hub=hub,
+        linacs=[
+            SimpleNamespace(
+                cryomodules={
+                    "01": SimpleNamespace(
+                        cavities={c.number: c for c in cavities}
+                    )
+                }
+            )
+        ],
+    )
+    sidebar = AlarmSidebarWidget(gui_machine)
+    audio = AudioAlertManager(gui_machine)
+
+    with (
+        patch.object(CavityWidget, "change_shape"),
+        patch.object(audio, "_handle_alarm_severity") as on_alarm,
+    ):
+        audio.start_monitoring()
+        push(hub, cavities[1].pv_addr("CUDSEVR"), 2)
+        hub.flush()
+
+    assert sidebar.alarm_cavities == [cavities[1]]
+    on_alarm.assert_called_once()
+    # Nothing was connected to the tiles themselves
+    assert (
+        cavities[1].cavity_widget.receivers(
+            cavities[1].cavity_widget.last_severity_changed
+        )
+        == 0
+    )
+
+    sidebar.stop_refresh()
+    audio.stop_monitoring()
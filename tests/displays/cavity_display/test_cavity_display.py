@@ -137,3 +137,21 @@ def test_add_header_button(qtbot: QtBot, display, mock_show_display):
     display.add_header_button(test_button, test_display)
 
     assert test_button.receivers(test_button.clicked) > 0
+
+
+def test_close_event_closes_subscription_hub(display):
+    """Closing the display should disconnect the tiles' PV channels."""
+    from PyQt5.QtGui import QCloseEvent
+
+    gui_machine = MagicMock()
+    with (
+        patch.object(display, "gui_machine", gui_machine),
+        patch.object(display, "settings"),
+        patch.object(display, "alarm_sidebar"),
+        patch.object(display, "audio_manager"),
+        patch.object(display, "status_timer"),
+        patch.object(display, "_resize_timer"),
+    ):
+        display.closeEvent(QCloseEvent())
+
+    gui_machine.subscription_hub.close.assert_called_once()
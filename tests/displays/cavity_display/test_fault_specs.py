@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+import pytest
+
+from sc_linac_physics.displays.cavity_display.utils import utils
+from sc_linac_physics.displays.cavity_display.utils.utils import FaultSpec
+from tests.displays.cavity_display.test_utils.utils import (
+    csv_all_row,
+    csv_cav_row,
+    csv_keys,
+    mock_parse,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_spec_cache():
+    utils.fault_specs.cache_clear()
+    yield
+    utils.fault_specs.cache_clear()
+
+
+def test_from_csv_row_parses_values():
+    spec = FaultSpec.from_csv_row(dict(zip(csv_keys, csv_all_row)))
+
+    assert spec.tlc == "BSO"
+    assert spec.level == "ALL"
+    assert spec.pv_prefix == "BSOC:SYSW:2:"
+    assert spec.pv_suffix == "SumyA"
+    assert spec.ok_value == 1.0
+    assert spec.fault_value is None
+    assert spec.severity == 2
+
+
+def test_from_csv_row_key_matches_display_hash():
+    row = dict(zip(csv_keys, csv_cav_row))
+    spec = FaultSpec.from_csv_row(row)
+
+    assert spec.key == utils.display_hash(
+        rack=row["Rack"],
+        fault_condition=row["Faulted If Equal To"],
+        ok_condition=row["OK If Equal To"],
+        tlc=row["Three Letter Code"],
+        suffix=row["PV Suffix"],
+        prefix=row["PV Prefix"],
+    )
+
+
+def test_spec_is_immutable():
+    spec = FaultSpec.from_csv_row(dict(zip(csv_keys, csv_all_row)))
+    with pytest.raises(AttributeError):
+        spec.severity = 0
+
+
+def test_fault_specs_parses_csv_once():
+    with patch.object(utils, "parse_csv", side_effect=mock_parse) as parse:
+        first = utils.fault_specs()
+        second = utils.fault_specs()
+
+    parse.assert_called_once()
+    assert first is second
+    assert isinstance(first, tuple)
+    assert len(first) == len(mock_parse())
+
+
+def test_fault_specs_skips_bad_rows():
+    rows = mock_parse()
+    rows[0]["Severity"] = "not a number"
+
+    with patch.object(utils, "parse_csv", return_value=rows):
+        specs = utils.fault_specs()
+
+    assert len(specs) == len(rows) - 1
+    assert rows[0]["Three Letter Code"] not in {spec.tlc for spec in specs}
+
+
+def test_fault_tlcs_sorted_and_distinct():
+    with patch.object(utils, "parse_csv", side_effect=mock_parse):
+        tlcs = utils.fault_tlcs()
+
+    assert tlcs == sorted(set(tlcs))
+    assert "BSO" in tlcs
+
+
+def test_packaged_csv_parses():
+    specs = utils.fault_specs()
+
+    assert specs
+    assert all(
+        (spec.ok_value is None) != (spec.fault_value is None) for spec in specs
+    )
@@ -1,5 +1,9 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from unittest import mock
+from unittest.mock import MagicMock
+
+from sc_linac_physics.displays.cavity_display.backend.fault import Fault
+from sc_linac_physics.displays.cavity_display.utils.utils import FaultSpec
 
 csv_keys = [
     "Three Letter Code",
@@ -165,3 +169,16 @@ def mock_parse() -> List[Dict[str, str]]:
         all_dict[key] = csv_all_row[index]
 
     return [rack_dict, cav_dict, cm_dict, cryo_dict, ssa_dict, all_dict]
+
+
+def mock_fault_specs() -> Tuple[FaultSpec, ...]:
+    return tuple(FaultSpec.from_csv_row(row) for row in mock_parse())
+
+
+def make_cavity(pv_names, ok_value=0):
+    cavity = MagicMock()
+    cavity.faults = {
+        f"FAULT{i}": Fault(tlc=f"F{i}", severity=2, pv=pv, ok_value=ok_value)
+        for i, pv in enumerate(pv_names)
+    }
+    return cavity
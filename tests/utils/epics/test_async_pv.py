@@ -0,0 +1,299 @@
+# tests/utils/epics/test_async_pv.py
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    CIRCUIT_BREAKERS,
+    AsyncPV,
+    PVCircuitOpenError,
+    PVConfig,
+    PVConnectionError,
+    PVPutError,
+    PVWaitTimeoutError,
+)
+
+
+@pytest.fixture
+def pv():
+    pv = AsyncPV("TEST:PV", config=PVConfig(retry_delay=0))
+    pv.pv.put(0)
+    return pv
+
+
+class TestConnect:
+    async def test_connect_timeout(self, pv):
+        """Test PVConnectionError when the PV never connects"""
+        pv.pv._connected = False
+
+        with pytest.raises(PVConnectionError, match="within 0.05s"):
+            await pv.connect(timeout=0.05)
+
+        assert not pv.pv.connection_callbacks
+
+    async def test_context_manager_disconnects(self, pv):
+        """Test leaving the async context disconnects the PV"""
+        pv.pv.disconnect = Mock()
+
+        async with pv as entered:
+            assert entered is pv
+
+        pv.pv.disconnect.assert_called_once()
+
+
+class TestGet:
+    async def test_get_reads_from_ioc(self, pv):
+        """Test get() falls back to PV.get before any monitor update"""
+        assert await pv.get() == 0
+
+    async def test_get_uses_monitor(self, pv):
+        """Test get() serves the monitored value once it has arrived"""
+        pv.pv._last_update = time.monotonic()
+        pv.pv.get = Mock(return_value=5)
+
+        assert await pv.get() == 5
+        assert pv.pv.get.call_args.kwargs["use_monitor"] is True
+
+
+class TestPut:
+    async def test_put_waits_for_completion(self, pv):
+        """Test put() returns once the completion callback fires"""
+        pv.pv._last_update = time.monotonic()
+
+        await pv.put(3)
+
+        assert pv.pv._get_value == 3
+        # The next get() goes to the IOC until the monitor catches up
+        assert pv.pv._last_update is None
+
+    async def test_put_retries_then_raises(self, pv):
+        """Test PVPutError after max_retries failed attempts"""
+        pv.pv._put_return = 0
+
+        with pytest.raises(PVPutError, match="failed after 3 attempts"):
+            await pv.put(3)
+
+    async def test_put_completion_timeout(self, pv, monkeypatch):
+        """Test a put whose completion never arrives times out"""
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.async_pv.EPICS_PV.put",
+            lambda self, value, **kwargs: 1,
+        )
+        pv.pv.config = PVConfig(max_retries=1)
+
+        with pytest.raises(PVPutError, match="not completed within 0.05s"):
+            await pv.put(3, timeout=0.05)
+
+    async def test_put_no_wait(self, pv, monkeypatch):
+        """Test put(wait=False) does not wait for completion"""
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.async_pv.EPICS_PV.put",
+            lambda self, value, **kwargs: 1,
+        )
+
+        await asyncio.wait_for(pv.put(3, wait=False), 1)
+
+    async def test_put_fails_fast_when_ioc_unreachable(self, pv):
+        """Test put() shares the PV's IOC circuit breaker"""
+        breaker = CIRCUIT_BREAKERS.breaker(pv.pvname)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        with pytest.raises(PVCircuitOpenError):
+            await pv.put(3)
+
+        assert pv.pv._get_value == 0
+
+
+class TestWaitFor:
+    async def test_wakes_on_update(self, pv):
+        """Test an update from another thread ends the wait"""
+        timer = threading.Timer(0.05, pv.pv.put, args=(1,))
+        timer.start()
+        start = time.monotonic()
+
+        value = await pv.wait_for(lambda value: value == 1, poll_interval=10)
+
+        timer.join()
+        assert value == 1
+        assert time.monotonic() - start < 5
+
+    async def test_timeout(self, pv):
+        """Test PVWaitTimeoutError once timeout passes"""
+        with pytest.raises(PVWaitTimeoutError, match="last value 0"):
+            await pv.wait_for(lambda value: value == 1, timeout=0.05)
+
+        assert not pv.pv.callbacks
+
+
+class TestMonitor:
+    async def test_yields_current_value_then_updates(self, pv):
+        """Test monitor() yields the current value, then updates"""
+        values = []
+
+        async def collect():
+            async for value in pv.monitor():
+                values.append(value)
+                if value == 2:
+                    break
+
+        task = asyncio.ensure_future(collect())
+        while not values:
+            await asyncio.sleep(0.01)
+        pv.pv.put(1)
+        pv.pv.put(2)
+        await asyncio.wait_for(task, 5)
+
+        assert values[0] == 0
+        assert values[-2:] == [1, 2]
+        assert not pv.pv.callbacks
+
+
+# Against the caproto simulation service. The in-process epics module is a
+# fake, so the client runs in its own interpreter.
+
+SIM_STARTUP_TIMEOUT = 120
+
+SIM_SCRIPT = """
+import sys
+from sc_linac_physics.utils.simulation.sc_linac_physics_service import main
+sys.argv = ["sc-sim", "--interfaces", "127.0.0.1"]
+main()
+"""
+
+CLIENT_SCRIPT = """
+import asyncio
+import json
+
+from sc_linac_physics.utils.epics import AsyncPV, PVWaitTimeoutError
+from sc_linac_physics.utils.sc_linac.linac_utils import (
+    LINAC_TUPLES,
+    build_cavity_pv,
+)
+
+SSA = "ACCL:L0B:0110:SSA:"
+
+
+async def main():
+    results = {}
+
+    acon = AsyncPV("ACCL:L0B:0110:ACON")
+    await acon.put(12.5)
+    results["put_get"] = await acon.get()
+
+    status = AsyncPV(SSA + "StatusMsg")
+    await AsyncPV(SSA + "PowerOff").put(1)
+    results["ssa_off"] = await status.wait_for(lambda v: v == 2, timeout=10)
+    await AsyncPV(SSA + "PowerOn").put(1)
+    results["ssa_on"] = await status.wait_for(lambda v: v == 3, timeout=10)
+
+    try:
+        await status.wait_for(lambda v: v == 99, timeout=0.2)
+    except PVWaitTimeoutError:
+        results["wait_timeout"] = True
+
+    monitor = acon.monitor()
+    results["monitor"] = [await monitor.__anext__()]
+    update = asyncio.ensure_future(monitor.__anext__())
+    await asyncio.sleep(0.5)
+    await acon.put(13.5)
+    results["monitor"].append(await asyncio.wait_for(update, 10))
+    await monitor.aclose()
+
+    names = [
+        build_cavity_pv(linac, cm, cav, "AACTMEAN")
+        for linac, cryomodules in LINAC_TUPLES
+        for cm in cryomodules
+        for cav in range(1, 9)
+    ]
+    values = await asyncio.gather(*(AsyncPV(name).get() for name in names))
+    results["concurrent_gets"] = len([v for v in values if v is not None])
+    results["concurrent_total"] = len(names)
+
+    print(json.dumps(results))
+
+
+asyncio.run(main())
+"""
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def sim_env():
+    """Run the simulation service on a private port"""
+    port = str(_free_port())
+    env = dict(
+        os.environ,
+        EPICS_CA_ADDR_LIST="127.0.0.1",
+        EPICS_CA_AUTO_ADDR_LIST="NO",
+        EPICS_CA_SERVER_PORT=port,
+        EPICS_CAS_SERVER_PORT=port,
+    )
+    sim = subprocess.Popen(
+        [sys.executable, "-c", SIM_SCRIPT],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    started = threading.Event()
+
+    def watch_output():
+        for line in sim.stdout:
+            if "Server startup complete" in line:
+                started.set()
+
+    threading.Thread(target=watch_output, daemon=True).start()
+
+    try:
+        if not started.wait(SIM_STARTUP_TIMEOUT):
+            pytest.skip("Simulation service did not start")
+        yield env
+    finally:
+        sim.terminate()
+        sim.wait(timeout=10)
+
+
+@pytest.fixture(scope="module")
+def sim_results(sim_env):
+    client = subprocess.run(
+        [sys.executable, "-c", CLIENT_SCRIPT],
+        env=sim_env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert client.returncode == 0, client.stderr
+    return json.loads(client.stdout.strip().splitlines()[-1])
+
+
+class TestAgainstSimulation:
+    def test_put_then_get(self, sim_results):
+        assert sim_results["put_get"] == 12.5
+
+    def test_wait_for_ssa_status(self, sim_results):
+        assert sim_results["ssa_off"] == 2
+        assert sim_results["ssa_on"] == 3
+
+    def test_wait_for_timeout(self, sim_results):
+        assert sim_results["wait_timeout"]
+
+    def test_monitor(self, sim_results):
+        assert sim_results["monitor"] == [12.5, 13.5]
+
+    def test_concurrent_gets(self, sim_results):
+        """Test every cavity is read from one event loop"""
+        assert sim_results["concurrent_gets"] == sim_results["concurrent_total"]
@@ -0,0 +1,222 @@
+# tests/utils/epics/test_breaker.py
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from sc_linac_physics.utils.epics.breaker import backoff_delay, ioc_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def upper(low, high):
+    """Jitter source that always picks the full delay"""
+    return high
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        "ACCL:L0B:0110",
+        failure_threshold=3,
+        cooldown=5.0,
+        max_cooldown=30.0,
+        clock=clock,
+        uniform=upper,
+    )
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+class TestIocKey:
+    def test_host(self):
+        assert ioc_key("ACCL:L0B:0110:ACON", "ioc-a:5064") == "ioc-a:5064"
+
+    def test_unknown_host(self):
+        """Test a PV not yet connected is its own key"""
+        assert ioc_key("ACCL:L0B:0110:ACON") == "ACCL:L0B:0110:ACON"
+
+
+class TestBackoffDelay:
+    def test_doubles_per_attempt(self):
+        assert [backoff_delay(0.5, n, uniform=upper) for n in (1, 2, 3)] == [
+            0.5,
+            1.0,
+            2.0,
+        ]
+
+    def test_capped(self):
+        assert backoff_delay(5.0, 10, cap=30.0, uniform=upper) == 30.0
+
+    def test_jitter_range(self):
+        for _ in range(100):
+            assert 1.0 <= backoff_delay(0.5, 3) <= 2.0
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self, breaker):
+        """Test the breaker opens on the Nth consecutive failure"""
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.retry_in() == 5.0
+
+    def test_success_resets_count(self, breaker):
+        """Test failures must be consecutive"""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_one_probe(self, breaker, clock):
+        """Test only one call gets through once the cooldown passes"""
+        trip(breaker)
+        clock.now += 5.0
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_probe_success_closes(self, breaker, clock):
+        trip(breaker)
+        clock.now += 5.0
+        breaker.allow()
+
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.status().failures == 0
+
+    def test_probe_failure_doubles_cooldown(self, breaker, clock):
+        """Test each failed probe doubles the cooldown, up to the cap"""
+        trip(breaker)
+        cooldowns = []
+        for _ in range(4):
+            clock.now += breaker.retry_in()
+            assert breaker.allow()
+            breaker.record_failure()
+            cooldowns.append(breaker.retry_in())
+
+        assert cooldowns == [10.0, 20.0, 30.0, 30.0]
+        assert breaker.state is CircuitState.OPEN
+
+    def test_late_failures_keep_cooldown(self, breaker, clock):
+        """Test calls that started before the trip don't extend it"""
+        trip(breaker)
+        clock.now += 1.0
+
+        breaker.record_failure()
+
+        assert breaker.retry_in() == 4.0
+
+    def test_lost_probe_is_replaced(self, breaker, clock):
+        """Test another probe is allowed if one never reports back"""
+        trip(breaker)
+        clock.now += 5.0
+        assert breaker.allow()
+
+        clock.now += 5.0
+
+        assert breaker.allow()
+
+    def test_reset(self, breaker):
+        trip(breaker)
+
+        breaker.reset()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker("X", failure_threshold=0)
+
+
+class TestCircuitBreakerRegistry:
+    @pytest.fixture
+    def registry(self, clock):
+        return CircuitBreakerRegistry(failure_threshold=2, clock=clock)
+
+    def test_pvs_share_ioc_breaker(self, registry):
+        """Test PVs served by one IOC share a breaker, whatever their names"""
+        acon = registry.breaker("ACCL:L0B:0110:ACON", host="ioc-a:5064")
+
+        assert registry.breaker("ACCL:L0B:0120:ACON", host="ioc-a:5064") is acon
+        assert (
+            registry.breaker("ACCL:L0B:0110:SSA:StatusMsg", host="ioc-b:5064")
+            is not acon
+        )
+        assert registry.breaker("ACCL:L0B:0110:PDES") is not acon
+
+    def test_remembers_host(self, registry):
+        """Test a PV's breaker can be found by name once it connected"""
+        acon = registry.breaker("ACCL:L0B:0110:ACON", host="ioc-a:5064")
+
+        assert registry.breaker("ACCL:L0B:0110:ACON") is acon
+
+    def test_state_and_status(self, registry):
+        """Test unreachable IOCs can be queried by PV name"""
+        assert registry.state("ACCL:L0B:0110:ACON") is CircuitState.CLOSED
+        assert registry.status() == []
+
+        breaker = registry.breaker("ACCL:L0B:0110:ACON", host="ioc-a:5064")
+        registry.breaker("ACCL:L0B:0120:ACON", host="ioc-a:5064")
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert not registry.is_reachable("ACCL:L0B:0120:ACON")
+        assert registry.is_reachable("ACCL:L0B:0110:PDES")
+        [status] = registry.status()
+        assert status.key == "ioc-a:5064"
+        assert status.state is CircuitState.OPEN
+        assert status.failures == 2
+
+    def test_reset_one(self, registry):
+        for name in ("ACCL:L0B:0110:ACON", "ACCL:L0B:0120:ACON"):
+            trip(registry.breaker(name))
+
+        registry.reset("ACCL:L0B:0110:ACON")
+
+        assert registry.is_reachable("ACCL:L0B:0110:ACON")
+        assert not registry.is_reachable("ACCL:L0B:0120:ACON")
+
+    def test_clear_forgets_hosts(self, registry):
+        registry.breaker("ACCL:L0B:0110:ACON", host="ioc-a:5064")
+
+        registry.clear()
+
+        assert registry.breaker("ACCL:L0B:0110:ACON").key == (
+            "ACCL:L0B:0110:ACON"
+        )
+
+    def test_custom_key_func(self, registry):
+        """Test the key function can group PVs by rack"""
+        registry.key_func = lambda pvname, host: pvname.split(":")[1]
+
+        assert registry.breaker("ACCL:L0B:0110:ACON") is registry.breaker(
+            "ACCL:L0B:0120:ACON"
+        )
@@ -1,11 +1,16 @@
 # tests/utils/epics/test_core.py
 # Get reference to the FakeEPICS_PV that was injected
 import sys
+from unittest.mock import Mock
 
 import pytest
 
 from sc_linac_physics.utils.epics import (
+    CIRCUIT_BREAKERS,
     PV,
+    PVBatch,
+    PVConfig,
+    PVCircuitOpenError,
     PVConnectionError,
     PVGetError,
     PVPutError,
@@ -182,6 +187,96 @@ class TestPVGet:
         assert result == 42.0
 
 
+class TestPVGetMaxAge:
+    @pytest.fixture(autouse=True)
+    def monitor_events(self, monkeypatch):
+        """Let tests call run_callbacks() to simulate a monitor update"""
+        monkeypatch.setattr(
+            FakeEPICS_PV, "run_callbacks", lambda self: None, raising=False
+        )
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.core.monotonic", lambda: now[0]
+        )
+        return now
+
+    @pytest.fixture
+    def recorded_gets(self, monkeypatch):
+        calls = []
+        original_get = FakeEPICS_PV.get
+
+        def recording_get(self, *args, use_monitor=None, **kwargs):
+            calls.append(use_monitor)
+            return original_get(self)
+
+        monkeypatch.setattr(FakeEPICS_PV, "get", recording_get)
+        return calls
+
+    def test_fresh_monitor_skips_retry_layer(self, clock, monkeypatch):
+        """Test a fresh monitored value is returned without a network get"""
+        pv = PV("TEST:PV")
+        pv.run_callbacks()
+        clock[0] += 0.5
+
+        def no_network(*args, **kwargs):
+            raise AssertionError("network get")
+
+        monkeypatch.setattr(pv, "_execute_with_retry", no_network)
+        assert pv.get(max_age=1.0) == 42.0
+
+    def test_stale_monitor_reads_from_ioc(self, clock, recorded_gets):
+        """Test a stale monitored value falls back to a network get"""
+        pv = PV("TEST:PV")
+        pv.run_callbacks()
+        clock[0] += 2.0
+
+        assert pv.get(max_age=1.0) == 42.0
+        assert recorded_gets == [False]
+
+    def test_network_read_refreshes_cache(self, clock, recorded_gets):
+        """Test a fallback network read counts as a fresh value"""
+        pv = PV("TEST:PV")
+
+        pv.get(max_age=1.0)
+        clock[0] += 0.5
+        pv.get(max_age=1.0)
+
+        assert recorded_gets == [False, True]
+
+    def test_config_default(self, clock, recorded_gets):
+        """Test PVConfig.max_age applies when max_age is not passed"""
+        pv = PV("TEST:PV", config=PVConfig(max_age=1.0))
+        pv.run_callbacks()
+
+        pv.get()
+        clock[0] += 2.0
+        pv.get()
+
+        assert recorded_gets == [True, False]
+
+    def test_unmonitored_pv_always_reads_from_ioc(self, clock, recorded_gets):
+        """Test max_age never serves a PV without a monitor"""
+        pv = PV("TEST:PV", auto_monitor=False)
+        pv.run_callbacks()
+
+        pv.get(max_age=1.0)
+        pv.get(max_age=1.0)
+
+        assert recorded_gets == [False, False]
+
+    def test_disconnected_pv_not_served_from_cache(self, clock):
+        """Test a disconnected PV does not return its cached value"""
+        pv = PV("TEST:PV")
+        pv.run_callbacks()
+        pv._connected = False
+
+        with pytest.raises(PVConnectionError):
+            pv.get(max_age=1.0, timeout=0.01)
+
+
 # Test Put Operations
 class TestPVPut:
     def test_successful_put(self, connected_pv):
@@ -250,6 +345,174 @@ class TestPVPut:
         # Should not raise
 
 
+LLRF_IOC = "ioc-l0b-llrf:5064"
+SSA_IOC = "ioc-l0b-ssa:5064"
+
+
+def ioc_pv(pvname, host=LLRF_IOC, **kwargs):
+    """A PV whose channel has connected to the IOC at host"""
+    pv = PV(pvname, **kwargs)
+    pv._args = {"host": host}
+    return pv
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+class TestPVCircuitBreaker:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(CIRCUIT_BREAKERS, "_clock", lambda: now[0])
+        return now
+
+    @pytest.fixture
+    def get_calls(self, monkeypatch):
+        """Make every network get time out, counting the calls"""
+        calls = []
+
+        def failing_get(self, *args, **kwargs):
+            calls.append(self.pvname)
+            return None
+
+        monkeypatch.setattr(FakeEPICS_PV, "get", failing_get)
+        return calls
+
+    def trip(self, pv):
+        for _ in range(CIRCUIT_BREAKERS.failure_threshold):
+            with pytest.raises(PVGetError):
+                pv.get()
+
+    def test_fails_fast_once_open(self, clock, get_calls):
+        """Test an IOC's PVs fail fast after repeated timeouts"""
+        pv = ioc_pv("ACCL:L0B:0110:ACON")
+        self.trip(pv)
+        assert not CIRCUIT_BREAKERS.is_reachable("ACCL:L0B:0110:ACON")
+        get_calls.clear()
+
+        with pytest.raises(PVCircuitOpenError, match=LLRF_IOC):
+            ioc_pv("ACCL:L0B:0120:PDES").get()
+        with pytest.raises(PVConnectionError):
+            pv.put(1.0)
+
+        assert get_calls == []
+
+    def test_other_iocs_unaffected(self, clock, get_calls):
+        """Test PVs with the same prefix on another IOC still try"""
+        self.trip(ioc_pv("ACCL:L0B:0110:ACON"))
+
+        with pytest.raises(PVGetError):
+            ioc_pv("ACCL:L0B:0110:SSA:StatusMsg", host=SSA_IOC).get()
+
+    def test_bad_pv_does_not_block_neighbours(self, clock):
+        """Test a PV that never connected does not count against an IOC"""
+        bad = PV("ACCL:L0B:0110:SSA:StatusMsg", require_connection=False)
+        bad._connected = False
+
+        for _ in range(CIRCUIT_BREAKERS.failure_threshold + 1):
+            with pytest.raises(PVConnectionError):
+                bad.get()
+
+        assert ioc_pv("ACCL:L0B:0110:ADES").get() == 42.0
+        assert CIRCUIT_BREAKERS.status() == []
+
+    def test_refused_operations_not_counted(self, clock, monkeypatch):
+        """Test errors the IOC answered with are the PV's own"""
+        monkeypatch.setattr(
+            FakeEPICS_PV,
+            "get",
+            lambda self, **kw: (_ for _ in ()).throw(RuntimeError("bad")),
+        )
+        pv = ioc_pv("ACCL:L0B:0110:ACON")
+
+        for _ in range(CIRCUIT_BREAKERS.failure_threshold + 1):
+            with pytest.raises(PVGetError):
+                pv.get()
+
+        assert CIRCUIT_BREAKERS.is_reachable("ACCL:L0B:0110:ACON")
+
+    def test_disconnect_counted(self, clock):
+        """Test a channel that connected before and dropped counts"""
+        pv = ioc_pv("ACCL:L0B:0110:ACON")
+        pv._connected = False
+
+        for _ in range(CIRCUIT_BREAKERS.failure_threshold):
+            with pytest.raises(PVConnectionError):
+                pv.get()
+
+        assert not CIRCUIT_BREAKERS.is_reachable("ACCL:L0B:0110:ACON")
+
+    def test_half_open_probe(self, clock, get_calls, monkeypatch):
+        """Test one single-attempt probe after the cooldown closes it"""
+        pv = ioc_pv("ACCL:L0B:0110:ACON")
+        self.trip(pv)
+        clock[0] += CIRCUIT_BREAKERS.max_cooldown
+        get_calls.clear()
+
+        with pytest.raises(PVGetError, match="after 1 attempts"):
+            pv.get()
+        assert len(get_calls) == 1
+        with pytest.raises(PVCircuitOpenError):
+            pv.get()
+
+        clock[0] += CIRCUIT_BREAKERS.max_cooldown
+        monkeypatch.setattr(FakeEPICS_PV, "get", lambda self, **kw: 42.0)
+
+        assert pv.get() == 42.0
+        assert CIRCUIT_BREAKERS.is_reachable("ACCL:L0B:0110:ACON")
+
+    def test_get_many_skips_unreachable_ioc(self, clock, monkeypatch):
+        """Test no pipelined read is sent while the breaker is open"""
+        pv = ioc_pv("ACCL:L0B:0110:ACON", auto_monitor=False)
+        trip(CIRCUIT_BREAKERS.breaker(pv.pvname, host=LLRF_IOC))
+        issued = []
+        monkeypatch.setattr(
+            sys.modules["epics"].ca,
+            "get",
+            lambda chid, **kwargs: issued.append(chid),
+        )
+
+        assert PV.get_many([pv], raise_on_error=False) == [None]
+        assert issued == []
+
+    def test_get_many_reports_missing_reply(self, clock, monkeypatch):
+        pv = ioc_pv("ACCL:L0B:0110:ACON", auto_monitor=False)
+        breaker = CIRCUIT_BREAKERS.breaker(pv.pvname, host=LLRF_IOC)
+        monkeypatch.setattr(breaker, "record_failure", Mock())
+        monkeypatch.setattr(
+            sys.modules["epics"].ca, "get_complete", lambda chid, **kw: None
+        )
+
+        PV.get_many([pv])
+
+        breaker.record_failure.assert_called_once()
+
+    def test_put_many_reports_missing_completion(self, clock, monkeypatch):
+        pv = ioc_pv("ACCL:L0B:0110:ACON")
+        breaker = CIRCUIT_BREAKERS.breaker(pv.pvname, host=LLRF_IOC)
+        monkeypatch.setattr(breaker, "record_failure", Mock())
+        monkeypatch.setattr(FakeEPICS_PV, "put", lambda self, value, **kw: 1)
+
+        assert PV.put_many([pv], [1], timeout=0.01, raise_on_error=False) == [
+            False
+        ]
+        breaker.record_failure.assert_called()
+
+    def test_opt_out(self, clock, get_calls):
+        """Test PVConfig(circuit_breaker=False) always tries"""
+        pv = ioc_pv(
+            "ACCL:L0B:0110:ACON", config=PVConfig(circuit_breaker=False)
+        )
+
+        for _ in range(CIRCUIT_BREAKERS.failure_threshold + 1):
+            with pytest.raises(PVGetError):
+                pv.get()
+
+        assert CIRCUIT_BREAKERS.is_reachable("ACCL:L0B:0110:ACON")
+
+
 class TestPVGetPutParameters:
     def test_get_as_string(self, connected_pv):
         """Test get with as_string=True"""
@@ -566,10 +829,12 @@ class TestPVBatchOperations:
 
         original_put = FakeEPICS_PV.put
 
-        def selective_put(self, *args, **kwargs):
+        def selective_put(self, *args, callback=None, **kwargs):
             # Always fail for PV1 (middle PV)
             if "PV1" in self.pvname:
                 return 0  # Failure
+            if callback is not None:
+                callback(pvname=self.pvname)
             return 1  # Success
 
         FakeEPICS_PV.put = selective_put
@@ -594,6 +859,226 @@ class TestPVBatchOperations:
         finally:
             FakeEPICS_PV.put = original_put
 
+    def test_get_many_sends_all_reads_before_waiting(self, monkeypatch):
+        """Test unmonitored reads are all issued before any is collected"""
+        pvs = [PV(f"TEST:PV{i}", auto_monitor=False) for i in range(3)]
+        calls = []
+        ca = sys.modules["epics"].ca
+
+        def issue(chid, wait=True, **kwargs):
+            calls.append(("issue", chid.pvname, wait))
+
+        def complete(chid, timeout=None, **kwargs):
+            calls.append(("complete", chid.pvname, None))
+            return 7.0
+
+        monkeypatch.setattr(ca, "get", issue)
+        monkeypatch.setattr(ca, "get_complete", complete)
+
+        assert PV.get_many(pvs) == [7.0, 7.0, 7.0]
+        assert [call[0] for call in calls] == ["issue"] * 3 + ["complete"] * 3
+        assert all(call[2] is False for call in calls[:3])
+
+    def test_get_many_falls_back_to_get(self, monkeypatch):
+        """Test a PV without a pipelined reply is read with get()"""
+        pvs = [PV(f"TEST:PV{i}", auto_monitor=False) for i in range(2)]
+        ca = sys.modules["epics"].ca
+        monkeypatch.setattr(
+            ca,
+            "get_complete",
+            lambda chid, **kwargs: None if "PV0" in chid.pvname else 7.0,
+        )
+
+        assert PV.get_many(pvs) == [42.0, 7.0]
+
+    def test_get_many_monitored_pvs_not_issued(self, monkeypatch):
+        """Test monitored PVs are read from their monitor"""
+        pvs = [PV(f"TEST:PV{i}") for i in range(2)]
+        ca = sys.modules["epics"].ca
+        issued = []
+        monkeypatch.setattr(
+            ca, "get", lambda chid, **kwargs: issued.append(chid)
+        )
+
+        assert PV.get_many(pvs) == [42.0, 42.0]
+        assert issued == []
+
+    def test_put_many_sends_all_puts_before_waiting(self):
+        """Test puts are sent without blocking and awaited together"""
+        pvs = [PV(f"TEST:PV{i}") for i in range(3)]
+        callbacks = []
+        original_put = FakeEPICS_PV.put
+
+        def deferred_put(self, value, wait=True, callback=None, **kwargs):
+            assert wait is False
+            callbacks.append(callback)
+            # Completions only arrive once every put has been sent
+            if len(callbacks) == len(pvs):
+                for done in callbacks:
+                    done(pvname=self.pvname)
+            return 1
+
+        FakeEPICS_PV.put = deferred_put
+        try:
+            results = PV.put_many(pvs, [1, 2, 3], timeout=1.0)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert results == [True, True, True]
+
+    def test_put_many_unconfirmed_put_fails(self):
+        """Test a put without a completion by the deadline is a failure"""
+        pvs = [PV(f"TEST:PV{i}") for i in range(2)]
+        original_put = FakeEPICS_PV.put
+
+        def silent_put(self, value, callback=None, **kwargs):
+            if "PV0" in self.pvname:
+                callback(pvname=self.pvname)
+            return 1
+
+        FakeEPICS_PV.put = silent_put
+        try:
+            results = PV.put_many(
+                pvs, [1, 2], timeout=0.01, raise_on_error=False
+            )
+            with pytest.raises(PVPutError, match="not completed"):
+                PV.put_many(pvs, [1, 2], timeout=0.01)
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert results == [True, False]
+
+    def test_put_many_resends_unconfirmed_puts(self, monkeypatch):
+        """Test only unconfirmed puts are sent again, and may then complete"""
+        pvs = [PV(f"TEST:PV{i}") for i in range(2)]
+        sent = []
+
+        def first_completion_lost(self, value, callback=None, **kwargs):
+            sent.append(self.pvname)
+            if self.pvname == "TEST:PV0" or sent.count("TEST:PV1") > 1:
+                callback(pvname=self.pvname)
+            return 1
+
+        monkeypatch.setattr(FakeEPICS_PV, "put", first_completion_lost)
+
+        assert PV.put_many(pvs, [1, 2], timeout=0.01) == [True, True]
+        assert sent == ["TEST:PV0", "TEST:PV1", "TEST:PV1"]
+
+    def test_put_many_gives_up_after_max_retries(self, monkeypatch):
+        pv = PV("TEST:PV0")
+        sent = []
+        monkeypatch.setattr(
+            FakeEPICS_PV,
+            "put",
+            lambda self, value, **kw: sent.append(value) or 1,
+        )
+
+        with pytest.raises(PVPutError, match="after 3 attempts"):
+            PV.put_many([pv], [1], timeout=0.01)
+        assert sent == [1] * PV.default_config.max_retries
+
+    def test_put_many_no_wait_skips_callbacks(self):
+        """Test wait=False sends puts without completion callbacks"""
+        pvs = [PV(f"TEST:PV{i}") for i in range(2)]
+        seen = []
+        original_put = FakeEPICS_PV.put
+
+        def recording_put(self, value, callback=None, **kwargs):
+            seen.append(callback)
+            return 1
+
+        FakeEPICS_PV.put = recording_put
+        try:
+            assert PV.put_many(pvs, [1, 2], wait=False) == [True, True]
+        finally:
+            FakeEPICS_PV.put = original_put
+
+        assert seen == [None, None]
+
+    def test_batch_create_shares_one_deadline(self, monkeypatch):
+        """Test later PVs only get what is left of the batch deadline"""
+        clock = iter([100.0, 100.0, 103.0, 106.0])
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.core.time", lambda: next(clock)
+        )
+        timeouts = []
+        original_wait = FakeEPICS_PV.wait_for_connection
+
+        def record_wait(self, timeout=None):
+            timeouts.append(timeout)
+            return False
+
+        FakeEPICS_PV.wait_for_connection = record_wait
+        try:
+            PV.batch_create(
+                ["PV1", "PV2", "PV3"],
+                connection_timeout=5.0,
+                require_connection=False,
+            )
+        finally:
+            FakeEPICS_PV.wait_for_connection = original_wait
+
+        assert timeouts == [5.0, 2.0, 0.0]
+
+
+class TestPVBatchConnect:
+    @pytest.fixture
+    def fake_ca(self, monkeypatch):
+        ca = sys.modules["epics"].ca
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.batch.sleep", lambda _: None
+        )
+        monkeypatch.setattr(
+            ca, "create_channel", lambda name, **kwargs: f"chid:{name}"
+        )
+        return ca
+
+    def test_connect_empty_list(self):
+        assert PVBatch.connect([]) == []
+
+    def test_connect_creates_all_channels_before_waiting(
+        self, fake_ca, monkeypatch
+    ):
+        events = []
+
+        def create_channel(name, **kwargs):
+            events.append(("create", name))
+            return f"chid:{name}"
+
+        def is_connected(chid):
+            events.append(("check", chid))
+            return True
+
+        monkeypatch.setattr(fake_ca, "create_channel", create_channel)
+        monkeypatch.setattr(fake_ca, "isConnected", is_connected)
+
+        assert PVBatch.connect(["PV1", "PV2"], timeout=1.0) == [True, True]
+        assert events[:2] == [("create", "PV1"), ("create", "PV2")]
+
+    def test_connect_reports_unconnected_after_deadline(
+        self, fake_ca, monkeypatch
+    ):
+        monkeypatch.setattr(
+            fake_ca, "isConnected", lambda chid: chid != "chid:DEAD"
+        )
+        clock = iter([0.0, 0.5, 1.0, 1.5])
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.batch.time", lambda: next(clock)
+        )
+
+        assert PVBatch.connect(["PV1", "DEAD"], timeout=1.0) == [True, False]
+
+    def test_connect_failed_channel_creation(self, fake_ca, monkeypatch):
+        def create_channel(name, **kwargs):
+            if name == "BAD":
+                raise RuntimeError("bad name")
+            return f"chid:{name}"
+
+        monkeypatch.setattr(fake_ca, "create_channel", create_channel)
+        monkeypatch.setattr(fake_ca, "isConnected", lambda chid: True)
+
+        assert PVBatch.connect(["BAD", "PV1"], timeout=0) == [False, True]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
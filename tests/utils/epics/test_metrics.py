@@ -0,0 +1,209 @@
+# tests/utils/epics/test_metrics.py
+import csv
+import json
+import sys
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVBatch,
+    PVConnectionError,
+    PVGetError,
+    PVMetrics,
+    PV_METRICS,
+)
+from sc_linac_physics.utils.epics.metrics import ioc_prefix
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep(monkeypatch):
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.epics.core.sleep", lambda _: None
+    )
+
+
+@pytest.fixture
+def metrics():
+    """PV_METRICS, enabled and empty for the test"""
+    PV_METRICS.clear()
+    PV_METRICS.enable()
+    yield PV_METRICS
+    PV_METRICS.disable()
+    PV_METRICS.clear()
+
+
+def row_for(metrics, name, operation, scope="pv"):
+    [row] = [
+        row
+        for row in metrics.rows(scope)
+        if row["name"] == name and row["operation"] == operation
+    ]
+    return row
+
+
+class TestIocPrefix:
+    @pytest.mark.parametrize(
+        "pvname, prefix",
+        [
+            ("ACCL:L0B:0110:ACON", "ACCL:L0B:0110"),
+            ("ACCL:L0B:0110:SSA:StatusMsg", "ACCL:L0B:0110"),
+            ("TEST:PV", "TEST"),
+            ("PV", "PV"),
+        ],
+    )
+    def test_prefix(self, pvname, prefix):
+        assert ioc_prefix(pvname) == prefix
+
+
+class TestPVMetrics:
+    def test_record(self):
+        metrics = PVMetrics()
+        metrics.record("ACCL:L0B:0110:ACON", "get", 0.002)
+        metrics.record("ACCL:L0B:0110:ACON", "get", 2.0, ok=False, retries=2)
+
+        row = row_for(metrics, "ACCL:L0B:0110:ACON", "get")
+
+        assert row["calls"] == 2
+        assert row["failures"] == 1
+        assert row["retries"] == 2
+        assert row["total_s"] == pytest.approx(2.002)
+        assert row["max_s"] == 2.0
+        assert row["le_0.005"] == 1
+        assert row["le_5.0"] == 1
+
+    def test_prefix_rollup(self):
+        """Test rows can be rolled up by IOC prefix"""
+        metrics = PVMetrics()
+        metrics.record("ACCL:L0B:0110:ACON", "get", 0.1, ok=False)
+        metrics.record("ACCL:L0B:0110:PDES", "get", 0.3)
+        metrics.record("ACCL:L0B:0120:ACON", "get", 0.1)
+
+        row = row_for(metrics, "ACCL:L0B:0110", "get", scope="prefix")
+
+        assert row["calls"] == 2
+        assert row["failures"] == 1
+        assert row["max_s"] == 0.3
+        assert len(metrics.rows("prefix")) == 2
+
+    def test_top(self):
+        metrics = PVMetrics()
+        metrics.record("A:B:C:FAST", "get", 0.001)
+        metrics.record("A:B:C:SLOW", "get", 3.0)
+
+        assert [row["name"] for row in metrics.top(1)] == ["A:B:C:SLOW"]
+
+    def test_invalid_scope(self):
+        with pytest.raises(ValueError):
+            PVMetrics().rows("rack")
+
+    def test_dump_json(self, tmp_path):
+        metrics = PVMetrics()
+        metrics.record("ACCL:L0B:0110:ACON", "put", 0.01, timeouts=1)
+
+        path = metrics.dump(str(tmp_path / "metrics.json"))
+
+        with open(path) as f:
+            report = json.load(f)
+        assert report["pvs"][0]["timeouts"] == 1
+        assert report["prefixes"][0]["name"] == "ACCL:L0B:0110"
+
+    def test_dump_csv(self, tmp_path):
+        metrics = PVMetrics()
+        metrics.record("ACCL:L0B:0110:ACON", "put", 0.01)
+
+        path = metrics.dump(str(tmp_path / "metrics.csv"))
+
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        assert [(row["scope"], row["name"]) for row in rows] == [
+            ("pv", "ACCL:L0B:0110:ACON"),
+            ("prefix", "ACCL:L0B:0110"),
+        ]
+
+    def test_dump_at_exit(self, tmp_path, monkeypatch):
+        """Test enable(dump_path) registers a dump at exit"""
+        registered = []
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.metrics.atexit.register",
+            registered.append,
+        )
+        metrics = PVMetrics()
+        metrics.enable(str(tmp_path / "metrics.json"))
+        metrics.record("ACCL:L0B:0110:ACON", "get", 0.01)
+
+        [dump] = registered
+        dump()
+
+        assert (tmp_path / "metrics.json").exists()
+
+    def test_dump_needs_path(self):
+        with pytest.raises(ValueError):
+            PVMetrics().dump()
+
+
+class TestInstrumentation:
+    def test_disabled_records_nothing(self):
+        PV_METRICS.clear()
+
+        PV("ACCL:L0B:0110:ACON").get()
+
+        assert PV_METRICS.rows() == []
+
+    def test_get(self, metrics):
+        PV("ACCL:L0B:0110:ACON").get()
+
+        row = row_for(metrics, "ACCL:L0B:0110:ACON", "get")
+        assert row["calls"] == 1
+        assert row["failures"] == 0
+
+    def test_get_retries_and_timeouts(self, metrics, monkeypatch):
+        """Test a failing get records its retries and timeouts"""
+        monkeypatch.setattr(FakeEPICS_PV, "get", lambda self, **kw: None)
+
+        with pytest.raises(PVGetError):
+            PV("ACCL:L0B:0110:ACON").get()
+
+        row = row_for(metrics, "ACCL:L0B:0110:ACON", "get")
+        assert row["failures"] == 1
+        assert row["retries"] == 2
+        assert row["timeouts"] == 3
+
+    def test_put_timeout(self, metrics, monkeypatch):
+        """Test a put with wait that times out (-1) counts as a timeout"""
+        results = iter([-1, 1])
+        monkeypatch.setattr(
+            FakeEPICS_PV, "put", lambda self, value, **kw: next(results)
+        )
+
+        PV("ACCL:L0B:0110:ACON").put(1.0)
+
+        row = row_for(metrics, "ACCL:L0B:0110:ACON", "put")
+        assert (row["calls"], row["failures"]) == (1, 0)
+        assert (row["retries"], row["timeouts"]) == (1, 1)
+
+    def test_reconnect(self, metrics):
+        """Test finding a PV disconnected records a connect call"""
+        pv = PV("ACCL:L0B:0110:ACON")
+        pv._connected = False
+
+        with pytest.raises(PVConnectionError):
+            pv.get()
+
+        row = row_for(metrics, "ACCL:L0B:0110:ACON", "connect")
+        assert row["disconnects"] == 1
+        assert (row["failures"], row["timeouts"]) == (1, 1)
+
+    def test_batch_get_values(self, metrics, monkeypatch):
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.batch.epics.caget_many",
+            lambda names, timeout: [1.0, None],
+            raising=False,
+        )
+
+        PVBatch.get_values(["A:B:C:OK", "A:B:C:DEAD"])
+
+        assert row_for(metrics, "A:B:C:OK", "batch_get")["failures"] == 0
+        assert row_for(metrics, "A:B:C:DEAD", "batch_get")["timeouts"] == 1
@@ -0,0 +1,168 @@
+# tests/utils/epics/test_recording.py
+import gzip
+import sys
+
+import numpy as np
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVBatch,
+    PVPutError,
+    PVRecorder,
+    PV_RECORDER,
+    read_recording,
+)
+from sc_linac_physics.utils.epics.recording import GET, MONITOR, PUT
+
+FakeEPICS_PV = sys.modules["epics"].PV
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep(monkeypatch):
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.epics.core.sleep", lambda _: None
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "session.jsonl.gz")
+
+
+def events(path):
+    return [
+        (event.kind, event.pvname, event.value, event.severity)
+        for event in read_recording(path).events
+    ]
+
+
+class TestPVRecorder:
+    def test_round_trip(self, path):
+        recorder = PVRecorder()
+        with recorder.recording(path):
+            recorder.record(GET, "ACCL:L0B:0110:ACON", 16.6, 0)
+            recorder.record(PUT, "ACCL:L0B:0110:ACON", 16.0)
+
+        assert not recorder.enabled
+        assert recorder.events == 2
+        assert events(path) == [
+            (GET, "ACCL:L0B:0110:ACON", 16.6, 0),
+            (PUT, "ACCL:L0B:0110:ACON", 16.0, None),
+        ]
+
+    def test_arrays(self, path):
+        """Test numpy arrays and scalars come back as numpy values"""
+        recorder = PVRecorder()
+        with recorder.recording(path):
+            recorder.record(GET, "A:B:C:WF", np.arange(3, dtype=np.int16))
+            recorder.record(GET, "A:B:C:SCALAR", np.float32(1.5))
+
+        waveform, scalar = read_recording(path).events
+
+        assert waveform.value.dtype == np.int16
+        np.testing.assert_array_equal(waveform.value, [0, 1, 2])
+        assert scalar.value == 1.5
+
+    def test_times_increase(self, path):
+        recorder = PVRecorder()
+        with recorder.recording(path):
+            for value in range(3):
+                recorder.record(GET, "A:B:C:D", value)
+
+        times = [event.t for event in read_recording(path).events]
+
+        assert times == sorted(times)
+
+    def test_not_recording(self, path):
+        """Test events outside start/stop are dropped"""
+        recorder = PVRecorder()
+        recorder.record(GET, "A:B:C:D", 1.0)
+
+        assert recorder.events == 0
+
+    def test_start_twice(self, path, tmp_path):
+        recorder = PVRecorder()
+        with recorder.recording(path):
+            with pytest.raises(RuntimeError):
+                recorder.start(str(tmp_path / "other.jsonl.gz"))
+
+    def test_not_a_recording(self, tmp_path):
+        path = str(tmp_path / "other.jsonl.gz")
+        with gzip.open(path, "wt") as f:
+            f.write('{"format": "something else"}\n')
+
+        with pytest.raises(ValueError):
+            read_recording(path)
+
+
+class TestInstrumentation:
+    def test_get_and_put(self, path):
+        pv = PV("ACCL:L0B:0110:ACON")
+        with PV_RECORDER.recording(path):
+            pv.get()
+            pv.put(5.0)
+
+        assert events(path) == [
+            (GET, "ACCL:L0B:0110:ACON", 42.0, 0),
+            (PUT, "ACCL:L0B:0110:ACON", 5.0, None),
+        ]
+
+    def test_failed_put_not_recorded(self, path):
+        pv = PV("ACCL:L0B:0110:ACON")
+        pv._put_return = 0
+        with PV_RECORDER.recording(path):
+            with pytest.raises(PVPutError):
+                pv.put(5.0)
+
+        assert events(path) == []
+
+    def test_put_many_recorded_on_completion(self, path, monkeypatch):
+        """Test put_many's puts are recorded once confirmed, and only then"""
+        pvs = [PV("ACCL:L0B:0110:ADES"), PV("ACCL:L0B:0120:ADES")]
+
+        def first_confirmed(self, value, callback=None, **kwargs):
+            if self.pvname == "ACCL:L0B:0110:ADES":
+                callback(pvname=self.pvname)
+            return 1
+
+        monkeypatch.setattr(FakeEPICS_PV, "put", first_confirmed)
+        with PV_RECORDER.recording(path):
+            results = PV.put_many(
+                pvs, [5.0, 6.0], timeout=0.01, raise_on_error=False
+            )
+
+        assert results == [True, False]
+        assert events(path) == [(PUT, "ACCL:L0B:0110:ADES", 5.0, None)]
+
+    def test_monitor(self, path, monkeypatch):
+        """Test monitor updates are recorded from the update's arguments"""
+        monkeypatch.setattr(
+            FakeEPICS_PV, "run_callbacks", lambda self: None, raising=False
+        )
+        pv = PV("ACCL:L0B:0110:AACT")
+        pv._args = {"value": 16.5, "severity": 1}
+        with PV_RECORDER.recording(path):
+            pv.run_callbacks()
+
+        assert events(path) == [(MONITOR, "ACCL:L0B:0110:AACT", 16.5, 1)]
+
+    def test_batch_get_values(self, path, monkeypatch):
+        """Test unreachable PVs are recorded as None"""
+        monkeypatch.setattr(
+            "sc_linac_physics.utils.epics.batch.epics.caget_many",
+            lambda names, timeout: [1.0, None],
+            raising=False,
+        )
+        with PV_RECORDER.recording(path):
+            PVBatch.get_values(["A:B:C:OK", "A:B:C:DEAD"])
+
+        assert events(path) == [
+            (GET, "A:B:C:OK", 1.0, None),
+            (GET, "A:B:C:DEAD", None, None),
+        ]
+
+    def test_disabled_records_nothing(self):
+        PV("ACCL:L0B:0110:ACON").get()
+
+        assert not PV_RECORDER.enabled
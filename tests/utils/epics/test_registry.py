@@ -0,0 +1,141 @@
+# tests/utils/epics/test_registry.py
+import gc
+
+import pytest
+
+from sc_linac_physics.utils.epics import PV, PVRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock):
+    registry = PVRegistry(idle_ttl=10.0, clock=clock)
+    yield registry
+    registry.clear()
+
+
+class Owner:
+    pass
+
+
+class TestAcquire:
+    def test_same_key_returns_same_pv(self, registry):
+        """Test acquiring the same name twice shares one PV"""
+        first = registry.acquire("TEST:PV")
+        second = registry.acquire("TEST:PV")
+
+        assert first is second
+        assert isinstance(first, PV)
+        stats = registry.stats()
+        assert stats.channels == 1
+        assert stats.references == 2
+        assert stats.created == 1
+        assert stats.reused == 1
+
+    def test_key_includes_form_count_and_monitor(self, registry):
+        """Test differing form, count or auto_monitor gives distinct PVs"""
+        base = registry.acquire("TEST:PV")
+
+        assert registry.acquire("TEST:PV", form="ctrl") is not base
+        assert registry.acquire("TEST:PV", count=1) is not base
+        assert registry.acquire("TEST:PV", auto_monitor=False) is not base
+        assert registry.stats().channels == 4
+
+    def test_negative_ttl_rejected(self):
+        """Test a negative idle_ttl raises ValueError"""
+        with pytest.raises(ValueError):
+            PVRegistry(idle_ttl=-1)
+
+
+class TestRelease:
+    def test_release_unknown_pv_raises(self, registry):
+        """Test releasing a PV the registry never handed out"""
+        with pytest.raises(KeyError):
+            registry.release(PV("OTHER:PV"))
+
+    def test_idle_pv_kept_until_ttl(self, registry, clock):
+        """Test an idle PV stays registered until idle_ttl passes"""
+        pv = registry.acquire("TEST:PV")
+        registry.release(pv)
+
+        clock.now = 5.0
+        assert registry.sweep() == 0
+        assert registry.stats().idle == 1
+
+        clock.now = 10.0
+        assert registry.sweep() == 1
+        stats = registry.stats()
+        assert stats.channels == 0
+        assert stats.expired == 1
+
+    def test_reacquire_revives_idle_pv(self, registry, clock):
+        """Test acquiring an idle PV before it expires reuses it"""
+        pv = registry.acquire("TEST:PV")
+        registry.release(pv)
+
+        clock.now = 5.0
+        assert registry.acquire("TEST:PV") is pv
+
+        clock.now = 100.0
+        assert registry.sweep() == 0
+        assert registry.stats().in_use == 1
+
+    def test_pv_in_use_never_expires(self, registry, clock):
+        """Test a referenced PV survives any amount of time"""
+        pv = registry.acquire("TEST:PV")
+        registry.acquire("TEST:PV")
+        registry.release(pv)
+
+        clock.now = 100.0
+        assert registry.sweep() == 0
+        assert registry.stats().references == 1
+
+    def test_owner_collection_releases(self, registry):
+        """Test a reference tied to an owner is released with it"""
+        owner = Owner()
+        registry.acquire("TEST:PV", owner=owner)
+        assert registry.stats().references == 1
+
+        del owner
+        gc.collect()
+
+        stats = registry.stats()
+        assert stats.references == 0
+        assert stats.idle == 1
+
+
+class TestClear:
+    def test_clear_forgets_everything(self, registry):
+        """Test clear() drops in-use and idle PVs"""
+        registry.acquire("TEST:PV:1")
+        registry.release(registry.acquire("TEST:PV:2"))
+
+        registry.clear()
+
+        stats = registry.stats()
+        assert stats.channels == 0
+        assert stats.idle == 0
+
+    def test_stale_owner_after_clear_is_ignored(self, registry):
+        """Test an owner collected after clear() does not touch new PVs"""
+        owner = Owner()
+        registry.acquire("TEST:PV", owner=owner)
+        registry.clear()
+        registry.acquire("TEST:PV")
+
+        del owner
+        gc.collect()
+
+        assert registry.stats().references == 1
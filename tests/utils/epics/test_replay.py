@@ -0,0 +1,236 @@
+# tests/utils/epics/test_replay.py
+import threading
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVBatch,
+    PVConnectionError,
+    PVGetError,
+    PVInvalidError,
+    PV_RECORDER,
+    ReplayPV,
+    ReplaySession,
+    shared_pv,
+    wait_until,
+)
+from sc_linac_physics.utils.epics.recording import (
+    GET,
+    MONITOR,
+    PUT,
+    RecordedEvent,
+    Recording,
+)
+
+ACON = "ACCL:L0B:0110:ACON"
+AACT = "ACCL:L0B:0110:AACT"
+
+
+def recording(*events):
+    return Recording(
+        start=1000.0,
+        events=[RecordedEvent(*event) for event in events],
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_backend_left():
+    yield
+    PV.backend = None
+
+
+class TestReplayPV:
+    def test_pv_is_replayed(self):
+        """Test PV(...) returns a ReplayPV while a session is active"""
+        with ReplaySession(recording((0.0, GET, ACON, 16.6, 0))):
+            pv = PV(ACON, connection_timeout=1.0)
+
+        assert isinstance(pv, ReplayPV)
+        assert pv.connected
+        assert isinstance(PV(ACON), PV)
+
+    def test_stepped_gets(self):
+        """Test stepped replay returns a PV's recorded gets in order"""
+        session = ReplaySession(
+            recording(
+                (0.0, GET, ACON, 1.0, 0),
+                (2.0, GET, ACON, 2.0, 0),
+                (5.0, GET, ACON, 3.0, 1),
+            ),
+            speed=None,
+        )
+        with session:
+            pv = PV(ACON)
+            values = [pv.get() for _ in range(4)]
+
+        assert values == [1.0, 2.0, 3.0, 3.0]
+        assert pv.severity == 1
+        assert pv.timestamp == 1005.0
+        assert session.now() == 5.0
+
+    def test_timed_state(self):
+        """Test a PV has its last value recorded at or before replay time"""
+        session = ReplaySession(
+            recording((0.0, GET, ACON, 1.0, 0), (10.0, GET, ACON, 2.0, 0)),
+            speed=1.0,
+        )
+        with session:
+            assert PV(ACON).get() == 1.0
+
+    def test_check_alarm(self):
+        with ReplaySession(recording((0.0, GET, ACON, 1.0, 2)), speed=None):
+            pv = PV(ACON)
+            pv.get()
+
+            assert pv.check_alarm() == 2
+            with pytest.raises(PVInvalidError):
+                pv.check_alarm(raise_on_alarm=True)
+
+    def test_unknown_pv(self):
+        """Test PVs missing from the recording never connect"""
+        with ReplaySession(recording((0.0, GET, ACON, 1.0, 0))):
+            pv = PV("ACCL:L0B:0120:ACON")
+
+            assert not pv.connected
+            with pytest.raises(PVConnectionError):
+                pv.get()
+
+    def test_no_recorded_value(self):
+        with ReplaySession(recording((0.0, PUT, ACON, 1.0, None))):
+            with pytest.raises(PVGetError):
+                PV(ACON).get()
+
+    def test_backend_already_active(self):
+        with ReplaySession(recording()):
+            with pytest.raises(RuntimeError):
+                ReplaySession(recording()).start()
+
+
+class TestMonitors:
+    def test_stepped_monitor_updates(self):
+        """Test stepping to the next update delivers it to callbacks"""
+        received = []
+        session = ReplaySession(
+            recording(
+                (0.0, MONITOR, AACT, 0.0, 0), (3.0, MONITOR, AACT, 5.0, 0)
+            ),
+            speed=None,
+        )
+        with session:
+            pv = PV(AACT, callback=lambda value, **kw: received.append(value))
+
+            assert wait_until(pv, lambda value: value == 5.0, timeout=1) == 5.0
+
+        assert received == [0.0, 5.0]
+
+    def test_timed_monitor_wakes_wait(self):
+        """Test updates are delivered at their recorded times"""
+        session = ReplaySession(
+            recording(
+                (0.0, MONITOR, AACT, 0.0, 0), (50.0, MONITOR, AACT, 5.0, 0)
+            ),
+            speed=1000.0,
+        )
+        with session:
+            pv = PV(AACT)
+            value = wait_until(
+                pv, lambda value: value == 5.0, timeout=5, poll_interval=10
+            )
+
+        assert value == 5.0
+
+    def test_stop_ends_delivery(self):
+        received = threading.Event()
+        session = ReplaySession(
+            recording((1000.0, MONITOR, AACT, 1.0, 0)), speed=1.0
+        )
+        with session:
+            PV(AACT, callback=lambda **kw: received.set())
+
+        assert not received.wait(0.05)
+
+
+class TestPuts:
+    def test_matching_puts(self):
+        session = ReplaySession(
+            recording((0.0, PUT, ACON, 1.0, None), (1.0, PUT, ACON, 2.0, None)),
+            speed=None,
+        )
+        with session:
+            pv = PV(ACON)
+            pv.put(1.0)
+            pv.put(2.0)
+
+        assert session.divergences == []
+        assert session.now() == 1.0
+
+    def test_divergence(self):
+        """Test puts that differ from the recording are reported"""
+        session = ReplaySession(recording((0.0, PUT, ACON, 1.0, None)))
+        with session:
+            pv = PV(ACON)
+            pv.put(3.0)
+            pv.put(4.0)
+
+        assert len(session.divergences) == 2
+        assert "recorded 1.0" in session.divergences[0]
+        assert "unexpected" in session.divergences[1]
+
+    def test_put_does_not_change_value(self):
+        with ReplaySession(recording((0.0, GET, ACON, 1.0, 0))):
+            pv = PV(ACON)
+            pv.put(9.0)
+
+            assert pv.get() == 1.0
+
+
+class TestIntegration:
+    def test_record_then_replay(self, tmp_path):
+        """Test a recorded session replays the same reads"""
+        path = str(tmp_path / "session.jsonl.gz")
+        live = PV(ACON)
+        with PV_RECORDER.recording(path):
+            live._get_value = 16.0
+            live.get()
+            live.put(17.0)
+            live._get_value = 17.0
+            live.get()
+
+        session = ReplaySession(path, speed=None)
+        with session:
+            pv = PV(ACON)
+            first = pv.get()
+            pv.put(17.0)
+            second = pv.get()
+
+        assert (first, second) == (16.0, 17.0)
+        assert session.divergences == []
+
+    def test_shared_pv_not_reused(self):
+        """Test shared_pv does not hand live PVs to a replay, or back"""
+        live = shared_pv(ACON)
+        with ReplaySession(recording((0.0, GET, ACON, 1.0, 0))):
+            replayed = shared_pv(ACON)
+
+        assert isinstance(replayed, ReplayPV)
+        assert shared_pv(ACON) is live
+
+    def test_batch(self):
+        session = ReplaySession(
+            recording((0.0, GET, ACON, 1.0, 0), (0.0, GET, AACT, 2.0, 0)),
+            speed=None,
+        )
+        with session:
+            values = PVBatch.get_values([ACON, AACT, "A:B:C:MISSING"])
+            results = PVBatch.put_values([ACON, "A:B:C:MISSING"], [3.0, 4.0])
+
+        assert values == [1.0, 2.0, None]
+        assert results == [True, False]
+        assert len(session.divergences) == 1
+
+    def test_batch_create(self):
+        with ReplaySession(recording((0.0, GET, ACON, 1.0, 0))):
+            pvs = PV.batch_create([ACON, AACT])
+
+        assert [pv.connected for pv in pvs] == [True, False]
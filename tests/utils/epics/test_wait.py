@@ -0,0 +1,90 @@
+# tests/utils/epics/test_wait.py
+import threading
+from time import monotonic
+from unittest.mock import Mock
+
+import pytest
+
+from sc_linac_physics.utils.epics import (
+    PV,
+    PVWaitAbortedError,
+    PVWaitTimeoutError,
+    wait_until,
+)
+
+
+@pytest.fixture
+def pv():
+    pv = PV("TEST:PV")
+    pv.put(0)
+    return pv
+
+
+def put_later(pv, value, delay=0.05):
+    timer = threading.Timer(delay, pv.put, args=(value,))
+    timer.start()
+    return timer
+
+
+class TestWaitUntil:
+    def test_returns_immediately_when_satisfied(self, pv):
+        """Test no wait happens when the predicate already holds"""
+        start = monotonic()
+
+        assert wait_until(pv, lambda value: value == 0, timeout=5) == 0
+        assert monotonic() - start < 1
+
+    def test_wakes_on_monitor_update(self, pv):
+        """Test an update ends the wait well before poll_interval"""
+        timer = put_later(pv, 1)
+        start = monotonic()
+
+        value = wait_until(pv, lambda value: value == 1, poll_interval=10)
+
+        timer.join()
+        assert value == 1
+        assert monotonic() - start < 5
+
+    def test_callback_removed(self, pv):
+        """Test the monitor callback is removed after the wait"""
+        before = dict(pv.callbacks)
+
+        wait_until(pv, lambda value: value == 0)
+
+        assert pv.callbacks == before
+
+    def test_timeout(self, pv):
+        """Test PVWaitTimeoutError once timeout passes"""
+        with pytest.raises(PVWaitTimeoutError, match="last value 0"):
+            wait_until(pv, lambda value: value == 1, timeout=0.05)
+
+        assert not pv.callbacks
+
+    def test_abort_check_return_value(self, pv):
+        """Test a truthy abort_check aborts the wait"""
+        with pytest.raises(PVWaitAbortedError):
+            wait_until(pv, lambda value: value == 1, abort_check=lambda: True)
+
+    def test_abort_check_exception_propagates(self, pv):
+        """Test an exception from abort_check reaches the caller"""
+        abort_check = Mock(side_effect=[None, RuntimeError("abort")])
+
+        with pytest.raises(RuntimeError, match="abort"):
+            wait_until(
+                pv,
+                lambda value: value == 1,
+                abort_check=abort_check,
+                poll_interval=0.01,
+            )
+
+        assert abort_check.call_count == 2
+        assert not pv.callbacks
+
+    def test_polls_without_updates(self):
+        """Test values are re-read every poll_interval without updates"""
+        pv = Mock()
+        pv.get.side_effect = [0, 0, 1]
+
+        assert wait_until(pv, lambda value: value == 1, poll_interval=0.01)
+        assert pv.get.call_count == 3
+        pv.remove_callback.assert_called_once_with(pv.add_callback.return_value)
@@ -107,26 +107,28 @@ def test_stepper_temp_pv_obj_lazy_and_cached(cavity):
     assert cavity._stepper_temp_pv_obj is None
     mock_pv = make_mock_pv()
     with patch(
-        "sc_linac_physics.utils.sc_linac.cavity.PV", return_value=mock_pv
+        "sc_linac_physics.utils.sc_linac.cavity.shared_pv",
+        return_value=mock_pv,
     ) as pv_ctor:
         first = cavity.stepper_temp_pv_obj
         second = cavity.stepper_temp_pv_obj
     assert first is mock_pv
     assert second is mock_pv
-    pv_ctor.assert_called_once_with(cavity.stepper_temp_pv)
+    pv_ctor.assert_called_once_with(cavity.stepper_temp_pv, owner=cavity)
 
 
 def test_df_cold_pv_obj_lazy_and_cached(cavity):
     assert cavity._df_cold_pv_obj is None
     mock_pv = make_mock_pv()
     with patch(
-        "sc_linac_physics.utils.sc_linac.cavity.PV", return_value=mock_pv
+        "sc_linac_physics.utils.sc_linac.cavity.shared_pv",
+        return_value=mock_pv,
     ) as pv_ctor:
         first = cavity.df_cold_pv_obj
         second = cavity.df_cold_pv_obj
     assert first is mock_pv
     assert second is mock_pv
-    pv_ctor.assert_called_once_with(cavity.df_cold_pv)
+    pv_ctor.assert_called_once_with(cavity.df_cold_pv, owner=cavity)
 
 
 @pytest.mark.parametrize(
@@ -143,13 +145,14 @@ def test_cavity_fscan_pv_obj_lazy_and_cached(cavity, prop_name, addr_attr):
     assert getattr(cavity, f"_{prop_name}") is None
     mock_pv = make_mock_pv()
     with patch(
-        "sc_linac_physics.utils.sc_linac.cavity.PV", return_value=mock_pv
+        "sc_linac_physics.utils.sc_linac.cavity.shared_pv",
+        return_value=mock_pv,
     ) as pv_ctor:
         first = getattr(cavity, prop_name)
         second = getattr(cavity, prop_name)
     assert first is mock_pv
     assert second is mock_pv
-    pv_ctor.assert_called_once_with(getattr(cavity, addr_attr))
+    pv_ctor.assert_called_once_with(getattr(cavity, addr_attr), owner=cavity)
 
 
 def test_start_characterization(cavity):
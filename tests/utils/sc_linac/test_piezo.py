@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from lcls_tools.common.controls.pyepics.utils import make_mock_pv
 
-from sc_linac_physics.utils.epics import PVGetError
+from sc_linac_physics.utils.epics import PVGetError, PVWaitTimeoutError
 from sc_linac_physics.utils.sc_linac.cavity import Cavity
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     PIEZO_ENABLE_VALUE,
@@ -19,6 +19,9 @@ from tests.mock_utils import mock_func
 @pytest.fixture
 def piezo(monkeypatch):
     monkeypatch.setattr("time.sleep", mock_func)
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.sc_linac.piezo.wait_until", mock_func
+    )
 
     with patch(
         "sc_linac_physics.utils.sc_linac.cavity.custom_logger"
@@ -111,6 +114,33 @@ def test_set_to_manual(piezo):
     piezo._feedback_control_pv_obj.put.assert_called_with(PIEZO_MANUAL_VALUE)
 
 
+def test_wait_for_status(piezo, monkeypatch):
+    wait_until = Mock()
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.sc_linac.piezo.wait_until", wait_until
+    )
+    piezo._enable_stat_pv_obj = make_mock_pv()
+
+    piezo.wait_for_status(piezo.enable_stat_pv_obj, PIEZO_ENABLE_VALUE, 2)
+
+    args, kwargs = wait_until.call_args
+    assert args[0] == piezo._enable_stat_pv_obj
+    assert args[1](PIEZO_ENABLE_VALUE)
+    assert not args[1](PIEZO_DISABLE_VALUE)
+    assert kwargs["timeout"] == 2
+    assert kwargs["abort_check"] == piezo.cavity.check_abort
+
+
+def test_wait_for_status_timeout_ignored(piezo, monkeypatch):
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.sc_linac.piezo.wait_until",
+        Mock(side_effect=PVWaitTimeoutError("timeout")),
+    )
+    piezo._feedback_stat_pv_obj = make_mock_pv()
+
+    piezo.wait_for_status(piezo.feedback_stat_pv_obj, PIEZO_MANUAL_VALUE, 5)
+
+
 class MockStatus:
     def __init__(self):
         self.num_calls = 0
@@ -35,13 +35,14 @@ def test_rack_fscan_pv_obj_lazy_and_cached(rack, prop_name, addr_attr):
     setattr(rack, f"_{prop_name}", None)
     mock_pv = make_mock_pv()
     with patch(
-        "sc_linac_physics.utils.sc_linac.rack.PV", return_value=mock_pv
+        "sc_linac_physics.utils.sc_linac.rack.shared_pv",
+        return_value=mock_pv,
     ) as pv_ctor:
         first = getattr(rack, prop_name)
         second = getattr(rack, prop_name)
     assert first is mock_pv
     assert second is mock_pv
-    pv_ctor.assert_called_once_with(getattr(rack, addr_attr))
+    pv_ctor.assert_called_once_with(getattr(rack, addr_attr), owner=rack)
 
 
 def _wire_fscan_pvs(rack, stat_sequence):
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 from lcls_tools.common.controls.pyepics.utils import make_mock_pv
 
+from sc_linac_physics.utils.epics import PVWaitTimeoutError
 from sc_linac_physics.utils.sc_linac.cavity import Cavity
 from sc_linac_physics.utils.sc_linac.linac_utils import (
     SSA_STATUS_ON_VALUE,
@@ -330,3 +331,33 @@ def test_wait_while_resetting(ssa):
     ssa._status_pv_obj = make_mock_pv(get_val=SSA_STATUS_RESETTING_FAULTS_VALUE)
     with pytest.raises(CavityAbortError):
         ssa.wait_while_resetting()
+
+
+def test_wait_while_resetting_timeout(ssa, monkeypatch):
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.sc_linac.ssa.wait_until",
+        MagicMock(side_effect=PVWaitTimeoutError("timeout")),
+    )
+    ssa._status_pv_obj = make_mock_pv(get_val=SSA_STATUS_RESETTING_FAULTS_VALUE)
+    with pytest.raises(SSAFaultError):
+        ssa.wait_while_resetting()
+
+
+def test_turn_on_waits_for_status(ssa, monkeypatch):
+    wait_until = MagicMock()
+    monkeypatch.setattr(
+        "sc_linac_physics.utils.sc_linac.ssa.wait_until", wait_until
+    )
+    ssa.cavity.cryomodule.is_harmonic_linearizer = False
+    ssa._status_pv_obj = make_mock_pv(get_val=SSA_STATUS_FAULTED_VALUE)
+    ssa._turn_on_pv_obj = make_mock_pv()
+    ssa.reset = MagicMock()
+
+    ssa.turn_on()
+
+    ssa._turn_on_pv_obj.put.assert_called_with(1)
+    args, kwargs = wait_until.call_args
+    assert args[0] == ssa._status_pv_obj
+    assert args[1](SSA_STATUS_ON_VALUE)
+    assert not args[1](SSA_STATUS_FAULTED_VALUE)
+    assert kwargs["abort_check"] == ssa.cavity.check_abort
@@ -1,5 +1,5 @@
 from random import randint, choice
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from lcls_tools.common.controls.pyepics.utils import make_mock_pv
@@ -57,26 +57,30 @@ def test_step_signed_pv_obj_lazy_and_cached(stepper):
     assert stepper._step_signed_pv_obj is None
     mock_pv = make_mock_pv()
     with patch(
-        "sc_linac_physics.utils.sc_linac.stepper.PV", return_value=mock_pv
+        "sc_linac_physics.utils.sc_linac.stepper.shared_pv",
+        return_value=mock_pv,
     ) as pv_ctor:
         first = stepper.step_signed_pv_obj
         second = stepper.step_signed_pv_obj
     assert first is mock_pv
     assert second is mock_pv
-    pv_ctor.assert_called_once_with(stepper.step_signed_pv)
+    pv_ctor.assert_called_once_with(stepper.step_signed_pv, owner=stepper)
 
 
 def test_steps_cold_landing_pv_obj_lazy_and_cached(stepper):
     assert stepper._steps_cold_landing_pv_obj is None
     mock_pv = make_mock_pv()
     with patch(
-        "sc_linac_physics.utils.sc_linac.stepper.PV", return_value=mock_pv
+        "sc_linac_physics.utils.sc_linac.stepper.shared_pv",
+        return_value=mock_pv,
     ) as pv_ctor:
         first = stepper.steps_cold_landing_pv_obj
         second = stepper.steps_cold_landing_pv_obj
     assert first is mock_pv
     assert second is mock_pv
-    pv_ctor.assert_called_once_with(stepper.steps_cold_landing_pv)
+    pv_ctor.assert_called_once_with(
+        stepper.steps_cold_landing_pv, owner=stepper
+    )
 
 
 def test_check_abort(stepper):
@@ -205,7 +209,9 @@ def test_move(stepper):
 def test_issue_move_command(stepper):
     stepper.cavity.rack.cryomodule.is_harmonic_linearizer = False
     stepper.move_positive = MagicMock()
-    stepper._motor_moving_pv_obj = make_mock_pv(get_val=0)
+    stepper._motor_moving_pv_obj = make_mock_pv()
+    # Starts moving, then done
+    stepper._motor_moving_pv_obj.get = Mock(side_effect=[1, 0])
     stepper._limit_switch_a_pv_obj = make_mock_pv(get_val=0)
     stepper._limit_switch_b_pv_obj = make_mock_pv(get_val=0)
 
@@ -219,7 +225,9 @@ def test_issue_move_command(stepper):
 def test_issue_move_command_hl(stepper):
     stepper.cavity.rack.cryomodule.is_harmonic_linearizer = True
     stepper.move_negative = MagicMock()
-    stepper._motor_moving_pv_obj = make_mock_pv(get_val=0)
+    stepper._motor_moving_pv_obj = make_mock_pv()
+    # Starts moving, then done
+    stepper._motor_moving_pv_obj.get = Mock(side_effect=[1, 0])
     stepper._limit_switch_a_pv_obj = make_mock_pv(get_val=0)
     stepper._limit_switch_b_pv_obj = make_mock_pv(get_val=0)
 
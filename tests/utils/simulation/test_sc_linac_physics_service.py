@@ -6,6 +6,8 @@ from caproto import ChannelEnum, ChannelFloat, ChannelInteger
 
 from sc_linac_physics.utils.simulation.sc_linac_physics_service import (
     LauncherGroups,
+    FAULT_TELEMETRY_FLOAT_CHANNELS,
+    FAULT_TELEMETRY_INTEGER_CHANNELS,
     HEARTBEAT_CHANNELS,
     ALARM_CHANNELS,
     ALARM_STATES,
@@ -226,6 +228,12 @@ class TestSCLinacPhysicsService:
             assert pv_name in service
             assert isinstance(service[pv_name], ChannelInteger)
 
+        # Check fault runner telemetry channels
+        for channel in FAULT_TELEMETRY_FLOAT_CHANNELS:
+            assert isinstance(service[f"PHYS:SYS0:1:{channel}"], ChannelFloat)
+        for channel in FAULT_TELEMETRY_INTEGER_CHANNELS:
+            assert isinstance(service[f"PHYS:SYS0:1:{channel}"], ChannelInteger)
+
         # Check alarm channels
         for channel in ALARM_CHANNELS:
             pv_name = f"ALRM:SYS0:{channel}:ALHBERR"
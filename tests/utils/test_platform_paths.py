@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from sc_linac_physics.utils.platform_paths import (
+    get_cache_dir,
     get_database_dir,
     get_json_dir,
     get_log_base_dir,
@@ -60,6 +61,17 @@ def test_ssa_cal_base_dir_macos_like():
     )
 
 
+def test_cache_dir_is_per_user():
+    home = Path("/Users/tester")
+    assert get_cache_dir(system_name="Linux", home_dir=home) == Path(
+        "/Users/tester/.cache/sc_linac_physics"
+    )
+    assert (
+        get_cache_dir(system_name="Darwin", home_dir=home)
+        == home / ".sc_linac_physics" / "cache"
+    )
+
+
 def test_platform_predicates():
     assert is_linux(system_name="Linux") is True
     assert is_linux(system_name="Darwin") is False